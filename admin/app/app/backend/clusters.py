@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
+
 import flask
 
 from google.cloud import datastore
@@ -20,7 +23,7 @@ from app_module import AppModule
 from common import roles
 from common import users
 from common import flask_users
-from common.cluster_points import cluster_points, compute_centers
+from common import cluster_snapshots
 
 
 class Clusters(AppModule):
@@ -54,33 +57,10 @@ class Clusters(AppModule):
         if result is False:
             return flask.Response('Permission denied', status=403)
 
-        locations = []
-        query = client.query(kind="User")
-        cursor = None
-        while True:
-            entities_count = 0
-            entities = query.fetch(start_cursor=cursor, limit=1000)
-            for entity in entities:
-                entities_count += 1
-                if entity.has_key('geocoded_location'):
-                    location = entity['geocoded_location']
-                    locations.append(location)
-
-            if entities_count < 1000:
-                break
-            cursor = entities.next_page_token
-        clusters = cluster_points(locations, eps=0.1, min_samples=10, n_jobs=64)
-        centers, sizes = compute_centers(clusters, locations)
-        results = { 'points': [] }
-        if len(centers) != 0:
-            results['min_size'] = min(sizes.values())
-            results['max_size'] = max(sizes.values())
-            p = results['points']
-            for label in centers:
-                center = centers[label]
-                size = sizes[label]
-                p.append( ((center[0], center[1]), size))
-        return flask.jsonify(results)
+        max_age = flask.request.args.get('max_age', None, type=int)
+        snapshots = cluster_snapshots.fresh_snapshots(
+            client, cluster_snapshots.USERS, max_age)
+        return self._clusters_response(client, snapshots)
 
     def photos(self):
         client = self._get_datastore_client()
@@ -96,52 +76,36 @@ class Clusters(AppModule):
         if result is False:
             return flask.Response('Permission denied', status=403)
 
-        filters = []
-        filters.append(('confirmed_by_user', '=', True))
-
-        image_buckets = flask.request.args.get('image_buckets', "").split(",")
-
-        locations = []
-        query = client.query(kind="Photo", filters=filters)
-        cursor = None
-        while True:
-            entities_count = 0
-            entities = query.fetch(start_cursor=cursor, limit=1000)
-            for entity in entities:
-                entities_count += 1
-                if entity.has_key('lat') and entity.has_key('lon'):
-                    # Negate longitude because photo longitude is stored as positive-West, but
-                    # code needs negative-West.
-                    location = entity['lat'], -entity['lon']
-                    if len(image_buckets) == 0:
-                        should_append = True
-                    else:
-                        # Check if this bucket is in the list.
-                        should_append = entity['image_bucket'] in image_buckets
-
-                    if should_append:
-                        locations.append(location)
-
-            if entities_count < 1000:
-                break
-            cursor = entities.next_page_token
-
-        if len(locations) > 0:
-            clusters = cluster_points(locations, eps=0.1, min_samples=10, n_jobs=64)
-            centers, sizes = compute_centers(clusters, locations)
-        else:
-            centers = []
-            sizes = []
-
-        results = { 'points': [] }
-        if len(centers) != 0:
-            results['min_size'] = min(sizes.values())
-            results['max_size'] = max(sizes.values())
-            p = results['points']
-            for label in centers:
-                center = centers[label]
-                size = sizes[label]
-                p.append( ((center[0], center[1]), size) )
-        return flask.jsonify(results)
+        image_buckets = flask.request.args.get('image_buckets', "")
+        image_buckets = set(b for b in image_buckets.split(",") if b)
+        max_age = flask.request.args.get('max_age', None, type=int)
+        snapshots = cluster_snapshots.fresh_snapshots(
+            client, cluster_snapshots.PHOTOS, max_age)
+        if image_buckets:
+            snapshots = [snapshot for snapshot in snapshots
+                         if snapshot['image_bucket'] in image_buckets]
+        return self._clusters_response(client, snapshots)
+
+    def _clusters_response(self, client, snapshots):
+        """
+        Returns the clusters of the merged snapshots as JSON, with an ETag so
+        clients can revalidate instead of downloading unchanged clusters.
+        """
+        cells = cluster_snapshots.merge(
+            cluster_snapshots.snapshot_cells(client, snapshot) for snapshot in snapshots)
+        points = cluster_snapshots.clusters_from_cells(cells)
+        results = { 'points': points }
+        if len(points) != 0:
+            sizes = [size for center, size in points]
+            results['min_size'] = min(sizes)
+            results['max_size'] = max(sizes)
+        if len(snapshots) != 0:
+            updated = min(snapshot['updated'] for snapshot in snapshots)
+            results['updated'] = updated.isoformat()
+
+        response = flask.Response(json.dumps(results, sort_keys=True),
+                                  mimetype='application/json')
+        response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+        return response.make_conditional(flask.request)
 
 clusters = Clusters()
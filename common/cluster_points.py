@@ -1,4 +1,6 @@
 from sklearn.cluster import DBSCAN
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from common import constants
 import numpy as np
 
@@ -29,6 +31,135 @@ def count_clusters(db):
     n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
     return (n_clusters, labels)
 
+class GridClusters(object):
+    """Result of grid_cluster_points, with the same labels_ attribute as
+    sklearn cluster objects."""
+    def __init__(self, labels):
+        self.labels_ = labels
+
+def _neighbor_cells(keys, unique_keys, width):
+    """For each of the 8 neighbors (and the cell itself) of the cells with
+    the given keys, yield (mask, index) where mask says which cells have
+    that neighbor occupied and index is the neighbor's position in
+    unique_keys."""
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            neighbor_keys = keys + dx * width + dy
+            index = np.searchsorted(unique_keys, neighbor_keys)
+            index = np.minimum(index, len(unique_keys) - 1)
+            yield unique_keys[index] == neighbor_keys, index
+
+def grid_cells(coordinates, eps, metric='euclidean'):
+    """Bin coordinates into eps-sized grid cells.
+
+    Arguments:
+      coordinates: a sequence of (lat, lon) tuples
+      eps: the cell size in radial degrees
+      metric: 'euclidean' or 'equirectangular', see grid_cluster_points
+    Returns:
+      cells: array of the distinct (row, column) cells
+      point_cell: the index in cells of each point's cell
+    """
+    points = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    if metric == 'equirectangular':
+        points = np.column_stack([points[:, 0], points[:, 1] * np.cos(np.radians(points[:, 0]))])
+    elif metric != 'euclidean':
+        raise ValueError("Unknown metric %s" % metric)
+    cells = np.floor(points / eps).astype(np.int64)
+    if len(cells) == 0:
+        return cells, np.zeros(0, dtype=np.int64)
+    origin = cells.min(axis=0)
+    width = cells[:, 1].max() - origin[1] + 1
+    keys = (cells[:, 0] - origin[0]) * width + (cells[:, 1] - origin[1])
+    unique_keys, point_cell = np.unique(keys, return_inverse=True)
+    unique_cells = np.column_stack([unique_keys // width + origin[0],
+                                    unique_keys % width + origin[1]])
+    return unique_cells, point_cell
+
+def cluster_grid_cells(cells, counts, min_samples):
+    """Cluster grid cells given the number of points in each.
+
+    Cells holding at least min_samples points are dense, and dense cells
+    which touch (including diagonally) form a cluster.  A sparse cell
+    which touches a dense cell joins the largest such neighbor's cluster,
+    like DBSCAN border points; the remaining cells are noise (label -1).
+
+    Arguments:
+      cells: array of distinct (row, column) cells, as from grid_cells
+      counts: the number of points in each cell
+      min_samples: the size of the smallest cluster
+    Returns:
+      the cluster label of each cell
+    """
+    cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    n_cells = len(cells)
+    if n_cells == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Offset cells so that neighbor keys never wrap into the next row
+    shifted = cells - (cells.min(axis=0) - 1)
+    width = shifted[:, 1].max() + 2
+    keys = shifted[:, 0] * width + shifted[:, 1]
+    order = np.argsort(keys)
+    unique_keys = keys[order]
+    counts = np.asarray(counts, dtype=np.int64)[order]
+    dense = counts >= min_samples
+
+    # Connect touching dense cells
+    dense_index = np.flatnonzero(dense)
+    rows = []
+    cols = []
+    for found, index in _neighbor_cells(unique_keys[dense_index], unique_keys, width):
+        found &= dense[index]
+        rows.append(dense_index[found])
+        cols.append(index[found])
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    graph = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n_cells, n_cells))
+    _, components = connected_components(graph, directed=False)
+
+    cell_labels = np.full(n_cells, -1, dtype=np.int64)
+    if len(dense_index):
+        _, cell_labels[dense_index] = np.unique(components[dense_index], return_inverse=True)
+
+    # Attach sparse cells to their largest dense neighbor
+    sparse_index = np.flatnonzero(~dense)
+    best_count = np.zeros(len(sparse_index), dtype=np.int64)
+    best_label = np.full(len(sparse_index), -1, dtype=np.int64)
+    for found, index in _neighbor_cells(unique_keys[sparse_index], unique_keys, width):
+        better = found & dense[index] & (counts[index] > best_count)
+        best_count[better] = counts[index][better]
+        best_label[better] = cell_labels[index][better]
+    cell_labels[sparse_index] = best_label
+
+    labels = np.empty(n_cells, dtype=np.int64)
+    labels[order] = cell_labels
+    return labels
+
+def grid_cluster_points(coordinates, eps, min_samples, metric='euclidean'):
+    """Cluster coordinates by binning them into a grid, an approximation
+    of DBSCAN which runs in O(n log n) with no pairwise distances.
+
+    Points are binned into eps-sized cells, which are clustered by
+    cluster_grid_cells; each point takes the label of its cell.
+
+    Arguments:
+      coordinates: a sequence of (lat, lon) tuples
+      eps: the cluster size in radial degrees
+      min_samples: the size of the smallest cluster
+      metric: 'euclidean' measures distance in raw degrees, like
+        cluster_points.  'equirectangular' scales each point's longitude
+        by cos(latitude) before binning, so eps approximates a great
+        circle distance (in degrees of arc) away from the poles.  It is
+        not an exact haversine distance: cells are only compared with
+        their grid neighbors, and the scaling differs across a cell.
+    Returns:
+      an object with a labels_ array, like the result of cluster_points
+    """
+    cells, point_cell = grid_cells(coordinates, eps, metric)
+    counts = np.bincount(point_cell, minlength=len(cells))
+    cell_labels = cluster_grid_cells(cells, counts, min_samples)
+    return GridClusters(cell_labels[point_cell])
+
 def compute_centers(clusters, locations, suppress_negative=True):
     """Compute centroids of clusters.
 
@@ -42,19 +173,26 @@ def compute_centers(clusters, locations, suppress_negative=True):
       sizes: dictionary of label -> the sizes of the centroid (number of members)
     """
 
-    points = {}
-    print clusters
-    for i, label in enumerate(clusters.labels_):
-        if suppress_negative and label == -1:
-            continue
-        if label not in points:
-            points[label] = []
-        points[label].append( (locations[i][0], locations[i][1]))
+    labels = np.asarray(clusters.labels_, dtype=np.int64)
+    locations = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+    if suppress_negative:
+        keep = labels != -1
+        labels = labels[keep]
+        locations = locations[keep]
+    if len(labels) == 0:
+        return {}, {}
+
+    # Shift labels so that -1 can be counted
+    index = labels + 1
+    counts = np.bincount(index)
+    sums_x = np.bincount(index, weights=locations[:, 0])
+    sums_y = np.bincount(index, weights=locations[:, 1])
 
     centers = {}
     sizes = {}
-    for label in points:
-        centers[label] = np.mean(points[label], axis=0)
-        sizes[label] = len(points[label])
+    for i in np.flatnonzero(counts):
+        label = i - 1
+        centers[label] = np.array([sums_x[i] / counts[i], sums_y[i] / counts[i]])
+        sizes[label] = int(counts[i])
 
     return centers, sizes
@@ -0,0 +1,328 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Precomputed location clusters for the admin Clusters endpoints.
+
+A snapshot stores the grid cell aggregates (count and coordinate sums per
+eps-sized cell) of the user or photo locations, rather than the clusters
+themselves.  Cells can be updated incrementally as new entities arrive,
+merged across image buckets, and clustered with
+cluster_points.cluster_grid_cells without touching the points again.
+
+Photo snapshots are kept per image_bucket and updated from photos
+uploaded since the last update (by uploaded_date).  Datastore queries are
+eventually consistent, so a photo may show up in a query some time after
+photos with later upload dates.  Each update re-scans WATERMARK_LAG
+before the watermark, and skips photos in that window which the snapshot
+already counted.  Updates only add photos: deleted or unconfirmed photos
+stay counted until the snapshots are deleted, which makes the next
+update rebuild them from all photos.  Users have no upload time, so the
+user snapshot is rebuilt from all users.
+
+Cells are stored as zlib-compressed packed records in unindexed blobs, at
+most SHARD_CELLS per entity so that each stays under Datastore's 1 MiB
+entity limit.  The first shard is stored on the snapshot entity itself,
+and any others on child entities of kind SNAPSHOT_SHARD_KIND.
+"""
+
+import datetime
+import json
+import zlib
+
+import numpy as np
+from google.cloud import datastore
+
+from common.cluster_points import cluster_grid_cells
+
+SNAPSHOT_KIND = 'ClusterSnapshot'
+SNAPSHOT_SHARD_KIND = 'ClusterSnapshotShard'
+USERS = 'users'
+PHOTOS = 'photos'
+# Clustering parameters used by the admin endpoints
+EPS = 0.1
+MIN_SAMPLES = 10
+PAGE_SIZE = 1000
+# How far before the watermark each photo update re-scans, to pick up
+# photos which were not yet visible to the last update's query
+WATERMARK_LAG = datetime.timedelta(minutes=10)
+# Packed cell record, 32 bytes per cell before compression
+CELL_DTYPE = np.dtype([('row', '<i4'), ('column', '<i4'), ('count', '<i8'),
+                       ('sum_lat', '<f8'), ('sum_lon', '<f8')])
+# Cells per entity: even incompressible, a shard stays well under 1 MiB
+SHARD_CELLS = 20000
+
+
+def aggregate(locations, cells=None, eps=EPS):
+    """Add (lat, lon) locations to a dict of cell aggregates.
+
+    Arguments:
+      locations: a sequence of (lat, lon) tuples
+      cells: dict of "row,column" -> [count, lat sum, lon sum] to update
+      eps: the cell size in degrees
+    Returns:
+      the updated cells
+    """
+    if cells is None:
+        cells = {}
+    points = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return cells
+    grid = np.floor(points / eps).astype(np.int64)
+    keys, point_cell = np.unique(["%d,%d" % (row, column) for row, column in grid],
+                                 return_inverse=True)
+    counts = np.bincount(point_cell)
+    sums_lat = np.bincount(point_cell, weights=points[:, 0])
+    sums_lon = np.bincount(point_cell, weights=points[:, 1])
+    for i, key in enumerate(keys):
+        cell = cells.setdefault(key, [0, 0., 0.])
+        cell[0] += int(counts[i])
+        cell[1] += float(sums_lat[i])
+        cell[2] += float(sums_lon[i])
+    return cells
+
+
+def merge(cells_list):
+    """Merge several dicts of cell aggregates into one."""
+    merged = {}
+    for cells in cells_list:
+        for key, (count, sum_lat, sum_lon) in cells.iteritems():
+            cell = merged.setdefault(key, [0, 0., 0.])
+            cell[0] += count
+            cell[1] += sum_lat
+            cell[2] += sum_lon
+    return merged
+
+
+def clusters_from_cells(cells, min_samples=MIN_SAMPLES):
+    """Cluster cell aggregates.
+
+    Returns:
+      a list of ((lat, lon), size) for each cluster
+    """
+    if not cells:
+        return []
+    keys = sorted(cells)
+    grid = np.array([map(int, key.split(',')) for key in keys], dtype=np.int64)
+    values = np.array([cells[key] for key in keys], dtype=np.float64)
+    labels = cluster_grid_cells(grid, values[:, 0].astype(np.int64), min_samples)
+    keep = labels != -1
+    labels = labels[keep]
+    values = values[keep]
+    if len(labels) == 0:
+        return []
+    labels = np.unique(labels, return_inverse=True)[1]
+    sizes = np.bincount(labels, weights=values[:, 0])
+    sums_lat = np.bincount(labels, weights=values[:, 1])
+    sums_lon = np.bincount(labels, weights=values[:, 2])
+    return [((sums_lat[i] / sizes[i], sums_lon[i] / sizes[i]), int(sizes[i]))
+            for i in range(len(sizes))]
+
+
+def snapshot_key(client, source, image_bucket=None):
+    name = source if image_bucket is None else '%s:%s' % (source, image_bucket)
+    return client.key(SNAPSHOT_KIND, name)
+
+
+def shard_keys(client, entity):
+    """Return the keys of the shard entities holding the rest of the
+    snapshot's cells."""
+    return [client.key(SNAPSHOT_SHARD_KIND, i, parent=entity.key)
+            for i in range(1, entity['shards'])]
+
+
+def pack_cells(cells):
+    """Pack a dict of cell aggregates into a compressed string."""
+    packed = np.zeros(len(cells), dtype=CELL_DTYPE)
+    for i, key in enumerate(sorted(cells)):
+        row, column = key.split(',')
+        count, sum_lat, sum_lon = cells[key]
+        packed[i] = int(row), int(column), count, sum_lat, sum_lon
+    return zlib.compress(packed.tostring())
+
+
+def unpack_cells(blob, cells=None):
+    """Add the cells packed by pack_cells to a dict of cell aggregates."""
+    if cells is None:
+        cells = {}
+    packed = np.frombuffer(zlib.decompress(blob), dtype=CELL_DTYPE)
+    for row, column, count, sum_lat, sum_lon in packed.tolist():
+        cells["%d,%d" % (row, column)] = [count, sum_lat, sum_lon]
+    return cells
+
+
+def split_cells(cells, shard_cells=SHARD_CELLS):
+    """Split a dict of cell aggregates into dicts of at most shard_cells
+    cells each.  Always returns at least one, possibly empty, dict."""
+    keys = sorted(cells)
+    return [dict((key, cells[key]) for key in keys[i:i + shard_cells])
+            for i in range(0, max(len(keys), 1), shard_cells)]
+
+
+def snapshot_cells(client, entity):
+    """Return the cell aggregates of a snapshot, including its shards."""
+    cells = unpack_cells(entity['cells'])
+    if entity['shards'] > 1:
+        # Lookups by key are strongly consistent, unlike queries
+        for shard in client.get_multi(shard_keys(client, entity)):
+            unpack_cells(shard['cells'], cells)
+    return cells
+
+
+def _snapshot_entities(client, source, image_bucket, cells, now, watermark=None,
+                       recent_keys=()):
+    """Return the snapshot entity followed by its shard entities."""
+    shards = split_cells(cells)
+    entity = datastore.Entity(snapshot_key(client, source, image_bucket),
+                              exclude_from_indexes=('cells', 'recent_keys'))
+    entity['source'] = source
+    entity['image_bucket'] = image_bucket
+    entity['cells'] = pack_cells(shards[0])
+    entity['shards'] = len(shards)
+    entity['updated'] = now
+    entity['watermark'] = watermark
+    # Keys of the counted photos uploaded within WATERMARK_LAG of the
+    # watermark, which the next update will see again
+    entity['recent_keys'] = json.dumps(sorted(recent_keys))
+    entities = [entity]
+    for key, shard in zip(shard_keys(client, entity), shards[1:]):
+        shard_entity = datastore.Entity(key, exclude_from_indexes=('cells',))
+        shard_entity['cells'] = pack_cells(shard)
+        entities.append(shard_entity)
+    return entities
+
+
+def load_snapshots(client, source):
+    """Return the snapshots for source."""
+    query = client.query(kind=SNAPSHOT_KIND, filters=[('source', '=', source)])
+    return list(query.fetch())
+
+
+def _fetch_all(query):
+    cursor = None
+    while True:
+        entities_count = 0
+        entities = query.fetch(start_cursor=cursor, limit=PAGE_SIZE)
+        for entity in entities:
+            entities_count += 1
+            yield entity
+        if entities_count < PAGE_SIZE:
+            break
+        cursor = entities.next_page_token
+
+
+def update_user_snapshot(client, now=None):
+    """Rebuild the user location snapshot.
+
+    Returns:
+      a list holding the written snapshot entity
+    """
+    if now is None:
+        now = datetime.datetime.utcnow()
+    locations = []
+    for entity in _fetch_all(client.query(kind="User")):
+        if entity.has_key('geocoded_location'):
+            locations.append(entity['geocoded_location'])
+    entities = _snapshot_entities(client, USERS, None, aggregate(locations), now)
+    client.put_multi(entities)
+    return entities[:1]
+
+
+def update_photo_snapshots(client, now=None):
+    """Add photos confirmed and uploaded since the last update to the
+    per-image_bucket photo snapshots.
+
+    Returns:
+      the written snapshot entities, one per image_bucket
+    """
+    if now is None:
+        now = datetime.datetime.utcnow()
+    snapshots = dict((entity['image_bucket'], entity)
+                     for entity in load_snapshots(client, PHOTOS))
+    cells = dict((image_bucket, snapshot_cells(client, entity))
+                 for image_bucket, entity in snapshots.iteritems())
+    watermarks = [entity['watermark'] for entity in snapshots.itervalues()
+                  if entity['watermark'] is not None]
+    watermark = min(watermarks) if watermarks else None
+    # Photos in the re-scanned window which are already counted
+    counted = set()
+    for entity in snapshots.itervalues():
+        counted.update(json.loads(entity.get('recent_keys') or '[]'))
+
+    filters = [('confirmed_by_user', '=', True)]
+    if watermark is not None:
+        filters.append(('uploaded_date', '>=', watermark - WATERMARK_LAG))
+    query = client.query(kind="Photo", filters=filters, order=['uploaded_date'])
+
+    locations = {}
+    uploaded = {}
+    for entity in _fetch_all(query):
+        key = entity.key.id_or_name
+        if entity.has_key('uploaded_date'):
+            # datetimes can't be compared with None
+            if watermark is None or entity['uploaded_date'] > watermark:
+                watermark = entity['uploaded_date']
+            uploaded[key] = entity['uploaded_date'], entity.get('image_bucket')
+        if key in counted:
+            continue
+        if entity.has_key('lat') and entity.has_key('lon'):
+            # Negate longitude because photo longitude is stored as positive-West, but
+            # code needs negative-West.
+            location = entity['lat'], -entity['lon']
+            locations.setdefault(entity.get('image_bucket'), []).append(location)
+
+    for image_bucket, bucket_locations in locations.iteritems():
+        cells[image_bucket] = aggregate(bucket_locations, cells.get(image_bucket))
+
+    recent_keys = {}
+    if watermark is not None:
+        for key, (uploaded_date, image_bucket) in uploaded.iteritems():
+            if uploaded_date >= watermark - WATERMARK_LAG:
+                recent_keys.setdefault(image_bucket, []).append(key)
+
+    snapshots = []
+    entities = []
+    for image_bucket, bucket_cells in cells.iteritems():
+        bucket_entities = _snapshot_entities(client, PHOTOS, image_bucket, bucket_cells, now,
+                                             watermark, recent_keys.get(image_bucket, ()))
+        snapshots.append(bucket_entities[0])
+        entities.extend(bucket_entities)
+    if entities:
+        client.put_multi(entities)
+    return snapshots
+
+
+def update_snapshots(client, source, now=None):
+    """Update the snapshots for source and return the written snapshot entities."""
+    if source == USERS:
+        return update_user_snapshot(client, now)
+    else:
+        return update_photo_snapshots(client, now)
+
+
+def fresh_snapshots(client, source, max_age=None, now=None):
+    """Return the snapshots for source, updating them first if there are
+    none or if max_age (in seconds) is given and they are older."""
+    if now is None:
+        now = datetime.datetime.utcnow()
+    snapshots = load_snapshots(client, source)
+    stale = not snapshots
+    if max_age is not None:
+        oldest = min([entity['updated'].replace(tzinfo=None) for entity in snapshots] or [now])
+        stale = stale or (now - oldest).total_seconds() >= max_age
+    if stale:
+        # Serve what was written: a query right after the put might not
+        # see it yet
+        snapshots = update_snapshots(client, source, now)
+    return snapshots
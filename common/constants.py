@@ -90,6 +90,43 @@ MOVIE_DATA_DIR = "/tmp"
 MOVIE_FRAMERATE = "2"
 MOVIE_FPATH = "{0}/mov.mp4".format(MOVIE_DATA_DIR)
 C_MAP_FPATH = "{0}/map.png".format(MOVIE_DATA_DIR)
+MOVIE_FFMPEG_BIN = "ffmpeg"
+# Re-encode only the changed segments of the movie, then concatenate
+MOVIE_INCREMENTAL_ASSEMBLY = True
+MOVIE_SEGMENT_DIR = "{0}/segments".format(MOVIE_DATA_DIR)
+# Width of a movie segment, in adj_timestamp units
+MOVIE_SEGMENT_WIDTH = 0.01
+# Threads used to download photos, and the size of the local photo cache
+MOVIE_DOWNLOAD_THREADS = 32
+MOVIE_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+# Frames are streamed to ffmpeg in chunks of MOVIE_FEED_BUFFER_BYTES, read
+# at most MOVIE_FEED_READ_AHEAD chunks ahead
+MOVIE_FEED_BUFFER_BYTES = 1024 * 1024
+MOVIE_FEED_READ_AHEAD = 4
+# Hand ffmpeg a concat manifest of the frames instead of piping them
+MOVIE_FEED_CONCAT_MANIFEST = False
+# Also render the movie at every rung of MOVIE_LADDER, decoding the
+# frames once, and upload the rungs next to the movie
+MOVIE_LADDER_ENABLED = False
+MOVIE_LADDER_DIR = "{0}/ladder".format(MOVIE_DATA_DIR)
+# Each rung has an output fname (relative to MOVIE_LADDER_DIR), the
+# argument of the scale filter, and the ffmpeg output arguments.
+MOVIE_LADDER = [
+    {'fname': 'thumbnail.gif', 'scale': '320:-2', 'args': []},
+    {'fname': 'thumbnail.webm', 'scale': '320:-2',
+     'args': ['-vcodec', 'libvpx', '-b:v', '200k']},
+    {'fname': '720p.mp4', 'scale': '-2:720',
+     'args': ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p']},
+    {'fname': '1080p.mp4', 'scale': '-2:1080',
+     'args': ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p']},
+]
+# Optional HLS rung; add it to MOVIE_LADDER to publish HLS segments
+MOVIE_LADDER_HLS = {
+    'fname': 'hls/index.m3u8', 'scale': '-2:720', 'multiple_files': True,
+    'args': ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p',
+             '-f', 'hls', '-hls_time', '4', '-hls_playlist_type', 'vod',
+             '-hls_segment_filename', '{0}/hls/segment%03d.ts'.format(MOVIE_LADDER_DIR)]
+}
 
 # Pipeline stats constants
 MIN_PHOTOS_IN_CLUSTER = 100
@@ -15,10 +15,12 @@
 
 import string
 from geometry import ratio_to_decimal
+import calendar
 import datetime
 import logging
 import googlemaps
 from common.secret_keys import GOOGLE_MAPS_API_KEY
+from common.timezones import get_resolver
 
 def _convert_gps_to_degrees(gps):
     # TODO(dek): use GeoPoint, http://gcloud-python.readthedocs.io/en/stable/_modules/gcloud/datastore/helpers.html
@@ -120,12 +122,18 @@ def exifread_tags_to_camera_datetime(tags):
     return camera_datetime
 
 def apply_timezone_offset(lat, lon, camera_datetime):
-    TIMEOUT=3
-    RETRY_TIMEOUT=5
-    gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY,
-                              timeout=TIMEOUT,
-                              retry_timeout=RETRY_TIMEOUT)
-    tz = gmaps.timezone((lat, lon))
+    # The camera clock is local time, so taking it as UTC for the
+    # timestamp is only off within hours of a DST change
+    timestamp = calendar.timegm(camera_datetime.timetuple())
+    tz = get_resolver().timezone(lat, lon, timestamp)
+    if tz is None:
+        # Outside the bundled time zones
+        TIMEOUT=3
+        RETRY_TIMEOUT=5
+        gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY,
+                                  timeout=TIMEOUT,
+                                  retry_timeout=RETRY_TIMEOUT)
+        tz = gmaps.timezone((lat, lon), timestamp=timestamp)
     offset = tz.get('rawOffset', 0)
     dstOffset = tz.get('dstOffset', 0)
     td = datetime.timedelta(seconds=offset + dstOffset)
@@ -0,0 +1,212 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline time zone lookups, answering the same questions as the Google
+Maps Time Zone API without a network call.
+
+Zone boundaries come from timezones.json, a simplified set of polygons
+for the time zones of the contiguous US, with (lon, lat) vertices.  The
+polygons are hand traced along state and county lines, and only accurate
+to a few kilometers, so locations within EDGE_MARGIN of any zone edge are
+not resolved.  Nor are locations in the excluded regions, areas inside a
+zone which follow other rules (the Navajo Nation observes DST inside
+Arizona).  Locations are found through a grid index over the polygons,
+and the offsets at a timestamp come from the tz database rules in pytz.
+Locations which aren't resolved return None, so that callers can fall
+back to the API.
+"""
+
+import calendar
+import datetime
+import json
+import math
+import os
+import pytz
+
+TIMEZONES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'timezones.json')
+# Size of the spatial index cells, in degrees
+CELL_SIZE = 0.5
+# Locations are resolved at this many decimal places (about 100m), so
+# nearby photos share one cache entry
+CACHE_PRECISION = 3
+CACHE_SIZE = 100000
+# Locations closer than this many degrees to a zone edge are left to the API
+EDGE_MARGIN = 0.2
+# The Time Zone API's timeZoneName for each tz database abbreviation
+ZONE_NAMES = {
+    'PST': 'Pacific Standard Time', 'PDT': 'Pacific Daylight Time',
+    'MST': 'Mountain Standard Time', 'MDT': 'Mountain Daylight Time',
+    'CST': 'Central Standard Time', 'CDT': 'Central Daylight Time',
+    'EST': 'Eastern Standard Time', 'EDT': 'Eastern Daylight Time',
+}
+
+def point_in_ring(x, y, ring):
+    """Ray casting test for whether (x, y) is inside the polygon ring, a
+    sequence of (x, y) vertices."""
+    inside = False
+    x0, y0 = ring[-1]
+    for x1, y1 in ring:
+        if (y1 > y) != (y0 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+            inside = not inside
+        x0, y0 = x1, y1
+    return inside
+
+def segment_distance(x, y, x0, y0, x1, y1):
+    """Distance from (x, y) to the segment from (x0, y0) to (x1, y1)."""
+    dx, dy = x1 - x0, y1 - y0
+    length = dx * dx + dy * dy
+    t = 0. if length == 0 else max(0., min(1., ((x - x0) * dx + (y - y0) * dy) / length))
+    return math.hypot(x - x0 - t * dx, y - y0 - t * dy)
+
+def ring_edges(ring):
+    """Returns the (x0, y0, x1, y1) edges of a polygon ring."""
+    return [ring[i - 1] + ring[i] for i in range(len(ring))]
+
+def _cells(x0, y0, x1, y1, cell_size):
+    """Returns the (row, column) cells overlapping the box."""
+    return [(row, column)
+            for row in range(int(math.floor(y0 / cell_size)), int(math.floor(y1 / cell_size)) + 1)
+            for column in range(int(math.floor(x0 / cell_size)), int(math.floor(x1 / cell_size)) + 1)]
+
+def _local_time(time_zone_id, timestamp):
+    tz = pytz.timezone(time_zone_id)
+    return pytz.utc.localize(datetime.datetime.utcfromtimestamp(timestamp)).astimezone(tz)
+
+def offsets(time_zone_id, timestamp):
+    """Returns the (rawOffset, dstOffset) in seconds of the time zone at
+    the POSIX timestamp, as the Time Zone API reports them."""
+    local = _local_time(time_zone_id, timestamp)
+    dst = local.dst()
+    raw = local.utcoffset() - dst
+    return int(raw.total_seconds()), int(dst.total_seconds())
+
+def zone_name(time_zone_id, timestamp):
+    """Returns the Time Zone API timeZoneName of the time zone at the
+    POSIX timestamp, e.g. "Central Daylight Time"."""
+    abbreviation = _local_time(time_zone_id, timestamp).tzname()
+    return ZONE_NAMES.get(abbreviation, abbreviation)
+
+class TimezoneResolver(object):
+    """
+    Resolves (lat, lon) locations to time zones from the bundled zone
+    boundaries.
+    """
+    def __init__(self, fname=TIMEZONES_FILE, cell_size=CELL_SIZE, margin=EDGE_MARGIN):
+        data = json.load(open(fname))
+        zones = data['zones']
+        self.cell_size = cell_size
+        self.margin = margin
+        self.time_zone_ids = [zone['timeZoneId'] for zone in zones]
+        # (zone index, ring) for every polygon, excluded regions first with
+        # zone None, so they take precedence over the zone around them
+        self.rings = [(None, [tuple(vertex) for vertex in polygon])
+                      for region in data.get('excluded', []) for polygon in region['polygons']]
+        self.rings += [(i, [tuple(vertex) for vertex in polygon])
+                       for i, zone in enumerate(zones) for polygon in zone['polygons']]
+        self._build_index()
+        self.cache = {}
+
+    def _build_index(self):
+        # Cells within the margin of an edge map to the nearby edges, and
+        # the rings whose bounding boxes overlap the cell.  Every other cell
+        # is wholly inside one zone (or none), found by testing the cell
+        # center once.
+        self.boundary_cells = {}
+        for index, (zone, ring) in enumerate(self.rings):
+            for x0, y0, x1, y1 in ring_edges(ring):
+                for cell in _cells(min(x0, x1) - self.margin, min(y0, y1) - self.margin,
+                                   max(x0, x1) + self.margin, max(y0, y1) + self.margin,
+                                   self.cell_size):
+                    self.boundary_cells.setdefault(cell, ([], []))[1].append((x0, y0, x1, y1))
+        bounds = [(min(xs), min(ys), max(xs), max(ys)) for xs, ys in
+                  (zip(*ring) for zone, ring in self.rings)]
+        for index, box in enumerate(bounds):
+            for cell in _cells(*(box + (self.cell_size,))):
+                if cell in self.boundary_cells:
+                    self.boundary_cells[cell][0].append(index)
+
+        # Cell -> zone index, or None for cells in an excluded region
+        self.zone_cells = {}
+        for index, box in enumerate(bounds):
+            zone, ring = self.rings[index]
+            for cell in _cells(*(box + (self.cell_size,))):
+                if cell in self.boundary_cells or cell in self.zone_cells:
+                    continue
+                row, column = cell
+                if point_in_ring((column + 0.5) * self.cell_size,
+                                 (row + 0.5) * self.cell_size, ring):
+                    self.zone_cells[cell] = zone
+
+    def _lookup(self, lat, lon):
+        cell = (int(math.floor(lat / self.cell_size)), int(math.floor(lon / self.cell_size)))
+        if cell in self.zone_cells:
+            return self.zone_cells[cell]
+        if cell not in self.boundary_cells:
+            return None
+        indexes, edges = self.boundary_cells[cell]
+        for edge in edges:
+            if segment_distance(lon, lat, *edge) < self.margin:
+                return None
+        for index in indexes:
+            zone, ring = self.rings[index]
+            if point_in_ring(lon, lat, ring):
+                return zone
+        return None
+
+    def time_zone_id(self, lat, lon):
+        """Returns the tz database id of the zone containing (lat, lon),
+        or None if it is outside the bundled zones, near a zone edge or in
+        an excluded region."""
+        key = (round(lat, CACHE_PRECISION), round(lon, CACHE_PRECISION))
+        try:
+            zone = self.cache[key]
+        except KeyError:
+            if len(self.cache) >= CACHE_SIZE:
+                self.cache.clear()
+            # Resolve the rounded location, so the result does not depend
+            # on which nearby location was seen first
+            zone = self.cache[key] = self._lookup(*key)
+        if zone is None:
+            return None
+        return self.time_zone_ids[zone]
+
+    def timezone(self, lat, lon, timestamp=None):
+        """Returns a Time Zone API style response for (lat, lon) at the
+        POSIX timestamp (default now), or None if the location can't be
+        resolved (see time_zone_id).
+        Returns:
+          dict with rawOffset and dstOffset in seconds, status, timeZoneId
+          and timeZoneName
+        """
+        time_zone_id = self.time_zone_id(lat, lon)
+        if time_zone_id is None:
+            return None
+        if timestamp is None:
+            timestamp = calendar.timegm(datetime.datetime.utcnow().timetuple())
+        raw_offset, dst_offset = offsets(time_zone_id, timestamp)
+        return {'dstOffset': dst_offset,
+                'rawOffset': raw_offset,
+                'status': 'OK',
+                'timeZoneId': time_zone_id,
+                'timeZoneName': zone_name(time_zone_id, timestamp)}
+
+_resolver = None
+
+def get_resolver():
+    """Returns the process wide TimezoneResolver, loading it on first use."""
+    global _resolver
+    if _resolver is None:
+        _resolver = TimezoneResolver()
+    return _resolver
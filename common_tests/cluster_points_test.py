@@ -0,0 +1,99 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2
+import numpy as np
+from sklearn.metrics import adjusted_rand_score
+from common import cluster_points
+
+# (lat, lon) of cities along and around the path of totality
+CITIES = [(44.5646, -123.2620), (43.6150, -116.2023), (43.0760, -107.2903),
+          (41.1400, -100.7601), (40.8136, -96.7026), (39.0997, -94.5786),
+          (38.6270, -90.1994), (37.0834, -88.6000), (36.1627, -86.7816),
+          (35.9606, -83.9207), (34.8526, -82.3940), (34.0007, -81.0348),
+          (32.7765, -79.9311), (47.6062, -122.3321), (37.7749, -122.4194),
+          (40.7128, -74.0060), (41.8781, -87.6298), (29.7604, -95.3698),
+          (33.7490, -84.3880), (39.7392, -104.9903)]
+
+def mock_locations(points_per_city=200, noise=1000, spread=0.03, seed=0):
+    """Returns photo-like locations: dense clumps around cities over a
+    sparse background spanning the continental US."""
+    random = np.random.RandomState(seed)
+    locations = [random.normal(city, spread, size=(points_per_city, 2)) for city in CITIES]
+    background = np.column_stack([random.uniform(24.5, 49, noise),
+                                  random.uniform(-124.5, -66.9, noise)])
+    return np.concatenate(locations + [background])
+
+def n_clusters(labels):
+    return len(set(labels)) - (1 if -1 in labels else 0)
+
+class ClusterPointsTest(unittest2.TestCase):
+    """
+    Tests for the clustering engines.
+    """
+
+    def test_grid_matches_dbscan(self):
+        locations = mock_locations()
+        dbscan = cluster_points.cluster_points(locations, eps=0.1, min_samples=10)
+        grid = cluster_points.grid_cluster_points(locations, eps=0.1, min_samples=10)
+        self.assertEqual(n_clusters(grid.labels_), n_clusters(dbscan.labels_))
+        self.assertGreater(adjusted_rand_score(dbscan.labels_, grid.labels_), 0.9)
+
+    def test_grid_equirectangular_matches_dbscan_haversine(self):
+        locations = mock_locations(seed=1)
+        dbscan = cluster_points.DBSCAN(eps=np.radians(0.1), min_samples=10,
+                                       metric='haversine',
+                                       algorithm='ball_tree').fit(np.radians(locations))
+        grid = cluster_points.grid_cluster_points(locations, eps=0.1, min_samples=10,
+                                                  metric='equirectangular')
+        self.assertEqual(n_clusters(grid.labels_), n_clusters(dbscan.labels_))
+        self.assertGreater(adjusted_rand_score(dbscan.labels_, grid.labels_), 0.9)
+
+    def test_grid_clusters(self):
+        # Two dense clumps in touching cells, one far away, and a stray point
+        locations = [(0.01, 0.01)] * 3 + [(0.11, 0.11)] * 3 + [(5.05, 5.05)] * 3 + \
+                    [(0.21, 0.05)] + [(9.0, 9.0)]
+        labels = cluster_points.grid_cluster_points(locations, eps=0.1, min_samples=3).labels_
+        self.assertEqual(len(set(labels[:6])), 1)
+        self.assertEqual(len(set(labels[6:9])), 1)
+        self.assertNotEqual(labels[0], labels[6])
+        # Border point next to a dense cell, and noise
+        self.assertEqual(labels[9], labels[0])
+        self.assertEqual(labels[10], -1)
+
+    def test_grid_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            cluster_points.grid_cluster_points(CITIES, eps=0.1, min_samples=3, metric='haversine')
+
+    def test_grid_empty(self):
+        labels = cluster_points.grid_cluster_points([], eps=0.1, min_samples=3).labels_
+        self.assertEqual(len(labels), 0)
+
+    def test_compute_centers(self):
+        locations = [(0., 0.), (2., 4.), (10., 10.), (5., 5.)]
+        clusters = cluster_points.GridClusters(np.array([0, 0, 1, -1]))
+        centers, sizes = cluster_points.compute_centers(clusters, locations)
+        self.assertEqual(sorted(centers), [0, 1])
+        self.assertTrue(np.allclose(centers[0], [1., 2.]))
+        self.assertTrue(np.allclose(centers[1], [10., 10.]))
+        self.assertEqual(sizes, {0: 2, 1: 1})
+
+        centers, sizes = cluster_points.compute_centers(clusters, locations,
+                                                        suppress_negative=False)
+        self.assertTrue(np.allclose(centers[-1], [5., 5.]))
+        self.assertEqual(sizes[-1], 1)
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,91 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2
+import numpy as np
+from common import cluster_points
+from common import cluster_snapshots
+
+def mock_locations(seed=0):
+    random = np.random.RandomState(seed)
+    clumps = [random.normal(center, 0.03, size=(100, 2))
+              for center in [(44.56, -123.26), (36.16, -86.78), (32.78, -79.93)]]
+    background = np.column_stack([random.uniform(24.5, 49, 300),
+                                  random.uniform(-124.5, -66.9, 300)])
+    return np.concatenate(clumps + [background])
+
+def sorted_clusters(points):
+    return sorted((round(lat, 6), round(lon, 6), size) for (lat, lon), size in points)
+
+class ClusterSnapshotsTest(unittest2.TestCase):
+    """
+    Tests for the cluster snapshot aggregates.
+    """
+
+    def test_matches_grid_cluster_points(self):
+        locations = mock_locations()
+        clusters = cluster_points.grid_cluster_points(locations, eps=0.1, min_samples=10)
+        centers, sizes = cluster_points.compute_centers(clusters, locations)
+        expected = [((centers[label][0], centers[label][1]), sizes[label]) for label in centers]
+
+        cells = cluster_snapshots.aggregate(locations)
+        points = cluster_snapshots.clusters_from_cells(cells)
+        self.assertEqual(len(points), 3)
+        self.assertEqual(sorted_clusters(points), sorted_clusters(expected))
+
+    def test_incremental_aggregate(self):
+        locations = mock_locations(seed=1)
+        cells = cluster_snapshots.aggregate(locations[:250])
+        # Snapshots round trip through packed cells between updates
+        cells = cluster_snapshots.unpack_cells(cluster_snapshots.pack_cells(cells))
+        cells = cluster_snapshots.aggregate(locations[250:], cells)
+        self.assertEqual(sorted_clusters(cluster_snapshots.clusters_from_cells(cells)),
+                         sorted_clusters(cluster_snapshots.clusters_from_cells(
+                             cluster_snapshots.aggregate(locations))))
+
+    def test_merge(self):
+        locations = mock_locations(seed=2)
+        merged = cluster_snapshots.merge([cluster_snapshots.aggregate(locations[::2]),
+                                          cluster_snapshots.aggregate(locations[1::2])])
+        self.assertEqual(sorted_clusters(cluster_snapshots.clusters_from_cells(merged)),
+                         sorted_clusters(cluster_snapshots.clusters_from_cells(
+                             cluster_snapshots.aggregate(locations))))
+
+    def test_large_snapshot(self):
+        # About as many cells as a worldwide photo snapshot at EPS could have
+        random = np.random.RandomState(3)
+        locations = np.column_stack([random.uniform(-60, 70, 200000),
+                                     random.uniform(-180, 180, 200000)])
+        cells = cluster_snapshots.aggregate(locations)
+        self.assertGreater(len(cells), 100000)
+        shards = cluster_snapshots.split_cells(cells)
+        self.assertEqual(len(shards), -(-len(cells) // cluster_snapshots.SHARD_CELLS))
+        unpacked = {}
+        for shard in shards:
+            blob = cluster_snapshots.pack_cells(shard)
+            # Datastore entities are limited to 1 MiB
+            self.assertLess(len(blob), 1000000)
+            cluster_snapshots.unpack_cells(blob, unpacked)
+        self.assertEqual(unpacked, cells)
+
+    def test_empty(self):
+        self.assertEqual(cluster_snapshots.aggregate([]), {})
+        self.assertEqual(cluster_snapshots.clusters_from_cells({}), [])
+        self.assertEqual(cluster_snapshots.merge([]), {})
+        self.assertEqual(cluster_snapshots.split_cells({}), [{}])
+        self.assertEqual(cluster_snapshots.unpack_cells(cluster_snapshots.pack_cells({})), {})
+
+if __name__ == '__main__':
+    unittest2.main()
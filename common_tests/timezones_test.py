@@ -0,0 +1,126 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import calendar
+import json
+import os
+import unittest2
+import numpy as np
+from common import timezones
+from common.timezones import TimezoneResolver, point_in_ring, ring_edges, segment_distance
+
+# Expected Time Zone API style responses for locations along and around
+# the path of totality, on eclipse day and in winter.  These were generated
+# from the tz database zone of each location, not recorded from the API;
+# the zone of each location was assigned independently of timezones.json.
+RESPONSES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'expected_timezones.json')
+
+# Outside the bundled zones: Honolulu, Toronto, Regina, Mexico City and
+# the Atlantic
+OUTSIDE = [(21.3069, -157.8583), (43.6532, -79.3832), (50.4452, -104.6189),
+           (19.4326, -99.1332), (30.0, -60.0)]
+# Left to the API: Tuba City, Kayenta and Window Rock in the Navajo Nation,
+# which observes DST inside Arizona; near the Nevada/Utah line; near the
+# North/South Dakota Mountain/Central line; and near the Florida panhandle
+# Central/Eastern line
+NOT_RESOLVED = [(36.1350, -111.2399), (36.7278, -110.2546), (35.6803, -109.0526),
+                (40.0, -114.1), (46.0, -100.55), (30.5, -84.95)]
+
+def brute_force(resolver, lat, lon):
+    """The zone of (lat, lon), testing every edge and polygon."""
+    for zone, ring in resolver.rings:
+        for edge in ring_edges(ring):
+            if segment_distance(lon, lat, *edge) < resolver.margin:
+                return None
+    for zone, ring in resolver.rings:
+        if point_in_ring(lon, lat, ring):
+            return zone
+    return None
+
+class TimezonesTest(unittest2.TestCase):
+    """
+    Tests for the offline time zone resolver.
+    """
+
+    def setUp(self):
+        self.resolver = TimezoneResolver()
+
+    def test_matches_expected_responses(self):
+        responses = json.load(open(RESPONSES_FILE))
+        self.assertGreater(len(responses), 100)
+        resolved = 0
+        for response in responses:
+            lat, lon = [float(x) for x in response['location'].split(',')]
+            tz = self.resolver.timezone(lat, lon, response['timestamp'])
+            if tz is None:
+                # Near a zone edge, and left to the API
+                continue
+            resolved += 1
+            # The bundled zones have one id per set of rules (so Boise
+            # resolves to America/Denver), and only the offsets and names
+            # must agree
+            expected = response['response']
+            self.assertEqual((tz['status'], tz['rawOffset'], tz['dstOffset'], tz['timeZoneName']),
+                             (expected['status'], expected['rawOffset'], expected['dstOffset'],
+                              expected['timeZoneName']),
+                             response['name'])
+        self.assertGreater(resolved, 0.8 * len(responses))
+
+    def test_outside(self):
+        for lat, lon in OUTSIDE:
+            self.assertIsNone(self.resolver.timezone(lat, lon))
+
+    def test_not_resolved(self):
+        for lat, lon in NOT_RESOLVED:
+            self.assertIsNone(self.resolver.timezone(lat, lon), (lat, lon))
+        # Flagstaff, outside the Navajo Nation, has no DST
+        self.assertEqual(self.resolver.time_zone_id(35.1983, -111.6513), 'America/Phoenix')
+
+    def test_zone_name(self):
+        eclipse = calendar.timegm((2017, 8, 21, 18, 0, 0))
+        self.assertEqual(timezones.zone_name('America/Chicago', eclipse), 'Central Daylight Time')
+        self.assertEqual(timezones.zone_name('America/Phoenix', eclipse), 'Mountain Standard Time')
+
+    def test_dst_transition(self):
+        # Clocks in Chicago went forward at 2am CST on 2017/03/12, 08:00 UTC
+        transition = calendar.timegm((2017, 3, 12, 8, 0, 0))
+        self.assertEqual(timezones.offsets('America/Chicago', transition - 1), (-21600, 0))
+        self.assertEqual(timezones.offsets('America/Chicago', transition), (-21600, 3600))
+        self.assertEqual(timezones.offsets('America/Phoenix', transition), (-25200, 0))
+
+    def test_index_matches_brute_force(self):
+        # The grid index gives the same zones as testing every edge and
+        # polygon
+        random = np.random.RandomState(0)
+        points = np.column_stack([random.uniform(24, 50, 5000),
+                                  random.uniform(-126, -66, 5000)])
+        for lat, lon in points:
+            self.assertEqual(self.resolver._lookup(lat, lon), brute_force(self.resolver, lat, lon))
+
+    def test_cache(self):
+        self.assertEqual(self.resolver.time_zone_id(36.16271, -86.78159), 'America/Chicago')
+        self.assertEqual(self.resolver.cache, {(36.163, -86.782): 3})
+        # Nearby locations share the rounded location's entry
+        self.assertEqual(self.resolver.time_zone_id(36.16268, -86.78161), 'America/Chicago')
+        self.assertEqual(len(self.resolver.cache), 1)
+        self.resolver.time_zone_id(21.3069, -157.8583)
+        self.assertEqual(self.resolver.cache[(21.307, -157.858)], None)
+
+    def test_get_resolver(self):
+        self.assertIs(timezones.get_resolver(), timezones.get_resolver())
+
+if __name__ == '__main__':
+    unittest2.main()
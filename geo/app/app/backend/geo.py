@@ -18,12 +18,20 @@ import datetime
 import googlemaps
 import logging
 from common.secret_keys import GOOGLE_MAPS_API_KEY
+from common.timezones import get_resolver
 
 from app_module import AppModule
 
 # googlemaps API timeouts
 TIMEOUT=10
 RETRY_TIMEOUT=20
+# Most (location, timestamp) pairs accepted in one batch request
+MAX_BATCH_SIZE=10000
+
+def parse_location(location):
+    """Parses a 'lat,lon' string as the Time Zone API accepts it."""
+    lat, lon = location.split(',')
+    return float(lat), float(lon)
 
 class Geo(AppModule):
     """
@@ -37,11 +45,13 @@ class Geo(AppModule):
 
         self._routes = (
             ('/', 'root', self.root, ('GET',)),
-            ('/timezone', 'timezone', self.timezone, ('GET',)))
+            ('/timezone', 'timezone', self.timezone, ('GET',)),
+            ('/timezone/batch', 'timezone_batch', self.timezone_batch, ('POST',)))
 
         self.gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY,
                                        timeout=TIMEOUT,
                                        retry_timeout=RETRY_TIMEOUT)
+        self.resolver = get_resolver()
 
     def root(self):
         return flask.Response('OK', status=200)
@@ -50,6 +60,8 @@ class Geo(AppModule):
         location = flask.request.args.get('location')
         timestamp = flask.request.args.get('timestamp')
         try:
+            # Always the API, so the response has the exact zone id and
+            # name; the bundled zones only serve batch lookups
             tz = self.gmaps.timezone(location=location, timestamp = timestamp)
         except googlemaps.exceptions.Timeout:
             return flask.Response('Timeout exceeded', status=408)
@@ -63,4 +75,43 @@ class Geo(AppModule):
         else:
             return flask.jsonify(tz)
 
+    def resolve(self, location, timestamp):
+        """Resolves location at timestamp from the bundled time zones,
+        falling back to the Time Zone API where they can't place it.  The
+        bundled zones have one timeZoneId per set of rules, so the id may
+        differ from the API's (America/Denver for Boise), but the offsets
+        and timeZoneName agree."""
+        lat, lon = parse_location(location)
+        if timestamp is not None:
+            timestamp = int(timestamp)
+        tz = self.resolver.timezone(lat, lon, timestamp)
+        if tz is None:
+            tz = self.gmaps.timezone(location=(lat, lon), timestamp=timestamp)
+        return tz
+
+    def timezone_batch(self):
+        """Resolves many (location, timestamp) pairs in one request.  The
+        request body is JSON: {"requests": [{"location": "lat,lon",
+        "timestamp": seconds}, ...]}, and the response has a Time Zone
+        API style result for each, in order, from resolve."""
+        body = flask.request.get_json(silent=True)
+        if not isinstance(body, dict) or not isinstance(body.get('requests'), list):
+            return flask.Response('Expected a JSON list of requests', status=400)
+        requests = body['requests']
+        if len(requests) > MAX_BATCH_SIZE:
+            return flask.Response('At most %d requests per batch' % MAX_BATCH_SIZE, status=400)
+
+        results = []
+        for request in requests:
+            try:
+                results.append(self.resolve(request['location'], request.get('timestamp')))
+            except (KeyError, AttributeError, TypeError, ValueError):
+                results.append({'status': 'INVALID_REQUEST'})
+            except googlemaps.exceptions.ApiError as e:
+                results.append({'status': e.status})
+            except Exception as e:
+                logging.error("Batch timezone lookup failed, request: %s" % str(request))
+                results.append({'status': 'UNKNOWN_ERROR'})
+        return flask.jsonify(results=results)
+
 geo = Geo()
@@ -0,0 +1,165 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import resource
+import threading
+import time
+import Queue
+
+from common import constants
+
+# Markers put on the queue after the chunks of a file
+_END = object()
+_FAILED = object()
+_ABORTED = object()
+# How often a blocked reader checks whether the writer has stopped, in seconds
+_PUT_TIMEOUT = 0.1
+
+
+class FeedError(IOError):
+    """
+    A file failed part way through, after some of it was written, so the
+    stream holds a partial image.
+    """
+
+
+def _put(queue, item, stop):
+    """
+    Puts item on queue, giving up if stop is set while the queue is full.
+    Returns True if the item was queued.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except Queue.Full:
+            pass
+    return False
+
+
+def _read_files(fpaths, queue, buffer_size, stop):
+    """
+    Reads each file onto queue in chunks of buffer_size bytes, followed by
+    an end marker. A file which can't be read before any of it is queued
+    is followed by a failure marker instead and skipped. A file which
+    fails after some of it was queued is followed by an abort marker, and
+    no more files are read. Stops early if stop is set.
+    """
+    for fpath in fpaths:
+        queued = False
+        try:
+            with open(fpath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                num_bytes = 0
+                # Each chunk is held back until the next read succeeds, so a
+                # file which fits in one chunk is only queued once it has
+                # been read in full
+                pending = None
+                while True:
+                    chunk = f.read(buffer_size)
+                    if not chunk:
+                        break
+                    if pending is not None:
+                        if not _put(queue, (fpath, pending), stop):
+                            return
+                        queued = True
+                    pending = chunk
+                    num_bytes += len(chunk)
+                if num_bytes != size:
+                    msg = 'Read {0} of {1} bytes'
+                    raise IOError(msg.format(num_bytes, size))
+                if pending is not None:
+                    if not _put(queue, (fpath, pending), stop):
+                        return
+        except Exception, e:
+            msg = 'Failed to read {0}.'
+            logging.exception(msg.format(fpath))
+            if queued:
+                _put(queue, (fpath, _ABORTED), stop)
+                return
+            if not _put(queue, (fpath, _FAILED), stop):
+                return
+            continue
+        if not _put(queue, (fpath, _END), stop):
+            return
+    _put(queue, None, stop)
+
+
+def feed_files(stdin, fpaths, buffer_size=constants.MOVIE_FEED_BUFFER_BYTES,
+               read_ahead=constants.MOVIE_FEED_READ_AHEAD):
+    """
+    Streams the files in fpaths, in order, to stdin (the stdin of an
+    ffmpeg subprocess). Files are read on a background thread at most
+    read_ahead chunks of buffer_size bytes ahead of the writer, so disk
+    reads overlap with encoding and memory use is bounded by the queue.
+    Files which can't be read are skipped; a file which fails after part
+    of it was written raises FeedError, and the encode must be discarded.
+    Returns the list of fpaths written in full.
+    """
+    queue = Queue.Queue(maxsize=read_ahead)
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_files, args=(fpaths, queue, buffer_size, stop))
+    reader.daemon = True
+    reader.start()
+
+    written = []
+    num_bytes = 0
+    start = time.time()
+    try:
+        while True:
+            item = queue.get()
+            if item is None:
+                break
+            fpath, chunk = item
+            if chunk is _END:
+                written.append(fpath)
+            elif chunk is _ABORTED:
+                msg = 'Failed part way through {0}'
+                raise FeedError(msg.format(fpath))
+            elif chunk is not _FAILED:
+                stdin.write(chunk)
+                num_bytes += len(chunk)
+    finally:
+        # Release the reader if the writer failed with the queue full
+        stop.set()
+        while True:
+            try:
+                queue.get_nowait()
+            except Queue.Empty:
+                break
+        reader.join()
+
+    elapsed = max(time.time() - start, 1e-6)
+    msg = 'Fed {0} frames ({1} bytes) to ffmpeg in {2:.2f}s: {3:.1f} frames/s, ' \
+          '{4:.1f} MB/s, peak RSS {5} KB'
+    logging.info(msg.format(len(written), num_bytes, elapsed, len(written) / elapsed,
+                            num_bytes / elapsed / 1e6,
+                            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+    return written
+
+
+def write_concat_manifest(fpath, fpaths, framerate=constants.MOVIE_FRAMERATE):
+    """
+    Writes an ffmpeg concat demuxer manifest which shows each image in
+    fpaths, in order, for one frame at framerate.
+    """
+    duration = 1. / float(framerate)
+    with open(fpath, 'w') as f:
+        f.write('ffconcat version 1.0\n')
+        for image_fpath in fpaths:
+            f.write("file '{0}'\n".format(image_fpath.replace("'", "'\\''")))
+            f.write('duration {0}\n'.format(duration))
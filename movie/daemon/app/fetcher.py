@@ -0,0 +1,195 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+from common import config, constants
+import common.service_account as sa
+
+MANIFEST_FNAME = 'fetcher_manifest.json'
+
+
+def get_processed_photos_bucket():
+    """
+    Returns the processed photos bucket, through a new storage client.
+    """
+    from google.cloud import storage
+    storage_client = storage.client.Client(project=config.PROJECT_ID, \
+                                           credentials=sa.get_credentials())
+    return storage_client.get_bucket(config.GCS_PROCESSED_PHOTOS_BUCKET)
+
+
+def file_md5(fpath):
+    md5 = hashlib.md5()
+    with open(fpath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            md5.update(block)
+    return base64.b64encode(md5.digest())
+
+
+class Fetcher():
+    """
+    Long-lived concurrent downloader of processed photos into a local
+    cache directory.
+
+    Downloads run on a pool of threads which is created once. Each thread
+    creates its own storage client and bucket on first use and reuses it.
+    Files are downloaded to a temporary name and renamed into place, and
+    a manifest records the size and md5 of each complete download, so
+    partial or corrupt files are never treated as cached. Cached files are
+    checked against their size on every use, and against their md5 on the
+    first use by each Fetcher. When the cache exceeds max_bytes the least
+    recently used files are evicted.
+    """
+
+    def __init__(self, directory=constants.MOVIE_DATA_DIR,
+                 max_bytes=constants.MOVIE_CACHE_MAX_BYTES,
+                 threads=constants.MOVIE_DOWNLOAD_THREADS,
+                 bucket_factory=get_processed_photos_bucket):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.bucket_factory = bucket_factory
+        self.manifest_fpath = os.path.join(directory, MANIFEST_FNAME)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        # fname -> {'size': bytes, 'md5': base64 md5, 'used': last use time}
+        self.manifest = self._load()
+        # fnames whose md5 has been checked since the Fetcher was created
+        self.verified = set()
+        self.pool = ThreadPool(threads)
+
+    def close(self):
+        self.pool.terminate()
+
+    def fetch_all(self, fnames):
+        """
+        Makes sure all fnames are in the cache, downloading them as needed,
+        then evicts files not in fnames if the cache is over budget.
+        Returns a list of booleans, True where the file is available.
+        """
+        results = self.pool.map(self.fetch, fnames)
+        self.evict(set(fnames))
+        self.save()
+        return results
+
+    def fetch(self, fname):
+        """
+        Makes sure fname is in the cache. Returns True on success.
+        """
+        fpath = os.path.join(self.directory, fname)
+        with self.lock:
+            entry = self.manifest.get(fname)
+            verified = fname in self.verified
+        if entry is not None and os.path.exists(fpath) and \
+           os.path.getsize(fpath) == entry['size'] and \
+           (verified or file_md5(fpath) == entry['md5']):
+            with self.lock:
+                entry['used'] = time.time()
+                self.verified.add(fname)
+            return True
+
+        try:
+            blob = self._bucket().get_blob(fname)
+        except Exception, e:
+            msg = 'Failed to download {0} from Cloud Storage.'
+            logging.exception(msg.format(fname))
+            return False
+        if not blob:
+            msg = 'Failed to download blob {0} from Cloud Storage.'
+            logging.error(msg.format(fname))
+            return False
+
+        fd, tmp_fpath = tempfile.mkstemp(prefix='.' + fname, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w+') as file_obj:
+                blob.download_to_file(file_obj)
+            md5 = file_md5(tmp_fpath)
+            if blob.md5_hash is not None and blob.md5_hash != md5:
+                msg = 'Checksum mismatch downloading {0}'
+                logging.error(msg.format(fname))
+                os.remove(tmp_fpath)
+                return False
+            os.rename(tmp_fpath, fpath)
+        except Exception, e:
+            msg = 'Failed to download {0} from Cloud Storage.'
+            logging.exception(msg.format(fname))
+            if os.path.exists(tmp_fpath):
+                os.remove(tmp_fpath)
+            return False
+
+        with self.lock:
+            self.manifest[fname] = {'size': os.path.getsize(fpath),
+                                    'md5': md5,
+                                    'used': time.time()}
+            self.verified.add(fname)
+        msg = 'Successfully downloaded {0} from GCS'
+        logging.info(msg.format(fname))
+        return True
+
+    def cached_bytes(self):
+        return sum(entry['size'] for entry in self.manifest.itervalues())
+
+    def evict(self, keep=()):
+        """
+        Removes least recently used files, other than those in keep, until
+        the cache is within max_bytes.
+        """
+        total = self.cached_bytes()
+        if total <= self.max_bytes:
+            return
+        by_use = sorted(self.manifest.iteritems(), key=lambda item: item[1]['used'])
+        for fname, entry in by_use:
+            if total <= self.max_bytes:
+                break
+            if fname in keep:
+                continue
+            fpath = os.path.join(self.directory, fname)
+            if os.path.exists(fpath):
+                os.remove(fpath)
+            del self.manifest[fname]
+            self.verified.discard(fname)
+            total -= entry['size']
+
+    def save(self):
+        tmp_fpath = self.manifest_fpath + '.tmp'
+        with self.lock:
+            with open(tmp_fpath, 'w') as f:
+                json.dump(self.manifest, f)
+        os.rename(tmp_fpath, self.manifest_fpath)
+
+    def _bucket(self):
+        bucket = getattr(self.local, 'bucket', None)
+        if bucket is None:
+            bucket = self.local.bucket = self.bucket_factory()
+        return bucket
+
+    def _load(self):
+        if not os.path.exists(self.manifest_fpath):
+            return {}
+        try:
+            with open(self.manifest_fpath) as f:
+                return json.load(f)
+        except ValueError:
+            msg = 'Ignoring corrupt download manifest {0}'
+            logging.exception(msg.format(self.manifest_fpath))
+            return {}
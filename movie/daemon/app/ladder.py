@@ -0,0 +1,103 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import subprocess
+
+from common import constants
+
+
+def rung_fpath(rung, directory=constants.MOVIE_LADDER_DIR):
+    return os.path.join(directory, rung['fname'])
+
+
+def ladder_cmd(ffmpeg, input_args, outputs):
+    """
+    Returns an ffmpeg command which decodes the input once and encodes it
+    to every output, through a split/scale filter graph.
+
+    Arguments:
+      input_args: ffmpeg arguments describing the input, ending in -i <input>
+      outputs: a list of (scale, output arguments, output fpath) tuples,
+        where scale is the argument of the scale filter, e.g. "-2:720"
+    """
+    labels = ['[s{0}]'.format(i) for i in range(len(outputs))]
+    graph = ['[0:v]split={0}{1}'.format(len(outputs), ''.join(labels))]
+    for i, (scale, args, fpath) in enumerate(outputs):
+        graph.append('{0}scale={1}[o{2}]'.format(labels[i], scale, i))
+
+    cmd = [ffmpeg, "-y", "-loglevel", "panic"] + list(input_args)
+    cmd.extend(["-filter_complex", ';'.join(graph)])
+    for i, (scale, args, fpath) in enumerate(outputs):
+        cmd.extend(["-map", "[o{0}]".format(i)])
+        cmd.extend(args)
+        cmd.append(fpath)
+    return cmd
+
+
+def ladder_outputs(rungs=constants.MOVIE_LADDER, directory=constants.MOVIE_LADDER_DIR):
+    """
+    Returns the ladder_cmd outputs for the rungs, creating the directories
+    they are written to.
+    """
+    outputs = []
+    for rung in rungs:
+        fpath = rung_fpath(rung, directory)
+        if not os.path.exists(os.path.dirname(fpath)):
+            os.makedirs(os.path.dirname(fpath))
+        outputs.append((rung['scale'], rung['args'], fpath))
+    return outputs
+
+
+def render_ladder(input_args, output_args=(), rungs=constants.MOVIE_LADDER,
+                  directory=constants.MOVIE_LADDER_DIR,
+                  ffmpeg=constants.MOVIE_FFMPEG_BIN):
+    """
+    Renders the rungs from the source frames described by input_args,
+    decoding them once. Rungs must be rendered from the frames rather
+    than an encoded movie, or the larger rungs are upscaled from the
+    movie's lossy encode. output_args are added to every rung's output
+    arguments. Returns True on success.
+    """
+    outputs = [(scale, list(output_args) + list(args), fpath)
+               for scale, args, fpath in ladder_outputs(rungs, directory)]
+    cmd = ladder_cmd(ffmpeg, input_args, outputs)
+    if subprocess.call(cmd) != 0:
+        msg = 'Failed to render movie ladder from {0}'
+        logging.error(msg.format(' '.join(input_args)))
+        return False
+    return True
+
+
+def ladder_files(rungs=constants.MOVIE_LADDER, directory=constants.MOVIE_LADDER_DIR):
+    """
+    Returns a list of (name, fpath) for every file written by the rungs,
+    with names relative to directory. Rungs which write several files
+    (e.g. HLS playlists and their segments) list their whole directory.
+    """
+    results = []
+    for rung in rungs:
+        fpath = rung_fpath(rung, directory)
+        if rung.get('multiple_files'):
+            rung_directory = os.path.dirname(fpath)
+            fpaths = sorted(os.path.join(rung_directory, fname)
+                            for fname in os.listdir(rung_directory))
+        else:
+            fpaths = [fpath]
+        for fpath in fpaths:
+            if os.path.exists(fpath):
+                results.append((os.path.relpath(fpath, directory), fpath))
+    return results
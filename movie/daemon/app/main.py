@@ -23,8 +23,10 @@ from common import config, constants
 from common import datastore_schema as ds
 import common.service_account as sa
 
+import fetcher
 import pipeline
 import pipeline_stats
+import segments
 
 # Used when running locally
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = constants.SERVICE_ACCOUNT_PATH
@@ -45,7 +47,12 @@ def main(sleep_time=constants.MOVIE_DAEMON_SLEEP_TIME_S):
                                            credentials=credentials)
 
     # Create new instance of movie pipeline w/ datastore & GCS
-    movie_pipeline = pipeline.Pipeline(datastore_client, storage_client)
+    segment_index = None
+    if constants.MOVIE_INCREMENTAL_ASSEMBLY:
+        segment_index = segments.SegmentIndex(constants.MOVIE_SEGMENT_DIR)
+    movie_fetcher = fetcher.Fetcher(constants.MOVIE_DATA_DIR)
+    movie_pipeline = pipeline.Pipeline(datastore_client, storage_client,
+                                       segment_index, movie_fetcher)
     movie_stats = pipeline_stats.Pipeline_Stats(datastore_client, storage_client)
 
     while True:
@@ -59,7 +66,10 @@ def main(sleep_time=constants.MOVIE_DAEMON_SLEEP_TIME_S):
             clusters = movie_stats.get_clusters(fnames)
 
             # Concatenates frames into movies and stores in constants.MOVIE_DATA_DIR
-            files_in_movie = movie_pipeline.assemble(fnames)
+            if constants.MOVIE_INCREMENTAL_ASSEMBLY:
+                files_in_movie = movie_pipeline.assemble_incremental(fnames)
+            else:
+                files_in_movie = movie_pipeline.assemble(fnames)
 
             # Upload movie file(s)
             if files_in_movie:
@@ -16,6 +16,7 @@
 from datetime import datetime
 import logging
 import subprocess
+import time
 from multiprocessing import Pool
 from itertools import compress
 
@@ -27,6 +28,10 @@ from common import datastore_schema as ds
 import common.service_account as sa
 from common.chunks import chunks
 
+import feeder
+import ladder
+import segments
+
 def get_file_from_gcs(fname):
     """
     Download all new files from GCS bucket w/ url <src> to destination folder.
@@ -66,10 +71,17 @@ def get_file_from_gcs(fname):
 
 class Pipeline():
 
-    def __init__(self, datastore_client, storage_client):
+    def __init__(self, datastore_client, storage_client, segment_index=None,
+                 fetcher=None):
         self.prev_fnames = []
+        # adj_timestamp of each fname returned by the last scan
+        self.timestamps = {}
         self.datastore = datastore_client
         self.storage = storage_client
+        # Used by assemble_incremental
+        self.segment_index = segment_index
+        # Long-lived downloader; if None a Pool is created for each pass
+        self.fetcher = fetcher
 
     def scan(self):
         """
@@ -83,8 +95,9 @@ class Pipeline():
                                      order=[ds.TOTALITY_ORDERING_PROPERTY], \
                                      filters=[("image_type","=", ds.TOTALITY_IMAGE_TYPE)])
 
-        # Fetch keys only, no need for other entity properties
-        query.keys_only()
+        # Fetch keys and the ordering property only, which is needed to
+        # place images in movie segments
+        query.projection = [ds.TOTALITY_ORDERING_PROPERTY]
 
         # Retrieve all datstore entities. Query currently
         # has no limit & fetches all full disk totality images
@@ -95,12 +108,15 @@ class Pipeline():
             logging.exception(msg.format(query))
             return None
 
-        fnames = list(entity.key.name for entity in list(query))
+        entities = list(query)
+        fnames = list(entity.key.name for entity in entities)
 
         if self.prev_fnames == fnames:
             return []
 
         self.prev_fnames = fnames
+        self.timestamps = dict((entity.key.name, entity[ds.TOTALITY_ORDERING_PROPERTY])
+                               for entity in entities)
 
         # Return list of filenames
         return fnames
@@ -113,25 +129,26 @@ class Pipeline():
         """
 
         # Get files from GCS
-        pool = Pool(min(len(fnames), constants.MOVIE_DAEMON_MAX_PROCESSES))
-        results = pool.map(get_file_from_gcs, fnames)
-        pool.terminate()
+        results = self._download(fnames)
+
+        fnames = list(compress(fnames, results))
+
+        if constants.MOVIE_FEED_CONCAT_MANIFEST:
+            return self._encode_from_manifest(fnames)
 
         # Start ffmpeg subprocess
-        ffmpeg_cmd = ["ffmpeg","-y",        # Overwrite exsisting movie file
-                    "-f", "image2pipe",
-                    "-framerate", constants.MOVIE_FRAMERATE,
-                    "-vcodec","mjpeg",
-                    "-i", "-",              # Input pipe from stdin
-                    "-vf", "scale=1024:-1",
-                    "-loglevel", "panic",
-                    "-vcodec", "libx264",
-                    constants.MOVIE_FPATH]
+        if constants.MOVIE_LADDER_ENABLED:
+            # Encode the movie and every ladder rung from one decode
+            outputs = [(segments.MOVIE_SCALE, segments.MOVIE_OUTPUT_ARGS,
+                        constants.MOVIE_FPATH)] + ladder.ladder_outputs()
+            ffmpeg_cmd = ladder.ladder_cmd(constants.MOVIE_FFMPEG_BIN,
+                                           segments.pipe_input_args(), outputs)
+        else:
+            ffmpeg_cmd = segments.encode_cmd(constants.MOVIE_FFMPEG_BIN,
+                                             constants.MOVIE_FPATH)
 
         ffmpeg_ps = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE)
 
-
-        fnames = list(compress(fnames, results))
         files_read = self._pipe_to_ffmpeg(ffmpeg_ps, fnames)
 
         if files_read > constants.MOVIE_MIN_FRAMES:
@@ -142,6 +159,81 @@ class Pipeline():
 
         return fnames
 
+    def _encode_from_manifest(self, fnames):
+        """
+        Encodes the movie by handing ffmpeg a concat manifest of the
+        images, so it reads the files itself. Returns the list of files in
+        the movie.
+        """
+        fpaths = ["{0}/{1}".format(constants.MOVIE_DATA_DIR, fname) for fname in fnames]
+        found = [os.path.exists(fpath) for fpath in fpaths]
+        fnames = list(compress(fnames, found))
+        if len(fnames) <= constants.MOVIE_MIN_FRAMES:
+            return fnames
+
+        manifest_fpath = "{0}/frames.ffconcat".format(constants.MOVIE_DATA_DIR)
+        feeder.write_concat_manifest(manifest_fpath, list(compress(fpaths, found)))
+        input_args = segments.manifest_input_args(manifest_fpath)
+        if constants.MOVIE_LADDER_ENABLED:
+            # Encode the movie and every ladder rung from one decode
+            outputs = [(segments.MOVIE_SCALE, segments.MOVIE_OUTPUT_ARGS,
+                        constants.MOVIE_FPATH)] + ladder.ladder_outputs()
+            outputs = [(scale, segments.manifest_output_args() + args, fpath)
+                       for scale, args, fpath in outputs]
+            ffmpeg_cmd = ladder.ladder_cmd(constants.MOVIE_FFMPEG_BIN,
+                                           input_args, outputs)
+        else:
+            ffmpeg_cmd = segments.manifest_encode_cmd(constants.MOVIE_FFMPEG_BIN,
+                                                      manifest_fpath,
+                                                      constants.MOVIE_FPATH)
+        start = time.time()
+        if subprocess.call(ffmpeg_cmd) != 0:
+            msg = 'Failed to encode {0} from {1}'
+            logging.error(msg.format(constants.MOVIE_FPATH, manifest_fpath))
+        msg = 'Encoded {0} frames from manifest in {1:.2f}s'
+        logging.info(msg.format(len(fnames), time.time() - start))
+        return fnames
+
+    def assemble_incremental(self, fnames):
+        """
+        Like assemble, but only re-encodes the movie segments (ranges of
+        adj_timestamp) whose frames changed since the last call, then
+        concatenates all segments into the movie without re-encoding.
+        Returns list of files in the movie.
+        """
+
+        # Get files from GCS; files downloaded by earlier passes are kept
+        results = self._download(fnames)
+
+        fnames = list(compress(fnames, results))
+        entries = list((fname, self.timestamps[fname]) for fname in fnames)
+
+        start = time.time()
+        changed = self.segment_index.update(entries)
+        frames = 0
+        for seg_id in sorted(changed):
+            self.segment_index.encode(seg_id, changed[seg_id], self._pipe_frames)
+            frames += len(changed[seg_id])
+        self.segment_index.save()
+        msg = 'Re-encoded {0} segments ({1} frames) in {2:.2f}s'
+        logging.info(msg.format(len(changed), frames, time.time() - start))
+
+        fnames = self.segment_index.fnames()
+        if len(fnames) <= constants.MOVIE_MIN_FRAMES:
+            return []
+        if not self.segment_index.concat(constants.MOVIE_FPATH):
+            return []
+        if constants.MOVIE_LADDER_ENABLED:
+            # The rungs are rendered from the frames, not the concatenated
+            # movie, so they are not upscaled from its encode. This decodes
+            # every frame on each pass, not just the changed segments.
+            fpaths = ["{0}/{1}".format(constants.MOVIE_DATA_DIR, fname) for fname in fnames]
+            manifest_fpath = "{0}/ladder.ffconcat".format(constants.MOVIE_DATA_DIR)
+            feeder.write_concat_manifest(manifest_fpath, fpaths)
+            ladder.render_ladder(segments.manifest_input_args(manifest_fpath),
+                                 segments.manifest_output_args())
+        return fnames
+
     def upload(self, fnames):
         """
         Uploads a list of Movie entities to the datastore and uploads the
@@ -166,6 +258,18 @@ class Pipeline():
                 logging.error(msg.format(constants.MOVIE_FPATH, e))
                 return False
 
+        if constants.MOVIE_LADDER_ENABLED:
+            for name, fpath in ladder.ladder_files():
+                blob = storage.Blob('{0}/{1}'.format(movie_dir, name), bucket)
+                with open(fpath, 'r') as f:
+                    try:
+                        blob.upload_from_file(f)
+                        msg = 'Successfully uploaded {0} to Cloud Storage'
+                        logging.info(msg.format(fpath))
+                    except Exception, e:
+                        msg = 'Failed to upload {0} to Cloud Storage: {1}'
+                        logging.error(msg.format(fpath, e))
+
         if os.path.exists(constants.C_MAP_FPATH):
             map_name = 'map-{0}.png'.format(movie_dir)
             blob = storage.Blob('{0}/{1}'.format(movie_dir, map_name), bucket)
@@ -199,65 +303,39 @@ class Pipeline():
 
         return True
 
-    def _pipe_to_ffmpeg(self, ffmpeg, fnames):
+    def _download(self, fnames):
         """
-        Write images to stdin of ffmpeg subprocess
+        Downloads fnames from GCS to constants.MOVIE_DATA_DIR. Returns a
+        list of booleans, True where the file was downloaded.
         """
+        if self.fetcher is not None:
+            return self.fetcher.fetch_all(fnames)
 
-        # Track number of files sucessfully passed to ffmpeg
-        files_read = 0
-
-        # Pipe files to ffmpeg subprocess
-        for fname in fnames:
-
-            fpath = "{0}/{1}".format(constants.MOVIE_DATA_DIR, fname)
-
-            # Read arguement files
-            try:
-                img = open(fpath, 'r').read()
-            except Exception, e:
-                msg = 'Failed to write {0}.'
-                logging.exception(msg.format(fname))
-                continue
-
-            files_read += 1
-
-            # Write to stdin of ffmpeg subprocess
-            ffmpeg.stdin.write(img)
-
-        return files_read
-
-
-def get_file_from_gcs(fname):
-    """
-    Download all new files from GCS bucket w/ url <src> to destination folder.
-    Must be outside of pipeline class for use as multiprocess map worker
-    """
-    storage_client = storage.client.Client(project=config.PROJECT_ID, \
-                                           credentials=sa.get_credentials())
-
-    try:
-        blob = storage_client.get_bucket(config.GCS_PROCESSED_PHOTOS_BUCKET).get_blob(fname)
-    except Exception, e:
-        msg = 'Failed to download {0} from Cloud Storage.'
-        logging.exception(msg.format(fname))
-        return False
+        pool = Pool(min(len(fnames), constants.MOVIE_DAEMON_MAX_PROCESSES))
+        results = pool.map(get_file_from_gcs, fnames)
+        pool.terminate()
+        return results
 
-    if blob:
-        fpath = '{0}/{1}'.format(constants.MOVIE_DATA_DIR, fname)
+    def _pipe_to_ffmpeg(self, ffmpeg, fnames):
+        """
+        Write images to stdin of ffmpeg subprocess
+        """
+        return len(self._pipe_frames(ffmpeg, fnames))
 
-        # Get files
-        with open(fpath, 'w+') as file_obj:
-            try:
-                blob.download_to_file(file_obj)
-                msg = 'Successfully downloaded {0} from GCS'
-                logging.info(msg.format(fname))
-            except Exception, e:
-                msg = 'Failed to download {0} from Cloud Storage.'
-                logging.exception(msg.format(fname))
-                return False
-        return True
-    else:
-        msg = 'Failed to download blob {0} from Cloud Storage.'
-        logging.exception(msg.format(config.GCS_PROCESSED_PHOTOS_BUCKET))
-        return False
+    def _pipe_frames(self, ffmpeg, fnames):
+        """
+        Write images to stdin of ffmpeg subprocess. Returns the list of
+        files sucessfully passed to ffmpeg.
+        """
+        fpaths = dict(("{0}/{1}".format(constants.MOVIE_DATA_DIR, fname), fname)
+                      for fname in fnames)
+        try:
+            written = feeder.feed_files(ffmpeg.stdin,
+                                        ["{0}/{1}".format(constants.MOVIE_DATA_DIR, fname)
+                                         for fname in fnames])
+        except IOError, e:
+            # A partial frame, or ffmpeg exited; the encode can't be used
+            msg = 'Failed to feed frames to ffmpeg'
+            logging.exception(msg)
+            return []
+        return list(fpaths[fpath] for fpath in written)
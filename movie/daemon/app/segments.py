@@ -0,0 +1,221 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import math
+import os
+import subprocess
+
+from common import constants
+
+
+# Scale and codec of the published movie
+MOVIE_SCALE = "1024:-1"
+MOVIE_OUTPUT_ARGS = ["-vcodec", "libx264"]
+
+
+def segment_id(adj_timestamp, width):
+    """
+    Returns the id of the segment holding frames with this adj_timestamp.
+    Segment n holds the range [n * width, (n + 1) * width).
+    """
+    return int(math.floor(adj_timestamp / width))
+
+
+def group_frames(entries, width):
+    """
+    Groups an ordered list of (fname, adj_timestamp) entries into segments.
+    Returns a dict of segment id -> ordered list of fnames.
+    """
+    segments = {}
+    for fname, adj_timestamp in entries:
+        segments.setdefault(segment_id(adj_timestamp, width), []).append(fname)
+    return segments
+
+
+class SegmentIndex():
+    """
+    Ordered index of movie segments keyed by adj_timestamp range.
+
+    Each segment is encoded to its own movie file. When the set of frames
+    changes only the segments whose frames changed are re-encoded, and the
+    movie is rebuilt by concatenating the segment files with the ffmpeg
+    concat demuxer, which copies the streams without re-encoding.
+    """
+
+    def __init__(self, directory, width=constants.MOVIE_SEGMENT_WIDTH,
+                 ffmpeg=constants.MOVIE_FFMPEG_BIN):
+        self.directory = directory
+        self.width = width
+        self.ffmpeg = ffmpeg
+        self.index_fpath = os.path.join(directory, 'segments.json')
+        # Segment id -> ordered list of fnames encoded in that segment
+        self.segments = {}
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self._load()
+
+    def segment_fpath(self, seg_id):
+        return os.path.join(self.directory, 'segment-{0}.mp4'.format(seg_id))
+
+    def update(self, entries):
+        """
+        Updates the index from an ordered list of (fname, adj_timestamp)
+        entries. Returns a dict of segment id -> fnames for the segments
+        which need to be re-encoded; segments with no frames left are
+        dropped.
+        """
+        segments = group_frames(entries, self.width)
+
+        for seg_id in list(self.segments):
+            if seg_id not in segments:
+                del self.segments[seg_id]
+                if os.path.exists(self.segment_fpath(seg_id)):
+                    os.remove(self.segment_fpath(seg_id))
+
+        changed = {}
+        for seg_id, fnames in segments.iteritems():
+            if self.segments.get(seg_id) != fnames or \
+               not os.path.exists(self.segment_fpath(seg_id)):
+                changed[seg_id] = fnames
+        return changed
+
+    def encode(self, seg_id, fnames, pipe_frames):
+        """
+        Encodes a segment. pipe_frames(ffmpeg_ps, fnames) writes the frames
+        to the stdin of the ffmpeg subprocess and returns the fnames it
+        wrote. Returns True on success.
+        """
+        fpath = self.segment_fpath(seg_id)
+        tmp_fpath = fpath + '.tmp.mp4'
+        ffmpeg_ps = subprocess.Popen(encode_cmd(self.ffmpeg, tmp_fpath),
+                                     stdin=subprocess.PIPE)
+        written = pipe_frames(ffmpeg_ps, fnames)
+        ffmpeg_ps.stdin.close()
+        if ffmpeg_ps.wait() != 0 or not written:
+            msg = 'Failed to encode segment {0}'
+            logging.error(msg.format(seg_id))
+            if os.path.exists(tmp_fpath):
+                os.remove(tmp_fpath)
+            self.segments.pop(seg_id, None)
+            return False
+
+        os.rename(tmp_fpath, fpath)
+        self.segments[seg_id] = written
+        return True
+
+    def fnames(self):
+        """
+        Returns the ordered list of fnames in the encoded segments.
+        """
+        results = []
+        for seg_id in sorted(self.segments):
+            results.extend(self.segments[seg_id])
+        return results
+
+    def concat(self, movie_fpath):
+        """
+        Concatenates the encoded segments, in adj_timestamp order, into
+        movie_fpath without re-encoding. Returns True on success.
+        """
+        list_fpath = os.path.join(self.directory, 'segments.txt')
+        with open(list_fpath, 'w') as f:
+            for seg_id in sorted(self.segments):
+                f.write("file '{0}'\n".format(self.segment_fpath(seg_id)))
+
+        ffmpeg_cmd = [self.ffmpeg, "-y",
+                      "-f", "concat",
+                      "-safe", "0",
+                      "-i", list_fpath,
+                      "-loglevel", "panic",
+                      "-c", "copy",
+                      movie_fpath]
+        if subprocess.call(ffmpeg_cmd) != 0:
+            msg = 'Failed to concatenate segments into {0}'
+            logging.error(msg.format(movie_fpath))
+            return False
+        return True
+
+    def save(self):
+        tmp_fpath = self.index_fpath + '.tmp'
+        with open(tmp_fpath, 'w') as f:
+            json.dump(dict((str(k), v) for k, v in self.segments.iteritems()), f)
+        os.rename(tmp_fpath, self.index_fpath)
+
+    def _load(self):
+        if not os.path.exists(self.index_fpath):
+            return
+        try:
+            with open(self.index_fpath) as f:
+                segments = json.load(f)
+        except ValueError:
+            msg = 'Ignoring corrupt segment index {0}'
+            logging.exception(msg.format(self.index_fpath))
+            return
+        self.segments = dict((int(k), v) for k, v in segments.iteritems())
+
+
+def encode_cmd(ffmpeg, fpath):
+    """
+    Returns the ffmpeg command which encodes jpegs piped to stdin into a
+    movie at fpath. Full movies and segments use the same settings, so
+    segments can be concatenated without re-encoding.
+    """
+    return ([ffmpeg, "-y"] +                # Overwrite exsisting movie file
+            pipe_input_args() +
+            ["-vf", "scale=" + MOVIE_SCALE, "-loglevel", "panic"] +
+            MOVIE_OUTPUT_ARGS + [fpath])
+
+
+def pipe_input_args():
+    """
+    Returns the ffmpeg arguments for reading jpegs piped to stdin.
+    """
+    return ["-f", "image2pipe",
+            "-framerate", constants.MOVIE_FRAMERATE,
+            "-vcodec", "mjpeg",
+            "-i", "-"]                      # Input pipe from stdin
+
+
+def manifest_input_args(manifest_fpath):
+    """
+    Returns the ffmpeg arguments for reading the images listed in an
+    ffconcat manifest.
+    """
+    return ["-f", "concat",
+            "-safe", "0",
+            "-i", manifest_fpath]
+
+
+def manifest_output_args():
+    """
+    Returns the ffmpeg output arguments which give movies encoded from an
+    ffconcat manifest a constant frame rate.
+    """
+    return ["-r", constants.MOVIE_FRAMERATE]
+
+
+def manifest_encode_cmd(ffmpeg, manifest_fpath, fpath):
+    """
+    Returns the ffmpeg command which encodes the images listed in an
+    ffconcat manifest into a movie at fpath, with the same output settings
+    as encode_cmd.
+    """
+    return ([ffmpeg, "-y"] +
+            manifest_input_args(manifest_fpath) +
+            ["-vf", "scale=" + MOVIE_SCALE] +
+            manifest_output_args() +
+            ["-loglevel", "panic"] + MOVIE_OUTPUT_ARGS + [fpath])
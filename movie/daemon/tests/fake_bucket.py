@@ -0,0 +1,125 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+
+"""
+In-memory stand-in for a Cloud Storage bucket, with optional latency.
+Running this module benchmarks the movie daemon downloaders against it.
+"""
+
+import argparse
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+from app import fetcher
+
+class FakeBlob():
+
+    def __init__(self, bucket, name, data):
+        self.bucket = bucket
+        self.name = name
+        self.data = data
+        self.md5_hash = base64.b64encode(hashlib.md5(data).digest())
+
+    def download_to_file(self, file_obj):
+        time.sleep(self.bucket.download_latency)
+        with self.bucket.lock:
+            self.bucket.downloads += 1
+        file_obj.write(self.data)
+
+class FakeBucket():
+
+    def __init__(self, blobs, client_latency=0, download_latency=0):
+        self.blobs = blobs
+        self.client_latency = client_latency
+        self.download_latency = download_latency
+        self.lock = threading.Lock()
+        self.clients = 0
+        self.downloads = 0
+
+    def client(self):
+        """
+        Returns the bucket as seen by a new client.
+        """
+        time.sleep(self.client_latency)
+        with self.lock:
+            self.clients += 1
+        return self
+
+    def get_blob(self, name):
+        if name not in self.blobs:
+            return None
+        return FakeBlob(self, name, self.blobs[name])
+
+def fetch_per_call(bucket, directory, fname):
+    """
+    The original downloader: a new client for every file, and a cached
+    file is any file which exists.
+    """
+    fpath = os.path.join(directory, fname)
+    if os.path.exists(fpath):
+        return True
+    blob = bucket.client().get_blob(fname)
+    with open(fpath, 'w+') as file_obj:
+        blob.download_to_file(file_obj)
+    return True
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark downloaders.')
+    parser.add_argument('--files', type=int, default=2000)
+    parser.add_argument('--size', type=int, default=200000)
+    parser.add_argument('--passes', type=int, default=3)
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--client_latency', type=float, default=0.05)
+    parser.add_argument('--download_latency', type=float, default=0.02)
+    return parser.parse_args()
+
+def main():
+    args = get_arguments()
+    data = os.urandom(args.size)
+    blobs = dict(('photo%05d.jpg' % i, data) for i in range(args.files))
+    fnames = sorted(blobs)
+    bucket = FakeBucket(blobs, args.client_latency, args.download_latency)
+
+    directory = tempfile.mkdtemp()
+    pool = ThreadPool(args.threads)
+    for i in range(args.passes):
+        start = time.time()
+        pool.map(lambda fname: fetch_per_call(bucket, directory, fname), fnames)
+        print "per-call clients, pass %d: %.2fs" % (i, time.time() - start)
+    pool.terminate()
+    shutil.rmtree(directory)
+
+    directory = tempfile.mkdtemp()
+    movie_fetcher = fetcher.Fetcher(directory, max_bytes=args.files * args.size,
+                                    threads=args.threads,
+                                    bucket_factory=bucket.client)
+    for i in range(args.passes):
+        start = time.time()
+        movie_fetcher.fetch_all(fnames)
+        print "fetcher, pass %d: %.2fs" % (i, time.time() - start)
+    movie_fetcher.close()
+    shutil.rmtree(directory)
+    print "clients created: %d, downloads: %d" % (bucket.clients, bucket.downloads)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+
+"""
+Measures wall time and peak RSS of feeding frames to a stand-in encoder
+(cat > /dev/null), for the original read-whole-file loop and for
+feeder.feed_files. Each method runs in its own process so peak RSS is
+not shared.
+"""
+
+import argparse
+import os
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+from multiprocessing import Process, Queue
+
+from app import feeder
+
+def feed_read_whole(stdin, fpaths):
+    """
+    The original feeder: read each file into a string and write it.
+    """
+    for fpath in fpaths:
+        img = open(fpath, 'r').read()
+        stdin.write(img)
+
+def feed_chunked(stdin, fpaths):
+    feeder.feed_files(stdin, fpaths)
+
+def run(method, fpaths, results):
+    encoder = subprocess.Popen("cat > /dev/null", shell=True, stdin=subprocess.PIPE)
+    start = time.time()
+    method(encoder.stdin, fpaths)
+    encoder.stdin.close()
+    encoder.wait()
+    results.put((time.time() - start,
+                 resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark frame feeders.')
+    parser.add_argument('--frames', type=int, default=10000)
+    parser.add_argument('--size', type=int, default=500000)
+    return parser.parse_args()
+
+def main():
+    args = get_arguments()
+    directory = tempfile.mkdtemp()
+    data = os.urandom(args.size)
+    fpaths = []
+    for i in range(args.frames):
+        fpath = os.path.join(directory, 'frame%05d.jpg' % i)
+        with open(fpath, 'w') as f:
+            f.write(data)
+        fpaths.append(fpath)
+
+    for name, method in ('read whole file', feed_read_whole), ('feed_files', feed_chunked):
+        results = Queue()
+        p = Process(target=run, args=(method, fpaths, results))
+        p.start()
+        elapsed, max_rss = results.get()
+        p.join()
+        print "%s: %d frames in %.2fs, peak RSS %d KB" % (name, args.frames, elapsed, max_rss)
+    shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest2
+from StringIO import StringIO
+
+from app import feeder
+
+class FailingFile(object):
+    """
+    File which fails after a number of reads.
+    """
+    def __init__(self, f, reads, truncate):
+        self.f = f
+        self.reads = reads
+        self.truncate = truncate
+    def __enter__(self):
+        return self
+    def __exit__(self, *args):
+        self.f.close()
+    def fileno(self):
+        return self.f.fileno()
+    def read(self, size=-1):
+        if self.reads == 0:
+            if self.truncate:
+                return ''
+            raise IOError('read failed')
+        self.reads -= 1
+        return self.f.read(size)
+
+class FeederTests(unittest2.TestCase):
+    """
+    Tests for feeding frames to ffmpeg.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.fpaths = []
+        for i in range(5):
+            fpath = os.path.join(self.directory, 'frame%d.jpg' % i)
+            with open(fpath, 'w') as f:
+                f.write(str(i) * (10 + 7 * i))
+            self.fpaths.append(fpath)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_feed_files(self):
+        stdin = StringIO()
+        written = feeder.feed_files(stdin, self.fpaths, buffer_size=8, read_ahead=2)
+        self.assertEqual(written, self.fpaths)
+        self.assertEqual(stdin.getvalue(),
+                         ''.join(open(fpath).read() for fpath in self.fpaths))
+
+    def test_unreadable_files_skipped(self):
+        stdin = StringIO()
+        fpaths = [self.fpaths[0], os.path.join(self.directory, 'missing.jpg'),
+                  self.directory, self.fpaths[1]]
+        written = feeder.feed_files(stdin, fpaths, buffer_size=8, read_ahead=2)
+        self.assertEqual(written, self.fpaths[:2])
+        self.assertEqual(stdin.getvalue(),
+                         open(self.fpaths[0]).read() + open(self.fpaths[1]).read())
+
+    def _feed_failing(self, fpath, reads, truncate=False, buffer_size=8):
+        """
+        Feeds self.fpaths with reads of fpath failing after the given
+        number of reads, by raising or, if truncate, by ending early.
+        """
+        def failing_open(fname, mode='r'):
+            f = open(fname, mode)
+            return FailingFile(f, reads, truncate) if fname == fpath else f
+        feeder.open = failing_open
+        try:
+            stdin = StringIO()
+            written = feeder.feed_files(stdin, self.fpaths, buffer_size=buffer_size,
+                                        read_ahead=2)
+        finally:
+            del feeder.open
+        return stdin, written
+
+    def test_read_failure_skipped(self):
+        # The first chunk of frame2 reads, then the file fails; the chunk
+        # is held back, so the frame is left out of the stream entirely
+        stdin, written = self._feed_failing(self.fpaths[2], reads=1)
+        expected = self.fpaths[:2] + self.fpaths[3:]
+        self.assertEqual(written, expected)
+        self.assertEqual(stdin.getvalue(),
+                         ''.join(open(fpath).read() for fpath in expected))
+
+    def test_truncated_file_skipped(self):
+        stdin, written = self._feed_failing(self.fpaths[1], reads=1, truncate=True,
+                                            buffer_size=10)
+        expected = self.fpaths[:1] + self.fpaths[2:]
+        self.assertEqual(written, expected)
+        self.assertEqual(stdin.getvalue(),
+                         ''.join(open(fpath).read() for fpath in expected))
+
+    def test_failure_after_partial_write(self):
+        # frame4 fails after one of its chunks was queued
+        with self.assertRaises(feeder.FeedError):
+            self._feed_failing(self.fpaths[4], reads=2)
+
+    def test_write_failure_releases_reader(self):
+        class BrokenPipe(object):
+            def write(self, data):
+                raise IOError('Broken pipe')
+        threads = threading.active_count()
+        with self.assertRaises(IOError):
+            feeder.feed_files(BrokenPipe(), self.fpaths * 10, buffer_size=1, read_ahead=1)
+        # The reader stopped rather than blocking on the full queue
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_concat_manifest(self):
+        manifest = os.path.join(self.directory, 'frames.ffconcat')
+        feeder.write_concat_manifest(manifest, ["/tmp/a.jpg", "/tmp/it's.jpg"], "2")
+        self.assertEqual(open(manifest).read(),
+                         "ffconcat version 1.0\n"
+                         "file '/tmp/a.jpg'\nduration 0.5\n"
+                         "file '/tmp/it'\\''s.jpg'\nduration 0.5\n")
+
+if __name__ == '__main__':
+    unittest2.main()
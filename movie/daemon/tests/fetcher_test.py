@@ -0,0 +1,120 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest2
+
+from app import fetcher
+from fake_bucket import FakeBucket
+
+class FetcherTests(unittest2.TestCase):
+    """
+    Tests for the Fetcher class.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.blobs = dict(('photo%d.jpg' % i, str(i) * 100) for i in range(10))
+        self.bucket = FakeBucket(self.blobs)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _fetcher(self, max_bytes=10 ** 6, threads=4):
+        return fetcher.Fetcher(self.directory, max_bytes=max_bytes,
+                               threads=threads,
+                               bucket_factory=self.bucket.client)
+
+    def test_fetch_all(self):
+        movie_fetcher = self._fetcher()
+        fnames = sorted(self.blobs) + ['missing.jpg']
+        results = movie_fetcher.fetch_all(fnames)
+        movie_fetcher.close()
+        self.assertEqual(results, [True] * 10 + [False])
+        for fname, data in self.blobs.iteritems():
+            self.assertEqual(open(os.path.join(self.directory, fname)).read(), data)
+        # Clients are created once per thread, not per file
+        self.assertLessEqual(self.bucket.clients, 4)
+
+    def test_cached_files_not_downloaded(self):
+        movie_fetcher = self._fetcher()
+        movie_fetcher.fetch_all(sorted(self.blobs))
+        movie_fetcher.close()
+        self.assertEqual(self.bucket.downloads, 10)
+
+        # A new fetcher trusts the saved manifest
+        movie_fetcher = self._fetcher()
+        movie_fetcher.fetch_all(sorted(self.blobs))
+        movie_fetcher.close()
+        self.assertEqual(self.bucket.downloads, 10)
+
+    def test_partial_file_downloaded_again(self):
+        movie_fetcher = self._fetcher()
+        movie_fetcher.fetch_all(['photo1.jpg'])
+        with open(os.path.join(self.directory, 'photo1.jpg'), 'w') as f:
+            f.write('1' * 10)
+        movie_fetcher.fetch_all(['photo1.jpg'])
+        movie_fetcher.close()
+        self.assertEqual(self.bucket.downloads, 2)
+        self.assertEqual(open(os.path.join(self.directory, 'photo1.jpg')).read(),
+                         self.blobs['photo1.jpg'])
+
+    def test_corrupt_file_downloaded_again(self):
+        movie_fetcher = self._fetcher()
+        movie_fetcher.fetch_all(['photo1.jpg'])
+        movie_fetcher.close()
+        # Same size, different contents
+        with open(os.path.join(self.directory, 'photo1.jpg'), 'w') as f:
+            f.write('x' * 100)
+
+        # A new fetcher checks the md5 of cached files on first use
+        movie_fetcher = self._fetcher()
+        movie_fetcher.fetch_all(['photo1.jpg'])
+        movie_fetcher.fetch_all(['photo1.jpg'])
+        movie_fetcher.close()
+        self.assertEqual(self.bucket.downloads, 2)
+        self.assertEqual(open(os.path.join(self.directory, 'photo1.jpg')).read(),
+                         self.blobs['photo1.jpg'])
+
+    def test_checksum_mismatch(self):
+        movie_fetcher = self._fetcher()
+        blob = self.bucket.get_blob('photo1.jpg')
+        blob.md5_hash = 'bogus'
+        self.bucket.get_blob = lambda name: blob
+        self.assertFalse(movie_fetcher.fetch('photo1.jpg'))
+        movie_fetcher.close()
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'photo1.jpg')))
+        self.assertEqual([f for f in os.listdir(self.directory)], [])
+
+    def test_lru_eviction(self):
+        # Room for three files
+        movie_fetcher = self._fetcher(max_bytes=300, threads=1)
+        for fname in ['photo0.jpg', 'photo1.jpg', 'photo2.jpg']:
+            movie_fetcher.fetch_all([fname])
+        # Use photo0 so photo1 is the least recently used
+        movie_fetcher.fetch_all(['photo0.jpg'])
+        movie_fetcher.fetch_all(['photo3.jpg'])
+        movie_fetcher.close()
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'photo1.jpg')))
+        for fname in ['photo0.jpg', 'photo2.jpg', 'photo3.jpg']:
+            self.assertTrue(os.path.exists(os.path.join(self.directory, fname)))
+        self.assertEqual(movie_fetcher.cached_bytes(), 300)
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,72 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+
+"""
+Compares the ffmpeg CPU time of rendering the movie ladder with one
+ffmpeg invocation (one decode) against one invocation per output.
+Needs ffmpeg on the PATH and a directory of jpeg frames.
+"""
+
+import argparse
+import glob
+import os
+import resource
+import subprocess
+import tempfile
+import time
+
+from common import constants
+from app import ladder, segments
+
+def children_cpu():
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+def run(cmd, fpaths):
+    ffmpeg_ps = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    for fpath in fpaths:
+        with open(fpath, 'rb') as f:
+            ffmpeg_ps.stdin.write(f.read())
+    ffmpeg_ps.stdin.close()
+    ffmpeg_ps.wait()
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark the movie ladder.')
+    parser.add_argument('--frames', type=str, required=True,
+                        help='Directory of jpeg frames')
+    parser.add_argument('--ffmpeg', type=str, default='ffmpeg')
+    return parser.parse_args()
+
+def main():
+    args = get_arguments()
+    fpaths = sorted(glob.glob(os.path.join(args.frames, '*.jpg')))
+    directory = tempfile.mkdtemp()
+    outputs = [(segments.MOVIE_SCALE, segments.MOVIE_OUTPUT_ARGS,
+                os.path.join(directory, 'movie.mp4'))]
+    outputs += ladder.ladder_outputs(constants.MOVIE_LADDER, directory)
+
+    cpu, start = children_cpu(), time.time()
+    for output in outputs:
+        run(ladder.ladder_cmd(args.ffmpeg, segments.pipe_input_args(), [output]), fpaths)
+    print "separate runs: %.2fs CPU, %.2fs wall" % (children_cpu() - cpu, time.time() - start)
+
+    cpu, start = children_cpu(), time.time()
+    run(ladder.ladder_cmd(args.ffmpeg, segments.pipe_input_args(), outputs), fpaths)
+    print "single run: %.2fs CPU, %.2fs wall" % (children_cpu() - cpu, time.time() - start)
+
+if __name__ == '__main__':
+    main()
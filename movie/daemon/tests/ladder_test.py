@@ -0,0 +1,71 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest2
+
+from app import ladder
+
+RUNGS = [
+    {'fname': 'thumbnail.gif', 'scale': '320:-2', 'args': []},
+    {'fname': '720p.mp4', 'scale': '-2:720', 'args': ['-vcodec', 'libx264']},
+    {'fname': 'hls/index.m3u8', 'scale': '-2:720', 'multiple_files': True,
+     'args': ['-f', 'hls']},
+]
+
+class LadderTests(unittest2.TestCase):
+    """
+    Tests for the movie output ladder.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_ladder_cmd(self):
+        outputs = [('1024:-1', ['-vcodec', 'libx264'], 'movie.mp4'),
+                   ('320:-2', [], 'thumbnail.gif')]
+        cmd = ladder.ladder_cmd('ffmpeg', ['-i', 'in.mp4'], outputs)
+        self.assertEqual(cmd, [
+            'ffmpeg', '-y', '-loglevel', 'panic', '-i', 'in.mp4',
+            '-filter_complex',
+            '[0:v]split=2[s0][s1];[s0]scale=1024:-1[o0];[s1]scale=320:-2[o1]',
+            '-map', '[o0]', '-vcodec', 'libx264', 'movie.mp4',
+            '-map', '[o1]', 'thumbnail.gif'])
+
+    def test_ladder_outputs_creates_directories(self):
+        outputs = ladder.ladder_outputs(RUNGS, self.directory)
+        self.assertEqual([fpath for scale, args, fpath in outputs],
+                         [os.path.join(self.directory, rung['fname']) for rung in RUNGS])
+        self.assertTrue(os.path.isdir(os.path.join(self.directory, 'hls')))
+
+    def test_ladder_files(self):
+        ladder.ladder_outputs(RUNGS, self.directory)
+        for fname in ['thumbnail.gif', 'hls/index.m3u8', 'hls/segment000.ts',
+                      'hls/segment001.ts']:
+            open(os.path.join(self.directory, fname), 'w').close()
+        names = [name for name, fpath in ladder.ladder_files(RUNGS, self.directory)]
+        # 720p.mp4 was not written
+        self.assertEqual(names, ['thumbnail.gif', 'hls/index.m3u8',
+                                 'hls/segment000.ts', 'hls/segment001.ts'])
+
+if __name__ == '__main__':
+    unittest2.main()
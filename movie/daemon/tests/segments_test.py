@@ -0,0 +1,128 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest2
+
+from app import segments
+
+# Stand-in for ffmpeg: "encodes" by copying stdin to the output file and
+# concatenates by joining the listed files. Each call is logged.
+FAKE_FFMPEG = """#!{python}
+import sys
+args = sys.argv[1:]
+out = args[-1]
+with open({log!r}, 'a') as log:
+    log.write(' '.join(args) + '\\n')
+with open(out, 'w') as f:
+    if 'concat' in args:
+        for line in open(args[args.index('-i') + 1]):
+            f.write(open(line.strip()[len("file '"):-1]).read())
+    else:
+        f.write(sys.stdin.read())
+"""
+
+class SegmentIndexTests(unittest2.TestCase):
+    """
+    Tests for the SegmentIndex class.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.log = os.path.join(self.directory, 'ffmpeg.log')
+        self.ffmpeg = os.path.join(self.directory, 'ffmpeg')
+        with open(self.ffmpeg, 'w') as f:
+            f.write(FAKE_FFMPEG.format(python=sys.executable, log=self.log))
+        os.chmod(self.ffmpeg, os.stat(self.ffmpeg).st_mode | stat.S_IEXEC)
+        self.segment_dir = os.path.join(self.directory, 'segments')
+        self.movie = os.path.join(self.directory, 'movie.mp4')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _index(self):
+        return segments.SegmentIndex(self.segment_dir, width=0.1,
+                                     ffmpeg=self.ffmpeg)
+
+    def _pipe_frames(self, ffmpeg, fnames):
+        for fname in fnames:
+            ffmpeg.stdin.write(fname + ';')
+        return fnames
+
+    def _assemble(self, index, entries):
+        changed = index.update(entries)
+        for seg_id in sorted(changed):
+            self.assertTrue(index.encode(seg_id, changed[seg_id], self._pipe_frames))
+        index.save()
+        self.assertTrue(index.concat(self.movie))
+        return changed
+
+    def _encodes(self):
+        if not os.path.exists(self.log):
+            return 0
+        return len([line for line in open(self.log) if 'concat' not in line])
+
+    def test_group_frames(self):
+        entries = [('a', 0.01), ('b', 0.05), ('c', 0.15), ('d', 0.31)]
+        self.assertEqual(segments.group_frames(entries, 0.1),
+                         {0: ['a', 'b'], 1: ['c'], 3: ['d']})
+
+    def test_full_assembly(self):
+        entries = [('a', 0.01), ('b', 0.05), ('c', 0.15), ('d', 0.31)]
+        index = self._index()
+        changed = self._assemble(index, entries)
+        self.assertEqual(sorted(changed), [0, 1, 3])
+        self.assertEqual(open(self.movie).read(), 'a;b;c;d;')
+        self.assertEqual(index.fnames(), ['a', 'b', 'c', 'd'])
+
+    def test_only_changed_segments_reencoded(self):
+        entries = [('a', 0.01), ('b', 0.05), ('c', 0.15), ('d', 0.31)]
+        self._assemble(self._index(), entries)
+        self.assertEqual(self._encodes(), 3)
+
+        # A reloaded index only re-encodes the segment with the new frame
+        entries.insert(3, ('e', 0.18))
+        index = self._index()
+        changed = self._assemble(index, entries)
+        self.assertEqual(changed, {1: ['c', 'e']})
+        self.assertEqual(self._encodes(), 4)
+        self.assertEqual(open(self.movie).read(), 'a;b;c;e;d;')
+
+        # Unchanged frames re-encode nothing
+        self.assertEqual(self._assemble(index, entries), {})
+        self.assertEqual(self._encodes(), 4)
+
+    def test_removed_segment(self):
+        index = self._index()
+        self._assemble(index, [('a', 0.01), ('c', 0.15)])
+        self._assemble(index, [('a', 0.01)])
+        self.assertFalse(os.path.exists(index.segment_fpath(1)))
+        self.assertEqual(open(self.movie).read(), 'a;')
+
+    def test_failed_encode(self):
+        index = self._index()
+        changed = index.update([('a', 0.01)])
+        self.assertFalse(index.encode(0, changed[0], lambda ffmpeg, fnames: []))
+        self.assertEqual(index.fnames(), [])
+        self.assertFalse(os.path.exists(index.segment_fpath(0)))
+
+if __name__ == '__main__':
+    unittest2.main()
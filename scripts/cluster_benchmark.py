@@ -0,0 +1,61 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare DBSCAN and grid clustering speed on synthetic locations (debug tool)."""
+
+import argparse
+import time
+import numpy as np
+from common.cluster_points import cluster_points, grid_cluster_points, compute_centers
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark clustering.')
+    parser.add_argument('--points', type=int, default=1000000)
+    parser.add_argument('--cities', type=int, default=500)
+    parser.add_argument('--n_jobs', type=int, default=64)
+    parser.add_argument('--skip_dbscan', action='store_true')
+    return parser.parse_args()
+
+def mock_locations(n, n_cities):
+    random = np.random.RandomState(0)
+    cities = np.column_stack([random.uniform(25, 49, n_cities),
+                              random.uniform(-124, -67, n_cities)])
+    # 90% of photos near a city, the rest anywhere
+    n_city = int(n * 0.9)
+    near = cities[random.randint(0, n_cities, n_city)] + random.normal(0, 0.05, (n_city, 2))
+    anywhere = np.column_stack([random.uniform(24.5, 49, n - n_city),
+                                random.uniform(-124.5, -66.9, n - n_city)])
+    return np.concatenate([near, anywhere])
+
+def main():
+    args = get_arguments()
+    locations = mock_locations(args.points, args.cities)
+
+    engines = [('grid', lambda: grid_cluster_points(locations, eps=0.1, min_samples=10)),
+               ('grid equirectangular', lambda: grid_cluster_points(locations, eps=0.1,
+                                                                    min_samples=10,
+                                                                    metric='equirectangular'))]
+    if not args.skip_dbscan:
+        engines.append(('dbscan', lambda: cluster_points(locations, eps=0.1, min_samples=10,
+                                                         n_jobs=args.n_jobs)))
+    for name, engine in engines:
+        start = time.time()
+        clusters = engine()
+        centers, sizes = compute_centers(clusters, locations)
+        print "%s: %d points, %d clusters in %.2fs" % (name, len(locations), len(centers),
+                                                       time.time() - start)
+
+if __name__ == '__main__':
+    main()
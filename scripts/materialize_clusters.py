@@ -0,0 +1,56 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keeps the cluster snapshots served by the admin Clusters endpoints up to date."""
+
+import argparse
+import time
+from google.cloud import datastore
+from common import cluster_snapshots
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Materialize user and photo cluster snapshots')
+    parser.add_argument('--project_id', type=str, default="eclipse-2017-test")
+    parser.add_argument('--interval', type=int, default=300,
+                        help="Seconds between updates")
+    parser.add_argument('--once', action='store_true',
+                        help="Update the snapshots once and exit")
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Discard the photo snapshots and rebuild them from all photos")
+    return parser.parse_args()
+
+def main():
+    args = get_arguments()
+    client = datastore.Client(project=args.project_id)
+
+    if args.rebuild:
+        snapshots = cluster_snapshots.load_snapshots(client, cluster_snapshots.PHOTOS)
+        keys = []
+        for snapshot in snapshots:
+            keys.append(snapshot.key)
+            keys.extend(cluster_snapshots.shard_keys(client, snapshot))
+        client.delete_multi(keys)
+
+    while True:
+        for source in cluster_snapshots.USERS, cluster_snapshots.PHOTOS:
+            start = time.time()
+            cluster_snapshots.update_snapshots(client, source)
+            print "Updated %s snapshots in %.2fs" % (source, time.time() - start)
+        if args.once:
+            break
+        time.sleep(args.interval)
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import pprint
+import time
 import shutil
 import glob
 import functools
@@ -39,6 +40,8 @@ from mpl_toolkits.basemap import Basemap
 from functools import partial
 from rawkit.raw import Raw
 from collections import Counter
+import columnar
+import rescaled_cache
 RES_X=1920
 RES_Y=1080
 
@@ -55,23 +58,23 @@ def get_arguments():
     parser.add_argument('--movie_blacklist', type=str, default="data/movie_blacklist.txt")
     parser.add_argument('--movie_stats', type=str, default="movie_stats.txt")
     parser.add_argument('--movie_frame_choices', type=str, default="movie_frame_choices.pkl")
+    # Optional previously generated movie_frame_choices.pkl to compare against
+    parser.add_argument('--reference', type=str, default=None)
+    # Time the original and indexed selection on this many copies of
+    # every photo, instead of writing output
+    parser.add_argument('--benchmark_scale', type=int, default=0)
     return parser.parse_args()
 
 def get_rescaled(fname, metadata, directory, rescaled_directory):
     # TODO(dek): move rescaling to its own function
-    rescaled_fname = fname + ".rescaled.png"
-    rescaled = os.path.join(rescaled_directory, rescaled_fname)
-    if not os.path.exists(rescaled):
+    rescaled = rescaled_cache.find_rescaled(rescaled_directory, fname)
+    if rescaled is None:
         print "Unable to find cached rescaled image for", fname
         return None
-    image = cv2.imread(rescaled, cv2.IMREAD_UNCHANGED)
+    image = rescaled_cache.read_rescaled(rescaled)
     if image is None:
         print "Failed to read image from", rescaled
         return None
-    b_channel, g_channel, r_channel = cv2.split(image)
-    alpha_channel = np.ones(b_channel.shape, dtype=b_channel.dtype) * 255
-    image = cv2.merge((b_channel, g_channel, r_channel, alpha_channel))
-
     return image
 
 def get_photo_selection(photo_selections, i):
@@ -84,7 +87,6 @@ def get_photo_selection(photo_selections, i):
 
 
 def filter_rescaled_photo_selections(i, photo_selections, rescaled_photos):
-    print "Frame", i
     photo_selection = get_photo_selection(photo_selections, i)
     results = []
     if photo_selection is not None:
@@ -95,6 +97,42 @@ def filter_rescaled_photo_selections(i, photo_selections, rescaled_photos):
 
     return i, results
 
+def selection_index(photo_selections, n):
+    """Return, for each of the n frames, the frame whose photo selection
+    get_photo_selection would return: the latest frame at or before it
+    with a selection that is not None, or -1 if there is none."""
+    index = np.full(n, -1, dtype=np.int64)
+    for key, photo_selection in photo_selections.iteritems():
+        if 0 <= key < n and photo_selection is not None:
+            index[key] = key
+    return np.maximum.accumulate(index)
+
+def filter_rescaled(photo_selections, rescaled_photos):
+    """Return a dict of frame -> that frame's photo selection restricted to
+    the rescaled photos, for every frame with a selection."""
+    keys = [key for key in sorted(photo_selections) if photo_selections[key] is not None]
+    rows = [photo for key in keys for photo in photo_selections[key]]
+    fnames = np.array([photo[1] for photo in rows], dtype=str)
+    mask = np.in1d(fnames, np.array(list(rescaled_photos), dtype=str))
+    filtered = {}
+    start = 0
+    for key in keys:
+        end = start + len(photo_selections[key])
+        filtered[key] = [rows[j] for j in np.flatnonzero(mask[start:end]) + start]
+        start = end
+    return filtered
+
+def rescaled_photo_selections(n, photo_selections, rescaled_photos):
+    """Return the list of rescaled candidate photos for each of the n frames.
+
+    Equivalent to filter_rescaled_photo_selections for every frame, but
+    each selection is filtered once and shared by the frames that fall
+    back to it."""
+    index = selection_index(photo_selections, n)
+    filtered = filter_rescaled(photo_selections, rescaled_photos)
+    empty = []
+    return [filtered[k] if k >= 0 else empty for k in index]
+
 def choose_movie_frame(i, rescaled_photo_selection, metadata):
     if len(rescaled_photo_selection) == 0:
         return i, None
@@ -117,11 +155,55 @@ def choose_movie_frame(i, rescaled_photo_selection, metadata):
         return i, rescaled_photo_selection[-1]
 
 
-    
+def choose_movie_frames(n, photo_selections, rescaled_photos, metadata):
+    selections = rescaled_photo_selections(n, photo_selections, rescaled_photos)
+    movie_frames = []
+    for i in range(n):
+        movie_frames.append(choose_movie_frame(i, selections[i], metadata))
+    return dict(movie_frames)
+
+def choose_movie_frames_reference(n, photo_selections, rescaled_photos, metadata):
+    """The original frame selection, kept for parity checks."""
+    selections = dict(filter_rescaled_photo_selections(i, photo_selections, rescaled_photos)
+                      for i in range(n))
+    movie_frames = []
+    for i in range(n):
+        movie_frames.append(choose_movie_frame(i, selections[i], metadata))
+    return dict(movie_frames)
+
+def scale_photo_selections(photo_selections, rescaled_photos, scale):
+    """Return photo selections and rescaled photos with scale copies of
+    every photo, for benchmarking."""
+    scaled = {}
+    for key, photo_selection in photo_selections.iteritems():
+        if photo_selection is None:
+            scaled[key] = None
+        else:
+            scaled[key] = []
+            for photo in photo_selection:
+                for k in range(scale):
+                    copy = list(photo)
+                    copy[1] = "%s.%d" % (photo[1], k)
+                    scaled[key].append(type(photo)(copy))
+    scaled_rescaled = set("%s.%d" % (fname, k) for fname in rescaled_photos for k in range(scale))
+    return scaled, scaled_rescaled
+
+def benchmark(n, photo_selections, rescaled_photos, metadata, scale):
+    photo_selections, rescaled_photos = scale_photo_selections(photo_selections, rescaled_photos, scale)
+    timings = []
+    results = []
+    for f in choose_movie_frames_reference, choose_movie_frames:
+        c.clear()
+        start = time.time()
+        results.append(f(n, photo_selections, rescaled_photos, metadata))
+        timings.append(time.time() - start)
+    print "%dx photos: reference %.2fs, indexed %.2fs, outputs %s" % (
+        scale, timings[0], timings[1], "match" if results[0] == results[1] else "differ")
+
 def main():
     args  = get_arguments()
-    photo_selections = pickle.load(open(args.photo_selections))
-    movie_blacklist = [line.strip() for line in open(args.movie_blacklist).readlines()]
+    photo_selections = columnar.load_frame_table(args.photo_selections, columnar.PHOTO_SELECTION_FIELDS, list)
+    movie_blacklist = set(line.strip() for line in open(args.movie_blacklist).readlines())
 
     s = set()
     frame = photo_selections.values()
@@ -132,32 +214,28 @@ def main():
                 s.add(photo[1])
 
     print "Total of", len(s), "photos"
-    fnames = list(s)
-    fnames.sort()
 
-    rescaled_photos = set()
-    for fname in fnames:
-        f = os.path.join(args.rescaled_directory, fname + ".rescaled.png")
-        if os.path.exists(f):
-            rescaled_photos.add(fname)
+    rescaled_photos = s & rescaled_cache.list_rescaled(args.rescaled_directory)
 
     print "Total of", len(rescaled_photos), "rescaled photos"
     
-    polys = pickle.load(open(args.umbra_polys))
-    blahs = []
-    metadata = pickle.load(open(args.metadata))
-    rescaled_photo_selections = []
-    for i, poly in enumerate(polys):
-        rescaled_photo_selections.append(filter_rescaled_photo_selections(i, photo_selections, rescaled_photos))
+    polys = columnar.load_umbra_polys(args.umbra_polys)
+    metadata = columnar.load_metadata(args.metadata, ['equatorial_mount'])
 
-    rescaled_photo_selections = dict(rescaled_photo_selections)
+    if args.benchmark_scale:
+        benchmark(len(polys), photo_selections, rescaled_photos, metadata, args.benchmark_scale)
+        return
 
-    movie_frames = []
-    for i, poly in enumerate(polys):
-        movie_frames.append(choose_movie_frame(i, rescaled_photo_selections[i], metadata))
-    movie_frames = dict(movie_frames)
+    start = time.time()
+    movie_frames = choose_movie_frames(len(polys), photo_selections, rescaled_photos, metadata)
+    print "Chose %d frames in %.2fs" % (len(movie_frames), time.time() - start)
 
     pickle.dump(movie_frames, open(args.movie_frame_choices, "wb"))
+    if args.reference is not None:
+        if movie_frames == pickle.load(open(args.reference)):
+            print "Output matches reference", args.reference
+        else:
+            print "Output differs from reference", args.reference
  
     f = open(args.movie_stats, "wb")
     keys = movie_frames.keys()
@@ -0,0 +1,273 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar on-disk storage for the offline movie pipeline.
+
+Each dataset is a directory holding one .npy file per column, so
+readers can memory-map just the columns they need instead of
+unpickling a whole file.
+"""
+
+import os
+import pickle
+import numpy as np
+import pytz
+from shapely import wkb
+from shapely.geometry import Point
+
+# Columns of the per-frame tables (umbra_photos.pkl, photo_selections.pkl,
+# movie_frame_choices.pkl)
+UMBRA_PHOTO_FIELDS = (
+    ('distance', 'f8'),
+    ('fname', 'S'),
+    ('lat', 'f8'),
+    ('lon', 'f8'),
+    ('image_datetime', 'M8[us]'),
+)
+PHOTO_SELECTION_FIELDS = UMBRA_PHOTO_FIELDS + (
+    ('width', 'i8'),
+    ('height', 'i8'),
+)
+
+# Columns of the photo metadata table (extracted_metadata.pkl).  Missing
+# integer values (including the equatorial_mount flag) are stored as -1,
+# missing strings as ''.
+METADATA_FIELDS = (
+    ('lat', 'f8'),
+    ('lon', 'f8'),
+    ('image_datetime', 'M8[us]'),
+    ('equatorial_mount', 'i1'),
+    ('width', 'i8'),
+    ('height', 'i8'),
+    ('user', 'S'),
+)
+MISSING = {'i1': -1, 'i8': -1, 'S': ''}
+
+def save_column(directory, name, values):
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    np.save(os.path.join(directory, name + ".npy"), values)
+
+def load_column(directory, name):
+    return np.load(os.path.join(directory, name + ".npy"), mmap_mode='r')
+
+def to_column(values, dtype):
+    """Convert a list of python values to a column of the given dtype."""
+    if dtype.startswith('M8'):
+        # Datetimes are stored as naive UTC
+        values = [v if v.tzinfo is None else v.astimezone(pytz.utc).replace(tzinfo=None)
+                  for v in values]
+    return np.array(values, dtype=dtype)
+
+def column_values(column, dtype):
+    """Convert a whole column back to the list of python values it was
+    written from, a column at a time rather than an element at a time."""
+    if dtype.startswith('M8'):
+        return [pytz.utc.localize(value) for value in column.astype('M8[us]').astype(object)]
+    return column.tolist()
+
+class Table(object):
+    """A directory of equal-length, lazily memory-mapped columns."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._columns = {}
+
+    def __getitem__(self, name):
+        if name not in self._columns:
+            self._columns[name] = load_column(self.directory, name)
+        return self._columns[name]
+
+def write_metadata(directory, metadata):
+    """Write the fname -> metadata dictionary from extracted_metadata.pkl."""
+    fnames = sorted(metadata)
+    save_column(directory, "fname", np.array(fnames, dtype='S'))
+    for name, dtype in METADATA_FIELDS:
+        values = []
+        for fname in fnames:
+            value = metadata[fname].get(name)
+            if value is None:
+                value = MISSING[dtype]
+            elif name == 'user':
+                # Datastore user keys are stored by name
+                value = value.name
+            values.append(value)
+        save_column(directory, name, to_column(values, dtype))
+
+def read_metadata(directory, fields):
+    """Read only the given fields of the photo metadata table into the
+    fname -> metadata dictionary format of extracted_metadata.pkl."""
+    table = Table(directory)
+    fnames = table['fname'].tolist()
+    dtypes = dict(METADATA_FIELDS)
+    metadata = dict((fname, {}) for fname in fnames)
+    for name in fields:
+        dtype = dtypes[name]
+        column = table[name]
+        if dtype in MISSING:
+            present = np.flatnonzero(column != MISSING[dtype])
+            column = column[present]
+        else:
+            present = range(len(fnames))
+        values = column_values(column, dtype)
+        if name == 'equatorial_mount':
+            values = [bool(value) for value in values]
+        for i, value in zip(present, values):
+            metadata[fnames[i]][name] = value
+    return metadata
+
+def load_metadata(path, fields):
+    """Load photo metadata from a columnar directory or a legacy pickle."""
+    if os.path.isdir(path):
+        return read_metadata(path, fields)
+    return pickle.load(open(path))
+
+def write_frame_table(directory, frames, fields):
+    """Write a frame index -> rows dictionary (such as umbra_photos.pkl).
+
+    Rows are sequences whose items match fields.  A frame with a value
+    of None is stored with no rows and flagged in the "is_none" column.
+    """
+    keys = sorted(frames)
+    rows = []
+    offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+    for i, key in enumerate(keys):
+        value = frames[key]
+        if value is not None:
+            rows.extend(value)
+        offsets[i+1] = len(rows)
+    save_column(directory, "frame", np.array(keys, dtype=np.int64))
+    save_column(directory, "frame_offsets", offsets)
+    save_column(directory, "is_none", np.array([frames[key] is None for key in keys], dtype=bool))
+    for j, (name, dtype) in enumerate(fields):
+        save_column(directory, name, to_column([row[j] for row in rows], dtype))
+
+def read_frame_table(directory, fields, row_type=tuple):
+    """Read a table written by write_frame_table back into a dictionary of
+    frame index -> list of rows."""
+    table = Table(directory)
+    offsets = table['frame_offsets'].tolist()
+    is_none = table['is_none'].tolist()
+    rows = [row_type(row) for row in
+            zip(*[column_values(table[name], dtype) for name, dtype in fields])]
+    frames = {}
+    for i, key in enumerate(table['frame'].tolist()):
+        if is_none[i]:
+            frames[key] = None
+        else:
+            frames[key] = rows[offsets[i]:offsets[i+1]]
+    return frames
+
+def load_frame_table(path, fields, row_type=tuple):
+    """Load a per-frame table from a columnar directory or a legacy pickle."""
+    if os.path.isdir(path):
+        return read_frame_table(path, fields, row_type)
+    return pickle.load(open(path))
+
+def write_frame_choices(directory, choices):
+    """Write movie_frame_choices.pkl (frame index -> row or None)."""
+    frames = dict((key, None if value is None else [value]) for key, value in choices.items())
+    write_frame_table(directory, frames, PHOTO_SELECTION_FIELDS)
+
+def load_frame_choices(path):
+    if not os.path.isdir(path):
+        return pickle.load(open(path))
+    frames = read_frame_table(path, PHOTO_SELECTION_FIELDS)
+    return dict((key, None if value is None else value[0]) for key, value in frames.items())
+
+def write_circles(directory, circles):
+    """Write all_circles.pkl (fname -> HoughCircles output or None)."""
+    fnames = sorted(circles)
+    rows = []
+    offsets = np.zeros(len(fnames) + 1, dtype=np.int64)
+    for i, fname in enumerate(fnames):
+        if circles[fname] is not None:
+            rows.extend(np.asarray(circles[fname]).reshape(-1, 3))
+        offsets[i+1] = len(rows)
+    save_column(directory, "fname", np.array(fnames, dtype='S'))
+    save_column(directory, "circle_offsets", offsets)
+    save_column(directory, "is_none", np.array([circles[fname] is None for fname in fnames], dtype=bool))
+    save_column(directory, "circles", np.array(rows, dtype=np.float32).reshape(-1, 3))
+
+def load_circles(path):
+    if not os.path.isdir(path):
+        return pickle.load(open(path))
+    table = Table(path)
+    offsets = table['circle_offsets']
+    is_none = table['is_none']
+    circles = table['circles']
+    results = {}
+    for i, fname in enumerate(table['fname']):
+        if is_none[i]:
+            results[str(fname)] = None
+        else:
+            # Same layout as cv2.HoughCircles output
+            results[str(fname)] = np.array(circles[offsets[i]:offsets[i+1]]).reshape(1, -1, 3)
+    return results
+
+def write_umbra_polys(directory, polys):
+    """Write a sequence of (poly, centroid, datetime) umbra tuples.
+
+    Polygons are stored as concatenated WKB plus an offsets column.
+    """
+    blobs = [wkb.dumps(poly) for poly, poly_centroid, poly_dt in polys]
+    offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(blob) for blob in blobs])
+    save_column(directory, "wkb", np.frombuffer("".join(blobs), dtype=np.uint8))
+    save_column(directory, "wkb_offsets", offsets)
+    save_column(directory, "centroids",
+                np.array([(c.x, c.y) for poly, c, poly_dt in polys], dtype=np.float64).reshape(-1, 2))
+    save_column(directory, "timestamps",
+                np.array([poly_dt for poly, c, poly_dt in polys], dtype='datetime64[s]'))
+
+class UmbraPolys(object):
+    """Memory-mapped, lazily decoded view of umbra polygons written by
+    write_umbra_polys.  Behaves like the list of (poly, centroid,
+    datetime) tuples stored in umbra_polys.pkl."""
+
+    def __init__(self, directory):
+        self.wkb = load_column(directory, "wkb")
+        self.offsets = load_column(directory, "wkb_offsets")
+        self.centroids = load_column(directory, "centroids")
+        self.timestamps = load_column(directory, "timestamps")
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def poly(self, i):
+        return wkb.loads(self.wkb[self.offsets[i]:self.offsets[i+1]].tostring())
+
+    def centroid(self, i):
+        return Point(self.centroids[i][0], self.centroids[i][1])
+
+    def datetime(self, i):
+        return self.timestamps[i].astype(object)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError(i)
+        return self.poly(i), self.centroid(i), self.datetime(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+def load_umbra_polys(path):
+    """Load umbra polygons from a columnar directory or a legacy pickle."""
+    if os.path.isdir(path):
+        return UmbraPolys(path)
+    return pickle.load(open(path))
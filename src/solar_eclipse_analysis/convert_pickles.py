@@ -0,0 +1,78 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Convert the analysis pickles to the columnar format.
+
+Each pickle given on the command line is written to a directory of the
+same name (without .pkl) under --output_directory.  Every stage that
+reads these files accepts either form.
+"""
+
+import os
+import time
+import pickle
+import argparse
+import columnar
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Convert pickles to columnar format.')
+    parser.add_argument('--metadata', type=str, default=None)
+    parser.add_argument('--umbra_polys', type=str, default=None)
+    parser.add_argument('--umbra_photos', type=str, default=None)
+    parser.add_argument('--photo_selections', type=str, default=None)
+    parser.add_argument('--movie_frame_choices', type=str, default=None)
+    parser.add_argument('--all_circles', type=str, default=None)
+    parser.add_argument('--output_directory', type=str, default='columnar')
+    parser.add_argument('--benchmark', action='store_true')
+    return parser.parse_args()
+
+def timed(f, *args):
+    start = time.time()
+    f(*args)
+    return time.time() - start
+
+def output_path(output_directory, fname):
+    return os.path.join(output_directory, os.path.splitext(os.path.basename(fname))[0])
+
+def main():
+    args = get_arguments()
+
+    conversions = [
+        (args.metadata, columnar.write_metadata,
+         lambda path: columnar.load_metadata(path, ['width', 'height'])),
+        (args.umbra_polys, columnar.write_umbra_polys,
+         lambda path: list(columnar.UmbraPolys(path).timestamps)),
+        (args.umbra_photos,
+         lambda path, data: columnar.write_frame_table(path, data, columnar.UMBRA_PHOTO_FIELDS),
+         lambda path: columnar.load_frame_table(path, columnar.UMBRA_PHOTO_FIELDS)),
+        (args.photo_selections,
+         lambda path, data: columnar.write_frame_table(path, data, columnar.PHOTO_SELECTION_FIELDS),
+         lambda path: columnar.load_frame_table(path, columnar.PHOTO_SELECTION_FIELDS, list)),
+        (args.movie_frame_choices, columnar.write_frame_choices, columnar.load_frame_choices),
+        (args.all_circles, columnar.write_circles, columnar.load_circles),
+    ]
+
+    for fname, write, load in conversions:
+        if fname is None:
+            continue
+        output = output_path(args.output_directory, fname)
+        write(output, pickle.load(open(fname)))
+        print "Converted", fname, "to", output
+        if args.benchmark:
+            print "  pickle.load: %.3fs" % timed(pickle.load, open(fname))
+            print "  columnar load: %.3fs" % timed(load, output)
+
+if __name__ == '__main__':
+    main()
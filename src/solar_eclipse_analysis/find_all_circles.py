@@ -2,2298 +2,189 @@ import pickle
 import glob
 import numpy as np
 import os
+import time
+import zlib
+import base64
 import traceback
 from multiprocessing import Pool
 import cv2
 import argparse
-from find_circles import findCircles
+from find_circles import detectCircles
 from rawkit.raw import Raw
 
-blacklist = set([
-    '0008415386b3e767dce4de9124104f66a270a71cefcf46f98bc49fddc1998b2e',
-    '000fcbda098cb0f67c2f821045d40d1f0345b9da003ba0f73f6d0faf946a87c7',
-    '00101bc23c829bc6247f0e0ee97851573e0521f1af294d04e6cd93a9441be01f',
-    '00106b370b0d67698df6959f460817ccdac0a90837dad7d9215edd6bed66a6f6',
-    '004a6abd6a52ccf95612344d2b4761559a837b4cae5d06a1e7a86076b1663f24',
-    '00588b76cbad82516a2e44e1e034cc0a938fb9177dcd950ed464eba3cb595b2a',
-    '005a87231314e35fec9267907797ec1199c3c62efe166c99130daa7fc339e0b1',
-    '0089d49c892b6d15513690521c08eb5ffc93fe24a4926c11903c821e2dcb0b76',
-    '008ee91b75df5ae84ad0a304978dfd284e5f4d9b048b3684d62d06572e6a769e',
-    '008f37e017970ff1657c04e38d86214243066b66d55e9df819b30d1c2c58bbe2',
-    '00909ebb455ac8bfce6ec8d2c170e172342fbffc6ab00118254f912e036d8dfc',
-    '00a15bd087b158d69c5d89bac826f22fcfb478fb916e70c2ce68b50288cfd9a6',
-    '00d2ccc4963c0f8ffb3f1c2f286b691a62043d8e01d07ce4706f27656e6e716b',
-    '00e9e997103151b1b8c5d6c4ca135f2877ad697cd6280fef43082b64c7ffc0d3',
-    '010f80a9c759fb99b629fd89a3a1de951655cb8f83138c4f6456e41b77add0b7',
-    '01168698d2cbd4aef8024d40a309d902880cd23de84f7418966bb0ed0a3655f0',
-    '0160498b80fcf8f55002627f1f3eb7c6969675f787741043c5c8610837c54be3',
-    '0164995550c1f80fe5d6ddfeb0c89115e804e464f7345d63c117559063cf8092',
-    '017fefeb09fad4fd7273ed7c663cf04e802a6492fcb280ad29e8f4cc3a546968',
-    '019eba0aa54c02a860586becf32229dfcd14d402c9a4af77a8738ff5fc3dec31',
-    '01b09b92f1b11881d40a5667f613ff1d76789e1b578fa731bbdeef6c2d641e98',
-    '01be0acdaa4b8fdd5d091d0cfe33d639fb18e39a633d3a7547ccbb411e5e2d2f',
-    '01eff6a0e97dcd20217ab3a9b5cc8d58cb2c15639d01a1651d0410050ae48881',
-    '02261afa97df9d69e0064701ee3bb9083f716fca8f6c5d7e7316d85e4ae69e43',
-    '0236ee789673897f3e379d7c3aa842dbaa2a7112ab078e88733e2c2a58ee3b01',
-    '02426273183de222144403295028c41f535ac84b9712ce32e6423bb382116b16',
-    '0248e13e4761dc1a483204ab96d522b7a13d751132a453a78046d8dce9787cf0',
-    '024a56cdf5abe7a2611bebdb9d1237d0718787ca99f3d51ce252b50f4d5f06ce',
-    '024d91f39d4deabb97d8f6934c17e537efee5573bce225f40146798ac8276361',
-    '02539721b582f7a4d280ec0d5fd0b9d16f5f151d8cfe016824aeeb33655dc614',
-    '025d05e2d49ad3f305f641a4e963c819b787b0540db743bad6eff9f80889171c',
-    '028536974b75c7605101ee8abc37d49fa2dc8a9cf3bb420cd5e000d6654a66a9',
-    '02905b5a699d85b37327726df1cef906734e0568727dacba638c43e0572f7ab0',
-    '029bd41acacb5d2fdbb80b8df0c14b7917cd43c5795475aa44fc6bd0cac816ec',
-    '02a5117bb6a85ff41b2a30487d7090fd2ebd4e7354e21dcc79a6f8ae8b303d8d',
-    '02a631a0b827647e38162f5218017ec647a1d9bedab3cee84aeac323308b4a6d',
-    '02a703dcd711e77c40c439828870274f569ef8393653641305c087a7d2ccd242',
-    '02ab3b7e5b4c5479b58cff676544ce00e2e6eab2db090b7f2cac1b3d525ee873',
-    '02f8a97a02b8120c28abcac3594810ee5d327d8926ad6a9c0703d0d8236f3f7d',
-    '03032defa7588a2fcf801538d5108c926aaee6d91f6501080f9b96429397cd60',
-    '03085dbad08dce877c5bc87f8186940887e65f39fc9893ab4e741b30ad75e2c6',
-    '030edf22ca14bbd42b6c9180ec419847dd63b933c2e871d005ef0b31a6467da4',
-    '03509106e75548a93d2baf7920b299857949694fe70f62ae50068869586ec08a',
-    '0372d83aa36ff9d1e8942eca228c27801897cea608e9d96af4570b1cf2ec8595',
-    '0395f1d43e665e75a1502b3f6420ab75d3602ce5720db5066210050c2d83fe50',
-    '03d77e7c88493b30ae570def1bcfdb3fb4805d86bb3db335e39c0ab6d5ebfc1d',
-    '03f5ed325e61005c6eeeb18e9a085f3fda6a513f95ed931412b4ba92042be3b3',
-    '04022b74f9898254d1e38b0337a3ab7c198a6dc42f78db97d524e3a01f5abe0c',
-    '040571aa17c65fe63249613b6bc57d68170c213618b13d2e62c89435515d96d1',
-    '040d2144f90848124d6544774bd5824e96a9eb3b4d04f9bcfe5c56ceb36bac23',
-    '04236ef055908ea8ca456dd8a9f746a6769a18289d8e6dcffc641ba9d336533d',
-    '0437b9df293495e2c70566c708cc723b1cf257ff0b1646fa3398098daf6b58e6',
-    '048a3d88398cd57d61c74c6289802c335d1c2e28a8e6e0658f086ab2ca669af5',
-    '04c50089d1c0019790cf55703dfdb7097182b907bfb87b39e821d40ec7383b22',
-    '04cef8de7187c80494165c240a841b9f337e9975622f1600cea810d0c4bc3c21',
-    '04ed40d611ba97ae04f5edc0074d828ee12c713f54e7ffc583d43e5a4abdb481',
-    '05302a9e089f34b62a91a9ef6afdffc16ca57748908a01c3ed40e0bd00cd99e1',
-    '05524fdf91303d0036827c630941a42ec916e7ef39dfe5d7ed7ad6cee3ccd1d4',
-    '0557102d0a2b95b3764232c90ac384a5205cba1ed9a2329784499445355cb529',
-    '0567511790915d839cdb4080b4fcf8a97002980cff6286f8db6dba3280c4c404',
-    '05b3f4155ae4f29f744b6c0f85147300ba1850d1ebfd5c7b50d804bcfb026608',
-    '05c02159611aaf060f688ace77ced12d186a05235f9c189adce217fef3647e6f',
-    '05dc8cda43f7c3abd82e3cfb18c6f3f41247831f2ebdcfc35bd2650565283c6e',
-    '061f7388279cbe0d5d3eebfdec178edbf2a48fbd16494380add5d3bdfbd38a15',
-    '06279430a184b71d406f01eb60cc5ad38e370f3a9e36f93b36f3aec422b96aa5',
-    '062e1f163bb0be2ce8bd5dd211a2a26f857a90aa7abf17f6e9dabeeae8745bae',
-    '06497bf25aedc8470ca6f5537b8da973c096d111d2beb5784dcd8370cd182d75',
-    '06712c94d5a24016298f64abda4fc2a8ddee28b6d039bbc0416b5e69d9e0b10c',
-    '067f12e06e8dd8616dee596234ecd7b38a062ce2f7d2c924977bf67c6c204330',
-    '068b30e4be9e1abcb20407f0878074135453739293578e6b877985c8a9ef7c43',
-    '06909275617865813346a590fbec37c7f0d2ffa08817e6120be2e5e9356bb778',
-    '06a81c451ed088dbc4fa5262afd06cda31fa4ba3553847819e80e0c58eaa1236',
-    '06b99e3056b9e30166a54d80958f8d552e55af56095381f967587bb8f830bad3',
-    '06bf4f53aab8878c9e9dfb02f5750496b1e0c93a85e2f3fbea3aa3e81e72e055',
-    '06f03b8bab5595b41439b7fdaf495493400d6f2464abb2e91f53393f37aaea3d',
-    '06f35245ec1c1c1410b601217a089a7877179288d0261114e963a4433182d97f',
-    '06f4f4cbf408cc1349fcc2e17244aba5c7e85e6486fc9da4b539375e820dbc26',
-    '06f62a93f5e83e379b92ec718fffedda316fa4d2f0d8ca566b622edda2b1bc15',
-    '07216a0da7a784ef0389ed375baf673097eea684d525b081fa17d41c9c99b98b',
-    '074de2e5be92797cc8561af02d305b75e34a47b1e92f00544ef113c461e34b0e',
-    '074e65894353a32998d933c7c1cd74493c53e7db85c24bbaa3a9b68ff2b11409',
-    '07a43d3c78cb67e6c4852b39a3a88422c76b8f088a613ee8114e2ab63411758a',
-    '07c2a2d62822a9c58a578ba392fa39b337adaf070d707bd77507db0332367ff3',
-    '080803d26ecfef15741db08a14dd9762a792489415167036c1c3a1a2e5c03a0a',
-    '082f27f82ff748ed9ba2d5daf692e060f267a3f4ba8161d76b89afe456b0655a',
-    '0837d11bd14ce07673edadea134e23e5497138094ac03bb9e31148e33054bbb7',
-    '084ce491b120b3e5e58a1a0cdf1f627b0a52ac4a9394cc78da6dbcea88c4d4e5',
-    '0856afca36301f79d53343254b70cafd5ab8f18b381dc00c84df5e52f045024d',
-    '088a0ebf7703ce9f696c811b7dcd8abba99c1706f19f994724a06c836dcd7c07',
-    '088ac4c647b9eea70f43877bdc319d6e5559c55b8a9b3405a3bf4b5dc0ba909e',
-    '088d188e23eb8aa5c4d5bc653714dd9a8e147dae86bd09a176d3a47e8eade4ae',
-    '08c7c7e391ae09c36d8b538d54aea428f7c22e0a6c81f95420da6c57be174577',
-    '08e0515e05dca54c5d66ba33deafb218e730b6336a40fdb3cee865378c91c2e5',
-    '09047cbdbac952648a9134f04154cec6726ef8ca59b122fcdf064d2ac060a103',
-    '09096250600256e275e310fbd11f63abcc725fcc357126a7b30aa11ff4d8e283',
-    '090ccdea8a9f4d2a52c6b7c733d4e7d48e7c566e2c7b3d7bb2c8b4a2713eef16',
-    '09190c5dd4a4fda7cc9a1a0aacd6a263c56413bb8d6e19fc18f49ee9db41008b',
-    '09197dd37bde7570157f8708b4d73711eaa8db2dfde9bae1dc9c2ff422dd54c3',
-    '093f97dd9c994903d58e89184381d0f3eb42f3987abc98d53a558857f4ad8f88',
-    '095bd84a62f62efcd6c9c6c90249cb0e66340612de76d1c74b8901928bab7e91',
-    '09986561cd1cda231806a28da98c6c3b4734d6c46576aa2dccd1bcd04387e3a2',
-    '09a60bd5370c274cd15d961117f37843efb80671ed2392677272956e8c41adbd',
-    '09c9ee6d4ac1e9e1c90261162ad40289e2c0ce38c2328c7206d517f59dde0bb4',
-    '09ef00b3fea2c96f3423619d45d581d81cfe8ddaa20dbfdbcaedd8715dde0ff6',
-    '0a08b51ccf7687c7b8945089803a1655572494a3cc947d3f6359c1d932cf0dde',
-    '0a0922aa528aa7c76f865e899930fd7c70da46b0e29febd8bc36f1435cdf5963',
-    '0a3a5ad33ca8e9be8d5509193fab443591081a55fd142201738618ff9b360992',
-    '0a51ca025398c825d76450e82a50a651021a237c27ea5f4d294d473f73769472',
-    '0a6601eaae24d111237c8ec6073fe03f8359b3860935ac7738bbcf0eab133c47',
-    '0a940d191bdba9d4331db8385f42716ef44b746ee8e40daa089d523fd806edd4',
-    '0a9cbc5782883f017bc44349d88f70a14c73b9a00c2a3ce494ae9b8379d98546',
-    '0ac48af48b446393cee52056ffd2c79ed7f5531a9820f413be34b625af8a1e11',
-    '0ac7334a0935e21eb240d69dccd944fc5e5806703446c2136dd18d2b86aed9bc',
-    '0ae1841e1240f6cad42aa1c5b78d88ff93ce2ddfc2d4a0fbfd2c58faa776d5fc',
-    '0ae9d650a77de67357e0d1da73d5aa45edbc2cf114b969d943c27bfffc0ae840',
-    '0b05519a0d846402091eb6ca7dfd49281eca4f896d8554f5cd22c9ddf05552a5',
-    '0b07a89cf2583c235f3347ef3a3d5fb113c74ddf8b9fbd613ac0b02af5a49970',
-    '0b10f192d4f88fac6c1e1eba133289156722ce0c5c6d844daf779e8fe015115d',
-    '0b1c2e9b46d2c1377282c502f8b95fb58d4cccc5632696064bc9b8a5c38c30ad',
-    '0b2ceec196a0cf40901f8a330cff26f3265ca8660f3861d2d5396f87c1c61e82',
-    '0b347c89f0566254b3085997e8ef015007ee7176975fdfcf19affe093dc29864',
-    '0b4a71fb81ca75d0e1283132773143062a7f4a3eae2f45bf13489a2984545e1a',
-    '0b5f8109897aaa29dd5551895fe7b6103f5a2b859b71435b97f97d13976d3771',
-    '0b8704ca65b4cf6f2d67971dfb835fc96d4ab6aa58b7f44e5a2c831fcd232728',
-    '0b89cf05dde6c5d144a7b4c99999e7655cf61a50d5ce21e6bb1f1a820d1f2ab9',
-    '0ba7d777d7de7c98c9251ff5019568c47c0b9cf8949ee587242d2d3d4c2890b8',
-    '0bbb0f2bee99c936067414b8e0bfa6923aeb0168c6d34599418213a7d93b09a2',
-    '0bcbe92db6f2eb95cd4dc6474c743d92ee6021f136cd02f73f3ead6e3a2a3bd6',
-    '0bcfe28c44da573cd88c17dc9c027c1eb83f295b3ed828f137d547184a3eb076',
-    '0bd0a2198d85f061b3228533473e55d3401b2c24e99dbf58c803139049e07250',
-    '0bd57023b1498c853c56c03f460c2edbbfadd88f5285365d44ad69b8bbbc6d0a',
-    '0bd5ee77249120b00ec7220d32d436c023b27c7bdb9b1988523f45ab1282fad2',
-    '0beaea775dc111453b3c0f14819c0567b3a25b358c851607bf2c31cad7a4879c',
-    '0bfd770c56087c300a634c19fe67a391cc20203b829f2dada3adf0e7d7aed74b',
-    '0c3b9dcfc01b15a9a889352ad9e7648909f20860bd276631d118b790a619b519',
-    '0c4bd9fbf660277f134906352327814c5b57022f1ab2608fd6e1b3daa8cd9930',
-    '0c53243622d05f1fad6765303e7fcb79aa0f7509339914c9ba92080e3aaee417',
-    '0cad3157dbf53da03c5199f005cce3fd893e44b5c904594d212b983a8cf90f2e',
-    '0cb8c78f0088214463e43daf203fafc1d109d3f9abe10896cbd81b2f2006563e',
-    '0ccf98d5027d6691c68d99fcb37ad9939327672309c3de44585c09344d78c6d8',
-    '0cfca84eeade605e41c10c61fc21875402ce813ad93e83203c791377c5ef0401',
-    '0d1f7ece130d947f0792a07fd0007757456b8e5d5a76791ebaf64e7769119f14',
-    '0d3b318e361c7daa9dcf46ebc94f5ed915bd2d4efd9080b63e5ba0e132d12b2b',
-    '0d58c36539af4988f64479829a886a43b2bd7f9cdd7e22d1f16f66230039e35d',
-    '0d635e03c22cffe978896d9653815c377caec45c4317667b9b8d49e020a3e346',
-    '0d6fd8fa0c28ade654e9e35c52d9ec5e64ab4362e46418f1ff2c77a2da6461fe',
-    '0d96d3a35be00be471db0de69d8739c22ef1221779d44766219fa92da49cfffb',
-    '0d98d681df5e69ceddb4878bcbdcadc1bb04cc5548f3cb6e492f9fcf44618e37',
-    '0da7fa1b8ffb323146b96cba51c8795e6f4c6083c37959d49e6af9825e23f64a',
-    '0db73134c97197c543e5fe9465656ae26ddf5c42eae9615603791b7124ee5ce3',
-    '0dc67c4cc6f6dc906605668d068becf07933e3392a28e53c237b7c24dfa6185b',
-    '0def4a90d7500fbe8a3a596e15b5c33e04d005dc59a8eb29011be6126728d50c',
-    '0e00f8cb36e909df0855d84bb8d79418c4c7ea75281c45e0f3f75ac173ee1730',
-    '0e039074c7e47f3d8ce04fdfd43ed61f3eadc3484c4af8bdfc2847fceae2ccf7',
-    '0e10a20dde4507ac0009e31a14974b533d2505a4ae1aa76b9774aeceb8b6a6dc',
-    '0e123344b0dbc99abe09f66ca3e588e7f5269152614bc3196021d99de72f173a',
-    '0e1440507a634585731c86bb961b55626c189bf34236a1440336360a968790fc',
-    '0e155fcf6562025b571dfd3095cbcb7b0624c591e6e2f32d2fa22bc5fba3861d',
-    '0e345bef02367728e0de6071df0ad38ee36cbe734fee368c77b10328c0d364f3',
-    '0e41abc247249f42abaf57b16619d16d496c915ceac1cc9c17f5d254be4de188',
-    '0e51524790c2864e22806d14a0f1d27e7c7d9d4db9c43b6cb709bd67710f681a',
-    '0e66ff7ab18d454a4b686188ca1ac3e2c748e72cb4eacbb8d89fbb70eda1eabe',
-    '0e7041bce2e36c4b37ab89e0a40109f50ebf12a1d5d738e202a0cdf3f777f70e',
-    '0e763d105a1785671ef5d5486b4bc68ed263e00f1df7059ffadcab99a8761b28',
-    '0eadd87fd93caff1e250e4f5827b70ff2458d43d2087e7c9ca107dfa4fced5d9',
-    '0eb073237b6512209aa5db77453408b33778b50ab8477e3900681423670b7760',
-    '0ecae8cb4f8adc6cec549a4416184e284610aa2a60b5b24a1564dc8b0349b031',
-    '0f03ebe16f3e528b5d420b17e9a3825829bb1232c07f8786e789a71b8f5d2102',
-    '0f1bad889d946acf2bd0f2dc3c9f1cda0a1fa3da0549f16296746d24287eebc2',
-    '0f1f32afd1a93416840c99ca37d08376a93217187e7ca1e6f3a11c1e3a8c7c7c',
-    '0f24bf966755f79538b2d7b07a31038aa8e747d7d49fc728dded3c894d30e7d4',
-    '0f2e13d9aa02516d85b090c6ca5df65ca2977b2028fba34636d496c74c9d1253',
-    '0f3812b018adb9b3318635b129dbfdfd49ddf49f550d425c11acb58f9319b3f1',
-    '0f3b78393957b1ae778f9ba079f60c5c8af26ae5a80ae664e91a299e2a8f61f7',
-    '0f3b7eea0d1a24c3d2bde10e4fee85288a9a076e04cd5aa355a0f93e5afb56f7',
-    '0f545d711afca92b2d59a46a5446b1196cd4c209583102bea8c31fc6c162da1d',
-    '0f5cce32b352522ceda70abbef3f710e38b98a3317d870c04d5cb95b0549964d',
-    '0f6654493d98674bcd05cbb161077dd9cdc6e5ece360593b1ae5ca717c607e5d',
-    '0f7cbee122412627436e8b17df66b844dddaead9c903165c594af8a937246adc',
-    '0fa9811a39114d36511dc1d653f7cf26a1df9e8fe39f654c7111e88d6b615dfc',
-    '0fb4fc504c4e0fc9d33e10db10430fd34953f4d23bdb2e7ec6d10d728d1e0ce3',
-    '0fc6af8a0da1eec67aed8adfe64c59de3c7b93bec62a9e8f509c8c423a450824',
-    '0fc9a1434ccf3c846703e4315c78e090aaa311fcf2a5547b79b6ac70ec81eb52',
-    '0fdbf9c9f18b8de723cd76945d88bca7f48a92cdbfe04d25d51d91109bebce37',
-    '0ffbf0b12ae8be292071e10076d442c9d57c3cfbb8cb9bb21512f4dd220959f0',
-    '1001596f80b924fdffbb0b8d800efca099db6b1f548cd2cec70f424bf9a7d20e',
-    '1015482a9f731ae8a6814d1d2ca18f506575db2fe80754bde651506e33324f0e',
-    '101a28312a71ff93f6695f282b84397923f343bcea74d2ff9e522b15d800dae4',
-    '10208c5b0000e223d85c50d103ccb41dd3533186e58f64c20fca58af26ae356d',
-    '1030db94d2c6d6ed4e730ac005702080529c4730cc89ab11d2e1e22f7a86824a',
-    '105a28c372e835ff94bc58fdf46d3fd856c2a19ab888d645d112ebc80991d4d5',
-    '10843950827497085dffc63a2eda577f28577a6fceb1e0598c27389e04d32296',
-    '1085cc718edabb68f6b8a301bf8e8a1accfc206cb4da75b994dfd71d6ba888bf',
-    '10d3f230c2f7d7c78011f1c93d89777997ced386bd2d432a425904bdeafced6a',
-    '10d50f16c65a13b6c25ad016d7efd748152c69676cd771ab437cef2137a46280',
-    '10d8c906255357fc261f7ee4b354bca866e2f3aeedce157daf0a7e8e776598ec',
-    '10ddedd891557afe52d07a066308c4bb32b2e037f624b41a5b3e1645ff889d2e',
-    '10fc26e678c9f2c7e50a8f676c00f5c8b034e6e639cce4c80486227b150c2bf0',
-    '110f4840819721c5d6a5f25af5b5abf1d30e7be2d273e966cef59955509d4b3d',
-    '11312ce9266a3fe69b2f492378d7fda98ec86e1dc343394973c6368ece3c0a6d',
-    '1141f89d6cd5abef9d50f3aa3ce86d84ef3ec35d42b86ced49eb3a64a441f992',
-    '1148fb0fdffcfe58a56548ea30f353abc8836f3b2b4e284ed6ebf8b6d89d9626',
-    '1155ca74a677cc6527b6d7a07976861d8ce6c1fd7a7beccfff360bc98dc07a05',
-    '115d2a4f3c165f40b2150d1baade9a71a0aa07ae5163672014aa8da57073b20c',
-    '11641638df8c531daa0d5ece032b4487997e71386fb72667b8c933aa95533912',
-    '1172500b1cc9d90c1121edd2accf48b825a25ae6049ba01b39284be1f8a38b28',
-    '11734db5c4319140b42f789f91c91428b16fa2fcf92b95048475756cb866a557',
-    '1178948006d54be807ee850cd0c598f2efa97c391d16437415b5708926c6c7c4',
-    '117adcc9ffb608f4e860c4949d208f5428b681ff8d68948d2445e67cfb5d46a5',
-    '11cce3e6623fd7a4d4130df3a0864f678d8b6f9b0458bd29c80440abc51f725c',
-    '11d649cd6b4e5a6a51a2d8982b9443ecf34fad1608f75d3b21904d90e0c999e6',
-    '11f0d10b6d4799547bda0273cc993258d337ee196703829d756baa55820b179b',
-    '11f56a745819bbb066b303c7d6ba1ff013371cf90a25dde9a9a2170a600a9cf0',
-    '11f64a6e532163337f36d79d4f9090df77b3454cc27583b525c8e6a7bfca874d',
-    '11f8d929cd9434eea61617273d36d595a8400b482975ac7830ee63d02907af60',
-    '122052cf843196ee355cf848234a4d571a72e398ea683fe7ecb6b046adb1e709',
-    '125505e750d87015f54a969bf5314957a672e4cf0115feaf9f7cb09e1bb568a2',
-    '1283aa5089f1e790fbb8a21eb07f7ba5a68dbef5e8faf697985d2fc8b8eeec5a',
-    '1292155208c2b021e034b04b209ae95c0342c3c2d8defb8ffcc7e878d52ce838',
-    '12956078c3cdedadb81f52ed6e7774284619485a7e81f763f1ce0eecd06dd312',
-    '12ba5adbf60aa760081fc94b28e2c48d78ec759850fb0a961b935ca8fb3a957d',
-    '12def5b4e9655819758abf29b02a3ac2f7a60c261f667671d2163184c0e3dfbc',
-    '12e92960cf02e35f64c5f3e85eab01650e1baee2ac49ca377be517417081d316',
-    '1302fd8db6c9d5396d7a60627f0000f49ea74701c60863d0ef6726f97d03ba1e',
-    '134fd02a052ceed8162b9d73bde3efc7601105d4ae1cb56a6b39873fb2f0d6a6',
-    '136755d6935c8850e24d4a918f26f6a87d968d92d16ec794d5405d93d60a7d04',
-    '136fcd6fc89046da8032285bfd9836b933ac76590f05799185d7c1176a213771',
-    '13a5d7ece925f2b8318b6f86cd84f236fcc8e14198ddcc61645c232c2d611a46',
-    '13acedddcaf00e52230c9383b9773b3159f9b3abb4d7d90664f7b0f5f352430a',
-    '13aeb9240ff743937850814d50826dfcae21375195ec0327d44074ef07ebac6d',
-    '13af06ff48892ad10f4650194b53139d364e84ddfae90dca77147cc1f5f97fba',
-    '13b59cdad8234bea17d5e38825a8413561f22145421ffa6dbcfe0e5a792c9be1',
-    '13b89b8725a4545a0706af693fdd390e004ea70bb3f5ab6b0b642feb7853137b',
-    '13ed917ccdc449891fb87ed86c29a3f49a992dbb4b4b723a40ba2e651175d20b',
-    '140cac4465081868832127d92d0693164f5ac250997e681ca588302f7acc0601',
-    '145a25503ae2c5eea5599a2bd9d298d41e2c3bf8734373d6f94114a765188a92',
-    '145e40d3cb8bbc84f8c51cd5c32138896d79b067ac813683e9f71b59a3b6887d',
-    '14849e47b97230a3cac4d263f616f089d3344e80c416dd1e6a05fe0c2f33c0ce',
-    '14c9dcf2e1902b8fc814c784db170d3610b7ce7e518c11fa1342e863b0cb16e4',
-    '14e3e3315aa9fdf4db1992ef594d31d9ab5a2494e9788f5a9a454e266e82d350',
-    '14ed1fde432597a2eb901582b0cd9c98d687e731a19e8a62121934c21b05b31f',
-    '15065b1022195ddb01a5697ea83fc6e1aeb0bea542e3b3d7ef55ecd319a28fdb',
-    '150bf38183e8912e1b184a64a7cce8ab0be16c17037ffc6a9a0c86893cf79548',
-    '157319f5d8b8c03666d4335ac216e9c23612f495197cdc43535101091c821a6e',
-    '1577bac13603983d078f2f5796256d98dd0d81c4ba79cc6da32b0089b54ab36a',
-    '157bd13e9f7b4e92681cc15b095e78eeab750b4c179fd2474f25eb074a960bbe',
-    '15993abfbcbb4335f41ea6d76fd81c180ad0b5e5addad67993c6677f4cc34647',
-    '15a6dfd950b074b098310196ea71cc35502c77b41e0d550ee7b951e4c7e27d54',
-    '15b4a431ec1b17138baadcd0f6fa52237e1f309e238156321626ecf09f430fec',
-    '15cdaed5f0608c089ba464ec06cce0f7451fb2a57ed054a4d6164227bcd5c290',
-    '15dec59653461d6fb60f02e183bf663eb3886809c069a26e6ca48f7a8938bf3e',
-    '15e1e967917b03c45e1dad3e380f218f1ff00691641c017ff7f16737ff4f74dc',
-    '15f94bd410eb6bded1c3d2257c0f9499bd650126b6d87851c653187082dbe7f2',
-    '1602fde29505fcd6db32f6637a1b38359b75fff83a5865f57e1657754a9e3d57',
-    '16108738c7a2767fff58df4e57ae4276d5a489167d0de3068de922902b1db5b8',
-    '16421d4183574e91f951c87fc068294d31f1723fb8c373ebc2b38cfaf54acde3',
-    '1674a2d3c40f7af33a964e611e331dee2004054fb4deac8d5695184e656a2062',
-    '16dff2ab610358368eb45bfc201e9159026ee8193c504d193b79c20ed55adbbd',
-    '16e6a9d447a8f349d4143a161c6c1b67fbddb5eecf10b98a76fbbfaea6b9fe2f',
-    '16e824921d9137e001fb8379df1b5cf572d4fb861812a1fd098015961b01b853',
-    '16ee475f50e37b1c395ecb7c80ea5f1dfe629c059fc6d6fc645e2927d32a1937',
-    '1717f9fa398093bbc29709cce6ebaa517c66e0f69309d9c6b49f0a54862df2bf',
-    '171c3343e2c246e441a8dbedd800eafbb5017b536ed29be3fa827cf45360667e',
-    '173c466e33c1a9193a8e1feee9be77fa5437201ffc00307680bbbe934fdcab18',
-    '174429c728d7680e0c69173ae7af4f56b8ef3545d6863f2bf3b05af7495c9271',
-    '17472b8de69bdfb289d5e88c5b0c7b5b29a349696c899f9b309aaf8b444afe2b',
-    '178838d56e487c90ba65c13d1dd7be8ac2e8eb086e22159cf147f0c5434257ed',
-    '178bbdd682afa578fd55ab68f15c5598a4fa12a9b3736b53761896b4cfaf7163',
-    '179de8fefc252c16d2ad460c3f0c07083cb97e683f8134c2a5cf82c15666f122',
-    '17a36642daf1a40d83f791a9e928bffe8cccb03f423c8bd9fd0031b28c52d2cd',
-    '17a58027ae7d31e1a553907d4098bfcaaf18decbbc63eee79c45dd5912c73747',
-    '17bce6da5d61cc039f81b41f0378769c95f6bbd7ebc786b87463d1fb60aa3575',
-    '17bf6c74db6f764bb20e6a912ce13e70804ffbbbb5d3ed9771b8bcc74c9a1ef2',
-    '17cc4eb7daa0d4b9beca5ea97c5f8ae51b2010ae773f2de31bea776527b77f93',
-    '17ccf08a58b2ccc1ff964a63484ffff8ed05f20572bc797d13366c4130a47fed',
-    '17d088d70744038ff51c763ee126531025acdcf97ca867a434a9b68db0c8aaa4',
-    '17d10a816a05a57c5c29ec55786fd8accfcf8644d18f008b2b08367f83002924',
-    '17fc6a659459d31ba3d8ab2cbbe47a76d72d0ac49a974f0dd5f63cd070c34316',
-    '17fedda62f9ebad9459162297861e073596186cd9a0bec7caa7b0551801c16b9',
-    '18011377511d00cf125f82cf90ed98e5b70734cec596de058d9a65dc927f2f02',
-    '1801a03facff227cff5651578c60627370437497ebba8a8443027d84abafa02c',
-    '1805d4218a4beed50cb9dc47c0922dfa30bf9747806ab0899188e5fd4bb010de',
-    '18067d951f5346c42ff4c21845c18c29ede4840ab6d8f8dc5ea445d74c6255b0',
-    '1821acbd30e2d5a25491a1b0a2e4b33cc0011f9cb1acffede6c65bc3efb09f21',
-    '1849a36518b83f8acb66c3e09bde448af858d14aa983d7c511c393659b54ba28',
-    '186e956834aaef02bce05b130d3f140e87e70130db420b2e41ef843dcb017a36',
-    '1899ea02e2eed7e9c102fd2a2e0e4ebefe7756094a8071714850cf1bad1f81e4',
-    '18b504f444d6e8ae601221e359aa4a94e3307d8547b0a0db0fd95ea84c23ba10',
-    '18cc23fc72e5ab55a08a4a777d615152027814c69ad97485515380c62f447039',
-    '18fbfbc8afc576722f64c01416d6b6d6c742b5f735e7e8662d143eb3c2026b94',
-    '190774728e23bd9ed02b4ea1b040c55196651eda778ff0cf2d81ac42f8c3ff91',
-    '19089f35c606513d618a3f4605cb4f5ba95e54dc93d1cca8dc3eb893d246db2c',
-    '191e66bce61a32b023d40eb8f60b1c75bfc1d7c8187d6fa5158be411d2f73162',
-    '193db32c2fa4db9e6524ecfdcc03a3b88df5c1ee55d9856562cb6ab8fe386e41',
-    '19549cb598b01a45f5058a042cc1b804ec6aa301979f092bb502ab54aaffc7aa',
-    '196bd52e34637eb89d30fb3950f9251a297f4b0b6391066dbf780146a15cfbc3',
-    '1973bf2b6fcaff2efa5fb6459f2b0af8f2ced5ec3c694d088dab60e2ddd4a252',
-    '197b6b9cc80e7e584bc3bffb9569351000a686feecef0eb8c4cd4edeb0b497d2',
-    '19863cb7f783eebf28dabdf9b0bb3aa6438a4340503178e306fcfb1466c20139',
-    '198eefc6ed3cb1fe3fae9a9f69b1544132777921583f12983197199ca1064e05',
-    '1991f388133ae74e7e90aad303711fe4af70fc6d288c076bfeec384d7192865c',
-    '19a7e159d4699f518e817ede7469c2e60d70d65970fcdf2cf3f50700ffa9e5f2',
-    '19d27c7875b387f91ee37ffe6eb174f6920a6f90af209c9fe4649be47204403c',
-    '1a029f4f53c5fe6c4c1146843d1fcc073d53030b06771885108337607a353cf8',
-    '1a28e731bb8a46d14cec1605f3274f526ae3da9ebf6f87fbddff0795cac736ca',
-    '1a363745b4db014d7ec12ff761219ad13eefc83a5d4a4d502645d50a8dcbccd3',
-    '1a5cc5184415a26c6dcac0b5c8bad5138a96e2fe31419bfb4e84175d57d496a0',
-    '1a94519eef3a4636e1692aed7f092058148e0a48a3cc3c194c0546a8e22df290',
-    '1ab58f28d372fff7dc0f7d99b2c391eb2b84a935bd5addf3e0d5dc80e7589e9a',
-    '1acb9fa2f2f5774083068c2ebd20cdf53d38a26065d9d472c15358bcdf921bec',
-    '1ae143a3622e219cbea346aa78d2e8f7a3ddf74e83eb1cb189b586357c3ea662',
-    '1b09ecb845b7f606c4ba45a3de97a4a26fd6d0285b4fffaf7d195476d4a17b8e',
-    '1b132ec02c84508efdab7f8aa7bec908ceeaf7564587f1abceb3e183877343ad',
-    '1b1a1045c3a68a9f3e73e23d8b98ca3ba4473601eb175dbf10fc7f08bb2d2719',
-    '1b31635267fdaf99b40fb47dab8d83140c24fac7e07995d5d6d78e36318c9281',
-    '1b55c41f21dd9bf45012719c1126b46fadf7de4780ffd81e81bf969d65da11e3',
-    '1b5be1a4ff9b9d2bc015ae44e3622c4d26499a3c314d41dcba8d61b25e53b5b1',
-    '1b5e5e8cca66065c5627282aec0706cd2a694cdec9cb31756664372ea7ae413b',
-    '1b69767df38a98a56fb75face4359f835caec6da39377640a5cb7a364e4dc91a',
-    '1b742745ad57d226003e1f0307e6ef27ae521126cbdc0ac459cb0443e301d0cc',
-    '1bb23e68f8d0b72fdc24a5280ca90b07aeb76f63d6093d94d8cb12cd98b03d68',
-    '1bb5c01f94e6d236f551ab97dfe2aad316d6c3bf1b8e56631f3475aa9b76a37c',
-    '1bc38df1c23d0db32b7e29209381da2fe80ca252c2492f6a63554383a81cba34',
-    '1bdabcfef16f71429b30bafff0bdb5900a9c6221f7b52a4e8c07de0a2aaf9e3e',
-    '1be5c4cde4829906f775613758af15c67a3a55a1cba8406eaee3b0be5cc5653b',
-    '1bfd49023e2d9a6652b2172e15e70a82172e9e087cd8ca0fea90e9a0177b57a3',
-    '1c0475df5d67da85ef6b76ca93917d6f7623a6e5f5378610668e42e715ef415c',
-    '1c1c9e317253212e8337c2e2dc6b00a04b11dd9a52cb647fbb5466e073fcd514',
-    '1c303ca423f1f51ab435434e112b14a0e6a39fd62e11369d278fe99bcb071f8b',
-    '1c7a9e5a6f49745e8df691d3dd6f4906c7152dcc705311b0a108075aadc9f59a',
-    '1c9cd16aec2ad97a348fdb1ca802f6550976afead170d6723bf766564d2480fb',
-    '1c9f06bccb1f57b593294520a501b928a7472b360e615c564b6472189d1a1248',
-    '1cecdaceef10bd11675348a3d3b293d66a86ff476af37c9cb6d5513db8c229ba',
-    '1cf126ddc5c849dc3321da8e6dc27242b6a9257e688124f1ce8339c0a2a04c7b',
-    '1d14f7dc1ab9a095eb8b5fb94cd187c04d63eabb21e93094806aeef7f74cb5e8',
-    '1d3c6d0771de8733a2c93122b3a1a51d909c8643948047d9db7550983c0eb8c3',
-    '1d420b87ff2557b1f4221aa7f26073d5466b5d4e6acdda987707e23a9cc12a44',
-    '1d648253782f3e85dcf29bb9088a5d5bea57a97a5bfc988449b492aa783a9896',
-    '1dad82b47ae257b310b5e69966ddce029188af181d6df2d401b3360bd3bd0b66',
-    '1dbb6f1f7a94483741c13db5a5c150b19da5e738f6b62568e9fd69b6707e89a3',
-    '1dd6905982a53c58dd67547d7e2001ca8ed802fb12554464668c80b65b08470b',
-    '1ded5e57de9964bab84efa52529f90dea15a15720ba0e38b567ec9a1c44213a6',
-    '1e37ba84f0e2856a91a33528919d2a8e13fce31cd997591e1873a3145ff39dc9',
-    '1e4225d5612f3d166edd3cc04beec0a83205c0cf408b7bac48c5a84c35057f2a',
-    '1e4f4d8227f3b2b15a88beed156c930e4f3339f8e7d8bdf4d6d5eec8f1b4f5ef',
-    '1e69b85fa45f59bd74f50939bce12b9ab50400116945e786328c1d6959e3ec86',
-    '1e6ec19ec3b126bf55caba2ae2c058188d18a8f6bdeb082aae4b97634548b6b9',
-    '1e6f1f0c4bd947fee5b574d94cd605549a346ee4ea9e106955e96613f9a758e0',
-    '1e77ef8f43a4e7aa8f6dc956925a2ff681905db6d121bfb3f5cfdd50f5748c28',
-    '1e89e356f316a2877497ea9be862b02a19d7db6395f0a4bbe85f2d4208069083',
-    '1e8c32eaca3791c37279ee8bcf54041524c4a7def7e036bb9284f755fe74793f',
-    '1e9d1ec369933b275430af117f2d8b1aeb3b366dd28ee79ac878d8a3c68e9f5a',
-    '1ead6ee9b34b7cfcea6f961e3a2c91fa4dbe1f4c9d07c15e9b9e3b73e29c07a3',
-    '1eb1567cf8cbcb33c718c2b54c3917651253d19ba90dc33eace8c2403f976d2d',
-    '1ecbd2b456b1fd3d3c6f2e5cbb3df04a1ae32a690f0ed10a582213f73136e3a3',
-    '1ecf343124d3ac04b840a2ad27615171a7a123f2320993a18606c424800aa249',
-    '1ecf7765cd5765679791e9f2b68f0dc4013857f824509d756fb700b04b368d38',
-    '1ed3dedbd7de832e8075dddf33b53764a13fc8b8b0facf88214da4899b335e90',
-    '1ed7dd7a9607ed5f7037a9e9b3ebf78b009bdf45880c24c8f92ed20ad926ce0a',
-    '1ede0c582a33dbc28bff60d3d780741e17508e5f36cbd789b12b679979bd3e38',
-    '1effbe8ff401c4914a95379348541d97c0cb1fcd4777ac3ab824125dd5d6c1ab',
-    '1f0475088f2a866deb44685b860c73b5f420590960ca72aa8a4fe0d545ae093b',
-    '1f2138f8323ebdfa92d211b42d125879f741605a5710cf60d0845ff623de7f19',
-    '1f38bd9b6e555913572630949213a0e1030696913bba261d836484e71a4e0822',
-    '1f3e0196bfb2a1b79f99e420c3c0b56dd15e4279fc93e898ad00d761bb2c2f9c',
-    '1f77cf1481b925990faf40da158984c4d2132569b5c93acdcfecd47799a4c768',
-    '1f7bb42b6044a03b073d0f9168612806158bee6934b769fc1be85f7dbada4d5b',
-    '1f8d23c92a6f2670b3c80e854f6a8512853d3e8088fbcf652c96f3b2b09c6168',
-    '1f8fa0268fd69de4742b19fcbbcc84e0b5d8864f7c00727621d4407a241e9750',
-    '1f91e6e20777fa37b06df560e68b51ec37d6336bc93659639fbd34f0a9da3ed2',
-    '1fb379494329695736c85b16c18e63c2749b09ea8059333fda7f17caf75ba2c0',
-    '1fb9d9e4360eaf161b6e4285e4661a85b8a8bee939f82c4981af51933cb074ee',
-    '1fc0ce8cc64184ccebcb0db188ea5dda3baba960af5f68e186fb8de72028f5ea',
-    '1fc1c7e857314f162b1bfa93b5226c56f592fb5cb11c75cbb40697260dd31e12',
-    '1fcfb2d8a41872ef1a7e1b8b547ce1d221c34976dc011eb2fcd1b7171b48ee4f',
-    '1fd3e9e1645db1d30342c5b2f7a5192cb146f81bb21656b4dd4e0b43cee0f068',
-    '1fef2735ac6c90db6f205ca62c0e135b6560e03743d476e2de0f5412dd929b14',
-    '20065e2876f1351c17d5c299bee2e999b96d8bfe4605a6304a4f359f47b46c59',
-    '2017cb4241b11939ae074a9846e75c071b2b4211d78d02a402ccffb7a31741b7',
-    '202b970b75c2839b63af44a6c3801d986b50249511584b27e9dddd04f7fc4431',
-    '202bef955a7678126624bfadbd20bd21f725078216763a6bf45db6fa51f645a9',
-    '203ac79983f4c1ecfd0306776f7fbe5837768fc5bf22e85b83dd297352b058a1',
-    '204429703fbc8ee4d0df743b2b3cd9ebc0aa48e26972549120c447d2e4eb34f1',
-    '205fed9bdf0ddc02910a700644b30363da0790493c961df39d751f683e2017ee',
-    '2062cb2d4f08f1c956a16439da3b563bab04082c8de0cc78d1ce923468f8f799',
-    '207937e57d7088beca3a126131fd59cb9d6167d11ea417e2211812037e363f90',
-    '2080eb7d1a10b73c15019d61ee42ffb0ae9026a1e6680bf700afc1f0f463d6cb',
-    '208218a847b038f1541e7600755f86cdd4a34d14bdd93843a6835470212ed7a1',
-    '20a9526726a2f467e122696dbe1e577e4dd970ac58792e195d36fdc045be8b52',
-    '20c0f191a09a08c883b12104f7d172b80ef088e80b9ff48ab15eb66d4d7be352',
-    '20c820b805a73e982e501e351ad2d214455ab9caa7c5dd742c2ca7ae4f79ddd3',
-    '20d85b2c379ece85caee7413edc63a7fb06f0f69302e7cd21c8d70f0373f44ae',
-    '20d85d3aa274d4f8f41fc31e16826a24a0b70b4c70fb8b11c690a656b614e7a7',
-    '20e37a722082689ecf120a171e6a2eabf906df3b74bc2a53f212c8f48c0fed8b',
-    '20ea2ae4c5f6360590e10801c1e29a87b45327330761b66a4f13435979eeff7a',
-    '20ec4c3c1eb36181f711c8401c52701377c5899f213a9f86cbc93c5da7a1bf48',
-    '20f89ca6ca258cf099d3029cc1e24f4ed0258248d0af889db0d5ab5f869d9a64',
-    '210a79f2b26cbc049e31d7a256d38180c62d1a949153eda49715df1b3f771aaa',
-    '21141c8ad23435529107b3c1df5b12ce747bdc4a96ee47ae4c96b4a68894ddcc',
-    '2114f4dbfbe5333c03b9599aca3b647f4f95222cbeb5890b82ba6b45c63c2578',
-    '21181fc1521833b6be75afd89361a9949acdcfd1a6cd79b6dbf12e8665bb3d24',
-    '211dd33fded53d59ed7fecdf73fc43ee32edd5fd1825b951504857c3c5dc08fb',
-    '2132f31890e997914d4c413bbbc670505ad01d50a75fd41bf3fe9f44f882c6a6',
-    '213f70403e86fc351499dd49cee7dc8a17910cd126670a0858863d7691522dd0',
-    '218478e8d5af2a6652ee01b9232c9a2040fc26173de1441e205a5370900b1ac4',
-    '2189e93bce5e02752db9e0a1c169a19f32fb6d12230cf3c015f62d00e6451048',
-    '2194f877815ef013c942e00f97656b69538fdc7fa3312a01edb7ce46b61827bd',
-    '21a15c993ce601c3748d0faba4c7bad37e579309369fc0cf89cf3fd3947c5097',
-    '21a24f648d51fb0a0da02f6a0737f93cd59071143a5b6e802c365066477f0523',
-    '21a6d0e5a9c73acdcf8c0833369dbcb61dc9ebe383df03cd5069539c6d4733b4',
-    '21ae89ed58b43638d5566ea5e0718afc8631aca6c5a25d80f8d3ed37203b4c37',
-    '21d876ea80a5e276eb3d9c52b04992c786daffccd6c961121bdc272da23cb679',
-    '21d8f668a6d94ff57243df692ddd9f0f1548a723cd12eaca5c0e0c2265fee36a',
-    '21dcd0b08cb0422ed61f2b1ebe59eac640c27350ada4a379dedd0d3f456de6f9',
-    '21fa2f5e68b766ceaeeb3f405e71668b7bdd0aebde914e32b6e037f25c0e60d8',
-    '21fbecada3fd365884d7a887fcd47ec2dbf5b705cf738f0b549934ddebcb0a99',
-    '22000df9452484e2b752dbf44421415873c50f1d4fbfcb9df7580cab8af8434e',
-    '221f3b2bca158c25d7476e88f6b3739103bb16839eaa8a1974194b860547b95c',
-    '22c9c3178669b4b8baf8c98f2f73f063a56b5cec84f541f761bbb21e7684c3cd',
-    '22df7e7fcd87a88a7f75394365109de0ceada10c8ee81148ea1d94a450d12cca',
-    '22e00446058f57fdaba0ce4b4ef5b28f8c4d9a4d310723efa5bd5f5a970035bd',
-    '22f1814d6121a30be271777a0250f0f9fb608380e0fc2f3e525282ccb01d9600',
-    '22f90d0bf1e22ac3288a4b08063e911ab03583e30f0b30330fa383f4c2dc78e0',
-    '230498c95e246b872836ca9796579fe9487fd8f1b4ab1b5d9af5ff8dde9df7c7',
-    '231199c355207fc77ac849c67bf6d0f0e774d76f2db1bdd8440e69bb8cadbe98',
-    '2319cf4de437219b4c5754d7867a79be8641f284b21fbbbf372ec8548acc0fe3',
-    '231ab56e8682eda5d2316b9b3b06f296be95c38ec18ad27aaeb242d2fce59299',
-    '231ac9c9ed7c544ddbf67dadd99dcf4609ec992f2faeef26e4f4db827eab90e7',
-    '231b5b178e1222c6be2bac4ba7c31aa83ab5916a67f8b4d1d4fdfad3c5b73098',
-    '2345a74cc5f98ab9a798d11598cc580c4afe74af8cf205dcf3c4dc08e3e8293c',
-    '2347a3e66a62d4003fc1c1da3a371ebe21b0ac4460202efb6a399fd59b49cfd8',
-    '23640641dd2dadf2a6d04cb60bf916bb1e67d7f1d78e56b719884c289212d108',
-    '236eda74f760702c9c1167512f206d7c29a6926ece3c5b778930d213d213d379',
-    '238dadd400c9d91710b5080f47a7003688a4e1f767e9ce18f9bb5ae2064b1b95',
-    '23b08bf474f5ab71445ea964995f0c97531bca9ec33455bb33fd787287aaa9b2',
-    '23b769efd7d6a04a8056ffd7c646cdb3c0ce3c96e61e284314eb92fc9135204f',
-    '23c31ae84c6d9cd7513df4f455617a8c9d92e5031ed96836e2e5d1c762a8eea2',
-    '23ddb625fda295fc2a9a8eda26225afda1e1f6715fd749598d7ecb7b233d14fd',
-    '23e23b491ea304305d1a77df1f52cd5f849b579c8b720327f123755a5e118b67',
-    '23e7054d8920f98ce6fa216e8a833e7b2bd76230fbf9bb21edaff2497f912bfb',
-    '23ea691aaa36e04a0371026a056da461326771030aacbc509fc8c40c9f43c1a4',
-    '24085150de49333041d51cf56cd18bb52b466c386c785690d791a14166f8fc86',
-    '2409ff1cb12b07d3861b79d433284578c96afc1c516c794ed5a028fcc62ed1ec',
-    '241a0e6f9eab69a99ee5a2440032ab94ff7b0da84a4e0a80d671aedf205d30d4',
-    '2423dae41e9931aa5e5b73ceda70f99919a7243a1581501340a88bbbfc0219c2',
-    '244e58f2885fd3e9ff430077406370e0e455388fa7e05913e5db53090874ed04',
-    '2453e9b5bbda7aac99aa911cc144be9368282e4661160aa77aa0d69014eb42f8',
-    '2480bde8e091203c53217a2aca94e87a3832e84c092873a09a46fbea97e15e82',
-    '24a758a0e271bf1dc21c6f7457ffe7d01b67b0e767a0d04319c39da05e4f6598',
-    '24a83bd204d65216acaab0013466efb41247ac7139f2b751e2fb00f33c1ed85c',
-    '24b82cf758d6891802e43bd6ff70ee31a253f63212084a3a343b02211e3bbac0',
-    '24dcc880756d95942686a26dd895fa45afa2ab1a02a960b914e60d559ef76c2a',
-    '24f5bb21cb66b96fa726f6cb0bd14e8d7119be6fa8e737690eb787c336230eb5',
-    '25300a97dbd8c24d1d93711475c7e8d1ba14dccf585b2db07c949c88a8ec488e',
-    '2549beeec44978d116c98d9f11182ee03551e5d17485417c143568bfd6f67dcd',
-    '257f905e4ba4f13bdfdb4b909c4fb550a517967e99a623dffa2512cee4141dbd',
-    '258d72b05c0edc14e9ca9bd2e68a7d48bc99f6bdc6d95e9c22e85b909a64aff9',
-    '25b486cb0b9447c2b72b276a8be0b43e1c32558010124737aa2a713746e7b9d7',
-    '25cdee4cc5b643555d9a1f797d3127f2417df67f5b289547622d64fd5a047fa5',
-    '25d11f3cf7b3e3f2a186c152fc94d88d9d1f7220a0effd5aa3c3f42223710015',
-    '25dcb2a31e7383bd6365fa77875dc431ca98892a520d9f6172980b01ad7f6c6f',
-    '2638295adc6bcee7b27dedcf5b0842bce186217ac0467fb0ef33f7d41488c8d7',
-    '267c017b794863962f30bd0583b2078d000fce21b035606d2953655767bf1aeb',
-    '2693798435e96a719aeba8856aaac844b1c9289536c8939a42edaf57ac487b3b',
-    '2694f120852c460f206640c953c563f52d9e152d57c60129e168d063e7f349e6',
-    '26aef68c511e0977047e32c719c3307a47d8263ead5b77dd4065c11b41491fa2',
-    '2726a6d0473581c86de0b0ce95ab5c9519d087f724bf3d44ba710b1bbf58479f',
-    '272d97fdf3947e5b69b986bf20a968c794ad1e77db41d3c9e788f3c5d61c7188',
-    '272dd0fc0a61f1620a276e130575c83addb52d14268db5b29c09a49d48fae0e5',
-    '274041da4d20c07396503129e3ea9a2c81a39060d00487415e6dcac2867e7f72',
-    '275097caac166d925b5f7532aa58383981847acd2e651c443c0d05673655e7b7',
-    '2759b4eded8ea598ddf8b77b5bfb1f26996a890d8dec110e4cf0c2ffbde56321',
-    '2783887a02ff5c335312c7f69bca0cb4a14823413e1e220ca189c14e26931ef6',
-    '2787176a7772a3e0b54031daa0a3755e24a00b0773d8138cb6ac38fdc398c27f',
-    '278ca2ec689e47ff3f68c0a2f8413324e11596cce91c791e1afaa36424c7044e',
-    '2791e71a82762b32c278ad141212f043b831104a60cd63955df64176b3faaae3',
-    '2792ec0861013349834f4bfbf84f8a0e4d2120595a34eb5d7868b81feaf53b89',
-    '2798577e8567fa15ee66d0b5bce1f76b1d724b660121007fc89f8c2de231e99f',
-    '27b78f050b2214c41beccbe1b16a61f816a7ca6070179e9e753a23ffa053820b',
-    '27c659818908a9bd0a473ddf99cca35393822356502162173eb526682bfe8a63',
-    '27ce06f94d847ea6fe93a4e26b1767d82e472d55ba5f22cc16e65c130dec1a29',
-    '27d08b29c4e22e3952a28aa25b7d94e2e36ff8aff860d43e519f5fb5df6d7852',
-    '27f0d3a872fe5270ce7de4eb64825213894d8a86dceec3cf1bfb27e2568981aa',
-    '281138947176f9c075684d35dac85f7fa157d43a9b3254b22c7e4c2231d9243a',
-    '282e81d8aa2b64c42359ee90d87180979c79ce11f7c5338576ef65242dc0cd4b',
-    '28418ea614aa4615ebbbbb54ae7fc446d5a7bac61a8f83368503df86f88b72a4',
-    '284d87301c8a331275d6e282feb5943e1a6c8b3da09794f0d4418c5335ab51d6',
-    '286eecde9f027da762aa2c6d085da9e310f74f8c01df071153f2e9c731f7ee77',
-    '28a0c631d0d84af02042b67bd2b1e84255f0a6e20364aa8c9133678a2901d3a8',
-    '28a3d1abf2640186a81c7ed5e7054ae1ab8588527b05a4b6876d038625880dd4',
-    '28bfb35550a4a62c15d4e42e43f51e4379b8c85caaefb6859615ce214cf9aa3e',
-    '28d79df6b9ce33f71b55544b42a6bbc78b0ecdec56429969ba39ecda37a7cca0',
-    '28db26e437e1e4eeb5a90e9e094fa6ba09a96f6ca5963b181064b7e97e285d1f',
-    '28ee03286e19bb30cd4bdb57c65a8d215297122d86671ada9828e0885ad335d7',
-    '29064164cf958828c8a1607234902ad588d924fb40467764c20b03a9b2deb9d8',
-    '2916c19b0a38163cc60402a3e2a41bd950f4e2d7b7bc8fc0f088473f61c84107',
-    '295bfceeac6df8d74dbf72932889fdab31743346ab9f20be5e64a1a41d8cde41',
-    '29737760830260147b4714c12a3d503c600f7b5d10c2a7a1dbf2059254418f8b',
-    '2979f65834ccfe19079d2f615580265fe5bac356debf07d490d5e26d46bd9e9b',
-    '299ea1a6e3c9879f5fc6cec8a1ea67ba85acab74d3a6be2b6d6119a0973c4877',
-    '29cbd8efaea242bee75367dd6999e3508e9c5e19a929e0f32a2cfc15f833f308',
-    '29d0c2984b2df57833f040940f33af953ef8536cebea578d27277f612d7d45a2',
-    '29da655ca98883bf4e79caab699808c42b897d748e6b8425a355a5dad43b0002',
-    '29dd51464c3231f92f8a0b164b09f5d7debbcd1e6830f5829df40772740691f5',
-    '2a0551eb6eb4c37c81bb34a14a9f6ac48952345f5f7708e51105c39aa1a203ac',
-    '2a2c087c5e7c91f1d939eb1fdc87cb116e14e60ce8f167f31fa68a3b7fb072ec',
-    '2a31c8c5eb2ca1cfd62c286228a2881949895500afda52b31fb3f4d97b03ab27',
-    '2a613e739be31efc587aa180b04b528697d88d71a7f0ea5d31f98b7b5f9d8f69',
-    '2a85023b5ffd44f60cec5c272005c90c9253896e24a2112d14b3e7e31ed226d0',
-    '2a890ef5cd06738d895a55827b9305112c5e3f724b45c437db6479707817b713',
-    '2a95723b9d8321d6a2353818fcfee283ea963acc4e2b41a2aab206af7b44922e',
-    '2aa0bcbacb9d61ae8a1262839f42eea606637c22ba3031976b92a5ba8f98084a',
-    '2aa52f59f5a59e2806063c05b0e96a7f79b2e39902664807f35fb061c5251a0b',
-    '2abb9ac5986f5197eafb23e92a6ed159efbae59b72eea16b5533b4f2935b9291',
-    '2ac6f6e354861f1539d6d97b0942d6aa525683642778c173ca62ec3f08f5debb',
-    '2ad0cca6f8d9c4ba0488b53fb87d80df1565b76cd1094b57d7014170900245c4',
-    '2ad1cb696001be9e5a726a669980db5e70054f1394baf9a59b3029b9836430da',
-    '2ae17063e45b24af7ded2b0b08f43699814be7a5024afbeb75568d057d3ed052',
-    '2b0611740aabd7edccb23dcdd921adb97c1f841e255beb3765443e1d60ce0870',
-    '2b0e8435c5953ed74197a7705f5dad0b0149e4e4755613f87c54e0105d9ab402',
-    '2b243edf8bb7472f6abcaf2a0d71906b1be7b37408f1a29cae913c0e6019e012',
-    '2b3e9827504fd8547606275cda6715d89d818166775484ac0d242020ef72e712',
-    '2b5c643ba42bc8c0586b1aca11b1c6977ca75ac542f12d7de895486d925b2e00',
-    '2b656311b7f7a0190f395bb4a9fb0c087c92e63fd18e69b72b64cd5eba38e89d',
-    '2b69276e64383a66c7025900e187390ab22d948a5211a76282c03b13e8a3b021',
-    '2b7107378bf0076c4b347ca46b897c60a16de749542414461c71c081c3713026',
-    '2b73ccc80aa34f411f67850e05b60bf31db81e3c64f09ccf4b225509071c9c51',
-    '2b7910d7696dc37496ace18279adb70204dec20949462d96edcf4ba09c26963c',
-    '2bd0ac44fa4b99e32ff607abc295f0145686eda1f006a05cd1c99da36ab6313c',
-    '2bf17d70cb1a5e01ea1b283e4fb7c4c9e9e775bd13470253a0082268c4c68f5b',
-    '2bfdddb3bc56c649979963c628e48886fdb16d8ce1e23eb3c350006802e2156c',
-    '2c34df7fc682e858a11c01a3af99b3dd8df938d48ca4b52892adab88edc2138a',
-    '2c43fa7765070a890959aabf2ff0528c2a4392307f5794becf734dbc287a6ed3',
-    '2c58edead8b127375753719573ffd849110329d0960a60e089fb588003c6984d',
-    '2c5c7e2ce528fbbbba80ab8152b2ceff67a926213b602849f66aa6867286274f',
-    '2c6d29eb7af4cd2263799881f6848043c6010a328cafc623dd37ba6dbb0a8a29',
-    '2c8a73d40a24aa7c67d84bc918d594b81c716fba96c491684f6e3decd279568c',
-    '2c92b33f8634921984663161a7392fd08e59de52607c62655b8aaeb206301c1d',
-    '2c93e3d33f9859c4772a7a229cf39cea19933fccfd4486d106eff2153b409eb5',
-    '2c9c81c0d39ecfde0ef3c2002e2b6027ebcc3d58fee3244be26f0bc8e29fadbc',
-    '2c9d2d2f6afc1d28d149d5819c10d1d3b0d6bd6e0a74db3596c32be129a4b7b1',
-    '2ca0502cc5eb7bb42fc847d548590ec03debdd58a9531a10c4a930318afedde9',
-    '2ca2b1bc6b4407e8883b9863f852fa5245cfc22b620caf3011e0a46d0b4970d1'
-    '2ce85ef98f4fd1b62ee0d4d1c46eaac44c3b0c4e3c72c53ceec743f85116daf2',
-    '2ce9e214362db792eaf043e59b32a942eec4125ab18089644416cbc7c40eec1d',
-    '2d05221969979dcecf6f8805b689b0583714c8487a983be5071ecea2dcc0f2c7',
-    '2d0b96a7a6e75f0e70d1a6d4771c187e1ae7f36f6a88028eda18db6d9ff7f975',
-    '2d1016e072121ab9234f5b1bb406f69d23ca175d679d6a208d2d10be3706e750',
-    '2d15971485ed03c68f00b9da57737d915d203d9a517ef99be830937ea4e8967a',
-    '2d1e19ce0a4342bf048e55005a150b7600c3f8f2ad964c62c3c67b7c86c0487f',
-    '2d21437196ec695fc0d8163e0bbcf2c2e2a6c22df9e25212c42b6e71c336352d',
-    '2d52d54d0d2f9c142394f0f081f7c98d2c35aa745f33d333928b20b181e3b859',
-    '2d7cf7c9acd7fedff8a9ed0adf6fe0c676abc7ab16a7e2871752b66b7c4b0def',
-    '2d8efc133d8b8accc9dd06f02b6180d47e5f2cfedef2047f4caa1c960ecc6fb5',
-    '2d9a18b790f176819b545b64088e293a6d1d1ade64e926497dc84531e12be1f7',
-    '2daa6ef1ad4cb742e98ddfcf914a474fd45006199d641da1e1d840a0d042d8d1',
-    '2db12a488221cab3eff7cfc98f2505e99c124d925308f4e322a794f7c1216999',
-    '2dc1052c9d096104ed49ef9e5ade156ce3dff6330570867e039841d8e72449c1',
-    '2dd5614325d5616f3c6ee063fdffd75bcbfe330a6657aa72d280f77c7a550c09',
-    '2dd6adced5897c5604f98d0f799501152c0f11446de055d1b7530309fa96d66d',
-    '2deedbea6f7ead533cf1b96f4dc0098fa5872f3b132721a559d59ed4bb42b007',
-    '2df5c7cdbd3324a38043d50c1560780937e6a736bd379b878a7389e06c212898',
-    '2e19251cddb39d9935af856e499d06e44bf61cf40771ce3bebd912568b95f36f',
-    '2e1b242d34b3dc4be1f2581a2f6f3a6e425d04081f202cba7bbf5878addb0745',
-    '2e28d9ffafe8fad31707cf3344e91e5712e3d48b6f7b0011ca97bc8ab5dc2052',
-    '2e4871473fdcbc58037e5fc9b625638efb57db68d866f50907df4f57120242b5',
-    '2e574ddac025eb32acca891c66e7870ccaef803766060d3305e17a363094b0d0',
-    '2e599858b4bbe65159095328c018ec176682abf3361ab40572eeebcfc5625198',
-    '2e6d2fcd1c86a5e652320362bdac347c942cef89055d8524e66e5895d9a2107c',
-    '2e7d076c45300732a9b3aa95d4f8efa15a51d4336cb6ccad5262c4e13d477695',
-    '2e8ab2bdf9a62d10d9ba225a73bc9952dc3fb1adfdabe35b39e27e6d13320a01',
-    '2e8e4ecd442a2f53785610383caa2b532b4dbb350b82b770639aa010769b7f55',
-    '2e94ca95f388846751daa676dfa6302bee6209c4af3aa6e06927d4ace1a8bc82',
-    '2eac54ef764893ecf39a8ecc7474bfc244c30887662d0903f952166f211d7f89',
-    '2eadc16444db7be4bbdd5757ab2f6eeb6321c24d2af09d174c7cf9f1b895610a',
-    '2eb9864573efc4b11c38c324acc6162bb9ec442b5215d162719cb22b462e5869',
-    '2ebb5eeede3b5c6d5a67cca4538f861917512acc480285d34f84289efb503a9a',
-    '2ec2a289cb8273b5a3dc5977956d8ec4c5c669c8ca3b9e24b3e43260cbd2bf54',
-    '2f19665e496aca648d783f20b0c6574e72330fcc824d3f6a68c143031da20144',
-    '2f3dfac4cff92744f162f42d4d798294420833861d2c28ccdbbf2b4d64e8f319',
-    '2f46cec8e2b514556c85f04c05705e6f9f631cc015c9223b0e5995b02b5ca41c',
-    '2f5e1a5da5877b12fd69f7f0cb00a2e4c4406b15119ef337f4479695dc0fc2d9',
-    '2f64aca829121d9ff3ac5943d382d3ad2c3228cfb432f0bab67f7a7973663ae1',
-    '2f68a624c6e9d43f67ac17849b1d98284b352ef65823f68125d5fae13d88937b',
-    '2f7163875b919841845438c97d7e30525c64241c887db6058ad0157d365f432f',
-    '2f773ed786766bd476c34871e9ce2e802b635bdd3ec94c9770861f2326b7e5f8',
-    '2fbdbb4d89c4b898d4bbdd2284f2c5ea273c69f86946d14ea2fdff562a535d72',
-    '2fd397dfafd02d01c5541270d547a3fb47cae8381ba91536d6bc7c03bfa1b43c',
-    '2fe00d9d04acb25374a5760680ff1031306b498ffec43c444d3c3c90d25d091f',
-    '300736ebd8491d165c8c89250f173d859bb141ec944078786b959c9471de0319',
-    '301b184c6aaef3972396970fa613bc486e26dceaea63cd3fe6069b8d42130e50',
-    '305a84079ecc4b7346c38e54cd076a3b1168ae07fac8be4abcff22cf14bb38d5',
-    '3078cd2bc0dbd62ffc00751f8d8ab7735eb0f65da71efd9fb91776fe3d063f4a',
-    '30889cc8a0d4d8d62e47b60fb8818ccd63f12c30e7ad9ca41d22ebcc84065222',
-    '30be9d3813880c0126c0a19bab8ac29da545290975468c8330a2f61d4d02a5ce',
-    '30c2841f3bd1247f3d254a4b20a74652f0f7f7f88091c85a3da314dec213dac8',
-    '30cb0fa224b2367862609e8e7873887e7828a43d2a455da51aeca451b77b747a',
-    '3124cb764af209123ef147489544482c2417ff828893edab6d0e2f8986887efa',
-    '312ba2dcda862c432d69c1c67001db4e45cef59d5941b2315919238935e33318',
-    '31444a47b20f7045767354037b97798f6a4e94f4ad68562d450994ad99aca7a6',
-    '3146ae7d34cdb1ecd0d8003836549777d0b5acd445f524fdff9b58bb03b09676',
-    '314a19d317bda3f3eaef4709c955af9b1db9450db8e74a27aad64e0f33c89f7f',
-    '3190b46bd736e73bd0b2a1608e808c3d93b83350931e1f603d2a12d1042d5ac7',
-    '31939004982c09489d2630427d861c0061ddbf7c4392819dfc0527505dd78a52',
-    '31ae549a27d55119e5b87ba6a95638f33291494c72506a1c104d1ae1c9fabca6',
-    '31cfe394143d6ac6bef87396ac26192384e82f6fd4e4b4f701b5ab71f18b7278',
-    '31fb58f2512f00104529eafae95ae632a835883888eb4ee7cfb3219bc62c8a89',
-    '31fe92bb15ab0476524f329ca816c8540bd22c4532bbb0a2887767321fe7eb4d',
-    '32040099a0787f10d6434e7e3182d3b80c5198e88f3abd91b133aa85cef6ebdd',
-    '323f4250edf3e88ca72ee8ec3a38cc0dbacfc3e1d15f4ca0236cc45f33b26d30',
-    '325931f2ea6e478301dbf10a4e7cf6ccb8641e8a5b96fab9754b0b2ab61b2eea',
-    '326277272a8a46ef144745ddf58bcf5940d748f923e42d173866526bfb820f7e',
-    '3285dea464362e2092a7309ad7c78cd048b66dd8bcccf9a3334311a90670d15b',
-    '329249c1fc5e02c2cc20a1ca18eafe4a85ed86c1c65054a5a5f8b0827464d0af',
-    '329d9dd6389ff6a0c3d933741d856092c1cef2b62dd1937a22bdeb8808fe906d',
-    '329ddf54f8fb283dcaa09ca41cdad7d449e8a31915c532a0691e5add85d44142',
-    '329fe44c3703d845a7de16cd9540226ac96686bde78d11faabe9c13140ece5e1',
-    '32ada421eb3e5c3a89c5d90f71f759f35f149981b7d320b034cd63dbe9fe6dad',
-    '32cd4220c2303d0ec810837d4f51aaa9c87c936d9e5118933207bed91b1a1c65',
-    '33358e9a3063aca54db23cb7d464041c7221dc15c6d3ab46d6dfbe38aa23f45f',
-    '333febec0cc20d853dff88652885d1bf10077e6e9698e952ff11d453d0f6ffd9',
-    '334c65687e3af2e3a5fb69175f06683e684f80108a1229b0b4d4f1010c7924f9',
-    '334cc0e51f749f64e9ec8293f0c22e80e92ccccebb79229171a591599eb07b3d',
-    '336e899fa2b7c53b761cd1d5c284dc870334d7579068ce75da0d863dca9ec569',
-    '3376936632f863bae51a959ad37cad6c81cba832648e101ae740bf6784972c8f',
-    '337740341f883ae66dac4ee2d1cb713588c9d4b9dfca06356a21ef21c21df17c',
-    '33989e482f41770d7b382bda2f615b5c8b22bee1c36da132c581d985418ca755',
-    '33b9ff89b0b9679e34334211be330353cb02a8c693d362908d3681e7aa4f59a3',
-    '33c3d7a7e58f234010f4a4b65e6924879b00952a33d972f2eb9d414c74a823b5',
-    '33f6da6f4bd76c8a940ced2345eec2e6e7920bd3c4b1bcdf7cf6cf7b0d1587a9',
-    '341295377f7b5fb5d6f7f29c6d94e7434f1b5dc9253bc1658900dbbe6e3b2e5c',
-    '3436abfd36b15a5c862f635b902da2c2db7687a8765bd3869f8ddd26d262329f',
-    '3443a03b652ec99287b0c85bed7747041dce60d2c0b2e5dc710bd95f6f3eaff9',
-    '344c94cee5fdc163a0b2ca3efc3c8ff234ac064e30b3c512b75e6fa7e9f71438',
-    '3450d5bac3e285f1fda5a0e3bb9198fa68dc5bd213f877bb1e774ce0063f6a14',
-    '3498ad25a7356bf6bbcd94f2fc509fa6aa55c564ac99e251597d722d64827302',
-    '3498e59adcd3cc01a0984bd9418dbdd9fd79db9cf6709c1a7c6b5bfaa71ad590',
-    '34b0fd1528b00228b9d03326ad2e758705e5cb182fcb652d8f75d8c32f675d78',
-    '34b35e232dce0b53ff93ab55df95f612e821769e57df54f9d14c38d11f78888e',
-    '34b63a050e3b7fe6787005130955e4daca3fcd9d1f8e159ddf39ddb36367d827',
-    '34bc9f6dd1d44703804a61ee5f30a7f006a6e2f024fba84abb1143c6138d4d73',
-    '34c2f3b69cdca0f455bac97a5200fefd8bb64d222483da58241c57a1a950d550',
-    '34e57aad460963b105ef8af0a8cbae7046cffd32e71284a217cae38fdec84c9e',
-    '34fd7f535bdad3a03f0ad65f8f73b04cf2f608aa5f46ca0ca1edfaa0310d902f',
-    '34ffaf38d5c54ccc77659e17b817d1dbb49e1a9b4733a56670b4175b2722a4ed',
-    '350052419cf36ffe8082b7dd75853e6e7e455c0c3cc1f586fc5277a64dde3810',
-    '35184b00ffdeaabe9f6c52d5471a358c80f45c8c3e36fe0c06e67241ce1900f7',
-    '35295925b54ed0248eaab4e88fc973559521f23235de4104baca547237c28238',
-    '35300b2e6dc8a375fe6f1f61a7bad602bbd740875d26ee157336dcf9b80a53e0',
-    '3575ba621ec4134c5f3725fa3e0534d7d493341285aecff4404e3f674ae54fec',
-    '35a9bcfb3eb273fe97eb9f369ef2cdc679acad0b7b25cde5611cbdd9263b8e54',
-    '35ab790bf75027096f5277b0807ddda46b918afb3f3bb0a8a71e4b5f8f49c3b2',
-    '35ca8ff8509b7d3fcc65baa9fc899ced114d25d4d52d206cde461348879eacc7',
-    '35d6b36fb9c9ad8d4af48f5d134c93a79b46e26fd949c6e992f419df196a14b6',
-    '35e3338c7d274396649d24d560427764f15ea48705c393eb0ce318cbf01bfe87',
-    '3618cd3ec026922f42a9fd9a08e90d1e757eef47e3508f2367287a828cce97df',
-    '3620d10cae1a0db6d12691fd6abe510a8085196d732848e07842b93f7af28063',
-    '362779aa52e85e9f592ead1023888b8b598389cbc55f5814521cadaaba4a8dca',
-    '36325692b73aa36e44efe8d67be4ff8ad51e68265ab69b945a1a1b26f67f6eee',
-    '3645108cab30f53c891f42da7395c2185984f63bc36fd45fec99aa0e2bf0490e',
-    '3649e41c448bfc8b734bd6872ce284908a2eca8dd5651e96fa16a1116117a7e4',
-    '368e656f083c88dae433a93e51894cad15b1a09d5571ac1048df624ac1ef81fd',
-    '369c4a65e2b173c2d0d08bbcfa7ac7f2110596cd9824c99cd8eade765ffc62fc',
-    '36a9e27e256cfdda23b5085e77f9f784bc7320cf9c9b8b6e6df95378a36e77d6',
-    '36b570bc089f910b14fac5f16c25066347380cbfc8bb3cb9e9fcc92762fda982',
-    '36ecc26695617059bc2a1db7d6bd10f964f8a8efdf5c6611fb06aeb0a4dbc2bb',
-    '36f179abaa2b89773165ceb0e6f357b85944e1ecc0398aa98767c36c60b65e7d',
-    '36f4552a5856a05920b7dba236241229a4d9389ce5bc3de39e7c3a1996ed425b',
-    '3703869fae35313b4c8256a944aa6e8d3da146cb4ccaf357428483a3d5824745',
-    '371b35d4f98a7e40227d5c21cb4455f6409d6ebdbb5a3a65f407a3dc46e6e72b',
-    '373e74986c3e3b38df18c6d35814cd4a604af303685b49a763a0c0d84edb67dc',
-    '374a5084c7e72978d4892fe8b26ce5c68a8401c56dcf93abc1160c06036e562c',
-    '3751ebfdf1fc6f3a3880e3066bf1c12c027c9eb7b413fdaf189aa80578ef5122',
-    '376748b9cd4407124d94b319a54bfd08f858d0180a57b032c4763d030fbf7cbb',
-    '378983d890c429c0d706343c05d523188fd5f255373d6c6a273feb61c136116f',
-    '37970f58e4f65ce946331b989fc7a1c4fb5b2abea3eed80806f3457d0f73c6ce',
-    '37a97ae5e86c1080ecd68b27a190de639f69d9f9c8a7b11c4ca9b0d61e558170',
-    '37afe2518e168fcbe8d945e8a8140112ee4e51a2c35b265e26282cbef4017ea4',
-    '381970f9e9066bce7c05ec4e359bc372213a8e7b2d40f2f21b4f217e104b2b4f',
-    '3832b699fb0b84077896b015245bc25899f51cd31162a90c25df36fe6cbaa915',
-    '3844f2fffbc95e6fb62f5e56d7d37de36b9dd44e4a946ac6457fc24a40527a3c',
-    '385e0de15fea7bf363e0ce782181fd0fa652ce25d4cab11e8ba7ad412d17a4e4',
-    '388ba0d4b5d374bd745fde870dd5b873ef8163bc3b9a9a3f4c605e9e410086c2',
-    '38da8f071610697e2c8aabcca04532bde30834e2209838ade256479ce1ba1e9e',
-    '38e60759c04eed969c2feae34be3591bc4454dabebb219d30a02b64a380b4754',
-    '38f01a4a5d719bd860918721f7ddbd19260513f19b0373727f6a0c2b509cc555',
-    '390a6fa7064a1f521d0f5ed986e4cc00a5da17d8451afc715438b48fc9c1b00e',
-    '39480c8bc94912b079677aa0290d7d63a02e6f5db67b73e3d4e034e8cd8e63ae',
-    '396a752b272e18453b54f3ec090a10225f885d2d515c0b124bcc313ab9d461b6',
-    '3991831f0b0e30b7448cd8731c7f797c3059b8d804c3d5e599376c81a06ec36c',
-    '399493dc1795f07424814d400abcacdedc9c5e6dba385e3255b62d9c020d5612',
-    '39ac16bff71306083c658c4859eb92386a64b86846c9957bd0f63350c52e4146',
-    '39b3c4b65cb1abfabe2331dafe7bbd1bab02e3c7037b96537d6041ce8f26bffe',
-    '39c1073f1d5651bcde40cbcd3275a062890e90b88abd98fcd466bff6a9c8530a',
-    '39d96433b3bf1840de5885fef806c401ff9fea43579ea6cea7179eee9ca0c7d3',
-    '39f9d2a56b51bf2d7f87eaab917ec0677ba9258e5bfebb4926f8d91af0bbded0',
-    '3a110ab74b2f69679fd8897cc1f7ace37415db82cc5668e69d9ee3231e38f8e4',
-    '3a40ea6faae5d84f79ba5711dfcf5161ea9fc41c2289071d0808fc36ea3ee4ec',
-    '3a57452a73ef3f44e0bfbff2a40fa2df2591e2165a7ae84f70add697d3b546a8',
-    '3a624289a7312819f3112d11e6b7cd4b0961b7bef2e2973c73a7e761b4bae909',
-    '3a79e9d939607eb5f09343eabcf27074f8cceeca3f9142475ee46f61f1a30c57',
-    '3a93cdb605f74fa597033df26a156d17d5a93af9a968c80767ec764858c0e588',
-    '3ace4e770dee075908fdf9b00fa09e14bd6e193303ba875621a5d5de9dd7e7ff',
-    '3ad1e5d43fb4132022d19a14d8a242e6b88c582478a0294d58f6ca2d37a91239',
-    '3adee04c35e316f2c8137235e79eebc1554dac1556f75d87f3a9609c111cf67e',
-    '3aea15b0f468becbaf58425e5d0014755333333cc0bacab75b62b500acc90a73',
-    '3aef43c7ddb52b9cc670ce4456f9c2fba63a2ff917b722f72d7c8738f94c7938',
-    '3af296f291e0f2f9c71650d679470d28531cb536e1f86f3d8eafaf5b216a4e98',
-    '3af2bbb0a369364c0e69173ff18fc3b1e4e27bc78862623ebb2fa35a9bae4ce0',
-    '3b0304fb5c277b3ab7e0f1f86bf2fe1d9c9baa6279af2b431cd6bf453799b019',
-    '3b097436d8892b05ac229d010ea934cfaee1c1d956bbc0cb00c94cd350c5804a',
-    '3b0e21de72de10c618c6cc080304617ef8d9715cb32bd209b406a9036fb0ecab',
-    '3b381ea1caef89e66d060b45b00ec563d931376e6d5ce1467ff8c393358e3c5c',
-    '3b5ef3a756739ee2e202546318bd80855dfce1ec38595da70f94a4a2c978c79e',
-    '3b843e63910a66f12bbbd4776dc4da8e6ed891641946d15fc514ff4544630552',
-    '3ba223f3318cccdaf5ebfb69bfd5eb8df6218fe958946dc0e555bf2c385789ed',
-    '3baa99ca4fc7baba2ac0b8c185374f002d4e9d862dd89d865e381ae3c6fd4a4b',
-    '3babaa94639052e8306e9f22222e2d6d28c02b3f85d9c008558f42d6fa66ab83',
-    '3bac1ef6a3c7d4ad7367eb2329bbac64416abda548c2bb49efd443e959131528',
-    '3bba677e732e63f834649a495e5cd3342c67c1a869e8d603cf0495a7f591fa30',
-    '3bd1cc60e2e728294d7df79dd763f21b832bac9d39ebe2beef4befbc3ba001fe',
-    '3c0eeb5814950efc7a2139f8bdb21eeb2ce548293479100f375c43407503d94e',
-    '3c382216fb90fa588871c5fa301e8f935788bb50998c70db1e0ff3be4f0bcac6',
-    '3c3994e49d87f526dad2dde38b5fb94ea5c93e6ce157403fa5da9ec51e6b0725',
-    '3c4eba9be4e3528879f8da8c9a73c31fa173ec3135d0c60d1c7ed5c862b47c30',
-    '3c865d071aa6c32558aa3cf4e3371db508e386357d28915d2244a08fed44c7f0',
-    '3c8b487691a4e570a658705e149239dc1cb2a418f5d049626bfeeff0f32807b9',
-    '3c9b43fab5a06612f57f296c3f20463e9048b5719e84ca04510e4eeec5d8884a',
-    '3c9dc1f7c8d9d9a7e9632aee816df3125d408df64a71118aaba01606450cfc76',
-    '3c9fe57057812ae07a1ac03e057ef875856cb849d7d208ce6193ec5786626bf2',
-    '3cc3349f167576db92f2aaeaa3892fc4538edf8704e0de3002efe70f901ffeb6',
-    '3ce7f59e5f8fef50cfeed0c051ff82036ee442697f93b9937fba4243a642dacc',
-    '3cf565b18b6f9c0ebd161748f4ac8a637e2b6ff05cde60bcd219bd99403cd1f4',
-    '3d0bd322e295f85a60bfc2768905e12f8424f26fb0486791d7b98198bd4958c5',
-    '3d2ae04b552970d57c56197909be6ed5074e137ab0b200bfa3dd67acf7ab9521',
-    '3d312e51dbfd8b049c8d98ef1d0520e9625d613f1cc669ad89374b868cae1ecf',
-    '3d51c029da6bccb47cac47638b08a586894d93b3b9102f8292a74ed85430aa94',
-    '3d5d3358ac2ec79c0720965b13a6c1c95d71d666c5cfe6385caea8a90072e621',
-    '3d5fedad9f32931ad5eea586781a092954c955148ddb20e395108cbf165be2b9',
-    '3d6072dcf49a935b2c302d9db41f3d92f1665e1bce0b682701a68da9e9def8d7',
-    '3df11c6ac4694af02ca63eb9809c31dcf656a31ae46f41ef30a5373ce345dff5',
-    '3df4f6c9c97dd9a502f1f78d89d190ffcbb8e0eb0c220aa0bdfba7bbc2471a7f',
-    '3e1515b665d5fd57e07e3b91f0474193fff4bcab509dea8965b50fa1abecd9d5',
-    '3e1dda9b424c40283dbe034cabe171c8d87d4d5aea7a06a8606c906dfd0230ba',
-    '3e222deb04295d89ace1f2a3be332d6651809a37517a61853a40c2f0cb2bd3ce',
-    '3e3d01828a6a9a221f70d20f4834a93b0f58a2c4a10c4306e05809b054a321d7',
-    '3e3d0515579668f542018b54fcba626d2ff51ae883bc907223ae592b817fe64e',
-    '3e8d0e157bb3de278df7fcd77829941f817f6d4e9f88308704610377860b6601',
-    '3ea4e850ea200be894269325b9cbe8f4991733938b5009dbb71a0d7b064d709d',
-    '3eb01fdae26bd34ad54d356818c1c17299ee6f7d254819600698cb58dcc5400b',
-    '3ec93bd637407e78e68d0a97295b3d64b2e9e2f89379745914bdfb5d84e1e482',
-    '3ecbe43dec1532a8f26621913b7669fbdcf80e3796c70bc68db08bb3eb98ac44',
-    '3eddda0c15350ff45fb9d186985c870050d8bf3ae8e4c55e2dfcb86637fd8b0a',
-    '3ee483ef0c07dea718ef2b16b93d5c15e982b070fff1e8c8308167f09f6290df',
-    '3ef20960453b0693a0e2c55d4fd101801ca46e41c5f8cdc663ea2dd8c2a28228',
-    '3ef26b8a48f3d33a67d61155f71c8bfeb0b265f51b323d3c4d0dd722309e33c2',
-    '3ef93ffa0ed00b9a0c935d5963038e0bade966157d1d36024aaa98dab041694e',
-    '3f4e4bae45d1dc68c7f2d1552e8a4ac59065d86ddad0dc5135cf7e383b3c873e',
-    '3f52378fefe8fe9c59664341c4539eae7ceb9d3200793222de8e2f6cea5535f2',
-    '3f6accb5b8eec6e113019fc1725d0989c9bc94513cae61690edad521ec17efc6',
-    '3f6eb71c82cd03368db86099e1fe28231353eaa0a831858d1cb5d17fd12b5ac4',
-    '3f776e9b07a0e97df465c11b624351d520d7fee5237239b52cc9d4cfab79a257',
-    '3f95e380481803f0f6bd0ff3de470ecc4026ded33b992e157e849542fff343c7',
-    '3fba86e2f6a05e108316f27574dd0c734c5226ded587809552e26d69f9e0fd18',
-    '3fcab77451ec62af2a89d52b9e7ef382cf2b24cc2864ed07869805da318b071e',
-    '3fea6a860d6e5a5dc52160a5406a64c2ed8b244f0df9df54f902287555eede32',
-    '400c0e825b3f362a8ba1b304326b01c34102d7abc696ad087edbac63ae7934ef',
-    '401320fd618d7f43850808e57a2ffc1c4370f00f47b49a0ed6168d289bc26e16',
-    '401db54a772b6e5f928cede7bbe1106888ed2842c18ec24c7e864feed26ac817',
-    '402fa8baa0588d7577b09f2be13f382b1c66ef61c7b467302277c594ec028620',
-    '403d61450ca2d0d503894a94898e8087b0e7666faef59a093bd8d15ff61bc506',
-    '4047172abab75f48f0eefb6a000605cfda25672a3ac2023a76b30bb064ffd2f2',
-    '404cdb57c98e222d3ced62a915d0b52de1b773f9a14766d30431acc768485af7',
-    '404cf4577be2afeb4ad3836007d0a364eb6f3a4ba03b9c854ee20efb8ae7a5e6',
-    '40557276eff4d64c04cf9ca2d20ddd6994f89086c70bf1ba83a78993317724d1',
-    '406220afd86ae96007c6d269fac5258d72f050c19a1fa49a84ee47afe0687e15',
-    '4097f76edbe06d3cdeebea5d78ea342bc7eb53de621840c15262714161af3e17',
-    '40a8e02c8a60c1b30f77467e7cb154c15b301f4c813e2df7d9a3adfd9056d14b',
-    '40cd108ef38baa649230158339caaeb5b9bb5fcc7e37511ec2624535bda9611e',
-    '40f0acf7612a5576cae95c94d097e8d5d8fceee11e3e331e8a7aa84c8fa3658a',
-    '413021985b2f2a26951aa3800aa3f10c3bfdab5d8cd377b370441cb9948a2537',
-    '41346410704f2e270e25c146b590c7e9442d85e46ce133b94b310b52308ab386',
-    '415263def19514bbc546790cee4cd87a5fdefe9465559c460a392ceae7f2a821',
-    '4156ac8e670e2c1fb6c60bf4b281d0c9e69a42ea7d668f3b39e0cd9ce9eb7dcf',
-    '4164a5895a7851e08a2fa1fc00a1c9f07ad9491820e6b339f8063ecb37be2060',
-    '416a3f7a9eb4e3f4f925d6ce42e2a164f928833fb055ca50c08df3bf797a2be2',
-    '416d5cae50c3501ab05e98e812b3e601a97dd0b5b2edc90352afc7992785a721',
-    '41b801667d3e12822905799531935c21047aad7d9d7f1489a7836d0efc628ac3',
-    '41c529ef81bd902ba31df36fa5ce92232bc1d93ebaeb6fddaeb19ca6c12fbda4',
-    '41c534e51b638b6d377569e4c49eccf7cc8972ba579d21aa1b2015eb29e65e64',
-    '41d16a576a32d75abdf086748ae1c8c0f5e19fe9157ee77eb39df6c37778b94d',
-    '41d37c2332aaa8986852c0087e57dade0ac698002517b2a160720219addb51e3',
-    '41dbc79f4f6a26a3f89261335cb09240a2f28f91c080ffc6c5d052d0fc0e4ce1',
-    '41dbff9aa0bf68f0f775b502647190bf094d136d1ae53ba1597c2682c155f289',
-    '41dd78573bddefdb13ac3987c82700485eb2cc885eac7d7390baec52bce2c2da',
-    '41ec4be9236c61c626029563192cef18ae6d709d7146612b670d0b83c93b51b6',
-    '41f0d58aade209ee656e90c100e7ae74ed0acf7aadaa2513985e8cc3e40036c1',
-    '420092a9ce423e4b2645cbc86e50b9758ad30a922bdf32073416b15a229906b2',
-    '420bed2f6e9eab307b2ba136ecfc772f7dadd3a67a8ad7def0e202948aaff988',
-    '421231c50aa05508dccea7ec55f3528bf855198686d30706f75b35901d55a073',
-    '423790d6b710511c042840d6070a5ce7a6edd9a322b5cbc3d8ca6dd4c1afe981',
-    '4238ded3db597de38b19dae234a58bb54c6fd3240f116bf038760e30fe37f5d7',
-    '423c15a747c5ce673965f87d8ea34d90837e8edb30a4950e207c18d319c92e4c',
-    '4243fa189b6eedfc8d3c23b6f2a4c0cb6209013d155eb3d30e777bef255653eb',
-    '426c3162e192c8454dbf07ba8f2e85b1ebdf3b4dced6eaffcafbd103b0158c03',
-    '427bb88631154dd9645236e243d6fc50755a274bc8cc12888846cf22c3d0b7dc',
-    '4291d2405c14704768644ae000553148025f562bff43c27ba7299c427b7246f7',
-    '42c95e2397d6a54ea7b420bb422111415934cef16fc1e470a7e46060410892e2',
-    '42d3b0832f4eace5719fdc7df5c439c68abb4f1ff541eed2a29b998c437dd5be',
-    '42de6a9493fda6ac19c74a3e30312537ec836f27435406a8730cd41c8bb3ba9e',
-    '42f8b976f9c1b6c188616cbc69c7d5d19d45a78bfbf7bd06de185a65711a5816',
-    '4306f8c99dcaacb06b1d8cedb7ea90ea134a7a58f8cf1ee7da8acb2f4d4c5c94',
-    '4306f8c99dcaacb06b1d8cedb7ea90ea134a7a58f8cf1ee7da8acb2f4d4c5c94',
-    '4310fade8bb7a771d7105a13c920e84e3cb3ce25cfea4ecb0d9a45ace7d3f3c9',
-    '4314d52221436042fd9448c16e9d9c547e5d03ee1638d642406f71956f489c79',
-    '4316f6a9cfacf2b6c54917ad9f2225264361e0187b0d2679af091d51590d7dc1',
-    '435041af60d41a30a231d425db19d36a539277098d87a7531e110d52876141cb',
-    '43508b7e600df3b3b0389af8c95b47a59b0ed00b9e251d4287ee3bab820740a2',
-    '43b0e0481bf16bde8afddba7a4e71422aa42d95401d6c7c8b331b7bbc8c8b6ee',
-    '43b3fb396266829a9ed371d30d2e452c3bf49d7cbc9f0a8e05a7ca4dfecba13a',
-    '43b6182767c800bc6170721170d65812a9ac81496136a1f31ddc2b9b8482bee6',
-    '43eb61767bebbd29bd40ad3ca2d31383062a14fc128917f66d2973582a79967f',
-    '43f159676e0464640a50a5d5257ed16797ecf624904e2a03bd4d7de73d71d14c',
-    '4403b148fbd4bcbd65e10fd3f27fae330e1a741bc63142d430b32925b4b445da',
-    '4404087a2c30935b9cdbca43f656638f64b503067cd28b5aa0ff285dae4a62c8',
-    '4404ad52fa90d8e4b0cbbda4ff35e64f400d5601cde08cd4a73ac1a8b1135139',
-    '442551fbee90a14f7b1b58c420fdd5f413eaa25bfaebfee21230efa7c3c22268',
-    '444187223e37759efdcd2078bd0ed87773021a35010fc6900b6657ffdd4f579f',
-    '444b8733c7cc3a58c15619863446dedc8415f80a71e303ef405e01da3e5a90c0',
-    '44530aad0c5a042530eb12214a5feb6457bceb8327675f7526ff9fe13686ee5a',
-    '446185586578cecba11fa6e9ca34d8d64e9cf96d033ae9e3c66e34258f090972',
-    '446c66af55d9ae70d9b2798187510e84746b2433a3e1a15d2341b1dde845e7f7',
-    '44a191aa8b9262daae7c2352918e49e68195abd92ed1c2f97599c7f9579ae706',
-    '44ae0c8ec12f38f55b54ca62caade57c743ee1201cbb58931e1e91e9b1280848',
-    '44c7fb6059c96a676a039cdb4c3cc32a1f55f778c4507df81d959ec24950c2cf',
-    '44c81566c74f2ea0008ccbee3bf8ad542f9dac46883d3775dafc20d0081d88bb',
-    '44d1a2f378a2283ab4cc4c655deb8c2a387f4e5f06b6a9e01ed7de691319deaf',
-    '44d59a3535270206030fce28579d129253c5edb6043f58b544c54cc7be343052',
-    '44d626d3c770745e12d864052ad9d0c1cb81ce72e13061c49ab784fe8020b49c',
-    '44d7915d0d9fa5c73ef7fcb7585663d619878edfe5c7e09174b83214d192c75f',
-    '44e9de675357a320a215b1b2863ad5d0797f1b9fa03c1242013a054aac636a16',
-    '44f86999bab3491c168914d2f520dab4c60f34087da510de15fd3ad904b8abc8',
-    '44fb0688d1d57c5d589f627672ab6a29f83f7689f52f7aab05c449b5dc9093a4',
-    '45411732f76fd94ba073f8709cdafc025f435162c97ffb1c707fea3d45466541',
-    '458b397636b543b6eb44471c2adeb81b06bc51f674b83c3739e080f9f6b49560',
-    '4593ca492002de46eebd0ecd66b1f383bf6ecc348a87343c291b384e96ee8ac9',
-    '4598e6c3b632fe0eba909732f49ad71b6034672565ca9e588deff560cff63b12',
-    '459d957ea7184a736ecb1f8f6240e014c0ac2611b55f61ac3c43da2a222eac45',
-    '45b1278c34375773379be7e81f838285c927a955453d023f19851a6ad2eccb23',
-    '45d36d2fd2c06b2b036564945597dbe37ca05d6179de167bd21b4388f11274b3',
-    '46009a80a619296c9b5f7e45495da63701807516261a0be2de982842f98112d3',
-    '461853788ca5a38160f2b4eca097dc55c35c5147cd0e126a5cef880c0789a22a',
-    '463922d99eb9b9b89a5d3fbc081717623264bf9a6ff8fe4713c88f2a67a53c7d',
-    '4646b50a32c97b651ec5b71ec880774e6ac927d30c2c5d326b61a7d4a02470e9',
-    '4657017fded9b1365e0af873b61695d361b236d695df12b48c07eb034da8a32f',
-    '466758f8d30cfe58fe5e705c98da4ed75b5ba6800ff9e716e32ca36b8ebcbba5',
-    '4669849cbdec8dba29a049eb1f27384eb2016fc2f8ab3d6c2e83224b86923d8f',
-    '4685568c12aa844ac8829b2f82a41d156952feb41db8732eac5e011927a9b2cb',
-    '46b97748f98111e7c1d4dc6c3205f7bdd6d0bbe253753a1e9a23a593c4da86d1',
-    '46e42284a375d21536ddec0aa87fb14bc6b122d479a8a5ae066d6cf06063a461',
-    '471a3fd893a70599e84e925c7e148edb544146f13cf51e5294fe1b5f7aa43ae4',
-    '4721ad7a6d4ae87097edac66c9b64ed9ae12482f3204091309f245a959a206ec',
-    '4725f6e7b888c323cb7549b70f96124cfaccb806156fe0b00e46d68344db2fd1',
-    '4747fe0d6883aa36a2c528c8d4123459852823aba98fcc044ae9119fa33f1ab6',
-    '47541ec4a04b09d7dbbf94ff5ec55e13903a9a26fbdf94d4c15773f89f1dec7b',
-    '47628d76c2ff9a9decb8b4b22d72a7dc6f3757412659ff987e741f978751c9e9',
-    '477eb645e46254c37c4ee8ec7628fa5adf26e86bab0225018f53652c1d58146b',
-    '47c1b069fa0b532336ea78528cc2650012886109097c25ff3a26de9d7ba88a8d',
-    '47c46ea918ad02caede7d19d382072b7c70806b2337cc33ba1aeb319f4574a29',
-    '47d221b053a55d65147857bce0bce82cfbbea54237d8971bb172be3524659b53',
-    '480ea860902ce72e40b0cd744a32ed05cf3158a90cdfbf017fd5fdb8f448968b',
-    '48196e5c4d304cad7e0edf1907f3b7bb9002ac358ca7602f0a46964edfea61b8',
-    '482577238719fe7f615da5fa76220aa4827f651737a240a0319d424ccebaa77a',
-    '482adba4c62a9fd23a34bcd07152d6d6edf5c1605c7cdd938c8d744d4f370822',
-    '4830c3d8745cfe94e16256a482ae52f85128509dfab5a8c661b14da5ec6ae881',
-    '483a90db1ec71b4838fb368b89041234f4696b24d83d471cd842cf8694bac762',
-    '4873da4106d0467d3738da28b2ffb16a03937f8c245c185dd19b050abbd68bf9',
-    '487dde4dc0f84f578810dae31e0e2ab335d3b46b5a60d220ebdc99c968f3c6e9',
-    '487ed6b071b4ae0b89e1bcc61cbe5906fb078f0598f25cae43695ff24f9ce3f5',
-    '48819cbaf497f4ba2429f12834a645149155be85aab867b011c122edc157ca8f',
-    '489b10dfa61173389ab3dbb531a3c24f5e99c464bb6e45ce1a286e9e7b6b0d80',
-    '489fa6c3d6d71bb9f9beab49594e530462deb3e8a3365e70de03d6a41d01fd8a',
-    '48a13c5363c1da1ccf0711b4b11dc72dee36662dcc3800d388b0341bbc8e1a02',
-    '48d2bb7cb342b61df59374222ef942b868458d46f471e26d58ac0512ddf1de0e',
-    '48e675bfc24408408c6ff540a87ba34fa3c92c8d7720f9250676899be62e4979',
-    '48ea2b79329866ce66aa87441d6313e60f51e432819c7a193031360d978d97cd',
-    '48fa10ff5dc75c4ddf9c6778af072eff6a4de22fdb917806bea9c9634d5e9629',
-    '4905d36c48d09d69451ca93741c91cb4e54a4c3cf83bc6c6345f61a89e551242',
-    '4911c0696bd104e583e6fa77d6381879b26fca94edc55d7e8e71c5dcbd876dbe',
-    '49138e9cc235d0815275dabb4f4a51309362f8d84b7238c72d178adf0eef3c04',
-    '492c36c63ce53c945535396659f3dd27f5f0ffce9954fb73b879d81807bb5d93',
-    '4941d49753212042bb17d7e6996a645607a79a6efb47e266673f66709138d240',
-    '494bc088c5afec3c2da88a8a286f4b2e399df5b3e066a12ca3850091fdc7f7f1',
-    '49563c7645c6fda030cb2b8d35726fe9f3f8c1c336e9bb196153c0d4910d464d',
-    '49732ebf25726ad3b285090e8e0e78c22c5c1475348b79ae77c9413f42377698',
-    '4a08ae5c7c96b839c19d4e54b8a215feb377a7b3febb1c782b3c039f35de0651',
-    '4a0c173727585fa565b15b6e32930d9f85975bec28963bf4b8e7e89361b87b60',
-    '4a0d6648706b6c549a43607954f220c14a183e4cb54bf40f994796c722baddf7',
-    '4a0db55e1e89a37dabf02c4fc282010d57c884389463cc45e81bd704b453048b',
-    '4a3964fc2544c8540b3ed229ca89fc5201e6abdb305efa1b5a41086a7aa009ce',
-    '4a4206d94fbd3ffe27ae73640c68e7773991cb6a4d19ee8b9dd43d4158d6d81d',
-    '4a47ab84835982a93b84c32ffdecdab1e28270ac9f082ca938b0a953d08e63a1',
-    '4a47efe142a21736f54b81d52d0efb1d63afa0499564ccdc0c3c7408183b01e4',
-    '4a7878ec7d6b48c883f65d32110c5f8630f7712869022776bac38eff550b2e5f',
-    '4aac60e3e578306e99c8a591439f92b1449be291a32abc6b8b98176d79481645',
-    '4aad64c86a9cf8d3258e15aa9a802ff1b65d16a0452b6cb4ca9a0d5c7c515a95',
-    '4ae77c008d8c714fa2d1105f57042f32d679718a8b431dae7b0fde7f11d40cbd',
-    '4b1257c1499e57229faca44726743bbd5adcc92c35c6c69690e0ee0dc37182ff',
-    '4b173c8284ad9a94dc085a5f4280900b0cd041f1e03409044e6937970d91a028',
-    '4b231eb5f8e6a037c7e56c9b5cfd305094b44a993f9cae94536703ad2e444cc6',
-    '4b28157c21789c5438bacf4c885dd905bba5e4ce01528981d24791878a385d60',
-    '4b37653ddeb4e4c0efa4d5b1fe38763e00694f5235414f7e3a6dc70ae10d4082',
-    '4b6790b69f66153d9db35c157aa331bded8e3938965f8bdc6f4438f604c5d751',
-    '4b8e78e681c5d9d63efc851d5a8e06d4142a8706dfa21eef0bad686a34d5cb5c',
-    '4bcea28b6eb257fb227d0c3f64005e56dbd67787f7c6ddb3a120f480267cdbee',
-    '4be9625bd3a9657229f635a36b91651991be1727fb9d28555dbc95401a085a88',
-    '4bfd91f1bd17138712a646dd6069288c6d1e007205bc68451b05cecf5909d6f0',
-    '4c2b552ac8776b6b49942d00e2e52815a44e507625a0a2431bb9ead0b2725b3e',
-    '4c579982fd220d5da0ae3763fe1b2226b776291276c652e3c6ebb0c4112fd9a7',
-    '4c57bc724649a0c308ffd348a7e395939e066c4da6ce2850bbb7b57b407c2b6f',
-    '4c59cb61cb0943e19fd558efe59009c4b9f41cb08d596b51b87dcdaa89dc061d',
-    '4c666be9b6c7c1acb7c21d514fef955f2555b89b52073d408cfb86dab85ac6ac',
-    '4c7718843f77bd4d25bd405b6e38defe7ed0c3f7335c867f566055cd1adfda5b',
-    '4c9150385868e268306075dd0d1d85a51ca37edefbc6210faf66e8a7d7135c67',
-    '4cac500bc26bc857c1222e01ed20e23ada206b9d82a6348b83277fec94554500',
-    '4cb95618ee108cb91385f6d1756e6009e09fce66e02c5c638963ac7679c5038c',
-    '4cbb9657a1161d9a9c942b7622071d4d62cb325ea5503d761a674311703794d3',
-    '4cc403f7fc7eebc0a7fe096a6b2bd57c0a5c2c9a62430cc5b698799037da68c5',
-    '4cd20e255ff55d1cff69b458c05bf59e26445aa82c9a2a1639efffcecedc49d3',
-    '4cd8a72d723f10fd939b3b082c0a1497329a25273b069ddeaacfa5d63d0a98e2',
-    '4d02f2b88e386887257c8405a34d2b5dd379b7e157c071ae6ae1caf1b0147751',
-    '4d30bc9090fb54e8a2ecc725136053c88437b20cda28e63cc53b887abeaf6989',
-    '4d62c8c2aac0697d3259892012f3d02f1bb4428c983816783572f576efd92e2e',
-    '4d641144cfe2af16498064b5bede6e53c0a425feeea9a05c492f027498c61113',
-    '4d65aa0a28cf60f0c371d983e1cdaa6b4c59f9ad90a96b27c7381deaf5cc28bf',
-    '4d6e98bc469d92b8d2807b7ef7260c696284f7fb06afe2d2010923a363c95323',
-    '4d7b0d8d94a1b5950e389a303bd8a83ffd04fdb6f8f6dd70a29434786a84df8c',
-    '4d7ee87fe9088aa49996c13e0011a6914c7ff4bc76afd7f4cd6b7798e9cea0c2',
-    '4d7f20f256c68ab04468fa66a5ba691d061f5c0f3700dd8695452bf2bc7c6c4b',
-    '4ddceba814d210288f7930f994fedc0bcbd5c15cb63bd080141de1a8ff0e68e3',
-    '4de420a3b200cc7bea24880ac63c7ad0f3d7553fdf20bf15a395c450a2dd07af',
-    '4df4846da6f3e310b869d628ee97a2fb80ad8b8eb69da80935dcc526d8bb9673',
-    '4dfc66d780f9b67f6c53d65cf9c775014fc0302d3feacc8fadd2f8f975b859d5',
-    '4e013120a9bea91ca56400653be551a4605ed03c0669142685dc32b8c930ac07',
-    '4e0606cd4e06cce1df1d93c6d53365538cdb9c823039962f12a6513face99940',
-    '4e184d6516c9690e360dcf73d488c0152c8e97a7e71e72db54bee9cf4110deaa',
-    '4e3e9a945edc3936d7c850fc0aaf3dc2fcf3b2d28750f811e8963c772948850f',
-    '4e40d04978a03a12d6ceec118ee83f4f37c93cc793fd766da678e3f380f6f277',
-    '4e54eba36ed7ab829fbe6c819d413026c7d9ba42de150ccd9feb3c68429ffbab',
-    '4e5c60947ba67a1d5424342d1338c867d06edc287443f662f6e274c70def3f0c',
-    '4e68378e6c714d6dc006226fc2d22b1b980cc276817c560c716e366d140b8319',
-    '4e97a1e0aa67daa8de4cdf907cbcfe4ba9f9c4d0a90e42718cb66c84cc6936b8',
-    '4e9c886919d20655a5593dae73c07dd77488c45de1ba4866cd101b142029fe98',
-    '4e9cc421df65d4f3e9a1ca9a51a4eddd9e57d7620691a5ac19ef7dd5c501d3fc',
-    '4ea6b33507fa9a03646a9940a9a39bedabb6c9d43666ea6cd14d9899bf33f6c6',
-    '4ecec0d6ea646a4d748228dd85297d8d5d81669f47d6f3dee3b674470b503c4d',
-    '4ee8f01c4a19a576e58ce08aac21a5e91b1a6b98fc21d24e11d9c8fb900534c6',
-    '4ef0956fcd58e933eb728fd74282694510c13ce719b7551cdbab7497d5a3f6ba',
-    '4f71fbebe2d195b318c8ab70a610c3a710d767c19775dd42a6a81facf10338a2',
-    '4f96fd394b13bf3e1410d8963933f7eac761399cc61223bd8ec86828eb1311c2',
-    '4f97ace531aef4107aef4e649073b2c40059eb6a229dc8201a53e0a0fcb00cc6',
-    '4f9ad381c7d0776e6c6ff9dd569cecc2cd7cff897e4cbae0c521c8124cc69af6',
-    '4fcba07deb03ed82efd0de4afb418f8364728bcefc9774e28989be20e0561c69',
-    '4fe4b9696b13ced482a21715e33164a89956e778ad30289ae1c491123bdff211',
-    '4ff387d0e7eccc698ade05c8959de3dfd5bd17aec23d2805617548da1254e9ce',
-    '50353556a3a5c0609aa222f534d80535f9ced6813c6823261aef9920bb361dfa',
-    '503d39c3bb575c966b73525ff2a51189a28e205cda67f50de787bf16bbdebdd5',
-    '503f499aac1ef7e1f2e01f14012f16855a4bfa9a81cc6a0ba6df2cd15a11021e',
-    '50733fbbd69dcba8d6fe5f224ac8822d19e6214e7f3b20c1cbcaca946f10b5d0',
-    '50793e5bf4f1b17c4af0230ba16d8752bc712524d54f7fd84c768739c278984e',
-    '509c7c321d421f4ab2c644977a6d16b0b6d31a183e1587aadf484cb17ee8fc77',
-    '509f409619274024337c2a46ef84ff1d26c8b5a099be67262038048ad7a3642a',
-    '50bd686db87ccfd50c279a9fdc24ae96643794de739419a2aa857d35b15ce235',
-    '50c00295941ca8b365fba38f83e03b0095bec93b0fa949a232e7be8b71c72351',
-    '50ca5712b6e3b1adc3dac570d68aa20f748ebbc452d6a51b784c187063a4313d',
-    '51020cd2b3a6bdc90286228f52a1a3c1fb065e9f72f55dd02a51f8c9e7987685',
-    '5125440d2e691c355b3bbfa8e10d3fa78878b03730a77702063c33b0717b46f6',
-    '51329c4cd110dcdd14745fd44cb03d65e0e296f08ec83c30b58c6dfd73f6a219',
-    '5138d15cdf3dd286d749450667e03427c331e7a7666ad41a5759873fefa61be4',
-    '5163847f71b2c612c635f401968597ddfa6dc325d3fe79281d43ee98f3c2642e',
-    '5163df77cadde7805736785d1b87a70ee3f4eabe69ce8cd754706f3a676d7764',
-    '51668e7b900431c46f9516180723ab88574c20574e2f7e20d444cd9c8cf29f59',
-    '5169bdd5a19f4736ca5619f39f06557f855674bb0ca16d172384064b82f0b02e',
-    '516a37cca38346647014c5a4a844647f5409608efb888a2eb0cfc18b9decc1bf',
-    '516cdf2725ec67ceaa4f5909570287b4092266150ae3e4b95f38987e6bc09935',
-    '51b847d35266d8d077508bccd5cd0e1ec61ec9db914a172b38b57421e76f782e',
-    '51bf68ea584f1255cd05939203a9c5563f3613555dbfeefdb4f9a898c6639331',
-    '5244dc0d67806b7b20cfffa1bbf72a8077b70b9a28a63e9f7604d80704e40edf',
-    '525416272a08f8adb22141de08398c7973574935ec405344acdbdb772a01f1e4',
-    '526c3a00073b360ad2998e0b96349bbb17d0991eb865991f1ff6c39450a7e0ff',
-    '5285ceed7977e6f2d3a2c4e36294fce3534032d549bf6e6c6c2ca5b0d82abb61',
-    '52c84b87277f94b8b91c84d6ed9f6c8e15cb2cd937aa1283b4552ca74b23e713',
-    '52ecc1d5344a468cbfa1e58ce13e159fccd4c73fb7786a3ea8043ab79d29bb4b',
-    '52f69801f3a70044ac176d5828df5c31e80e5eef79c00a0ff83215e58d58ee84',
-    '52f915fb8d22761a6a6b60143a8f184a869bbb3dae457b0a9c437fb90837beb1',
-    '532c52ffae8c27fcb0062fe22b6e6cb3074caa119b5e84259172a7e62d1e0b7f',
-    '533de00f5958975464ba325034f54dd56b4673809e6b387d7f1b297bf746ada2',
-    '53658009e80e256763fc0d12f3d9a60d4bf24cae8cd9d76edf5ab8b12c33875f',
-    '538d0b92edf1f94820194bf378e99c773f7ab4123833cc037cd3183b5ee61d38',
-    '539661c40dedda23fa928816e4ac1fb0a8b98028c4f92ecc218f16183d10aceb',
-    '539c899fbb3df64272618a98511e65057500ef9abc6cb5dea1f354c201fceddf',
-    '53a4b4ee2703f1937ec3551526c31ee8b9912c5b14946c3b2b0c4de31525513b',
-    '53b7d63191fadb9b888cd48e1f281ffdd86d988d560a921e9359643e0f58f533',
-    '53c12e10242ecd4098ffad07bab1738c790545de70b413e81fd419f4e869cca5',
-    '53c83110caea4526b9f3a4f0267fee9164d1a50d9eececd266789da5f8891083',
-    '53e36fc9a6ff930db71e0c3ab2e8e978b7484c1fd20c1530c929531076b1afa5',
-    '53f7352998c028e44da14d283feb4ac45fe9e86e93dc662b296f728f2779bf3e',
-    '54123da2f861df7609b00b53edcfa9ee0991a9a5aea8ca438f3749ff7a40f388',
-    '54125e10e3e59ef78bcb163ad0c96dee544337ce968904a1d5fb6a9abea50cb9',
-    '5442fcc787f048da788a08dd9eb3e897b30c6aedcf1138321a4f3d399bd0f4cd',
-    '54584d439a6b3216a356b425f2398d1a8e2bdd81254b3466e3612a419b07cf24',
-    '54699338591d642220894db5030c8e4a98b00172ce1c4f2dab8c96002a820da2',
-    '54ab386eb53bdd7d4fccca0a7e9b3aea1fcfd50062350bdc182d4163ece6255f',
-    '54ba7289b90080a33dbbf1a9fb4391ccb150b392e6f73b72c5cdcf1957a24533',
-    '5522880dddf64e8597c38d5cdcbf4875ad8e5a28d01d0900ab710890b27055e4',
-    '556f31e2e3c4fdc21192fa67851100c6de2c6814ad30144ae8bcaf97ae643618',
-    '55984b2db0c9ebd7ce60baa5c17287da321201646ad5de07dc6c5896f46ab350',
-    '55ac0b4629712d29fae980a8e9c50367d57b15d642bb715b187ddbeb06a1479c',
-    '55ac8980e521cf64f5f84b3257acbe126f3bbcae14946266f8bd4a0368ff9c8e',
-    '55bb7fbc29ff0e68d5d450c9ad2930fcae0829166fcd8b823a4f9c575da2731d',
-    '55dc1422a163f093727eb90301877b2e6c27af1aa96877b13129f6351601ce35',
-    '55fca2de58c91ac19a86d2e69d190a3c7505826b681d24011ba910551abd5313',
-    '5603a0f3efe38e0c030a0ed2c5f3e516587c166a5a30212fe7363ebe72f87456',
-    '560afee2788c0a433da9793648ae0c2cbd7eeda390481677e8c695f100738f70',
-    '561ddec406a42aedff9d5362e3a3a339c51f3396e8a94d8ebbaea289de2c5b1d',
-    '563e3dfd9735bcbdcf84d400d602452b265df9000acceb55f54f26b6e8168300',
-    '56404b247a8b405380ba8d8d67d576141fa2f602c9d793b40feb323b430f4b19',
-    '5652b8aa94d7ba050769f182fd28433e54c6c03fee3b833bc723cd4ca5dcd6f3',
-    '5654ff5eed20a629446cf4fae4ed7f7634fbca347fcf5baea9e605484bf3dba7',
-    '565f0a1b62f021e6ab0f3efb994980567a1bad9c3c4281f461aec0dc81619255',
-    '567dc05c926c8fef66310c413481bcd80364764fa03bbaac85e30939334068f9',
-    '56882ceea74448e2b658e319fe352298135456c8cc7e548b6e426cffc7e2a5a8',
-    '569457027009d8a4edb1f73e97a29273376e3c6dcd850e07edb94bde25a2bb27',
-    '5695d6f40140247b2929bcb74f9be44ec13c9c50eb8efbda2a715f8e481b865d',
-    '569645c38565cf10996d69d4345c750c02de73711cb58bfc611ae66dd2c29b6b',
-    '56eeed64be75dbba0b009f71bd4aee2eab5c90e8a86fd88d34ef50bea4d6096e',
-    '56ef3004c80003b1005285a658ed4ac23abfa593d7a2d4d0b9c44406c6606ad6',
-    '56fbcd609d0a49ccde94e267a730e1ca1599d56d28ea60946e5f076bb71132cd',
-    '57063d8b5c414a9f1a01259dd90da05f687053fb0b1634cba949126669948efe',
-    '571aa7cfb456093429d292f8d590a5354fd90ef814cfa55cf1662a7d58b6bfe3',
-    '57240ed56b307181c3b7864539c04528dab3399b4aa2e4467d8d9bcbb1fe58f5',
-    '5728bf2679d8cdf8bd6df5819179ee7e47d7f3b77e95738e05e9454ef273fe12',
-    '575804e56d05fb59b65c6a6aeb14e577b7febbd347d0dc2a1fabd847e50d16e0',
-    '5758d06319b31397f0d7c119c6128b1c62581d0c97107b07f82b4c19e33494a7',
-    '57594bd1c607511cc1b46d001a9d2cbc632151adfdd3bbc3f0eedfb7b73967fd',
-    '57648248f305136177a11e0e49055871d3bb80ce08e0542d85c457a874b8ec7a',
-    '576627ee2ca36d7893b8b5683267a9fb0bd32aef3c51bbc9c2c19ca9e5ca1c45',
-    '576c37ae08b39feaa770f5368a6c1871e01af826eab7493399fb20b57ab735b1',
-    '577a4b97481cc9fb5717d88c85b7b963549f5ae35af3d92eef1835f2cd85b56b',
-    '5780d09cba8ff5f723b83baa860687b538d8abfc8dbb77b611a8898b4d14d4ba',
-    '578751bbe4c82989f1495cc8b6257f4db78e5a00e4eb390fb37e4acb44fc85ce',
-    '579f71d6ef5886c117bd1be944ae0a3d9f99a5f8156a13255f1dc3896a91bd61',
-    '57b0372450b849f13bc9286cdf120357f266c5a3b9329714e6b7fb69508454d1',
-    '57bb95e304025a55a820a6471ebd2eb1e228d2684f69c1bf1ef09201849bb70b',
-    '57c0008b9174008b21803ae8dfecc387a592466f8b5655cfa6ee3ceb4a56c22a',
-    '57c1de8e447c5055525a8fb84df672af05569d3d22854c54aa5654854b0d5799',
-    '57fce352addcc2fa9aa9105de71f5386fca161a4a59a701fc2f0da77e0d6496b',
-    '57ff2d9668307e6dfa94cd07d38d0f8188371980d13f598624cb40a26b0652d1',
-    '58054fdd41d6541d3d487be834fb59c0f7104642aa7214c167d05b891a0938cb',
-    '5826189ee2deead7ec600c7a9ad910ef62e500716a9f6dd896f38f0617a7c1b8',
-    '583cfe2825aa97a8cc00e3f8af1ac47952cc0ce087d0c55f5655032421d6429c',
-    '584ebf9d3cdd13f14bca315db05ccff21087cb698ab09997a2b57dadbfcd71e8',
-    '585962e8fb08a977a78dd27d0e2642a2aeb265f370ca8b0324707febcace0295',
-    '5867315849142c7a2629f6f929dd13b72de1e5ae0692ead5abaa70708699ee27',
-    '5868bb8f1a6e0b3917441e8b9e94b82ad58539a17f4bb7110eaf200fda95d7f6',
-    '58919033b9eead310fc68762c0e26f74a61b42d4af33c18de10b69f61a7449ce',
-    '58a55ff932bf932771dbd64ba18145d159d6310d3484ce782d9cdf565876c685',
-    '58b0b9f380edb38f80ff779e7e6bef93ba7126995a5a987cb163b7dd3e82283e',
-    '58e6eeedb1c473f52778c12a05f6b41885f16613486138923f4caaa8a64cd829',
-    '58ea62c00124e966d47f11a81fb37cdf01f4f2e4320fc6fa3107af5596a828a2',
-    '58ecccdde3a5a6b19d2649c103e59625eff8df30423f08a9bb669bae2eb3f617',
-    '58f50d3b2f9ce1691155319b2e2143d2e4615cf84373c4ee365a757eec4ca380',
-    '5907474c81cafeb7fff51d396d3dc7a41c2249b602569ac0dd89c452d5764844',
-    '5920f18a4f675d697355c1d962e8e14f90a30cfe3d8339bfbfa89383a00d759e',
-    '592c910adccdb6bae6b33e037230ed7f57cbdb307327a47c2fbd65452312e48c',
-    '5935b77358b21de28351692c7814faad77b1e3ffcd84f9507d5665d8faab320a',
-    '59453985d90d4c7f19b8249975627683ca5ce4841462e9040ca551b974bb51fb',
-    '595014ef7ca7e0d4202bacb5ee92e4391d8feccee16c7fc53a0acee305de4ebf',
-    '596e4512bfe0680bcafbf4f34ec4f13db2d7db4193161c852354d093df9247c2',
-    '5970b9b2a009d83a24584ce31d38563cbabdd7863d17edb592f6581212bbec82',
-    '59784b0a6c728926f39a17a676327488deaf1f93b5bf738237c5b740c6cbb4be',
-    '5979ddb0f155304fd10d544435db3ec768504d81ea380d192ddb0c2b41e195f2',
-    '599158b539e4918ec4917cc6d6d51340df6031907cc6bdc0ae209a5c9614a1da',
-    '59d2d417152bbc537bd8e90aa07ebe065597c4d283d41c64485fc53227521d8d',
-    '59ebefe457c2338968d5a6bc090dce53e7d20266d447d4fb4c48b200af1a9c00',
-    '59f5ef5d902e65f4a94ae6691a5f7cd9f5ba1cb6c643fc2bbb600b02d183322f',
-    '59f621a648f23f7f1c7ff141192eadb76682f57b64d5d9b7118d8071a1c40505',
-    '59f7a2fcf8dbe8cc84a91a30d40b14cceafe580aa3774f8d947202845a09d563',
-    '59fd2e0a1c6b3ab7ea42472d1e948f524b7c7b2c98ab47fdf406ab2374c5943f',
-    '5a10e45fa7167f141ad9b7c03f659ec5f825ed55969b9366b7cee3bfe4e1de5f',
-    '5a17787c8dc4cc9b5fee14492c4a58dc89ab016684bfca17806de6c3e45905b5',
-    '5a28610aa146c351ff6584cf2b0bc7a911f77f27c8d84f2a61e90d99aa3335c0',
-    '5a43146725dd4aaf1ec31382e0ba1a11c4b0b01c3fd16efec792d67bfc5c987f',
-    '5a49626786528194365f9247f96e30538f5542c71f70a9d8cd51e8e77847c23b',
-    '5a512db9c8ebc94bbca5a31532886c220132fa4e5665809d5c3c678427b4ada2',
-    '5a8b84c737079d5abd4b43a2f814e931ba11769a3cdd6bb049f71c04d8bfd59d',
-    '5ae3bbaf31bc9b2169ae5dd1c726006a9f38b03181479cab2d7493b1ea4cd154',
-    '5af6f2793aaa2a7c305c327e2531d4b1968bc100203e2e7f7f4d4a06d3b79ac7',
-    '5b2ee3e9dfeff572244c29d29df2152da3b98b1b4b95ae9c23acc48a974d79d9',
-    '5b4ddfc79c2e65b8f49474178c83dadbd69ec4f5f722e785de040a63ae6c85f0',
-    '5b4f9410ac035fdc9c5438c8cfe41b10dae29a8e779d0fca21f535b7fb1b8114',
-    '5b5a730157b1caca09e7e49bc5e1298dfc8ef7bf18a7e271d6ac85d94379ed14',
-    '5b6e9d043bd27ecb77c7fc27adb1c3cf382f48c17591bd0ded3a9d9e6b108127',
-    '5b7cf9fc21fc742f62ef5582b678c9864dac342f85778e8f8e57bd4d35ff497a',
-    '5bcc9d92914d3585fd038a6b4ceb876641b508ad0f0d529802ac7313754ff0db',
-    '5be2394968d7607a040a0b9f6c6368aab3d4a54af05bfb1b91cc1c4a381dac9a',
-    '5befc719408a18fd1094077993418f4e125e4306094d31aff573d55e58c192cc',
-    '5bf9c1a92a54b94b7d2ca07ff3c8d8a1591a1a6395cc5277e5d3965f2b40bd36',
-    '5c1ad92458d375825a8b147e57c3048e1bd6c0f5c0079d1e48610f09c803ea12',
-    '5c2593b519a0d40b9f735a08ead501791057a0900882bc96560e328e7155f831',
-    '5c2c0b4e00e41c959aeff32a039b65605f0dba78678baebd8d7bf52e28b70594',
-    '5c3f2b3fabe58ee6964d418ba010bd37789b0e154dc5953966e8aaf9c85e9e49',
-    '5c8a56a1d163dabe991bad2bb5ebcb378a71ee70d5e8748253e278cee77eb64e',
-    '5c8c059b21cbb313d863248785c13ae4815eacc2c005480ecd80b85b9d301f27',
-    '5c934e9044dfa617975525ade129a8ba3bc6f229c08ed875346a99011a57acd5',
-    '5c99970a3206c245c6e3321c9ebccf839d6b3a89124fec3d120d395a661ffd7f',
-    '5ca1b173621250551b0d66869f3c4ebd05e5a8dc669932db51e4e7a268b3bdb0',
-    '5cce1e65c0dc6797e477fddb08b8af729b18c02837d70bece739dd1e47495834',
-    '5ccf712e19e2722e4e8166f2738fbc5ee6363c79dbefcf148d075cabde2d12d1',
-    '5cf451a85dc64a3c35ee9e763ec2cf11456c16f78e31679747429b5be61d0a0b',
-    '5cfd7a6d2e17fde5f64fe43e6e97a1ec30c51c6f6da091df0c6f1cb080bd1e54',
-    '5d0197aad2c5f1b476dfcb202940f0acf0b82dda9f24324e3c8b26a573ba3134',
-    '5d06f1644f6871fdac61935e7f9cb31622bf2c3dfc5bd3447a3fdb9e0e4ca26d',
-    '5d41139e4848ddec3963cc1d489ed944da7cb6fd7c31e89a2bf405f81bf8b008',
-    '5d45b8d9b0a5a21561b410fbd673c2b4171b7d09df09631f0faede1bcb43bd71',
-    '5d47f9557813f574f9f2b8fab6d1aadf99da5a661bfa68ae865a13b84abcf40b',
-    '5d5c5aabe024f4078074fd3591ded9e743aee9b328146d5b0a8fffab4a388f24',
-    '5d5fa13016284cdf9d3f30c4b3838ee62099882bf7e00b27ce55d572fb9cc4e8',
-    '5d7e5bd90d26f42d803c1c92855d0c497995476b79f8ef60ebbf5dc103f898c2',
-    '5d819fa417c72e4115da552f916bab6e440cbf7ee764f23548195b669ae7dd5c',
-    '5d96085dca639f0f3883e23e5d61e2afa71b6ba12e499bca3c365c7dd150077d',
-    '5dc04bb4192b84fd02105ffe9cd9d917dde3534a973a345d5933175ce16de768',
-    '5de35bfe4220d9bf84b3a089fb51509492595eb52efd137178b438e20971c291',
-    '5de5c6bf22a072dbf877b1e56d212dc499bf217b5a1cae5deb742b673d892309',
-    '5de9e3b127b66b5d9c3daecceb82a7ef3a2ea8c6b38483b7beae64238cb51ef0',
-    '5deabb36d54dd568ac5b1723970d859e7df8384b0b18661422fbcc362429a48a',
-    '5dedadd66dc9a51a327431d687cce6f31f6faa129f2b3a7cc84ff7a4a2125d8e',
-    '5dff0b96336977634606982a4c16cce8f635f0d6637944119535a8c8f2517ed8',
-    '5e10bc384428c588a1bee79f4d9e4681169a1fd6506cbc1bf152e728a344a305',
-    '5e53fb347af5eeedf6f42434f9b44624281d826cdb34ad47f391ca4131ea85ca',
-    '5e5b74ca0f676d485166d4f56fe5cc3a6633557aa1b31e445b6358ffcb010819',
-    '5e5e5ae29c577c7efbbb8ee7898e4c6199e48fe9bed79ac1a037f357c88cf26e',
-    '5e7fb5535875e374783efdf114c8c10292b33f80df56b1152c52cdf3365d2472',
-    '5e8d9585886d93353ef04becb10d79c45440207cae21e97bf3083dc79a78c91b',
-    '5e9c3da4b3237e829d22440eeea1bf580a43b3b8916c0eb89ca89f457169527f',
-    '5eac7fdc87f5a0a60acaf546b95091e43f1483977f11d582976e1e2d5e285f57',
-    '5eb2add718cab5b6028a96252d5881ecb6fecb16217cfaafbb123a563fd592e2',
-    '5ebbe9934827f6d63c36e22e1273cd793178abf6da83bd6b7312b07d28d77dd1',
-    '5ebf7201216b16d97adb6e0402aa2362297b95ba17aaabbbb1dab2adade18bc0',
-    '5ec13949bfc878a5ba90cca582258af1be84ceac6c10104e23ee08bd7c8eede3',
-    '5ee29a9eaba2ddb9eb6e1acb822eedbae57cbf5391d72f8ac2628dd5751181c0',
-    '5efd8e72a22080eb9d80caece3364f00972c1dadb8ad25ca4ac6c6e116ebce1b',
-    '5f3eaca9b21827eb06a2b9911927f783e16c0a41be1a2deccf11a4dd562c5afb',
-    '5f46609e802dd0feded3a27960bc71fff39506681bff683d7b30db5df0684693',
-    '5f63159cd6c2ef5dd68855f290ef1d741fd36235c29a4865c67622872991c497',
-    '5f820320b77279bf1bde4bdd0d4705cc797a9f0240ea289f611c84474e94c3ef',
-    '5f8f44c5bdcce9e95bdf86bacc81374bfaa55046b0ea1288db324793e566ae70',
-    '5f9e296d2a8eee449a3bef77f69dab803f745977480eba93f1dcf9c5f2281fac',
-    '5f9f42c7819ef42ca50c561cdc6854ad4c080db86fa09e4dedbf5da834c2f08a',
-    '5fbd7f046cc25fa6d20213350af082658470e410447b5fcf1317726d2209d881',
-    '5fd5e629e07d52c19f834220a317be211f87eaba992fd18e5d000f59e353412e',
-    '5fe7b8b94d5b09fd70d8f6b059339de1c608cc45e44bcd29f1da1060f91205dc',
-    '60083e9d61241643efa0cffdaa96244cb5e8d54dba9c6608a6dfe6305bcf3303',
-    '6017b9b560543cd100d1c3b206f5a2c232d6fca95c7b8918859ec6dfcbb288d3',
-    '60186b60b4a3806eac16a6329d9d86a14a91bb1835de02661e64f71663f7b1ec',
-    '60199129dd5379bd63499997ee4eb3ac941beb5ab8d098066c3b53f7c0acd625',
-    '601d291933f44bb487638bf3b1503577ad28686e7e8e99679630f503bcb0cc37',
-    '6039a938ded79999596efb322ca778c92439f07c921494d54cb13dcef7db203c',
-    '604f8a6c60250bf4fabf71dc62e9d11f09d478010240483f780b136a44136caf',
-    '607cbc07abafac74bf08d81a7ca4686af30828921bd4f4f49818c3d7fb21491c',
-    '60853dfc06263c9fa184a25bf9328172c8db09ac36f0cc3214178939def11d7d',
-    '608deec68496f3b463d3cdabfdc30ef1b4eba617b3c8e5160a104b49c933df47',
-    '608e9de241126bf149e58765145ca17e89ff7232e2b552def24d14f4fb162bd4',
-    '609c208c99dbf6eeb24ec9e2c3efbcc29f6cbcd287e5c101adf393769c858c7a',
-    '60a02dcd48c4d82929d4b66421354b8480004b0b72ee19f5f9f4f95e8ecab856',
-    '60bad915e2f3177bb61a77184905c8094fca6f28f24482013d130e9b5b9cae6b',
-    '60d5f57561b7d19a94ab500e73d37ec3b0ac0d035fc2874e4bbcc5968373f1de',
-    '60e4bd7d0dbdaf53ca04d47f3990c3cb6f0c9e1af851c203dc0d10e3097be0c6',
-    '60f24d13efeea5d3bb33eab37f02bdeb44b1b2169d7ba67bb9c8d3759ca45463',
-    '60f7df64e85892c04d4f93cf34558625173fb491dea49dbdac389a272ef02869',
-    '60fef1ec5dd1ef9f5a6c63401c3160b2991c2b05c5d2784daab261e7823d4384',
-    '60fefbd8052d0746f313f518f917258054e1b360a3771b5b2f553a2c39476f12',
-    '61468a4fc9d065cbc070a32806b70c72944737ca5e033fc8fbe4e4039c4e3b56',
-    '61692e8f02a3fe439ef5782cf2c2f7f10b6cce23f0d04ba7d2582cdc96f8998f',
-    '617b2408c5af58d2567fa067df1f612d9494a304327460edc698f11fb95637a0',
-    '617e4d0c358f96b9badaebe4fd92f56da0be4228507af770d92d63a64f8fbd2b',
-    '619c02bd3df425fbeb4018b4d9a7543d37fd94e50d4e7c0de4cafe8f15f91fbe',
-    '61c20b9dc4a476be79027ff6f4dcc636843536f3102137257e1108283934cd48',
-    '61d4835f21f39820833a584e7fd530e1007b387787d88f6d778471bb1b044cc7',
-    '61d97378cee3f87da4a9b4521f7106cbd1bf2763fb6ba75407995cdab7773978',
-    '61f0c261dd8d9eee44ba69816b5f9048938f3eef33a0e0e329c282e1865f8fa3',
-    '6232f10adc0178ae47315689efa42305ec4764f6fd7052d5d616415b2a60778e',
-    '624dbc8549bcf917d6ed1aecbcbd63eeda23e660d974360717ae419895978ac4',
-    '6254f4fe1c57e27554f73f8cddc754751ab913b5aba5eeff3bc395ad5ae916e8',
-    '62555aa8bec4cb755de60204a3408dcb7f5b22ccdf1f7aca489205c9366f7d2d',
-    '6279b62903d79cf79090e20445bd806709df64085dc60546c8af8a07edee3234',
-    '6283022ef6a438fe409137152bd593bd2a22e1c559ce150fc864f64f3295cff1',
-    '629816fb931b0e920e3971b0048e6430380050c5453b2e356d54296d4f99a61b',
-    '629adda3234b9ce3038b4b929a18a21ab9f83b1bf0f3bf26151b6c584db1bfbb',
-    '62aa86e78edbaad24254665270fd18e7d96415311ae477236eb6b6a69cdce3c3',
-    '62b8a9be6f940fccfa6125016442785e1b85f927464729544138c3006fb527a5',
-    '62ce7e405c4d8ab077772e430a9bb82a6fb4178bc10e6b9306b762f1b0aefa47',
-    '62d08c19089c13f2dbce70a5b01c46c73930f560b01154a6ecbbc73c120f7995',
-    '62d17386f4d01ce48b54912add9720c1662eb078c3bf5baf9237d5cc797afcd4',
-    '6315d54d95299550c510105a1677cd6c879b0ee187674046da6f12afb84fd0e0',
-    '633255697c76d6aa532e3e8660f79972bafd5d1a47d9c96089fdcd8332bfb46b',
-    '634684a7e3cd8fb11d71e5b3bc1336e1eefe704e7aac37423a7e0be722eddf5b',
-    '634f0a0544b320fc5412b28aa8a18dc43ea4102f7e41acf04ac4a8d5ff17d741',
-    '635b3596c8c23896dbd12bb56e9aa744a559a4affdff7c473fb6455d84e879be',
-    '63688865b8b21ff7748d70b28c94a0100373772fad58f1e4ee43aef617d83a7c',
-    '636b7295eda856c917831702576915b98a41a00bb43f0ff75a213dd395cac421',
-    '639147c30cb6e2f5a8adafa4beceb1b95e5aa5c8865e44f5134a9118fd89fbee',
-    '6398bd26d2424985e8bad76b5376d1c56679bbe9938f55d29805b877d6b5c302',
-    '63b2d2fb77d4588645f50af8771615960de70443d3a5a60248f6b72a33703a03',
-    '63cf85dc3ecd11a15a07f5134dff2cfb0f9916706310ec23aacce033fbe2a5d5',
-    '63fa65294d559caa2d2ac2e08a35f6f7d260a479aa00ec5fe70d2c7babaa2a1f',
-    '64049ffa4fcc2b9f28a07d1d5c7e16bfe70ccfecb1573b6f1879068c5d00b918',
-    '64054116f38f908b0765c22a7cb0a005c9fc2155da3781de0bd195172b77acb7',
-    '64119a5915980fd0ea1151cd67050de673c2fc303e837198915a55221e2d7b16',
-    '64252c762dc3149a5f9b137d83b32b65e2e968bac7e17b88ca54e97ffd748e0a',
-    '64788198abd92b31e9b8757f82e4bf7376110c20df3bafca3fea0f203473e02f',
-    '6488826587928b61b3d04702d6be9695f5ba9fdaf7909dcc8d6bd56e295e9c7a',
-    '6488e87e766f85f5666615391472b408672c34935907a3172c1cd5eaf98db501',
-    '6498e41c946d3dbbea4e798baed4f9442be0b23e596e090fc772a968e3613fd9',
-    '64ab60f11c1d113dcd68d86e371576c79b8aecd214f37884e0aa013f29782807',
-    '64adcb5f08e38840c8b7477965f96acae8b2daa714b34e7f268b3ea078f2f867',
-    '64b5498912df65aae821bc1d8c57380e2a19757ef6e81267edeca7409304efc9',
-    '64c574426d1a1e807ee781845faf698b3a6dc80bf7ae5f02a50e0b98bfe33f4d',
-    '651d5daffb456ac2ae14ff3e70222614052c4f2e1ab1cfa07dcd5ecda07a95e3',
-    '651f0b52deda0e593792119839e31b816430aa12191511cd3843a29f0c9cc849',
-    '6522827f7f034496222a6398c9edf97d7f3de4b1b355a15f35ab4eeb6cddec56',
-    '6534c904add8aa40b3cc6c5837ea9e916b6413d3c76f0255380137b11865b4dc',
-    '653dfcc7fc26cf899dcc795ba0588a4b8e6959b26e39693854a02fb37ed1ea1d',
-    '65786877362d8496f3ad49d59d9840e419412d9e2f571352f5d7a02cc7312daa',
-    '657d6ca08386effa74b090941141990da1a2aecbf8f4c8997ac5908eb476d107',
-    '65a07a20767ee1e350af3521c048c7612a55f12b844ce1dd68bf3c18e4aedec9',
-    '65ec541e3b72fec851458c05e9c64fed7e894fc6052c15e4d0cafa6fb73333b7',
-    '65f4236f28063acf78f830b736876f13f766078c3e8579fbc280c1508a953415',
-    '6624c490111ff0c208eaa0fc2025de2ddc764a90429b53c9236150b7b9ea3d4b',
-    '662bb9f66cb442bef0760f9be64c07ccc4b9131a7734018bbfbf00a628de691a',
-    '665cbedf60a2757d22bf7f1918e02ab5398a7bb2bdbfaf8cec22ebedffc237ed',
-    '665ea321fcc1965b6955d9714b186868c4d12a1ef28dc1e948ceba8eb05ae220',
-    '666316d688466d6e3df28a8a6a212d5a8ccccf4e1012eff140509b12851e81ad',
-    '66675f9e605d3d746d9360908783f9a45c59179289afcb513324e096d4658ec5',
-    '6673e7f338fddc7d912f2b8dc52e5982f38e571e3ef6637b3e0e5be7429f6114',
-    '66b25fddf46b21d8950213466f121a2f947d740411539a70653feaaa8a48da5f',
-    '66c5598084e26f9e3f9f6f135a4f05b66111bcaf28af62a938855b3c62c57f2b',
-    '66c959153c734662a705d9966966fcf6624527130f0279bafae6b3f0f2d9417a',
-    '66d2e15f3b635bb6e62637ee4ea051e919bbe1add51a76b18677a32c71df2f53',
-    '66d588e9d78f9dbbe5ccdd0635e1825cb9c84f01aed3026f01be7567087adcee',
-    '66f7a56b43f987c6132b27521cb0d4feadfebf6053deb5550b18b616bec67341',
-    '673a17d3caa5da9db7f396e5ba9528bd1e22ba3249ed18c25588c19bcb97168b',
-    '6740150e949a06c69672385dafc6dfe223dac749fe46912ac84a55fbd338785a',
-    '6752320380246562aac2f4dd6323d282897874150363f607340f2a420bafaf1d',
-    '67de5b9de61ea94db91c7dae6153ab0a42edb97b60df36c61cc90711ed0b0e4b',
-    '67e35af7ebf740fe7a744572774a8934b853517039b022f8461e7b7536ca5af6',
-    '67e7214fa9f2948e3493a704dcb728838f37d1afe7d6b0388053379dba833cea',
-    '67f9548b7970776f585f260e112654c75eede9781a2c86d791446790eef15f9e',
-    '68045ccc2c7c4e18a0bff4afdc1a195f89e9967cefca3d73eb5dd2fa96428dfe',
-    '68046248cb3ec9a30652390c52de34af2e30ec34644a6cdfdeb2a388379dd1c5',
-    '6809a027097945935e451a44bedfa05c0b924c574592518c69819fe5ee11828c',
-    '6809df2df013f4a57cb0c3fbf208da3084a339020e7f24b842612b8a3d784d21',
-    '68193a945783a0c8b3ba15b975d4651fd3f89f92b52bb4ef7237b5b1367c2d6f',
-    '6832f3e57e93c717a8a7eeac6100d3fc88a39bcdb01830cb60d80d810992ce8a',
-    '683869fe4ef85383960860c48115384f0a68ca51ad1e904355a550ee5ace94c6',
-    '686fc724f5790dca967b4d56e257be00b98b62366ebf60d8bd387e1a17eab1ca',
-    '6884be7f1b2411ebcc9f2a5ad854785b5b436efc01d4c97cef3ec12b7dbe07a9',
-    '6894b16b72a18105e9c77543995c6c11dc01762df774c5d865478ad1c7dd05f2',
-    '68a81b148e738fb69cde09626b5ade61b94957d2e2034f49d073fce75189c624',
-    '68a8adad539250162fc2d10039585f504a5aa70f29ba1f5c0f4c2300843c47c7',
-    '68eb8c128f5f0afa0e5c5c1ac77bc68f11e127d1fa86195b84ec8e2278c471b9',
-    '691a53c5f93fd426da3f8727987b78e8b6e116208e6470ac3984b5b94b4efea5',
-    '692a07dc50d60321a5074e46852f7c1582bdf46222ef760abfe6222e5944048b',
-    '6930cc8fbaaa8bbcbed9b62dcba72aa7cef8ae76c21651494756fec8f45fa9dc',
-    '696eab9d7e6c259287854dde73c3f4e795a08e71054d9478282056c074bb369a',
-    '698744a7f7820eeaf71d7bb6e8e7bfec9c47d0225cdc60e0daf41a8c87e938a0',
-    '6989da4caaf0b64d22da3883287ec6f1b70c87888677475c7ea7670d5f1b3739',
-    '6999ec61d177b0fcbce54ed35a226ff9adb4d1b4267b54abe5620a2579fdc3db',
-    '69ae786c636e76f7cbb482ad76f75e249511a8e3a412c4b7a37391394aa3abaa',
-    '69fb4f546dbb8e869357ecf1da1466717f31748ff2cc6cf66d77a38e55bfbe21',
-    '6a1407408d22ea92ffbaf82a3c7e51fa355f4efad5ea2581e60f7b04ea23718c',
-    '6a15ad7cc00dbe1847d1f5d7a723d1fe13477439e3b03beabeb18ad36804f83a',
-    '6a2bcf88a7d7ce0188438932d51fb20d2507d1fc14f297de929bc8c820def8a0',
-    '6a4c98f6445943ddfddf5cd46dc291953612b48a4f796e1257782039480222bd',
-    '6a68d1faf64ef88fabc4beac60de65b9361c80de4222fb8e694aab781d8c9489',
-    '6a6fdc4f6316abf6d2b079c2bd237c9943fdef2dc487e0274520aeadb72692cf',
-    '6a75e1b54ee33feb493877859d288b076af135f8f06f0253a41355a28061e209',
-    '6a8d9a4c37c1206fa9d801863c3bf56e4aadfbc71e02ae1937aa659ad7bab85e',
-    '6a980e6ac3592870038bdef01a1dc8d550fb937a55ec477eff4ee9492b2bef9e',
-    '6a9f16c8077f32630ef4b9924d3f8566138bc8dd179be222fe20bceddb79a67c',
-    '6ab37110333ed4fcf1e22b51f49696e6ff804b9d72ba5650dfb149e53498e785',
-    '6ac71456eb9d801a41ecae9d677d9467580466328bdd44c3ed33f9ba979da69b',
-    '6ada557798783e1d11e1d4a32bc229e90a6ad67e2c4c3c551d513a185eccd731',
-    '6adf0f94de4e4fc56811aefc14be1e0274cc99cd30b6e17183c7fe1ae6c4b83e',
-    '6af8ffce6282fc90d1cf9932a9fa9512a975f68c84bd7254af9c6361fdd8cc61',
-    '6b16e6bfd6c1b9f23ce16282cd641537331416e1936a76468ae65afc270f2033',
-    '6b1ea0b85ca4c2bd7e107ac77cc9973bdaf67dc9b098d36676bfc5fc3631ef27',
-    '6b3f28be36b5f05cc98389070734fe1ed08647da593eb15e474e524cd492121d',
-    '6b678f41feae55348f13a8e2b1a6061f9c5747d7374d3b08485782818621bfca',
-    '6b7df97dd4084d889a947e195adfde7abcd972dd0e7b6160519e9f198d04c1f8',
-    '6b9e3d1334ad485c86a4a52a23cb24f23f186251c2de38601a777c5d8e20df93',
-    '6bc5d4648d04fb130efb810e868e752a16f562813620e27a9aef9c56095a85a3',
-    '6c23084806fc7f986ff93b80ab78e99ad8396082866c1a3142d8ec388703aa60',
-    '6c579d1d4a389fa774eabb4bd729a220908e6f0eff970ec8028b78ebc02f932e',
-    '6c6ca58eab3869ce9f9472cf83c29e72043fa1446b90612ac951be92c4d7611c',
-    '6c9432d348f02f007fd0063444c077a0f7d7ec4ef8f70b48a60f55da564be7ee',
-    '6c9d23274837350e0ed8a25beff1a683581a6a27ec72d2b291a06962e6e783ce',
-    '6cddcecba5e571087cd9b0424de48a774dc56c41e6e2f9a8a77e5c5565930633',
-    '6cea262115f85f30f916114a52ccac5364251aed1ea46a8764351be2adf947e6',
-    '6cef9c53a7d406892a77393c0a19eba0f3ae43d009356be508aeb4fe98fe8615',
-    '6cf42a39fd1ae72d02edaf89f55ac5a9380904fdad5b4a01536fbc13f28486a6',
-    '6cf5cd9b14b98b975c4cf4bf7a91a07c4ecb7aad46f5a7b95413dc157c48a057',
-    '6d0a650f7ffe7b5bfaaeae9c9c98666d2fe0b5c655346bd3772edf67de759625',
-    '6d1759c34f6f77e41c4c54f8ad7a597ecb295a873aaaa3f19bec6ea083622451',
-    '6d2966f73f4d4219b411035dccf468900ea0fcb21a14afb90ed4a3824521348d',
-    '6d314b93e201ed03141e81d1b6c34aaef8b2a2096909f0f9ededa30553db6f7b',
-    '6d396cc587ddd744dacc3cc6b10ee48463eeaeac4cc9d427b7f269b0047572bd',
-    '6d6eb7a017ae36e89d28cd6e82d28b82a89130ed1e82355baeef9274e376b629',
-    '6d79b4bbb364864f7689ea534f2ca82f7ef138763ed9f5f51e2fb5704f4c3487',
-    '6d7adbb283a2dbb38fd3632526039d2688e1cfd46b49a100c05d40df68a9344a',
-    '6d7f0ce6b02ec74daa413f9444a44b09af1989083382ceb18b3ebc3ecda1d8ef',
-    '6d8662c7be5a56f4277dd7878868f589a84e99096ae032837129be008d759e5f',
-    '6d876d916f73a4ffd2bda6169268e0a2e0a2f7c8d900e836f20d4911a8c40fe2',
-    '6d90ee849d08815413bd1e8ca98f981230cfafbb8668dc744f0627a777d5555c',
-    '6daf0f316d70d38237f703b5963cbdcff5e348b4e01f06e690ec56fa63bf76b3',
-    '6e06268dc6594ede19bfc25d89bf3fdf34f527971037e2e6eca3c6afb90f4588',
-    '6e59a4ce160aaafe21d57294b70c0844c80b3fe62e9f4d8e303ecf02a620e845',
-    '6e713fb051cd36e259218437155255328019aa214dacbae428b8c9ec136b5efb',
-    '6e76c0098a00375f4694f841f36c1cbb6c63cf1b0b0a94cd3a2ece3d7a1d6d7c',
-    '6e9460133a1242a798f54310f8b8e124fc28c2153c1cde69849d64d3146e1243',
-    '6e9ce794b8a7a9991c59dd1b081bd25abfb9d0263fa302515bb5a3a22a4802fa',
-    '6eb7d377c64f6b5f0b4ff183481441e856d9883ee8a6a2018e79f730d283c04a',
-    '6ec5547c8ded094255c25652dc0ceb2791d96863ceed45b456def200d7391ef8',
-    '6f0d33ddbf620e82d6cb5002bfbf4fefc2989b7874ef41da0145d7d8db1d88b5',
-    '6f3310a222633105baac176139b0f1d39e62de973f4d10070477c013b4c45349',
-    '6f9840269614563f5dc4aa13836d6841b51bb21e4f9a822ecc5f0ef78a1c4b09',
-    '6f984d7b72830ceffb89281b85799c9614027a2a076aafe1b9e1c6fad934b36e',
-    '6fa2ce3865c1df376c20f3a1cd640f58118d9a7a8e0dec9da4629b9116ead7e4',
-    '6fb697826924c33dcdf73dcfc034ccfc9180259b55c279f9e043929162c88087',
-    '6fedbdcb5edc5d331cca423ee9ffc87852535675d39334aa4155e0a21c5ac69a',
-    '70036f270a41881f3c6c0cc29d9dc60cc150385ea645a606d1fbc82a4a410e47',
-    '701d69acd31cc5988a1fe7c99418712eb00ddcc3282ce3e7fb49ab50121c4f34',
-    '701ff32d746f1f583c04b95f6286179f3ecaca7743c7a3829a9723bae1d9f230',
-    '704db1fe0e0bffd22ad2263baa507b374a57ee9bfbf2411ae44fd0349891d723',
-    '70ae529ab3c6bff40f78d73fdb00b8e5859c04f89888a47b41e9ff504e5215c5',
-    '70f01cc1c3095df7d5310b2282719127acd4d65da8cd2f3c4d6ec9d67b276229',
-    '711129345a0d389131d178dbd7a7ec2352321b5f4ed61e9bc3263f8bec69b51e',
-    '711ce30f8ef4458950e9f4eadc478f54decac42132ce85e0cb5f26f2c3baf43a',
-    '711e4ab074a0573d52496c71197c9761232c37027b27e9b94730c5939f898139',
-    '7138a7d1fbea53f0c162a181d72a30ce29173a125b7a97b49f2ad00f63e756c0',
-    '714c51027ad7afe5f5caf10333f85ac66e705f0a99a48da19d9483284a887503',
-    '716411a7c4022d8b11d2e6091a82c6685753386e2bd98496c860eb1cbc7c080e',
-    '71c666f6a1a729fc44eed049dd16d0f3919a14f54d97e3cfad52a39539c7e4bc',
-    '720ce0c65c0ab262faf62cc3c269bdddadc11c884d69c4bf2d85c5dd028cb1a7',
-    '7226fd00259af48a0fe2135ceaa7e3dbb6773e0e800c05928ebad9df9490f8f6',
-    '723d8b116c44f765f2baf8d2da76a81b75433e9998d178fabe74a2fb874b7212',
-    '7242255ac96233a119eb9a04507bf803f4bf3de2ef7f0b3e2e1412016a85c01f',
-    '72581c45805f07f568993c2a3c5c024c85fd5fe1738bcbf0aa69269d41c1ac55',
-    '727c3b67456e3d33c4dd97a60b0d9eb70c281857122bc4e3bda068edb1aef280',
-    '72e3613d61376fb777f11b34bc9e9a0c6e8d027959811b02871892540f9f9cb1',
-    '72f0ec0c4102ce5a12503e8c2795342d2eebe6a61e17cde84199862285a843cd',
-    '7330092cb5fb7481f474c8996caedadb42d65c7870d6aa1f73961e5c823f77af',
-    '733e1451edee68c8864f29751399f08610a5a01884f676768b8cb7c6cb88d40e',
-    '7368634de098d2d87d1da2a04fee5e3a5eb854cdd3b0d040298a5ed2b09ff19c',
-    '7371df612f17693becf841b44abafc9d4b9dfeb0e605df844824e302408767d3',
-    '7373635ba16eeab9a54400ad6f69ab2808e62cf3fcedfb7dc754697cfc972b2c',
-    '7398d0d363cc2b09ee71fc21dcd812dec93bdf3a5baabfff51ae961d455ca51a',
-    '73e8ca2e75183741ebad433a0dd0247f192ff32f5bf4cbdb5d25eca4ff1fc8ed',
-    '7413eec6ed7fba559506420d8a8de1d3f3372545f0f8ea15497c2783d232d34b',
-    '744df5f38bfa2ce90995e5560ffbc75aca57b00ded69cc1e7542f7c3446367e8',
-    '746d1b1a190183b529caa4f5a6ecf7df903f6b1e25130f4c21cfc836af139231',
-    '747680919c40498bdc82816fe277a328af53e8d8c4124a69ff27349569485659',
-    '747753e7d57c9113bb05d18c6f91ac0b8e6cde69920bd27942329a94378d64bd',
-    '74d49ce257397b977681096983f77d0d7977536526edf21facefc1e76b34ff87',
-    '74ea207dafdfbc10fd1b69d3abd3ed9ca910504807458256c27164384124289f',
-    '7509f94fe194055b9eb1d0a96b06559bd5db6be204eb232db9d8e86148a139eb',
-    '7515c119a0831299f92f3bc02980b48f994759bb755826e69b95b20c6f9b1df8',
-    '7518edc71d62089c79517b66a4f334c63db963219f8649f243882deaee39ebf4',
-    '752e5b0b03bbfa051e3b2fd2d5457cfd2b9cf8ddd915301dd1a62f86a8bb8dca',
-    '7541e3cf8e016774c316a38dd369fbcdd67b3d0d6fdc68d6a4610b3939cefc72',
-    '7573d5d92b75e58d70d49686bdad6cf8c333c16e628ec3e9dad44c02c6da5f13',
-    '75968ef7840da879645d289be20eaf30e7503e001406f5dac3dd85d927fcaa35',
-    '75ba7f82abbbc87af0d45f0ee7d5f88f310a3ad13df6c8425e6bba06aed7b628',
-    '7660c29216e2c443d6d04050f518d7ca3be3f1f40cd371e3869079f156949f36',
-    '766f69abe0e9f5f111c8443b54caac4dcf7dc34dcade7b5037ea82723453f16a',
-    '76c2d27e57eb8c1fc4a02b3f0f982d2632afafd48884783582bf17292d73b7d6',
-    '76d51194354129dd768fe102bc82081f4112fcfce7e6603b6dd55516220920b1',
-    '76ed2d1a8ff5f50500ac1b245149080795f74dccf43821137a07563fc5dd7532',
-    '771631413e8a8c2fa080f7c15901cb27f6ef820892c25e86004c4453d057bf3f',
-    '77182d7c68f734a79cf73340aa4ce0f2a80b7ef0bec33ed1775cbc4e82edc583',
-    '772b6a95f341d94374bdf2bb30a2cd36844bff1c6cfa2cb97bb8496c3a825bda',
-    '777f5bcbcee2a3b15fe4a3325e49b208b4977859431d80089c9c4cd3474fe169',
-    '77c18fe12a059245bacba9a0340666c4b99a0b26113792a146200c5c8531008e',
-    '77c6c6d3bb00930dcb3bede893e02b7540f8305275953032780189a4c3957b0e',
-    '78093f7fa06cc9730f2370ce6281ff5a6ff65a6a78155c054a6e424338797588',
-    '780ab286f3ab9e8e711f1728c1128d9937de869c1988d1d2aa99f43c22d8402f',
-    '7811a69a4d0742ec6c5a8303ec4f9fd60ba74e43724d6ce043ef9f04eb62f4e4',
-    '7814bcb60fbe895e9a9d5959698cf6f3ffe5fd99ee95f1b4d85c682fae74a6a2',
-    '782a2b88b43eff90ab1239502af18532c976f89026aec3d51ca6e4709a4f1b71',
-    '7850765ac443a9ca190987d3571a5f88f6af3923c34e71189933442eda030bd7',
-    '7890d149bc79903be59457e0921ea52c63bff0e378cc93041bdf9afa423420ca',
-    '78a0274b7dde3594fbbf7d7ff11c9974c32079df3e2772083c8a25a405f11c7e',
-    '78aff1ed7c1b553eb6041a6cdbc225f820d6dd3657f35747ac98764086408990',
-    '7923b6104f9b1fc09cd76c7244c1e4350ba100e6e87ad9d637b98795f0b0ca7f',
-    '7931a5e40cfcf680fc248cd2dd91ac58561f1be7d1f1c7761bde854666d03231',
-    '793aa1765ff947a7ced6aa82f0f3cef249a45e80412491667fe4f97eff9bb7fd',
-    '7a249d524b6e4010a6492e4a744b1501b892fd136c420de7c4c444c489074ef7',
-    '7a81a3bfae5fa8b6791c839ddd581f7074945690bf20ebbbf9040e02abfb0a0e',
-    '7a95df3abab1fb0a8e19853f692dade00faab15bb1cc8a755fa1dc52348331d7',
-    '7aad44fea318e8251604634e25abde16a1fe73600abbcb05aeab6cdf071aadc1',
-    '7b0bac6b7c05340d3b4972378d6d86d32d53e06325b98c1e020529890a2bb349',
-    '7b27f3cbce017f031cb90ab7c2e241be4b16e4c46a3a96962f8a5e4a13e4d1b7',
-    '7b3033bd86c36c71888f9359dc41a8841e183655a45adb86395882745027a21d',
-    '7b33f23a0192fdf16e5e4f30bb2309b167e42659483ec73b2f5461b2c75ad61e',
-    '7b677a3d1d7883d7b3707e81b495ebd733d51b5206377d9a56e15f0d7c7345e2',
-    '7bca435f2f05aa7e638e4f9331da25722fe05686cee9d7d080e3c80aa52ebdc5',
-    '7bfc6eccc5c9a26bb0da28e54fc631783f1696102f7c32afaae4af831a1a47a2',
-    '7c067f45f5fed91525b264b345db84c86bb4f5377dcdbde7f9e345378072d7f5',
-    '7c33d5006d4a6efd2f836970f308a1e38e7fcf76a241c1f055270269ce27c64d',
-    '7c4e4d58c9c1bb824314f16ee9cce86b5cb4cc23e33b49e76a1ce26046aad54d',
-    '7c634e5eddd8f1680e0aa9e49bca62b36ccd5ed898db99d75d0823f6259860b9',
-    '7c827dae8db404f05c7427f5b5313807742cff74c741b9ff80867559b3e08da7',
-    '7ca04d664e6e1fd918d3fb2bde5aae1b83f26ba547e12ce0f61a3e70b20dbc96',
-    '7cec52d595ba0b6fd7aa17c6ac397b73acaa0d9aceb68ff500bb33e49532c78f',
-    '7cf8e86c3eb2f3d2d445f09736432bdaf038ee0865ae39f8e867f600545010f7',
-    '7d1dbd8670b8a2c3362236a8466f70c6ae992b4176b0b1741c253d6f20db1ae2',
-    '7d5dbbdb02364254092bd26451afa8a6281b01574ee6c3f83922002970d9cfb9',
-    '7d603ba0cb431fbce180fe0a01d1c1e839fff28a9d8d6614b85e3e52b599af4e',
-    '7d61832c3c1621a122e1c8d498f2667e8c3ad7969feaaaea48c34c2817b4c313',
-    '7d92bd0c965e07ddb95232c97806f1ece92a15d97121b2539f86cfa03935e6c0',
-    '7dc08e0d351e41bddcce323cbc18503eed1adcfcbcdc0779e6cc0c39c0026c19',
-    '7dc716b4e8f905d9eb3b49cb329c57e16b7faebc3f6e8333a9698eb4ae90b961',
-    '7dd6cc278d2a7a9f9b71bf462794ea9bc3c015918ecb99c3db74ed580c9b383c',
-    '7e5bd95d481ec7a8dfb497c4478737e3eb0e21b4e1f34f0a715c7ed01ecef1a8',
-    '7e6c4a7731a34c4f76657e37a2191902eb0d22d1ba64dcff80cd2ca6b09bac25',
-    '7e71b1f799dd7872cd893495e6f84eef96d5bdcae10774986c3c88cb8cd77db8',
-    '7e77f7124fdb94cee3cfaa621befe7a8fd8336f881e19c14fd3bfdf93edd9cd1',
-    '7e86336fa849b9da2ef537c5cba13b0f13a8f0faedda83510faf4dcbfd122feb',
-    '7ed85462c220ba2ec5781a9dcd4057123b7899de26c0742eb9513a486055fcc3',
-    '7f1429a35b82e3d808c9ec753882da72a780edd7fc6bde0a8c0b35e1d20bf857',
-    '7fd8e58a5f6a9c622b7228cb17741e637352abec51aab220d63355b1c8ee4c62',
-    '8004258da44d779f432e97672da556e588a338011845c3e702c8a6081f5b4d39',
-    '804999952e3271ab2b537376c34e5e06a152c0a008deedaaa27f0d834b54f0fc',
-    '8095f0b9f5bc383348176b7f4fb3d7190a35ba6183be45ed7f171ab21ee9e1a4',
-    '80b7c7372f0936f352caecc08f6c271799d7c30655926c2068925c54e643a578',
-    '80c6f160b1e7fd30e1334c054a73904a36caca4a867c6feab5baada2c6e243dd',
-    '80dcaff8ad810b797035c7c02cfeb011ccf62d29ca2634b3fffd898011b2cd1a',
-    '80e49e618b7f163775b768fc9eb98baae70cd1d87d3da1e5eb68143403e50702',
-    '810c47f8e061b275367f0bd38ab135d8cc4e239e16721a88c804ce250b7a8813',
-    '810f1d55b462cc6234e039daf4703b36f9a3cbc8a6d56551ac2b5b4d2919e783',
-    '81778e21ea32af1a517e1b4fe1f3a30e7f9acfc7f0e7839de054d751f6d8a5ef',
-    '817aeea22aa80b48bfdb14b72999ca829f31aba56ff03be7950c1ad99dc05859',
-    '81b6d97248770dcead1cfb7a433b2f7c91b2270271225cd342498812808620bc',
-    '81e83b6997f06e19165760c17b14dafbc8f73aabb78376f7236d2576d7867057',
-    '821593fccd3b8b6db769a8b5911dfbbd95e276b2dcdf822037ba3fe7a4dee8c6',
-    '828c2a143f6a35ea975ece68497a76f8b38a3a1e71445fbccec79e7a441ce91d',
-    '82b2a47da3b8b22156997951f35dfb886d2d1411b099f7f0caa9196516be1b83',
-    '82cce6caa186911b8c0702f54c8fb0816bb13416927400df682132792ac8f0ab',
-    '834bdd82de52c3bc860b5c8b0574f65964848559fbb0957df5683e75ad17b305',
-    '835daee2cb41ba19baaf5064bed1c04c5ccd071d8306fb6fc1111ba819430ec8',
-    '8379347eea6d2c58e4493cdb2148c659ee8221e7d9d61b3652fa861297806d5b',
-    '83af48b1d1ca7c405f144dc63868db3fca06f72f65b8ea07f5671bb03c106845',
-    '83bcb940340a7a8a2152decce9eb42a68ff66a470c9f693b48fb310a63b21cfd',
-    '83fc1b9b4bb1bed9ae8d967b95f92255b69469677824c3168b4fddf7b5335262',
-    '83ffff2ff2b12e2e7a89fbe0f070e9f5dae5045f51f3296c359b1307371c8797',
-    '84c1a3a15650821e9e032658f49a257fb8e653236e122d2ccea135af6c96ece3',
-    '84cd0c9793b86fb7c27ad15dbc8775dc5f378bea88081928f62a52347a4a0557',
-    '84ef4f2a450bec0368ac16d46b1dee2c62c1175c67b952674b642e64a74380c5',
-    '850e971a7e411bc059f707338678f702a5b524d09f738499c31e44d4d624c5bd',
-    '8516ed92db38cde81567459cad3b1feef0e0882e021653e5fb6a41b8cd22c94d',
-    '856d26de5cd3a8dd6870e00d2ff8719f8cd68b5cb3b30357d346b685e36ccade',
-    '85725f0f1037647d5bace1139f348e8f066a56ebee3af9c3c966118a06bcf94e',
-    '85919f979c8ca3307308276044b80937c2333eaa916986ac29576f473fbea2b8',
-    '85d487c8646aa908060678c3dbbf808f5099dce3a11e0eb5773a83348c25bd6c',
-    '861f4393019986831f1c4bd29f5a61215c5121a5872777bb4adadb3f3ee6554e',
-    '861fb51f94f47949a287cd036da4173582f7f5cab4b4c12fb53885a067365091',
-    '868100bfc657532cbebd7d52e0f8f869ecd826f6da967706d8d8b634a982a4a5',
-    '86d54e30eea6a7132bbebbf5ffe09893248cb2c99c420243ba4053f85481a83c',
-    '8786f043911827f91a5d88bb2f6984b1738e3d6c0d50673ecff408e837eb19d7',
-    '87b5883185be0700a2a9692de95f3105b2c162e54a35968aa9fdd0eb2a2b6bde',
-    '87f25429399c73d9c434b5e49b0e3cc75ed840aab8b3d17e1b4721c602e27b39',
-    '8810f98a3b68bdce2f84fe970ef5cef839916d75cfd1e82c6df18c0b56da2dd0',
-    '883c06ddcd57fc7bdaa022bfdb9863c4923c8e5db3ae0c51854b409f9480256e',
-    '8866b4547f09901bd9d30722c39041770c0026092c50b81ef95dcb738b1f89d5',
-    '88791bd17ccad2b7abc470370c3dc1738ec91a5e3fa97b7273eb3699d232c959',
-    '889737defdc84fc47084c518f339a459791ff83216784591ab5179b78d7bb854',
-    '88b9f8bf1c9969358eb49a809284451f6bad35a9e6d1190df709a6f6dd718c91',
-    '88f71bd9b4aa95ec20aeb993f3d6de4e91ae48cb7aee6d3e95acf22b89108f65',
-    '88f72792701eba6fd01790639b810d9290d8037131fd57af7952e260a68e2cfb',
-    '891f41e9cf9689196a4f1c8edd4ae270e3b322486f83fdade2f904ccfe003606',
-    '8958ab53eba683479ac9ec6c4cbd5d3fca6d08fa03efc8c61081f95baadfbf73',
-    '896b5723527288e4845b331c1c4a78488db8056212a9f20577f20731ef5139a9',
-    '89b10d5e337a974954ba8cad0979b32ff2495ec49cd08a1a777c51c7eb99075a',
-    '89f5a185862aee924c94bc5dcab55a2f3dbb564a2abf63652c74d0ad98ca6b2a',
-    '89ffdd6ad44462b5b12d95a1eea76113916b64a35c5f66bc49f08327fcc0f7e2',
-    '8a7ca148bfbfcba0b098459a9840fe1698ab603a38773a7045a72dc2144dfae7',
-    '8ab883b078bf0b36adfda67a5eba5e39037b88f7189123836e589cdb1eab5d84',
-    '8b21a3c1d4a89db08e7c080608020fd6e0d7f4fbbb0e1acc45aa528acef11c96',
-    '8b2244670f8baf1c015ed8112194051d5c95aab4e4fd95777501bc2e3ad17b1d',
-    '8b5ba6630382da7d1a7f1cc0335ff43816c680990ab647d273e07037f068e6d2',
-    '8b9049dfde370ead24ab626872568897ac219f1f2013579c1ceed3e524220363',
-    '8bb49e8fe7dd2becc65940298a39427eac99cec71d643a329eb6628dbd1dfc78',
-    '8bf1cee62563f3983e47c487a15e108ea5a7198e7ef5ee65dfbdb2c106d4a519',
-    '8c2ba22b16ce2d41edaeb4dcb2e2faf44f8e646821d47f4b5ac7a3f8936361a2',
-    '8c47b2e0925da0f7e00a262567d1606dcd1029b5b4e85c32b6ba6150cde74bdb',
-    '8c47f5c2e5ebddb91f825dfec692c42dac5d4bc655de1fcd155516f162be6433',
-    '8c8c165984b6ac30efab38d3048f712803acc3a1cc64268a6bc84f1851ec6f4d',
-    '8cb5d1af24aa88b0ea578beda19086f47a1103350b1569354b40d42aca672e97',
-    '8cd4bdb6affa98dbba8a52fca63129ead49612cc140b72d38f18deb80f95d354',
-    '8cea1e001425a5ed7601dd5f0cb771d33c8a18fdad2d6be3c2422d297d38c0f2',
-    '8d20cdcfd15fc837de2d34f9c94ef046bbbf50d6b4c2edea4ba362910604a0ee',
-    '8d30d36294b91264ea79e79aedc3d29ad5d0ad9655106031fbb3ad9f8a3b69d2',
-    '8d504134a5640df866dfeeb404c849d142ab3526e4f9e06d58fead1fc48fe055',
-    '8de778ae6b039fde5ca1ead81d68f0d8dc281d5d406ce00eb01a0ccee9009492',
-    '8e04f760ae308f45b2273369d1248e7e1b024a87410ba77bb3305c50ad498c42',
-    '8e0d739cb73b8c99d87e8092f78c44e7f6f4cd436a19f8809c6a1a1ff4ab5f89',
-    '8e292bf9b5f3b595b5b153f46ad88c309a3e54e66edf9949f3dba05a74328161',
-    '8e2f102abf2ef8e99c1addc73149873afe6dcad0f7df185b418508d03625193b',
-    '8e3c820dbbc56b2b8bf2e0f8471ec06dd6f8611ce451d53ebab599a7086bf936',
-    '8eab3fe519c057f3d2b945b75a19e00c69e570d2eaf076b5c9ea0b0e66c72834',
-    '8eb1e56ac1c21ab3925d987bbc73328cf2ec1222d6518d638fca58dd3ed479d7',
-    '8ed3f496b5391deb8123db29a6dacbb2b3e28fe1a3a15a80c86c794f87f5b791',
-    '8f28f114e4944f93c1b0e28855550b19c2c2338aca3d022ee4b3d78b70ac4a8a',
-    '8f70eca72c0ff19a38f7762f6442193bf57e64138e08dcd337edae60dd5f5f1d',
-    '8f78582d4a6b2bd1b4171c80fba3de716d56179fb66740ee928c0b0e19fc14f8',
-    '8fa0c0b65b7fcdeefcb037ff0466456aabbf75c06f81f6050f9606fea8314f88',
-    '8fd6c8738f1d2301957309054057316ded6a665e309f4a4980f8fa4d1435b38e',
-    '8ff5f039fcba5da4c936eada303e10256047cdd84a94a3416d8160e33206a2e7',
-    '8ffd2a8c60f01e96626311646719dfdfd02bddde75a720adb7b2a9860b78c8ec',
-    '90006d0a63433854185d9b8bd3f76c0a2da0c58c92fb51bc374ec6d17aa4f083',
-    '90201019e643eb5221ce819d8066592a0498cd5ae1b8508a8b367bec2cb7c61f',
-    '90204f8ad03214b97e57b39175add32150a1d4951ac6fcc8ffbf75accbf75e2a',
-    '909be748c8fec77734bb4cc3cdc4e98dc6d8cc191223962424e58edba6731559',
-    '90b313a3d91be29daa14f6603dff64359959dbabb80b4bab8ea91c82bd96756e',
-    '90bfa07ac346adbf233c542d2473c1c848547a4364c32760c70f113c8b98bc19',
-    '90d15dc9921ee1396818ab30f2eec04ccf2987501a6abcd33929c06bffdfa6b6',
-    '90da5a93fde5d6737c93bf8386df766aba5c033b3e37ecdc5f47cd30ba781e45',
-    '9109ee83dc753a098325c251e36131830f43ae7904544a0b06159d3f752d9742',
-    '913afea8fad79d5d7d7b7e9dc70176acbe3ee4e2b90e78ae2ebedc8b1820ca55',
-    '91c21a78d79c9b48a1587ad5fc155a340b06f70ea486c559196afbad38881c04',
-    '91e0c7e0780f6440f5ec7829276f3b7814f1214bfd3d9cd9bbe8062fdab3f482',
-    '91e648631b231c6d70b3d376d5bd50e3bec468104e917217ec5e58562e962f7f',
-    '91fa3b88ffdf6b015d0d0c18fc777b68cd6cc09234063d19c6f9fb91f325f23d',
-    '9266e7c148d3a53519ac7633c75942a2e7daea6b7f6a87198f1de3a3fe0c2396',
-    '927dba762348188e83e450e2fc246033e347535b3afd757cbfc3fb185f21aaf9',
-    '92b556ec56dd3795fb0e64ac07b003b9394bbbc2e9822b61f702909b0ab5c94f',
-    '92e21e63d6516827d70d7bf05845e47925b9be229b072bb9788102e78dee8532',
-    '92e34914cf7e69089a9626a5af7e90f66de9e65a3a9130ba3da4cf227083c984',
-    '9300545da42d4b8c74118900f20a7c2d1fd09a64c91cd6cbd5ae895736feca74',
-    '9309690c59b6465e1484bf1ef9ab80b8aa7d2046653549858280c577e9639e06',
-    '935702d5425fb0342315ba262113baf7ebb6c20d2fbfc784fb5c1ddd6ebbc7ef',
-    '9363b7f9f68d00369edbc1ec8c57f2dd758217ac69edac487f84c0a8e073b2a5',
-    '93a3168f8ac5e7497d5d63afae2991f66faccb2d36965a348b2d4d47d7d64f3f',
-    '93a94b2d37d833f699473e34031a7cb22e78aa1d6ac37429c4e69dbf0df7d0e8',
-    '93b59c27e47114be00b02830369afd84ab8835184bfecd1607d1681a5ed5f47d',
-    '93bc36556168ef94a6af19667f837f462175d1c93a234ee210d39bb1b1344219',
-    '93dbed8a7456d2f3ef6d90137f364307b1dafdfc6eee454726c02b8369d8bb69',
-    '93ecbfddf0321cd964a66ffd8d4d7e846fb51c83fedbce9012cb49309a806418',
-    '940b49e1f5a489c2eaf609668d24da87dacd13b6f99e8323f90bc3a02110b6ed',
-    '94c54e2ca5b286d7754b080d7a8ae8d69f6aa164173d70f0a78cfd5cd7b289c4',
-    '94ce15477d79950b539ba095a4c909443df6d157182f64a03aa061a789df0466',
-    '94eb4cf2b5ce844e6b966e40aae1e68f2e4538ba47da561cd748feaffd317947',
-    '951f25835c3cd2ea319ab288f8ba55d7dc0470aad0566e993d3f30fce0a1cae1',
-    '9521ca592a378902bd309bfa5f54743e546d9b8d8bc006ad60e13e0a0c63b46f',
-    '9536bcfd20f2d0180eb30740df9b10eeb0325b726fdba84c9fb8cf3050022180',
-    '958bf5d6855a119d5466b7fa530d70f2d1f23922986270b42093a45206796bd3',
-    '95b386ccdbb22cb00a789631791fc45584186772ec60e2addb7e5e85a9a8a00b',
-    '9602e6cf90ca1811b47507350927b6634117c7abb5d9830d8ef7c5c334fba863',
-    '960e4412a0c47663c1385bdf2c4638bd9d2550b1d50223d74c972a845d542c25',
-    '96d5be21fd32173294aebc35e52d26d99c75141401fad5b4dda27fde3e37da7d',
-    '96d92e209fda0fc8e1dd3708b12814159784f6bc46d15e7b01b03a98cbfbebb5',
-    '96f4921b987afb539044ccf83ab78d4257223f6b2b77c549b85aa20380da31d3',
-    '971f6a6701c75ba5c5b88bea6a8ebba96e1118ab48f6f9ed4e41f47fd9b58c06',
-    '97a1f20a78f67e73b3f9b1b657476d8ae82245b1e7754d4ab9447d8434a71da6',
-    '97a705f70eeac148f31a0f04f74b1ba1fb90685e0089e71a59879e14e7bd91e6',
-    '97c3d3e11f6765b5919a31b8baad3a21b962927b4deade2340f38931c3000516',
-    '980503cd32bdf4d1903c0f02c5840ccee04aa86c460a444ac3a60af49097ea36',
-    '987bc2afb73051e85f1f72e6e723134f6e99828ff342d8af79a75921a160de78',
-    '989eab434ad131562ce9c3e21f78222a3a5c462f3bbcca65b9b7add44ad8aead',
-    '98c3331d70555b059f4d7f1942724d9e58862aa9e30f912c4d16a63867fae3a0',
-    '98e0a8ac1e06bfa33c4d4aa7b256d8729f4461397d2167aabd333cba863bb69b',
-    '98f31051454b0e9aec39d20a562dfb126f0c5b27d86cc1fffd6aeedb2276b8ee',
-    '98f4a53fab3bf619ec84f37d7de203a2df58d9263173553d28f012c4c8f81008',
-    '99312a5dbe1f18090a787095be2559f354f2059e067cfe26d4e857a8dacfec35',
-    '99593542b8d5386991fb4c2191e02bc3202add23946a1359492b8ab946dfd059',
-    '99a1022ceb044a381f3b595cab89e98df9c7ba1ca0c2df4957120baf54db4d91',
-    '99dc037239a51dba15caa4748479351a8156b1209124aaee6d16cc0deb9d03b7',
-    '99df6be41a3255d6dbb743ebd6249f2cdee2281e5767c10d27aa7f719a6316b6',
-    '9a59e1bc9de02af7cf85ecc9cf71443ed5a62ce89e6c24185871adc51f577941',
-    '9a642d6d85918bc97375833d7598c326e03b56436339891fa120a339d47a12c0',
-    '9a8dce3cf4b021aa84fd431997445ec78e198575f6a5f866a142306e3fbc99ed',
-    '9aa2d3be6bf2c3beb1c33aa5d3f12ea4d7692a2547937b6f611337bfb5e7e4da',
-    '9b34aedfbc9b4a2f22007b559ec9a2c04f73bc59bcdfa93d39cc28736e9df6fd',
-    '9b743979327ba466a79bd829da2911ee52e2a6471d18452cb6778ff3a4c084f2',
-    '9b7683be7dbcbe3a9dbbc92be2c5b4f7aab032d6b0b2068d111dc2282a168333',
-    '9b951dc93324a23a416272e6d97ce2109bcb690d569d01be13c6374437544137',
-    '9b9a1eb6004958f906c863b187c0eb38c434335ed66cabe88fba55828fc546e8',
-    '9c1ec2783e3e29ea17c8f8de0fbb10240a4923ce4506bee6ab7077922abb05f9',
-    '9c3edfe2ef9251cd137492d7d332c34316633303eab8cfe047bf301ccc742bca',
-    '9c547dda90e5e2e45c408161394243df1a2f9bdb0b385c5bb35e61195cdfb13f',
-    '9c98983b949f7acc58fe4e05d7510fdcf795b933ff312a75fd16118f37f62b53',
-    '9caa8dc1cf1608eb59affb7ad875bacd8e4d016118b267080cd22e65129a4ea7',
-    '9cba5d04cc831844e4ae5db5276a3615c6d3ad935c0f9ec5a74660a0b3e14761',
-    '9cdffbae203b358cf8241297ae9e3e25c7d5bf50296811a4a310442d0d9d0b8b',
-    '9d0348c50a471ce9f33e0817d0d417825e81994b695bc87ee3156649b786e567',
-    '9d0e33f21be25645df5110144977738a9baf9dd7a93baa0dcb0f478239615a01',
-    '9d4b039a91b43ed4c24cb73a6e752e91f26c9c5e2f1f6d5812cd0e0544bfa999',
-    '9d877343a9a4229b32001a5c63de5a8315241a91a0bb0941d7d4689b0218885c',
-    '9d8c931e94e807ad9fbdae9305e325d5124a34fd424d36ae03a0befe83ddb64c',
-    '9d9e10e7a74302a4bc1dd324f30e7e437806af4d51ec63f5190f5572cd209583',
-    '9de7833ab349b3d67f73ae17c93d3e45d53dc67d3755f936950a816462792cef',
-    '9e15427351a2d2ee949570f7973ba1899fa1da3dd3b1ee42d9d411ee4122e3cb',
-    '9e6afd8ebefdc102cc51d6b482ed4fc41c9c1d3b0c396c36bb7807a984e00ac3',
-    '9e7adb9bd255c2a16f498959e1b07baddebcd009e5460f4bb402ed04292f4a9a',
-    '9e854ab913ed004649f5c42636405d236c48123c9c3a9fd554f6d67bc972a502',
-    '9ea113d66adb16f4b9242f8a6e7720ecd850bfbbb023381c2dbd36d4253a1151',
-    '9eee7ea4d0e6acc27567a42b588c4a49a82e1ff2d41fae6fa82519e5bc2e672b',
-    '9efa75ad2b93fd35546cf458e24d109779b64f7e9b9fe5df4159bb2838ff021b',
-    '9f15765af63170c80bddc7371c624f7f95c9d09d437236939b7ed6f6b938fa0c',
-    '9f1beb90b7853a423dc7d2b63beb39defdeeb6277ce44a8c55bdb9074e07a306',
-    '9f4489aa1a192adf75fe0c0d5a67e29e83a682bfd1bfb7868ca063ab4220011d',
-    '9f4bcbb14f0a86d9881492d3f37280f2c3b8df04dd2a8987929a65094b2e08bd',
-    '9f7fe5cad01a57b071630637be9e3ccc7283734364ed3ea556635865a24cbc71',
-    '9f887c94e711c8af44619d4ec001cf320c25fcba011f2b7c34a4fa960699eb78',
-    '9fdfe052a81957c79f277876c62b76c0ee656312838eb2f0ee25ea7fd3eb6896',
-    '9fec56dab04c31233dbad14cd8e66eac60ada5ac55b6c4881553c24dc3e9296e',
-    '9ffbb5787a12562a62c3947aea96cf955edb31022b4d70b462cc4f2304bbe7fd',
-    'a017439786184296eac9565ae981540cb791245beda3a46ec21488cbf3c53f24',
-    'a017dc4426529306a872eeff833e8688233ad3ec4b560a7bbe3c8a833a43ea3c',
-    'a02dd7cad2364346727ac176010f3515e157ca7b098df8a24b9b47c6a5b7c706',
-    'a0ba6c195d65e1c40fa41fb4d416d52897b6d3cba4bffc4fbf27f216872f62a0',
-    'a10a4b61204b54a5150d40b902bc77a0ee78aa3a8cc35856e8c547fcea241eb2',
-    'a1409f9ba8d0ce403ad875935452395033c125491621d3d98d4c95abd7a0e5d5',
-    'a164ea5a7badb8871114f005af876435235fb77c9630e23fd927b6a725a631a5',
-    'a18fec8b9db5b07d9bf5046d4021c9675da5ef141dc88063d39fbd80b55a4ba1',
-    'a1dc90e8006a41ca0a839d4e05051bb01485511bbd9c83bcf531c664f6d62787',
-    'a1fe96d19505da2e560849fcf6394c923b4d1f6ed6570ea79a187ee1e92e48a8',
-    'a201ec747a645832768a977d2fd6ab1bd7bfaf7a6dc0140803fe8195230c11b3',
-    'a2047d913a4a53f68259aff9ffa8cb58951039b63605463593c0c7a18a3cd3b3',
-    'a207b87a4c4c4431507171cbca43702e68fa9b1e1fcd6dbcdf08e50821ac2682',
-    'a2382e563190653b2e1749361270387e4bd0a748870ea7496c242ff5deeac9cf',
-    'a249fed346a1bfb0251fc3bed21054fee16c0a695edee757bcf6605229823a8e',
-    'a270ca3d1b3253afd511a6f7d7afb1b816d0fca5cc440d843d404e5e115b1e47',
-    'a2c14d592c5f5b2c2bdd21e9638caee850dabaf75c3ca45ad59e5a0298b88217',
-    'a2d43709a57bb004df5a62e7712b7c88d2ca8783592dea2922d5bda48ccf0c68',
-    'a2e3400f21bf97ed5fb1bbf42a5097f7d251f627a9ae86a253ba636f187fb4d9',
-    'a2fcc152faa6b58740f60978dffc78af5d9900a4fd2697f3858d0e8f2413436c',
-    'a302881f535f3753a989d0338f88ad0a98c4391687580e6728dda703f994d867',
-    'a317c5f23b2e35cf681f0d22f1df02b5c24346bc1b8cbdf9d953f3e4bfd656ba',
-    'a3214fd710f3a239409e414733c854dd09f52472ff1bdd6bf8832e974a13b1b4',
-    'a339fcea33143647be3ad42cf0f89cb7dc5dd10e0976d3f717fa7bf7c0297640',
-    'a3548f915e06d9a29a0806b985211670f0861bffa2e605b44c16488758f019bd',
-    'a37fc48d20cab4da74ffe31767772e971e2331bbad85a1fe7a8a247151c6c0d2',
-    'a3ab2ec406f1cfb893bbf870ba19dce1d1909c3979adfe2d652d19fc96e6d2a6',
-    'a3f880eaa0e2307ac8fbe41165cfb3a365715357bb50669ca1d95dd233f8ecf5',
-    'a417b9cac8d2531813eb6e51f21c36eba13f8370ee8fd4b624bf9a78f821996a',
-    'a427721e78ef6f9e0b3005b9c1104e492969287802b69efd9fed483356405c0b',
-    'a4363f002bff8adb2ad4d549965adb150db3d13f1f3a6dd42a5949055aed0c87',
-    'a479588c0ac661bcee0b4cf44e35b030b7c9c723d8f7921207f1d0f52e273e19',
-    'a492b976d131cec62cc564fd6e61579ba9118adac9d5f1182a66c03c8f2170ac',
-    'a49385137e2bff5f0dd3385820dd9fa138976b9494de430cb1a9cf6988c0d878',
-    'a4985b8804547fde5c4107b14bc6f4019ced1488dcad1de89b7d828faea9dfd9',
-    'a4e6d792ddf758f2299dffc4f0fcaea9480b044179d433eea9dc369fb977ceba',
-    'a51718b98ebc52f5b631c812bc398dd9aee93e95c712c91238086adb6725c450',
-    'a5228bd44298cb2b5835ddbd74affec0c1d099c3fc681e20218a195bd197912f',
-    'a559fa529a02eebba86cd11653226a4ada687f57ea4eab03a7d09707b6003b02',
-    'a583ab94cbba4164da6ba1b7c3a39f864c3e7aea9863e9de4940d01f4f1ff78f',
-    'a584342c9d7bb5918738d491b9f1812637d0118a866a16b13b5e59b6f1f14aad',
-    'a5d43a89697db48cb6e67e694d0a072d55be801c7fd916244a1e4597a4642ddb',
-    'a5f8cbe6b171f84a19c245d81e3166d13664e8da862df4928951a6ad9a82b235',
-    'a64cbd01f8620d925a7fa67b6fa200ddbfa5d24c9dc9f44a8a374b7e4e5b1d30',
-    'a6552fddd2e638ab8afed218a6553a6d3366d727d93ec14c8f55270db2263f17',
-    'a6570af0ac432e5c249333e6dd2920418defc41e2f73bc14c0a3d89293bc9052',
-    'a680371ee7c6ef29535f7c1bf570de731c4740683d89f8fafb8d9c7e9befda07',
-    'a68b6e5ad5bd79e53c5262a9a7cf09344c145739169f10817eda5d10c6609333',
-    'a68ccc6c6e37e7ca413c8f4f36e177222a7273245b7a54809d81016c755804cb',
-    'a69fdfb06d2da6156054fd814e6dda749d1d6ae251383a78e1e0a6f96bd94f56',
-    'a6b2d7e20b5e1da0de79323cdac375918b58e575391fa0e97b43e44e8950b3fe',
-    'a6b6272b6f754a9216f4595e59229d8b7f73d07acf6dafe71e3e5fc91a8ce8cd',
-    'a6d47c47a957141b74bfc676fbc5dd8cb5acfe23feb4373790e4351937f5d6fa',
-    'a708bd06f159d47c895a66e4d378f417c093860380b9e10915799b12426b5af1',
-    'a7269b03604d18293b175e62894f1a97a93b932d0302036b7f3d108a25133b72',
-    'a767b63cbd9ce6702bc926498c537545d99b56be8f760d4245e6e49d05de6e2e',
-    'a78e36f1e9b6e8cb5a1305f4baebb4af532bcdf9e43b9c9356dd38f729895793',
-    'a7b1ec3d71b1feef0bf233bd9819e5caa1a60f77e38ebabc03f5ace6565345aa',
-    'a7c03fd7d7f73e9c6e571b22790cf1981870e7d8d0649f3479945f31ab98ed88',
-    'a7ce2e233ab377326e4ea8eedb98b673d89e5c93e8b8d1b119b680aec9ec1418',
-    'a8023b54339612a5af676581f1e2ae383bf57d310521f2e00086111821b9ecba',
-    'a80ba55cf491986d471fcc731bba645ceb6f56aa24d6cfd02a83c259ca9313ce',
-    'a80fca77d69a164b6dd68bb675825fbdd4444e8244a6a5c83ee14e07b0b9b456',
-    'a83e23894c4c353586a1b4ec6db88a5391b690ee754f3e297bf28df98a1c2bd0',
-    'a84cd0e1f26018e8f061a1e2501ad40b2f9564d4c5dc0d634ce316bd51e163e2',
-    'a858cf24e18989acc65dcc9e7e7f20580f52025e24f2811edc66bc5592f2df9a',
-    'a8596863f80de86ba1eefdbed5ed1b8d4e2f30c459f17d7b37c4cd34936c991e',
-    'a871f066069600ea526dc73cd4b32cc22a80918e0517da95c7633f22b915340f',
-    'a8a4c706d60b044acdff9da8812978c085405c93ef6ae283bb855b8359d05970',
-    'a8c61d9f7bfa6384cbcf38b55f2f3d4a00537d476284c88127b0e5e449c2c4db',
-    'a8e23089c63e6ad3cdc45d0ebc52f8e4f35d655964271aee6e869e1403cdfd66',
-    'a8e2c8ee8471e224c193b131510c858abc902e9145387d519fc5bbe8001a0ac9',
-    'a8fa79a337fcad0183d96e9cb2cc1b6989f59ced2879e663a3523a5e708ec640',
-    'a9054057cf583b0d0cf496e33e0bf31d934ddf9d96499961757be97b86f81d5b',
-    'a93063905aeb6a0378d667c53448fe40e9d4410eb3166fe55b8adfe2dcafae59',
-    'a9487864db26a92bfc456617469872509b881cb7ef7a131af8e2360a0e761241',
-    'a94b7ed4e9ba7c37ba02a5b6bc27ae08ecf690729d64de955ebd857a80f75a8a',
-    'a953529479da58c4c5bfa817e57a65163e3bc8cb19eaecec0b62243f86365ff0',
-    'a98a64897ccdbb78c11670809587b4275391c06f4fee5240d84937dee5667918',
-    'a9d7031661e66fbe75ded35c0c394a09bdc712005cac6167649b791f42ae8701',
-    'a9e3db3142ea54f4f820401fed450d243242e0c8c13ab74e4471ca8a1d0cd956',
-    'a9e61cad5206794dc0a6a9b52d8fce39c2ec89fd26c1c108aa1637d9f5a2e647',
-    'aa282d6c0625a1f4451f69337ed320070ddb7356b51c805857ec4b0557d29751',
-    'aa288981e18552a31a46a9f5e03e9d4dba053fa5b74a6ddb6595d70fdc0c4801',
-    'aa6f69fde2005b549091e1a0bd98403e9c291f760a5853388e6e8607e430b56e',
-    'aa7544b0c8859b8a0911e8d4dcbb1fc69187d4208afb9363bbbc789f58b74de0',
-    'aaa89026e13fd354c09548e0219b5e462e47e7d872073d6ba7c191ab29a98641',
-    'aaba09793551327023769248dc31d5d8a2c33b40ca2f4327841c9712190121a4',
-    'aacc8854c3f74d30f6decebaf33d55de428c38ea6827e1bd7444b1001f2aed92',
-    'aad45079fc6cb61dbfcae1debcd0e967fe1a61e20b6b78cde648a2e56c418229',
-    'aafaea79efdf1bdf3fb6c0a0cb262c75bafa0dd8391e32989c5600a819ad288a',
-    'ab1166d724dbb66bc69ae06e88c1258b53ceb20b13943b6c874ca7e67c7a91ff',
-    'ab3b96a7160ea0a19dbb5994b07284183558f70e7923d93b67676d01dd8f45c7',
-    'ab608f8f3a6993ef4bf5dbacc027491f273800cdac14d25b9770ff26aa426201',
-    'ab612c7308b3f29fc4bc1ac605683518e4489522f31d5baf5cd04869946f5784',
-    'abb786be865d1ffa281abdd589d5a6bcac0355ece8b878430b88ed42dc3db973',
-    'abbffa4edcb62db4df0226c80de477125aace408f8ccb87a9b5b179fd13c4fec',
-    'abff84b4e4a6990fbe1b68f67f0ae955960e5e23f935bb22f6db973e7ac5ad62',
-    'ac0a8dae8a7b0225e9461e050ebd8dbc5951c6d39f22d8fcdc6abe5562ee8660',
-    'ac279eb70058086d048bdb166be91388369e32a89bbbd2db6ae7ee546a9f15f6',
-    'ac29afc21f9db0b8ac9dfbe169b6a443b6feee0f66abf39864f979a141fb3cb7',
-    'ac3fff1128f75b486b6779ebc709c479c4e1d6d973d3fee73b33214e3acd2f6a',
-    'ac497ee12a299051ef55b5e07451f21d6dbba598913af6badb46db2fd80f1a3d',
-    'ac5e68b678ad7ea43e15d58a070549cf13a57b10e380345df4faff41edd6ea01',
-    'ac61434886b851b09372dcb1bd5d4c2b1d5cbaaee1c265522fa3b831272b2c24',
-    'ac8bdf8b49880b104da825f44ec4cfc94567d7882dec7d314045957ffae88421',
-    'acad42407154084ccfe96ce5a42231f28cf88680ab28bcb9a7a8dd19a42e30c9',
-    'acdc31c938d8dff5f9b691f881faf0edf2019725efb7cb8ba160d99a39c4ef5b',
-    'acf9df335d090992a6bff5ffde963bf15691fc9f48152729a674a1cf17a2bca3',
-    'ad3ce92b7b3f6c4d9967a70211580c0118d6ca9d5a2fef1083d6f3a889da162f',
-    'ad80f59f063ffb426d25c10f5212d29e2c5abd20995390869af9b9a5007cc0c5',
-    'adab454629a5ba023c05280f39e89903239ff98851583ff76a06b7f394b61dd6',
-    'addc23c8705c8a61c0c0bce61deb9fd41c0f8ffd4b3965e5936b4557dcf51aa5',
-    'adec29136d055fff41c30258fbca025aa85e40f697c8675c1ae83cfc3ddbdedf',
-    'ae1e90a45d9182d555995b3ffb338d9903b5afef5b5b62754a5f7801af4d9db6',
-    'ae4ce709a2c134809e812f6ee968f226e5491ec05c0b23fd6a50929a98213a8b',
-    'ae4ea24ed1e900467e8b7e7f464090c748ce669c0c57b88a60b570b383e28e65',
-    'ae8dce143800cbc8b2d5c856f67a1db97b4632ced274b79f546e4ce93a59c915',
-    'ae90aeff9d3d49e5bb7dd39055a83ada852f077540e3a73845d15172926a7325',
-    'ae919952caac67b34209742f44c78ce8457b4028095f8ace039ebe61e8263880',
-    'aeb5d8f0bd2c637f1c9b8989650d65ac031c9df4d132a8b6c381402d554b2d93',
-    'af0158dc3c87db985dfcfa645302862471ea6c143085203937dfdb8d69ec8d0b',
-    'af05466189768544d3ccd3cb704a89cf2fb687d5a09be9dc7f4837a16492b78f',
-    'af18a541ca91e849023e8f2569c60b52a71b490d0a5c0154b5a192f9c70e21a3',
-    'af19bcb3d5cde292977ff10c881e5f7552a3127990f3f65dc04b2298aed161ff',
-    'af65563767f47817756280d10885c869e2f83891e118b1782087afc373be4dc0',
-    'af89000d6eab3ec5ede8ab4f150c734c00fd0a36d2bc873d7b5b86b52aad398a',
-    'afd6794747a4126aeaa2d9ee18770d1a18ce3f35b7c419505e6870a53dc34151',
-    'afe7b5846cd84dd7831599514f85e624e50e6d003552af8f84ca09e78f621f3e',
-    'afe8ef00058fdbbb17f072eb3ad20a7fbc256df78256ae9bfc530889aea0f647',
-    'afee3cf2f5c132aaf3b0e5e3073d253038059fefbfd90578005a7782e0a5509d',
-    'b01b368002e2578828f57a1620cb52a5100138191ea417e127dec569316b62b7',
-    'b0230edc7d3b6c5fbcdd87ca3337410efe5b11148372bf75af3151ff3ff49cac',
-    'b065de450c5254b740b9641a4de0f7cf7fcfbd087bc8467762272368a8a6bf56',
-    'b075ac0fdc40fef3c72186106f29d72efdf960dc2e76769f8b90a7979e8e0a32',
-    'b0b255618d86d669b226c12ad86b4138fb0605b87e0b7536f3bfacd6d13a982a',
-    'b0d4d7f61f77e49db2958a81966d2ba47a47a567c6b07c9f4933236c50287c46',
-    'b1454072fc63224f99c11c86da8c75310b571956ffb912661ec454599b6c7188',
-    'b171e5c689cbedaa2a1d53b3a98e54d52c3ca179c3085ab195fc6349abcb3aa9',
-    'b1a87c1575cac0d6cb0e394995c40c14d02aaf783409f108687ad2536000f32d',
-    'b1ae500f2d9a1c73607284f8168b2e755120c2db371a071031ca2a6f0a234e95',
-    'b1b89aeb737d9f6ab93080c1ea370881f97614f0eae5d51bb521ba6fa586bf5e',
-    'b1d7d56eddcd91f3ed7407fb80a26a30aacb789004f23a1e0dd703c78f8ba4d3',
-    'b1dd50f9bc2b04078818dfa5c9ca5d1b3715242a4c5f8ff51a1f3e2a8ef6f656',
-    'b206e593d476b1cdc67f449434299870ff87f724620575ca53213d74bbd349d3',
-    'b2136449729d01c2fe16fa4de50b1334697912554a8fd424bb67901a12f39df5',
-    'b223f4afea6c2b0d649b771f77ecc6ff3d531bfd672fc2527553dcd20910bbd9',
-    'b23c08935cc5b2fc13d53e62e005a5f9981bd8c5a3fa0e96dbc3d8db073d5ef1',
-    'b261a91298009e0344a0f1ce34c426372bad7a9bd553c1bade75b30751944a68',
-    'b2d03dd531cb7a6927b84fc00f86351dec6a14ed170cefef556981c6358d608a',
-    'b312ea2090f9188674ef67c3a8b9e8113fab58c2ad68792ca911ef7b07d777f3',
-    'b327305eb988cc9f74e6cd2706a9ca90fc1a6ea4ae83a0329bb19a142ef6b9f4',
-    'b3ae1ad4eb330039e859e3aa984c044482c66f0fdbf7c1817494da38a8435bbc',
-    'b409dd3764e91a786f7a5eee3edbbf21724221aed91f3440119d7b5e0c4d54f7',
-    'b433ddacca519187bb694aa20e8d8aa25c060c3ece5bbd733f197dae7657488f',
-    'b47be4c9fb5387125f614faaf089715bb028abdfc8d9fdf64a72022b2606a60c',
-    'b4c60b088c01a282808fb6d100192ab8c74e6e417a7e61ae51c47e8f7894d51f',
-    'b4d3969f210752c388f1eb5086750ad616f7816fbc85a61942fd5711f2fcdb7b',
-    'b55c8aa72f5cf385057512b5a5791876af52915a3a664c1841bf475067d55cf6',
-    'b5685afa711fb34b435ef2a143b706eeaa14d111d2a9eece043cd805e567c7b2',
-    'b575195d09bbd80eb1860c2c72dbef6bb924052fbaf8a8d1c990fa2e48b59049',
-    'b60336b52871d66469f9e32bc6a701c838da4ebdb6188b8cc7b199181af02fd5',
-    'b61205e3b391434f1b1cc4dc0e12a59aab6ff9838bd4d16c26258579b26a1dd0',
-    'b61aee5a06d72a643f615368debe33ff051d8d29ca8e4220c6fbbb9da280c34a',
-    'b692004cfbebc6f774542b3ab82d751aab53d74a901d74314b97e10bab574879',
-    'b69f1c90cc2da46bea6bc8f97d966df341b63330631947338d83a6323e6aa87e',
-    'b6c0b980b63aa7d54627c2629a7918eb1fc22f827cb7e8c63ed940693249864d',
-    'b6c40994e988972fd304a6ed1da9e6016088a31da8b01029707ded881b5694eb',
-    'b6c5c3dca66307d17b0ad5c3358248d087292474896d44996725634e1f440eca',
-    'b724e511fac88175a40661a59da90215e477a2d3082f596bca92ba1e89c277c5',
-    'b75bb1a02eba55825a062146af298a5aa6e73a9ef1344d1407009b65721fedf6',
-    'b7c6418998a554a10aec2af35f7169f0b0732393d7dffe503234cd3635d8cbc4',
-    'b7ee8c4ae8deda139c501be9c01131fe767a9a0d9e843e62cecd3199b459f248',
-    'b83f3184c1bb1b3f8222646423d241cc0134010e5cc2db85161b885bea9f8c23',
-    'b85a5cd3c7b4819143e7747daefd30f33040a7cde662772f455bce981b18276c',
-    'b86742249b8c18f9cbe3e7e5a38bd7f8f944685b150d1ad7ec654b21b4d82ac7',
-    'b8b9b5a66bce1011c3f457d4eb30888bd46399eff9e5de3d316f2211fbe950ca',
-    'b8d3c4f3f209c26efd9e7fc9eefb2076d96bd04f15dfdced60b78b3d9d3537bb',
-    'b8dbfd1693d43ad63f2d2a50b876d8da04a63ef8841e184d55ed282504711df7',
-    'b8e689ca88b4f785f2eee2be798ae2132de118af0fa2c3a74462f1590fdb7f99',
-    'b92581b984752f0c2799f9d6f6d887db99f45999cb952ba1ea516f2fe57b65a2',
-    'b9920af0a15d0d59db281d795edcbc967bc66569c985a33608c1fe6310269e1a',
-    'b99e46907953874d21648eab1a957f8c1e4f62cb51802945b80c23065a7b8f1a',
-    'b9a18372197af10c889a14aa6ecd75ccf47f947256b834da102e69fac66df234',
-    'b9e871487d02565c9361c31154c773fe24ba00795a187df8f36cb52a179f8835',
-    'b9fd4082833245adcf0353d03d1ad61ed88ea7838044cf4a42f0028f4ed2e124',
-    'ba10b3264329c7165bcb482cf8f49db582003c1a39b86cf998bc794dd2ea2ec2',
-    'ba1b3305abaf26a2bfd84c88ec0e19a87439ab458ebd5e8999f08a91bec59798',
-    'ba4cf7a94172eb468495f8c47df7606f4f881980400c4c6748d1b31d6b92b42d',
-    'ba51dec409bd62cf32eec60dc642384318ded8931918cadcf25a1bf436124f35',
-    'bab0fc3d31734c60807ec9a55fae3da74f39be05d34c48213de0f6e7f72df7c0',
-    'bb65e3ee73522f3da2e1716de3cc96dd19d57af91d0184e3f7f3c4e85721dcb6',
-    'bb70ec484aa4464c891e3e75b3898988283922de06ec9710ca31d894d958b7e7',
-    'bba36bbe064af5578e494221efaf6ebdae4cfe674e0e5801a6f29fc563697f2d',
-    'bc1efe8a4a0133fc89347d88f89b548d22831ecea7367a8e8f5b8faa2d86f3fc',
-    'bc85dcddf5c1bd961299296734501c96c22af0142c9856ba713bdec983511567',
-    'bc8e452c4f364e4e0e2bdb6d9c9451647e38e750b93700650c871263da73ba2b',
-    'bccc8a1e9baf944a4880d9318485d12593903d2bed84dbe886825d6eefb5e42d',
-    'bd38453fd016ad72bff5f69592887c216e3a40045478c4e01c50a8001c622683',
-    'bd55fb217dbea26c7b3e6814ee2ed10086fe9ab081c14940e0fc21bab85bc523',
-    'bd9f788e0df4c661b91eefc2599ae150ea5486a18939e4f04732370817b5dde1',
-    'bdba3211d5e9d595752cd4de3b0b8509ec460ece07f7958ca824a526dd540e23',
-    'bde4dd48837a2f87d7ff6f6f3e1c12dcaef8bc7a07a15f33f25f0de7f24b4485',
-    'be02508158838b35acd5aca56807bb0504c856e14b586a1fc0ada7ce94e172a6',
-    'be186e7f8294ecc2c37b7979efed8a64c31be0dc663071cd36c500a0b0f871b0',
-    'be275c1e61fceedb21bb9c626706afac6ef441e2acddde274b2e0ee16615dbac',
-    'be29b744dc3ada073938b563279afdb82298dff2370e9b547bb5710c7dbe9a2a',
-    'be4299ccfb84016a9dfa760e8491be69cfb0b2a9e75d936ac350fb5f202efca2',
-    'be57bd4d73941b80b51c8599a30fa6dcee121b639919940c438ce54be9512b7c',
-    'be719469b8d4a505ff77916810780a086e2abe43f20c5114092b619cbc10674b',
-    'be81e43404928adac96c7a8e122a6f82b65140f4c2cdaf08a4d3254c43df559c',
-    'be884ac89d00942b15666d0baf6ee5fc3744278e6224049c614037c01c348c43',
-    'be988665558968c1a3a6064fd663c9ab65794d280087288a0ac23c4f7aae9fc8',
-    'be9c81f228364672c37b77faf30b924afd0e78ce7b5f1756b960c5dc02ae17fc',
-    'bed791fa3c3ba779a0fc739ff25f869a734c306d1459ba31920e8a2aa3655a86',
-    'bed809b82253fe321bf67e473d721101a29ff5cdc1272631da1a150d04d249d3',
-    'bef15531ad2ffa52c21745bb439ff826f63a580e2c9e7f5855a40e5c61794cc6',
-    'befe1e37aa4caf3d11198d19a0f86a43486ff1ba143b5acc9a7394434506482e',
-    'bf1b38b0505c0e322196515f9cfb7db64f6693dc12929e7819030fc06a5d22ea',
-    'bf3627fe61ae6487dabf151c636255882c7df24b1465301593a351e3d3e21974',
-    'bf7a648e0fc527f0058a0908fd9c6281deb20ab35edd0bc868baeb31e4e1c422',
-    'bfe611f0a43ea0b20c4025cff9ea6dfdabc6cfb6a04c4551a3461c234ea843af',
-    'bfeebcfd773c04f89092202b6cd30300495848d5c757c2cd7afa5a5684827104',
-    'c007c269a2297ea1b778222776bc24d9e15493fd541aa2a50f2f602f3234a081',
-    'c00d1d528107c7a1b29d9356567541adf89a8e23237e17496d8c3f95733d00bd',
-    'c03c264ec7b1797ac5529f683e053df6f9015d132a4b76e59024b17ba1d4ecdc',
-    'c04fe05c199052a256ca228d570994d293c036ed8b00769f25f02e0e2e04f0d7',
-    'c054602bbaddcdb7644a2773aa59ca07534fcb93c144342d4288d11901774fb7',
-    'c05f5e51e3886fe244c425eb9ed7ab980fd7ac83591f80a17c0f66f510f94b36',
-    'c0c35e353d781dd2932365adf3230690d3d9a14b3bbdb241532f5016cf389e02',
-    'c10a5cea87846ccf239f8b3ecec448cef963f567a6593b35fdfd53a99053e9d6',
-    'c14d187bb77778777d18b9185a3879a8e0d9a48c107a3af20e3b8a88b3498f66',
-    'c15202f6cf9b4975ccbb7b8d79914cc0fc2677d5a3286fdafc871b6df40ca0be',
-    'c1989c88652ec0838d1e1ebbfa97d2d95c2f703692a94830a6531eb0a03534ac',
-    'c1c86539662d60e2107fc62dd0e313d5f9fde485b53542cfd4f198e76bb1476a',
-    'c1d58658e0086e901fc44b6a5ce25e5f9240e7125236cbb8d31609638258c0cd',
-    'c1f2fe17fa7d27082063748da0f2c4436ac810f06ac76a6641ec56d35537fbcd',
-    'c221e89abcc9035aa800c315be519afd2ff2f1ff1e6b4f755e92ebd0e848524a',
-    'c22bdcb4e6f47b0a0bc25c55016d6e0a6b1341a49c31a9ab0b6775bb3908c172',
-    'c2a6ee7106a856ca5eaa2bc3852cb994bbfee32545de17b41bdfe9f5225c26a4',
-    'c2b36c322b68efbdb4ffdc41ef08bd928ebe539c84dfceca0e13960562680481',
-    'c30cf5501414543e633c812261fdc0a8852b372f558213cfb1eaef54daef2492',
-    'c3229b6bd200bee2f9ea05b82ec02f35de06796df2f6ec6f604079d3232452c4',
-    'c3d2c45824023192131c1af7c3ee74f2e0f4f87685154f32e99771bdda143f5c',
-    'c42dbfb1ca22be249d7047ddab980749d13143f7d577edcdc277ea0d443899cd',
-    'c46f3ada96c2eb0c8523c2cd52b6dcfb24e9ac85c55909824bcd29b357367680',
-    'c47ee62b83509ad739bfededcab37949ad50f950798c5164701e4e02d3671ef5',
-    'c48834bf4228ad5e43c4b9f6cb247455ae851aab5fde053ffbda2b52a388d3eb',
-    'c4a1fca3b64dadfd2c66b62d63bd11fb76114abbf67a7453a442f2933c460447',
-    'c4b41f36d5b9fc120b7d22d15709c2b85397c64c910a1569ecdf918cb79671e4',
-    'c4d98f30af59e94a04c89665ed58828c62f69876bc95e0be750d04e8fbff346e',
-    'c4e3fb190be5d9cd78916ef79e79bf0251b3788d9917e0d3cd550e6575a92f17',
-    'c4fadbc423d02d6c46db06ceb9f72e6c135d676304a08e898df21e70c69bacf5',
-    'c505129a461dee920a2fd4720c230eaf9c1f340d547932f3a919c163964dc2d0',
-    'c5295a48cdd5ac64356ce63b4e405edbf065d5dd48a9ea9a246c62ea80d359e6',
-    'c5486e1bcaa8efcc1bf815838bb1409097f53a36af94d27b5f01ed0aa86588b9',
-    'c5580b5f8f2b4bac22809119195106e5e06c86f50abd28c010056f756533cc3d',
-    'c5616b7661090de823ee1e29433931cc80fcfb63e0b30b88bb3a227db4df91a9',
-    'c579e56a9594f166284c7eae94e5dbc919288a6a040437083593c047a0e34eb4',
-    'c584de0f51fa9b1bd24ae7a94aad6cf9d6211bf1f569ed2d4df697ada390037d',
-    'c593575eb8d8ec538cdbc41392bc69e6007ace366876549df95b834b58774dba',
-    'c5b782149d0c2e0ea78ddb1da592875c8b04cf8f2ce73f66ec55ae874607f452',
-    'c5c989958bf0313eb9e6d7401e23e27fe639e586dc0d96cc8db399ac67dc7091',
-    'c5f5b521b7589619dbad47f0693cfc9b60bbda651c806d7db6e3aa67c50bbfac',
-    'c60611169772b540e1da2c46f27ca74a15e849cba645580f8dbff3418f12330b',
-    'c628fb685732057eae91e432d8b86c5b60ea1fd8a48797c2585d2ce24f1d4ce7',
-    'c63ff2ce84305ef3ac091c6d72c9ff3856ffa988e5154ee6254ecab9a3ae8673',
-    'c6477d672994e76f31b6953e011a15fba99abe314257002cb9e0c52a719ef584',
-    'c680b93d4af7851312afd5547f953f9d982a54c43fac85caceb00b1775b8a0a5',
-    'c69ec6e7e7579e2748458e3581c420677a52614f08d1e292f98b54e85b443acc',
-    'c6cca4119371b8b72b9d1f9612d7fcaaab56c8b5de8d0c160bb4d8cc7c4412b8',
-    'c6e4eb49cccdda897e2627a63dbc9aa734f7e0eaba71e9c9cf624f51f22ca938',
-    'c7653e2a4573226bee4204ed0412c222322fd1d65768ebcd96f116a1dd9c8410',
-    'c796f029e5d2e23cfc3f132ad4c508c39dea3ef52e07adfa5976cf900d40d9b4',
-    'c7a352487f284751d7c2582cf4fd875b76d07f955e5e53c406787bea2baf1d49',
-    'c7c53180087dfd9fcd7f1e90029ae7fb3f7df029f0c6e54bba397d73ca50d9b8',
-    'c7db50c3e2c28771436d414c4b623acc4e1ad663f283991f835a946f28de7e9e',
-    'c7f8909c7642d229afb9ceeb36141fe258640a896c582f2483f7b8af6eb672df',
-    'c82d4cf3d1ffa5f6e748f6717cb45bd3154fb33ec9ade08c5c8f7a3011529303',
-    'c8c36598c0032be7e513c8a3cfee2ca37ca67e39ff9a62f90ca0483e9c35436e',
-    'c8c76f92f25210b1b60f9838afe76d0e1d2dea3f01755332f95783b29b884249',
-    'c8c7d7d42702e10d8a3a071441f4faffcbd8d50e7c2fee4ce1120e4b9784f9a7',
-    'c8f731277763f09e8f11dbbca17cfd422c16bc93f4c6d1a9e4cc9301459dcded',
-    'c9373cf3efdc143da25ab135b0843d9591ac8d953ea777eaebc4128f0c9aa022',
-    'c96ad1b56aa93ca97530a65c25e38b7d32783935d8433943bf96f489d11a0074',
-    'c972683670a73552be83926edb08ba78201f8eb2397a20badb4fd838bfd6b45e',
-    'c9c6609f1d17100e4e6d4f57d0ff49463ddfc5d19d04db4da269edae005905b5',
-    'c9eb7b75655f92dbd2578ffa8c75d93ae11b660e2870bbd3dbb63ed6acf19c71',
-    'ca76e9bb7231f2e9e9c1cdd6dde654bafa9e7087e727a701071f842c1ebb3484',
-    'cb437c8212069b2546bfba2c418e5076f1e2401dcc8bb31a703245cd0f5ea7bc',
-    'cb7b312e78713657b63df089a5d65a3874204c345cfb5a8f8463925b9c3cc8be',
-    'cba421d1a4037163918efacd9e0c8aa2f30e4e6d60f6abbfa5faa6a8e96384ae',
-    'cbbcb3ae3530ac9faea88c61fd6a5f38dc84735dde8e52db766bcbb06be315c7',
-    'cbe9137e7e2e95a5b7c03f9827d6b3807cee57e577c96ba02da5c3045e7b99de',
-    'cbec64c97de7f432fb91625aaae53eef993d95b5dbb4b319ecbcd203885e2f9f',
-    'cbf80d87060383c91f98e0063542affb7d619aa26a9f7df5458b0f0e21a3d159',
-    'cc30fd0121fde62de8925fb87e1fea3cbdffe52cc3e0db0db124d98d494594b4',
-    'cc3a8179a1b30c318b483f7ba03d9fb76b0095b82e72df24f9e56a58750946c3',
-    'cc515daffd2fb30792c40db9f005762b58545ea9dee0b4c69ebd954bd0178d11',
-    'cc55c4195ce5ef89b0349370f01387437ee79b0f7e36c11abf82b7e944c63c65',
-    'cca933876bbaea038490b5726d12009947234fe594e54a251b9df502d56ee7e3',
-    'cd3b0bbb82481b7ab42b1117a2ca76ae826b05ded27e83c0fa451622a26c67ed',
-    'cd424d3a4ada4d35fa79cc7f53bc6edff17b6447cb0dbf5c5b3dce73c0cccfbe',
-    'cd45f7fb844e0739cfa3754a4f4fe43bc1deb1950f82bf975ccad3fc25dc9240',
-    'cdbbb5ea4a689efdd6956a605fdd2ae4ec2807c8fb33c262bd6ea1fd5ecb5c3d',
-    'cdc8c216ceb97fba49918695b5aa64756ad4974cc0e9727f3f35e6ba141b59a4',
-    'cde0f0fefa97e35e42e235310b3f202f08a327a2d4f8d7949ccfe2fc156f028a',
-    'cde2b8d3af6322448e0713abf7e793f096281f63107ad33a35ac46f5de1cedbc',
-    'cde9f7530d8e177918ad0bd07b93f725871cbaf3e83fa487af24a59c690c76d6',
-    'ce60bf2dd5022471639ed1240535d15bbabd47db0619edfe62fabebe50d5b737',
-    'ce679e4a3621f3b9247a592335c0f6452241e9aa9b05454b9336d4691d778131',
-    'ce74acebbd11735d814627097d741e2a60786ef2ed76e7d0ec76aa220231cef6',
-    'ce8347e00b2a202d3594e80335cc783471db248732b24b6a7812a5a038bb56a4',
-    'ce8dbe68ee88e434de0958a661f7ccd44e8a8b5ed0755f1a48e897615463dbff',
-    'cea73864e3d0d2f9cbc97a11b37f4ac6e2717ec489bcce56546473c568a76ba0',
-    'ceccef813596b64bc3b18910b6812ffecd781f15a71f49d8a587cf703ae95a87',
-    'cf14f21df757f83221183c2b2a93ea1c3908273519a9bd76df573fd691e29978',
-    'cf22a23a1cd5959451104a39cc71fb8b4cbc8e4ec7e22dd833071679b88cf34f',
-    'cf233602ab6036f8a515cac6d1fc63f097eb376eb3ec5f9b7b4c1ed46454c61c',
-    'cf3135324f57179a3b32a57f1c3dbded614faa4085d23cbe7b42c4f03df67ce8',
-    'cf4aa482c408676d7a32db224d2000bf0d8d58c639c81f491a77800f86ab6c1f',
-    'cf9f4758a7da4ca6b79389721120eec71a6b4178eef3552817ddd2792eea040a',
-    'cfa9333ecd81ea2a272949b76f4905ed5564742aaa03eaed35c22f8bb9134903',
-    'cfc9c748828b2935cbc2566109a4f7e6b07556587df967492831d19ce8d0f53d',
-    'cfdbda8a41ab58e4d51daf3ed022d9a3289a4fa84cdbeea78ad2a7b48a659b23',
-    'cff12a162844970de863c19444d5a84725b340f113ad108c3ad845971c3fe105',
-    'd04483d92212b98a8ae55f966dc4e1cf2c5c42888917f9dc3404f87e70243561',
-    'd0570ddc56f52b3eeca151720301835afa446d03fad76c9da751dbbd436f6214',
-    'd0a886d59bb36a8efa8df2ae7b4e3b2b9bdf0ea014437f538fdea340ba88ef43',
-    'd0adae9c82679d4be6eb267b8fcd38140d827921669f92fc94d753dc7392a610',
-    'd0d49597e813a296ba0b9cc9df6567155ffe9099a33400ced9a999ae24b7460b',
-    'd10c000eeb6d04acf56e23fd3e194c06dc568624cf8f226d052acdff6be935d0',
-    'd16f976fddd7d53923218bdcab1368542e38870e4845b954c4e59d3b5f10f5ee',
-    'd18cc4aa55ea91ddbb34485f50379ff4b00839070ffeb17f1387b56ad0a0d811',
-    'd1a6d8ddb7da357001a975c37a509c0b772ad268b45ff5053d6aed3ea868e5cd',
-    'd1d42c0fab34f63d3bd434e90e67ca9581f728dff785b1ef4753769ab49be4e9',
-    'd210f24363f814472ad2dfff50af4ed8f20a350d154925d271b3b604d6293874',
-    'd2378628c29f59ba882a2ec161aba8c72addfe4aa0f9ba8cb7efa4d05d2267fe',
-    'd24796e6d107a59db631b0d5bb4143fa4a70b5e5c41f362ba11a245326ac6651',
-    'd256f0b1665ed9a67fdf583b2c126eaeb703cd400330a28c36323bd2e1c51f52',
-    'd26e2b30601749c06581d9abdcba9ddc1290f5540047e53da24bdc6b21eb5fca',
-    'd26e67d39e55cab49aa2cc55dbeb78e12196999907c92d64ee77e843f9b3b9da',
-    'd2cad466e8555442471328a8dac565eac99afe2474af79af05fde1632161242b',
-    'd2e9af7af841f7db167c08a1b50596a3c02166d51b21a4e3f02c23609bb4b807',
-    'd3456b3c19d45e5649b09860560c30ba0f623176ef153af922bd03f29e8eeebe',
-    'd37428ccc1f4e2f321374a4b55dc42329063e16630dd8b0967dcbad40a73ec0e',
-    'd3a4bc0f96f71c8c9d41d2d8c34a77fd695b2557aaf9a9f1207bf24ee481305a',
-    'd3b09711bfbd8b47b1f1f704443ce4b37b60440b04b03e892c9a2632b8526348',
-    'd3ba3485be3f0f4b825a5254de71b873928b4dc8e5f73c5d210250093193d084',
-    'd3e7c10ddbb2c17b475800ac746b2837c9f4a56cf8ed0def012870ccf79fa78c',
-    'd41c6c849759af7c96dd54c45ccaf05fe093df12bb56351729b7a9904bbd838a',
-    'd42ee6a48dd7fec9246cfa780f172fb1397d0b2ca50d74824e7455c453a7ba11',
-    'd4470f9b8f919c9b990775ad6249c5552a5affbcfdee28775a9df9bbc295d763',
-    'd4697823e913c504a1c2c45e2d1bcb5cc66e8d858adf1f14c70d650f237e3ad2',
-    'd5555f4bba3d38696b2718c2d7c4ae4274f4639ab1db71c2fbc0381aa9ac82ba',
-    'd59d7f8092cd108057d4b7039d582067590f52a6ec9fa28d54068aaf297b8b8f',
-    'd5af952a32d75de2e22df0b15c8f8ef9b830228989583cdb223775e3a46dc6c1',
-    'd5b8e4864366071d88cf463489588324d466537a2c1cc9c7821f6d0710ec346a',
-    'd5cb9e089f2ba94d43d1dd67f5b88d5360c800b6f1c673e0c8449079782d6f52',
-    'd5cd0773fd4291bfed9a6f0e2ad548be2376b93720ac3508dc414131a7ac4036',
-    'd5da9a10138381b379b97d12f1383715fa7d2d43a629bb7e3aaec76dd47b5b0d',
-    'd6002a100dcc0d17aed4ba39694d82ee1e576a0dc3eaa20a0254cbb61bfd558d',
-    'd620d1b90183a19edfd3f180bc6c9749484de7b9648bd542ee62ce8e1e03c592',
-    'd62b34d9e412d66c1f4638146672c3b8fdfe41e64c702a139bcc7ae5a8ced3eb',
-    'd64c3831d052ef2dfd3b49ad25675221aa62cab31bfabfe1aff45d10128bc4e0',
-    'd68c078a895c71712663987ff719d1850538d67f0521b9aae2e6680f07af01f4',
-    'd6ac03eca0978e342fe32e2429331385cb91f6a52b573999c02cb0a3a0d56a3b',
-    'd6df2f48b267fa39686e974238ceaeea8380f5fd3a88135127f4aa60dd849ee6',
-    'd71c74ce212c8ccf90079b9c245e15ce0ee93b16c22d99c036bc82fe8793a8b4',
-    'd74ab76f25ea10c1bbeca323c2d1a7c91a7b836d1cb29e75fc23de64a699ac0c',
-    'd7c265bc8a2b8ec71b80170ef215c788d772221a76786278661b6d08b4cc460d',
-    'd7ebbe65a8763dc76a27efd5e680c0d458c925f971e6bf9cf4ea6c3cf7ae9ddf',
-    'd80d72b9e716a07ee78f823aa61cef7bc145a6ba74c7c27d3479e6f8c4eb89c6',
-    'd82493ba09fa4cc7053bdf814207b37492381bcddd0a042531865a4598e3f72d',
-    'd83122d71ff30f7cf2ec5d704695a4c752203709c3de384e940831db338a1637',
-    'd85bbd4042e7f7ef92a49e9f8b9d90803d319570dae3b79e85e2b9a5cd40a735',
-    'd89481fbaa05177876cc5fb585bb857387266eee6277eeda87461fa58af55412',
-    'd8e140f24f3236bebaa5c22dc2ec8a8754e0a9b502f39b0ec407981e3d526091',
-    'd909dc0deed33b14a03553d417bd540b5cc34c3c20a08c6c434cba7a278936bd',
-    'd9751b10fa954cb213d3f80971277f20f249d381a7b4392b4fa40bd684559ac8',
-    'd9794ff416443bd649546cedb084cd6c0f5b8ec03ac79f2fafc871d283f8b09c',
-    'd9a8e4a9b0c0bc39a30f0f208e838f6bb53fdbb9f107cc03a8a5599c7ddb742a',
-    'd9c3e513091fdbd56b0a68396ae2fe5dfa1423c60d42fe1bd809c07a51ae066e',
-    'd9d9fcdc8475c26a5e81720564320662161d3017248d52f183b9badbb182abc4',
-    'd9fef2dc06547b50ffb9b3c31c8506d874171c0e8a8fe1a260191aea86af3c37',
-    'da07801f318a2dea77774ea3b8f5cab3598db96ea6f23c6ac9664b2f49646201',
-    'da35f89eb69adfce1b322ba813cdff227470e730e1a8dfef61e157dcace575fa',
-    'da66175285e72855bcbd5ff2de962ba7fe0d4f99da3cbb0f9441840be86d52b2',
-    'da6a6f728bb81ef8c74903430ee69f6b101f250ca14e15389fc94638d8b0a7c3',
-    'da8c1b785a18c82b27c78a9c9784a6a7aadd41464c6fd9b198c079f1661d2d3b',
-    'da90c8f7b3885fd979c9f5ebe0be8be6917a19a645b10d21db91643efe6c52ca',
-    'dac5f2b5b1cdf47b95b3f95825e325d0da7cc37474a7ea42e61ddb432592e68a',
-    'db1aa10a5e67886331b29ce484b0bddeee5ea36bdce13eb8702ad9d267087848',
-    'db1fdd7c8162bd9c85875e56237ec2218ee53a9c0f00d4e73e4b22e0c9cee884',
-    'db275711ab76f40c09727a3b9be42e41b40490239ff33ab29fa45f5d3e09d46a',
-    'db819b59d40f42b30de6ccfaa5bb1bde2932710b71e2558afea2a4752dd10c47',
-    'db941fae26840f659a865d1a8d6bcfa71eebf520165785a55ac3aa1d60503b6d',
-    'db9ff934906ffcb2d90f96a708e02c8061d3d580a28a5b0569550f4ee36cae93',
-    'dbc5e66fe652f691b56201c2a2ae6f50066f759dd448b5b763da60b5a96bdd30',
-    'dc4b3cef414ad424bb5519189295c6b4cfa18ea7eed08f1cdac0bfc36ba37920',
-    'dc5c312f47f09bc70cd39bc8da619b23f971bcf97674219a06088e2fe6811efc',
-    'dca6dd2d012fddf07a00aea53cc35c0de14776217b9a6bb0da634b7acb9a86b9',
-    'dcaf93ce8d67c46443b7858bc2c290530d889646ebc81f184aef4f19659172f2',
-    'dccdf2ff9ddafb3b37c42e1976d16b3549a5af8c713643d0f6eafc271606e454',
-    'dcfcaf2f55358367e5adf66e4d6c2f7ef2285de66cf576ed3591ac37d612bad1',
-    'dd148429b235001b5637444cf20ec6cff897f2d0450b004604fbc7c3f61eae0c',
-    'dd157b78516d2176b38e3a24b3cfb4354f32725f62e46a863c21e0907d453dc4',
-    'dd34558dfe43aa41e5f2bfbb2f78e85cda2352b59543d0d7f10f583735f6ce78',
-    'dd4cc07db73fc85efc4b30b28a4160b4af8b78b2461fdff300826c607aac6398',
-    'de09fdc6503840baf4b0fc27572b5a24c487d0ff1ae80495c1ab4843e8e544a8',
-    'de0a700cca4634b28ea3a666ba0525801f4c016f89f08da14d163b61c5e7d7f5',
-    'de2fd7e6fe80ca9bc67ac10c8828170c867fb6623e840fd436c4b0b158c36524',
-    'deaa5268d5bace1d0bcbf2764f86099d2d10d88a516ecd4c55f3a9ce11d0cd90',
-    'deb13579e5dac971637fb1969ba43351ec5a3e857224dfb449b366bfd69fc27b',
-    'ded64a54555261250f7d30ba8acd516514dd32423decd17d260901e9bb0f56dc',
-    'def7f0f1eb42813f1c7168e3d1e594752945f5b06836048b119f3bfd8650e9a6',
-    'df0a21e8b1a7ae998d1207b5eef97c651e3af5514e2f7c1e8eff784c22d9c851',
-    'df6d856ee8b522146168ff0fc306f3a4991829065eb7ab24fd73431b4b98490b',
-    'df73f598b4a0e9c0565d9741a34c3c1bfdaf03efb2107e16e8f8fdecacb00cd6',
-    'dfe5e94d830c8fbb25f10dbeea14db3600b64393e2976bda559e740afee686d7',
-    'e0789941ad911c7e3e48b9fad6b7a85afd6a0754f01536c9d1a1176c01dcf056',
-    'e0b2ae48b30b2efcab3ce381ce886413781fe574e43d45a1078746091dcb0f24',
-    'e16617c405aadb867a328e2b0e5119490933e3a1fa52bf1618987b868f01e48e',
-    'e18bf57d8dde61198cfa36eaf6dc7d0b3f7a5d2383fc49e54fbc4e096dcdabec',
-    'e19a5aa30585b5489cbb4f00c1013c11db0a309dcbeb52c5b0a501137779df22',
-    'e19a77048a7cdeb10be40c4f05826d9ab88c43a77d483d5264d963eefc88305b',
-    'e19b281c1f6a37bbfea68581f47117299c8e0ff3bb5f56a63289f0cac17b9614',
-    'e1b2448c64c8bf2c92f588a1e562b0d1cf6d2467ef42ded0136440dd5d34b10f',
-    'e2668bc2946b4f1d35d62f2af373e04b29b66d8051d31e74a5a9aa5245743682',
-    'e292e834fe646382bf1f47e1d1a85eeab2c96a88558c566997a24f2639b1bf9a',
-    'e2990433e39d19e8617a0d814a4485639ecce30825226796bf57455917efd353',
-    'e2a199d7c9ed878f963ca54a16a39396bb59136d7b6d186f5209b9b3f1f1b515',
-    'e3002462914dbe1f1f1666622cb6cf5ce749f2d90a2043e16d43d33e3d97dd20',
-    'e303d28780dbf5fbd1ad1b14a6e11d70383a395ab530b2e4017f5edf37965347',
-    'e3099a6afc93cb2f94d0b3dedc5721be1b2db27b84b12149842b803611a0e3b3',
-    'e333ce104ad18d3caddd0635a18c9cf6bdb2e85201ca3a7b2266ffd9377a5296',
-    'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855',
-    'e3d96981b1580a76ae862d5e2904018a494300c167730a39f0d63ef27c4612aa',
-    'e3f8605343d91299cf34fd3b80a9b620c51b9382746c2374eace2a7f942ce6cc',
-    'e41cb3dc142dd04b9948ad99a13cb91cc711cf16791c258c5ebfae751509f985',
-    'e42d4eec491a2dd24e026daf88fb823857a8280065fb6a1510321cb76c9c960e',
-    'e4a1963fd99ea6391f5a1d20ddd237269a4c9583c703f1f558cd7f5713c96262',
-    'e50d577c385181a398a5422d6c32c224c2b0988d6b252c0ca376d0e24eb94f70',
-    'e510345615ef2bd0ea40435cac02aa99f077315031540c53d6c94b0eeb9f9438',
-    'e53e4cb98cafa8e65727ec80578685ee8f637c28bd772481463a63bc0dc5281b',
-    'e553714607dd6a1c327f7dcd19bfc7b7281920d26aaf646a006144392f01b9b7',
-    'e58f1a3dfd1c91cb3c9668e22c27aaa1ab3ff949c2da5dbac52b996a8baff349',
-    'e5dda40631a027fcdf9122e36b16b0186999c021d34c509601051d98473021ea',
-    'e5ec4359df1fe2459b06244101d878e1c524a8eeb6a00afdba1860a0026f0ed1',
-    'e5ff6b16bd20b56ddad6ad7c223b07fab631d9809587535045e84f81c9d7c8a8',
-    'e661f6afc6641d511625397278ff4e2f6774411a270479aefe006f2ea875a32c',
-    'e779e0ba4f1e20da348c44bbcdf4506c8f6ca9c2f8eb0a37e98b6f72cdd021e3',
-    'e7a5b4f93dfa4cbfd339be0527fa4a8aee89372479e0c9a87f5a6c9104e30428',
-    'e7e1603c6646c72ee9f1c9e1138b884c9d252267690523804704fb985a6a3213',
-    'e89a90aacf8536258207148bf7521b0e8a5bb49f6add355a80fdb7b716b47c02',
-    'e919e1a1603e2e68f1bc7bb14e1dfc4f891c4430185a92984b6ec88e3d0831b1',
-    'e9538bab7c656e18b1541c575a8504b953f5b4a14268896d1f202d68248318d5',
-    'e95697c83959215a8eca80db0380ead9c315ecd96183ea366b1493bf3b2b1e3a',
-    'e9d50ef061541751071234b4688e8239043eda3fd293628cdf476ff60a4d7371',
-    'e9e004af27a975f9acf2d3660882a6acb5cbb5ca85622a49039fffeb1196115c',
-    'ea0157f9289caf401b086a7374c907519a67ae8a6254c97e7dcb20060009d229',
-    'ea281e1dd9ec73b8d0428c42574a54645c91f6ec4e5f97035c6d52f7572533e3',
-    'ea4e1628ca853c94913fbcac798b9fa4bfb6bf055168402bacb8a0cb7e855960',
-    'ea68ecc8179f69aa8a8328421a835f4f1cc985dcb4c9d2a370042322797e8edf',
-    'ea7d06930b8130b4e627de2ce0336c26ff4840f2a6222b9d244b8edd3f051002',
-    'eb0920cc7ecc8fd68f3ceb49ef4a5bf4bcc627404e0aeb275a26e0105c52ef60',
-    'eb8f441166f5c5ea0403cdb367fa766647096b6124e7bfbd28ba8ef6f956a1ab',
-    'eba31afe7b536a94468e2c8d9a9d44aad7de4551192fe78d7ca789e899e2e4b5',
-    'ebbb31d45961c828c3000934a9d87f16143abbd80889c7857a2ab82e5e61f460',
-    'ebbb6dc739a05ffcafb16eb1518a1abc4b6796630e7f722123fb4fd516115e56',
-    'ebf502bb65996beedbeef22f7c49671f7f990f718578af2691fa44426e9bbb59',
-    'ec187a6c788da9fc07807076a752dfc0cff7430cad26cdf3880b4e8343f61bef',
-    'ec9c664a20b90d8b9eed8cfe939b541c681370728b342f87e03a5e193dff018b',
-    'eca6a244cea9db507c41c6c82d589df2ff7a9d6be8fc8b3a22d41734d5401585',
-    'ecb13d7c0f9884076a5877a4b57ce6a22f6dc6fd647f687e32fb7dc6b5e488db',
-    'ed823a4b14e15ef9dbbeca56917082bfdf0878dae18c0417736a6df155924fce',
-    'edb49561251618406a032ee6cd529c7df4ec182b1dc67c278531d97cf16c7f99',
-    'edd448167281828c50b21c37f05417b1e7e4b27ae0229bcad4986354436eaed1',
-    'edd7f55f325d056c7d08ac64857013994527b125cb346f69a3a0ded03854ef12',
-    'ee28bbe1f9e0d4d221ba873c02d92af4889e9b4ef03000a28b03a90321d6d3a4',
-    'eebe424ef68e9d2ba025c9c69a95ca6b934881e87191f03b61669461d324c805',
-    'eef692b86edef5db30b1be6b00531b9d76786562c4c92b7b1ef84cffb8688279',
-    'ef55fb74e63d499aa755454eacd658e67102cfc13a5e20a9658291dbecea8b35',
-    'efa07c2099b9075d04491900ea32e758b9161dbc100391ab94b4bd5294768079',
-    'efa8128a77ec9b87442fbc31c5373845b84e489afc2504592093280101406c69',
-    'efa9994e1b35baf86c755bbd75d190e7e7cfbeeae94f1169173528135f5cff58',
-    'efb465f4fc32598dd3b0b0e067dc23c8d83c996944c7354706c49ef58fc47d70',
-    'efbfacad255379cd212d2b02e6441511881fb7ae33d785647eb7e87984e05b09',
-    'efc241fa6d9cff296796e47b11ff6484bcfa9e0fab8e5004200dc4d54f737916',
-    'efd5e343849f258e2beff5161576f55f495ba661a08902919bd63d80ea91a92f',
-    'f0525026f9ec8f189785025a29f5c7de728ef59c0834f084eb6560f545c5e9cd',
-    'f0633ef06df5b9afc35f04fc00d582a412eec125cd5f8b3978eef79cab1a2ecb',
-    'f0993e23230ef7818c5988df8cc9234808ee51dfe3fd1ab76f5384204698c109',
-    'f10f458cde12645f31b1b077a59febe9989fe23299eb6dae5011000b4a80104e',
-    'f157143367949d330bd93e1e816519ef2caf14aa681d8bce8a0b6f8f7efa8123',
-    'f15d7b2929ce7eff20a0334ec59263d6c4959d4bce49ec248280017e555d4182',
-    'f161bbd378149256e8086fa7c772fb62e3c1cc66382133dc67891a59378f9976',
-    'f1941147679c28ebf7e74f059936519fdf64ca55502a45292d4af33e06d732ce',
-    'f1a93b32a421dd755264fd71809c0d5fc24a444d5e0ecd5a83130a116731182f',
-    'f1af6034ba20208d0c3e3e2219e3efd556357d0d73d5983c04919c5ba05f7d6c',
-    'f1c23ef268d1c9af68d4a9b91b5446ee654eea8f8e69f7af14fab38530fe8bb8',
-    'f1ce54b9ff54b1926bf3083dd35a726d712510985b1f37da7cdb8f0f1685c249',
-    'f1d8892ab112688e19c790006216d8535f673515c6663d4522910266a597595c',
-    'f240716dce92c8d3705eee17c79f9bc1ca1eca8ce9154a8e0092be1d9cf527ec',
-    'f2b3c7af1fe93f76fc58fbe871fa87ee6028951086b221dc81b2fbe9ac12a40d',
-    'f2bad332811b54ebc63baffa1a248750417a7403bc181a8d729e298fba1b5f54',
-    'f301d3f0d673dd96d304acbbb690717d0d6250ee264a6f9e7ad5f7f6b2c6f6f6',
-    'f3230fae86d7eb223157744c2a5e8a508d880c7a279a8a6e353f70fa49c7eac1',
-    'f39b35b121dcf764096ffd34bd9b4b0c18d44a1de116306e47ec1a2706929ff6',
-    'f3e2024aec4a6b931031fcc7c72b6ec2bf2584edc77ba008b5b26b101c5ef96c',
-    'f4410e2618b335b93b3bb4a360918615626c8fdd83b251d2267a5dddc4d1d74b',
-    'f45e9d82ea0be7687eb7845869f4ddb1b422a4f6d159ec23003997a629831da8',
-    'f4645ab8fa1e35e5305703d26538d9d253862d32cbea73b5239057be04639020',
-    'f4bfe30f51b3bbf3d7c757c383a4d31b0771a317c8605f9823e936cfb1619816',
-    'f5078cbc450d50183b66182a93d3820ae24f35a5f4e59d456e6199c19f8f0795',
-    'f50bf354b524b2cd85d65ac988fd0fb8443d1d0599919306005b59552253e461',
-    'f51c26ee4acf1e3ada0d3d8a576ad198964f76427829eaf4476df02b4a056f44',
-    'f520bc30e7229fb179826f8059fc948c61bca37cb5a0ee9e35c9eacb0f2cb498',
-    'f55292aa21f97e74892ca14717848cb659a7803ecc3657546c8dbd1797a2e3c6',
-    'f55bb21ef8127fd15ce278ec832ad54e0a5d9408a00e7e8262432ad82d26bc40',
-    'f566862f3454772fd809d29f3b6752fa032b5d959357ae4aa46e0a4b79729f15',
-    'f57f5abae22997fe89be07a5456865f4d1672c8d7aa64882eb6ad0e905f2344e',
-    'f5c0f1e3184421ef88a1271de0b66ed7b5b327ab33ab9144671a81b309885594',
-    'f5c2b8f6923c76221826ac1a687b32a08c6728c4d8e4081bdad4e209a822d11a',
-    'f5dab7d7efaaed9643764eefff212ccc61407783c890ddb92d4e8408662e3014',
-    'f60a2ff7666dc714a82e1dad233bcf0a8b1ad48c3ddf9347ca5df93d4f0bb95a',
-    'f62b76d26968e3fd30f7f72fa393b9a9e94ef8358198185e5a9159a2d463913b',
-    'f637e1d271a5728aaa4a22b335d208e3e18303ed3c484831374e7dc51f871f53',
-    'f65c3d46842d8cdeab50bc06ed2c6022d8534e427526507764b189c59f27a2f3',
-    'f67147263ecc3d17d7502b5889b724ea41af169e04698f4983bf936538f1c8c2',
-    'f6832d9de42fcdbe37cca94e450096ac657b4086fe6f1d902ffbc49b434faab9',
-    'f691c1b03d46e5a3aa185512d7cc80a935e867c49fc3661cb2ca453c66174138',
-    'f694257d9fd741a20a748ee147cb7795243ac6bc51a871ec970d0c42ca27fa75',
-    'f6c044ead3a9b035142597b4da41ff9c5f8581d6c1dc98db6b8a7786639d5c10',
-    'f727467d4b776bfc13a1f0c4963dc86f35f66d8f54d8e4d1ab9c2033346be086',
-    'f76bc245f1c93b3a907d35a4fa0aa17b5df67583834850bac5be3862f9a839a9',
-    'f77a2e72bc73590699c0b376e8a74b731609c77d978a76a0be5baee83c7937cf',
-    'f82f3c4de9f8756178c09d1e0f12ad9f89d2cd3a402b7be3f2b9d291af09451c',
-    'f83da6f821075c8e0deef17f70772d24fe8753778046f71465e3992ffd8f1aca',
-    'f84f022ef64ff41c4b229bc30b433d571bf80feaa2f0050226d5b8f6ada4259a',
-    'f8688bb47318474ce498e07f1daeaef03b1a85433ede167a22bf8b5b1d74bca3',
-    'f86c13bf26a6d0599b4ef2ea15cc2cbf8633b969d81932911911d9c7b5d003a0',
-    'f88ea5cfe950b12b3e29ead5501c7a4fd01c1ed0a1de38f268a7e86ac0dc7a9d',
-    'f89002b8d2c96e266d397802e9adbd976fa25065ba61be7a1e947f5400a9304a',
-    'f8ae15a2d91281835177e26d7d65afa5b7961bc0798a982155de58298ac40258',
-    'f8ea08a28a9b570e8ae04f063140e49c1df9f88007ddf09f295ef7d91c693a24',
-    'f984a447c25ee0635cce506a4480ea2add9f4c7537ba8dfa41cc8b769abab68d',
-    'f98865158c4a332c010c02b5b9bc098cd04bef96fcc7b92b8b4674434eac518b',
-    'f9bf2b70e732df31ef64951ea8e67699da10202a7a6f2592a1836d89f8186192',
-    'f9d23f969f82f2f68a45968e1043228f6260fce8efa784a0591a3423ef17ebdb',
-    'f9de6db7a90cefab93a5d4fce9ecf16896d5ef176265a3274787568152b2f57b',
-    'f9eb5e906735d158d075bf3c9495260c1ff66b00cc2e7c492ff9fba53773439d',
-    'f9f19ac15629ad8a04bf57d636d9e0955407ad53775b4875a8b5ad82443511fc',
-    'f9f30ab2513e97bfd2be8b19631a069822704e7964df60a25075557e02ebc8f1',
-    'f9fee6b008cfa167242142ab2e891e16789921eee0bf07645134bf073c7795cd',
-    'fa5617f7c33f9ef334b788fb31759a068f933f6a951f7a1f0454b9a51e0752f4',
-    'fa6d2cb27b5ad4e46ffbd59eeb22d19ed2eed8f6c76af021b867f314a69c37a3',
-    'fad5f7202ccf9b7c56fd754881001563c04218ecd23283c779d22270e52944f3',
-    'fad896e2870b24a515bdb18465228dc96b612fa98825dd512c51ec8c944fe907',
-    'fb110b152d4c4111a13ee125280869605ca189fc20f429193a2739986feb6a2a',
-    'fb2198eaa958a1b31a268cb43d4368ea65b590b747d51386a248da8ed15d4d30',
-    'fb3b852795b7993b837e881b39f45778ee02d7819f48c775ea6a528b3ad7ec51',
-    'fba0c61926b1905dc73963094e6cf8d51f968d5f797f0251e3f3054714268347',
-    'fbe94d709eb7832a510dd72b517c871e782f5f94ea76f0e48ea43c7c58cf8712',
-    'fbfe03fb931fb54696e830d6f4f3768fb5c5abc3b680751bd93cbf0349e50f55',
-    'fc1181880f12dd8ab670ac29d5a21a15fb5cde4b93847463890c43be902b459f',
-    'fc4bd705d69b84604bb866e54d10d2167de0bac713f0af9df3c1e9c58ac3eb61',
-    'fc6249a55f4c15596cc118156cad9497b2305dbdf497f4f45a93e5cc306caf74',
-    'fc7f2565633d93ef5d9244e47496e3abbb2c96b7491cdeb95265d6cf038676fd',
-    'fcb4334f182c31a10605cc8eb55c46660ecd0f00a38c385e08ce0d1fe5eec727',
-    'fcba05549e5178a2eed562a8d02cc633e09f14488cadd65ca536c515eb8c4e33',
-    'fd1058a1b1c50288dea503a5e75b5684fc31c2476daed11356e3b143b7cb055c',
-    'fd153bab426af4dba6c77dc15bbc450e7a03521ebc15fcbe5bcb171823fbc9d7',
-    'fd387b69edfb5c84fba7417eade2cf67223fc6c97bb27865cd9961982ab395e7',
-    'fd57248d6f883e35b2bd71221b55938c18fad615dcd30e2402ae81dc62d4efa7',
-    'fdcb5a20053f8daf0934117c5d469e0ba0a9b1be612698cff587f8f83aed51e6',
-    'fdd05ee8ecd366c8740c1b73c5b22343dd42f41b71309b2f9db07b2e74d18db4',
-    'fdfcab222d749674b4927c0f2a92a63eca988e91db3dd635e9360b902f77453f',
-    'fe224ab9fca727f0d4c01f7a18f49b87a575d1fe27fe158584d6c0961d2c6d97',
-    'fe3f9a932d41a4096b1becaa3a683ae5b7d0223a91fb1cd10eacd4d45f55cfbc',
-    'fe3fa0469af7abe513d06508faba444cf1411da92bc92a5288523aff138aa56a',
-    'fe5fe49d9254f6d5cde8ab1c5eaff0502f143f504dfafe66e07da41f9bf25356',
-    'fe60c2b4b77200e8710bce743b981071b02e7aebe6faf8d26cb79e88c74f08f1',
-    'fe6ceaba809ac87af99f79313ae3f84a1b8f24407182619db56c6f9c4971ba1a',
-    'fe83feb8157bc714ec0ca61f8da1a89d2e86686349d363063d95030d080b4236',
-    'fe8794bd3d9dce26b4f80b5515868247543d10ba08357bb2ec574cd3f2ea5760',
-    'fe994a50a065365dc9ba022a86e4ad433d5cea48508c01c287d1ad6546682f33',
-    'fec914a2464667379f7cac8927fac50561af21896d78ddffbfefd1e38ffde966',
-    'fefb0eed100ec1f8781e04858eba5142e10dea45a0c74fdbf7a4b4b55b21f6dc',
-    'ff0eb34972165b4dc48180c9ae6c22a7117e8a0a9353f26220f4d5fa07cc07d2',
-    'ff136298b3081cf483e6bd9f63c382afba788dbfe71f3f0d55e5b64628bbb3d1',
-    'ff5392a7e1e026f34a5f46398efba750dede6f709c6c4f60259e6ae4001d964a',
-    'ff6f45820352a83e971cf2c397716f598e8cc8582a7810664d695301262c38d7',
-    'ffec52150d8a04edc3b0e1de10d508fb532f6bef178f1429b9ca79ccb85592a9',
-])
-
 def get_arguments():
     parser = argparse.ArgumentParser(description='Find circles.')
+    # Manifest of image paths to process, one per line
     parser.add_argument('--files', type=str, default="files.txt")
-    parser.add_argument('--circles_directory', type=str, default="circles")
+    parser.add_argument('--blacklist', type=str, default="data/circles_blacklist.txt")
+    # Append-only log of per-image results; used to resume after a crash
+    parser.add_argument('--results', type=str, default="circles.log")
+    parser.add_argument('--output', type=str, default="all_circles.pkl")
+    # Directory of per-image circle pickles from earlier runs to import
+    parser.add_argument('--circles_directory', type=str, default=None)
+    parser.add_argument('--processes', type=int, default=24)
+    parser.add_argument('--merge_interval', type=int, default=1000)
+    parser.add_argument('--retry_failed', action='store_true')
+    # Generate a synthetic corpus of this many images (written to
+    # --synthetic_directory and listed in --files) and process it
+    parser.add_argument('--synthetic', type=int, default=0)
+    parser.add_argument('--synthetic_directory', type=str, default="synthetic")
     return parser.parse_args()
 
-def find_circle(args):
-    # print args
-    fname, circles_directory = args
-    try:
-        tiff_output_file = fname + ".tiff"
-        if not os.path.exists(tiff_output_file):
-            image = cv2.imread(fname)
-            if image is None:
-                print "bad orig", fname
-        else:
+def load_image(fname):
+    tiff_output_file = fname + ".tiff"
+    if not os.path.exists(tiff_output_file):
+        image = cv2.imread(fname)
+        if image is None:
+            print "bad orig", fname
+    else:
+        image = cv2.imread(tiff_output_file)
+        if image is None:
+            print "bad tiff", tiff_output_file
+    if image is None:
+        print "cannot load", fname
+        return None
+    elif image.shape == (120, 160, 3) or image.shape == (171, 256, 3):
+        print "Generate tiff for small orig", fname
+        with Raw(filename=fname) as raw:
+            raw.save(filename=tiff_output_file)
             image = cv2.imread(tiff_output_file)
             if image is None:
-                print "bad tiff", tiff_output_file
-        if image is None:
-            print "cannot load", fname
-            return fname, False
-            print "Generate tiff from raw", fname
-            with Raw(filename=fname) as raw:
-                raw.save(filename=tiff_output_file)
-                image = cv2.imread(tiff_output_file)
-                if image is None:
-                    print fname, "failed to read image after tiff conversion"
-                    return False
-        elif image.shape == (120, 160, 3):
-            print "Generate tiff for small orig", fname
-            with Raw(filename=fname) as raw:
-                raw.save(filename=tiff_output_file)
-                image = cv2.imread(tiff_output_file)
-                if image is None:
+                print fname, "failed to read image after tiff conversion"
+    return image
 
-                    print fname, "failed to read image after tiff conversion"
-                    return False
-        elif image.shape == (171, 256, 3):
-            print "Generate tiff for small orig", fname
-            with Raw(filename=fname) as raw:
-                raw.save(filename=tiff_output_file)
-                image = cv2.imread(tiff_output_file)
-                if image is None:
-                    print fname, "failed to read image after tiff conversion"
-                    return False
-        circles = findCircles(fname, image, circles_directory)
+def find_circle(fname):
+    """Returns (key, circles, success) for the image at fname."""
+    key = os.path.basename(fname)
+    try:
+        image = load_image(fname)
+        if image is None:
+            return key, None, False
+        circles = detectCircles(fname, image)
         print "success", fname
-        return True
+        return key, circles, True
     except Exception as e:
         print "exception", fname
-    #     traceback.print_exc(limit=50)
-        return False
+        traceback.print_exc(limit=50)
+        return key, None, False
+
+def encode_entry(key, circles, success):
+    """Encode a result as a single log line: key, checksum, payload."""
+    payload = base64.b64encode(pickle.dumps((circles, success), 2))
+    checksum = "%08x" % (zlib.crc32(key + payload) & 0xffffffff)
+    return "%s\t%s\t%s\n" % (key, checksum, payload)
+
+def decode_entry(line):
+    """Decode a log line, returning None if it is truncated or corrupt."""
+    if not line.endswith("\n"):
+        return None
+    fields = line[:-1].split("\t")
+    if len(fields) != 3:
+        return None
+    key, checksum, payload = fields
+    if "%08x" % (zlib.crc32(key + payload) & 0xffffffff) != checksum:
+        return None
+    circles, success = pickle.loads(base64.b64decode(payload))
+    return key, circles, success
+
+def read_results(path):
+    """Read the results log into a dictionary of key -> (circles, success).
+    Later entries for a key replace earlier ones."""
+    results = {}
+    if not os.path.exists(path):
+        return results
+    for line in open(path, "rb"):
+        entry = decode_entry(line)
+        if entry is None:
+            print "Skipping corrupt entry in", path
+            continue
+        key, circles, success = entry
+        results[key] = circles, success
+    return results
+
+def open_results(path):
+    """Open the results log for appending, terminating any line left
+    partially written by a crash."""
+    f = open(path, "ab+")
+    f.seek(0, os.SEEK_END)
+    if f.tell() > 0:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != "\n":
+            f.write("\n")
+    return f
+
+def import_circles_directory(circles_directory, results, log):
+    for file_ in glob.glob(os.path.join(circles_directory, "*.pkl")):
+        key = os.path.splitext(os.path.basename(file_))[0]
+        if key not in results:
+            circles = pickle.load(open(file_))
+            results[key] = circles, True
+            log.write(encode_entry(key, circles, True))
+    log.flush()
+
+def write_merged(results, output):
+    merged = dict((key, circles) for key, (circles, success) in results.iteritems() if success)
+    tmp = output + ".tmp"
+    pickle.dump(merged, open(tmp, "wb"))
+    os.rename(tmp, output)
+
+def make_synthetic_corpus(directory, count):
+    """Write count synthetic eclipse images and return their paths."""
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    fnames = []
+    for i in range(count):
+        fname = os.path.join(directory, "%08d.jpg" % i)
+        if not os.path.exists(fname):
+            image = np.zeros((480, 640, 3), np.uint8)
+            center = (int(np.random.randint(150, 490)), int(np.random.randint(150, 330)))
+            cv2.circle(image, center, int(np.random.randint(30, 120)), (255, 255, 255), -1)
+            cv2.imwrite(fname, image)
+        fnames.append(fname)
+    return fnames
 
 def main():
     args  = get_arguments()
-    g = glob.glob(os.path.join(args.circles_directory, "*.pkl"))
-    r = {}
-    for file_ in g:
-        key = os.path.splitext(os.path.basename(file_))[0]
-        r[key] = pickle.load(open(file_))
-    pickle.dump(r, open("all_circles.pkl", "wb"))
+
+    if args.synthetic:
+        fnames = make_synthetic_corpus(args.synthetic_directory, args.synthetic)
+        open(args.files, "wb").write("".join(fname + "\n" for fname in fnames))
+
+    blacklist = set()
+    if os.path.exists(args.blacklist):
+        blacklist = set(line.strip() for line in open(args.blacklist))
+    fnames = [line.strip() for line in open(args.files) if line.strip()]
+
+    results = read_results(args.results)
+    log = open_results(args.results)
+    if args.circles_directory is not None:
+        import_circles_directory(args.circles_directory, results, log)
+
+    todo = []
+    for fname in fnames:
+        key = os.path.basename(fname)
+        if key in blacklist:
+            continue
+        if key in results and (results[key][1] or not args.retry_failed):
+            continue
+        todo.append(fname)
+    print "Processing", len(todo), "of", len(fnames), "images,", len(results), "already done"
+
+    start = time.time()
+    p = Pool(args.processes)
+    for i, (key, circles, success) in enumerate(p.imap_unordered(find_circle, todo, chunksize=16)):
+        log.write(encode_entry(key, circles, success))
+        log.flush()
+        results[key] = circles, success
+        if (i + 1) % args.merge_interval == 0:
+            write_merged(results, args.output)
+            print "Processed %d images, %.1f images/s" % (i + 1, (i + 1) / (time.time() - start))
+    p.terminate()
+    log.close()
+
+    write_merged(results, args.output)
+    elapsed = time.time() - start
+    print "Processed %d images in %.2fs (%.1f images/s)" % (len(todo), elapsed, len(todo) / max(elapsed, 1e-9))
+
 if __name__ == '__main__':
     main()
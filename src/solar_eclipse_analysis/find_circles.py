@@ -30,6 +30,14 @@ def findCircles(fname, image, circles_directory):
     if os.path.exists(f):
         circles = pickle.load(open(f, "rb"))
         return circles
+    circles = detectCircles(fname, image)
+    pickle.dump(circles, open(f, "wb"))
+    if circles is None or not len(circles):
+        return None
+    return circles
+
+def detectCircles(fname, image):
+    """Run the Hough circle detector on image, without any caching."""
     image_cols, image_rows, _ = image.shape
 
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -44,7 +52,4 @@ def findCircles(fname, image, circles_directory):
     print "start hough", fname
     circles = cv2.HoughCircles(gray, cv2.cv.CV_HOUGH_GRADIENT, dp, image_cols / 8, param1=c1, param2=c2)
     print "finish hough", fname
-    pickle.dump(circles, open(f, "wb"))
-    if circles is None or not len(circles):
-        return None
     return circles
@@ -0,0 +1,153 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ordered frame lists for encoding rendered movie frames with ffmpeg.
+
+render_movie.py numbers frames by umbra polygon, so the numbers have
+gaps, which ffmpeg's image2 demuxer doesn't accept.  Instead of copying
+every frame to a contiguous number, the frames are listed in an ffconcat
+manifest, which ffmpeg reads directly with -f concat, or linked to
+contiguous numbers.
+
+Run as a script to compare the encode step using copies, links and a
+manifest:
+
+  python frame_manifest.py --output_directory movie --encode_output /tmp/test.mkv
+"""
+
+import argparse
+import glob
+import os
+import resource
+import shlex
+import shutil
+import subprocess
+import tempfile
+import time
+
+MANIFEST_FNAME = 'frames.ffconcat'
+MODES = ['manifest', 'symlink', 'hardlink', 'copy']
+
+def frame_fpaths(directory):
+    """Returns the rendered frames in directory, in order."""
+    return sorted(glob.glob(os.path.join(directory, "[0-9]*.png")))
+
+def write_ffconcat(fpath, fpaths, framerate=25):
+    """Writes an ffconcat manifest which shows each frame in fpaths for one
+    frame at framerate."""
+    duration = 1. / framerate
+    tmp_fpath = fpath + '.tmp'
+    with open(tmp_fpath, 'w') as f:
+        f.write('ffconcat version 1.0\n')
+        for frame_fpath in fpaths:
+            f.write("file '%s'\n" % os.path.abspath(frame_fpath).replace("'", "'\\''"))
+            f.write('duration %.6f\n' % duration)
+        if fpaths:
+            # The concat demuxer ignores the duration of the last entry
+            # unless it is followed by another file
+            f.write("file '%s'\n" % os.path.abspath(fpaths[-1]).replace("'", "'\\''"))
+    os.rename(tmp_fpath, fpath)
+
+def link_frames(fpaths, directory, mode='symlink'):
+    """Makes fpaths available as directory/%05d.png, numbered contiguously,
+    by symlinking, hardlinking or copying them."""
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    for i, source in enumerate(fpaths):
+        dest = os.path.join(directory, "%05d.png" % i)
+        if os.path.lexists(dest):
+            os.remove(dest)
+        if mode == 'symlink':
+            os.symlink(os.path.abspath(source), dest)
+        elif mode == 'hardlink':
+            os.link(source, dest)
+        elif mode == 'copy':
+            shutil.copyfile(source, dest)
+        else:
+            raise ValueError("Unknown mode %s" % mode)
+
+def encode_input_args(mode, output_directory, renumber_directory):
+    """Returns the ffmpeg input arguments for frames prepared with mode."""
+    if mode == 'manifest':
+        return ['-f', 'concat', '-safe', '0',
+                '-i', os.path.join(output_directory, MANIFEST_FNAME)]
+    return ['-i', os.path.join(renumber_directory, "%05d.png")]
+
+def disk_usage(directory):
+    """Returns the bytes the files in directory add to the disk: symlinks
+    count their own size and hardlinks to frames elsewhere count nothing."""
+    total = 0
+    for fname in os.listdir(directory):
+        st = os.lstat(os.path.join(directory, fname))
+        if st.st_nlink == 1:
+            total += st.st_blocks * 512
+    return total
+
+def measure(fn):
+    """Returns (result of fn(), wall seconds, blocks read, blocks written),
+    where the block counts cover this process and its children."""
+    def blocks():
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return own.ru_inblock + children.ru_inblock, own.ru_oublock + children.ru_oublock
+    start_in, start_out = blocks()
+    start = time.time()
+    result = fn()
+    elapsed = time.time() - start
+    end_in, end_out = blocks()
+    return result, elapsed, end_in - start_in, end_out - start_out
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark preparing and encoding movie frames')
+    parser.add_argument('--output_directory', type=str, default='movie')
+    parser.add_argument('--encode_output', type=str, default='benchmark.mkv')
+    parser.add_argument('--ffmpeg', type=str, default='ffmpeg')
+    parser.add_argument('--ffmpeg_args', type=str, default='-filter:v setpts=0.5*PTS')
+    parser.add_argument('--framerate', type=int, default=25)
+    parser.add_argument('--modes', type=str, nargs='*', default=MODES, choices=MODES)
+    return parser.parse_args()
+
+def main():
+    args = get_arguments()
+    fpaths = frame_fpaths(args.output_directory)
+    print "Encoding %d frames from %s" % (len(fpaths), args.output_directory)
+    for mode in args.modes:
+        renumber_directory = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(args.encode_output)))
+        try:
+            if mode == 'manifest':
+                prepare = lambda: write_ffconcat(os.path.join(args.output_directory, MANIFEST_FNAME),
+                                                 fpaths, args.framerate)
+            else:
+                prepare = lambda: link_frames(fpaths, renumber_directory, mode)
+            _, prepare_time, prepare_in, prepare_out = measure(prepare)
+            prepare_disk = disk_usage(renumber_directory)
+
+            command = [args.ffmpeg, '-loglevel', 'error']
+            command.extend(encode_input_args(mode, args.output_directory, renumber_directory))
+            command.extend(shlex.split(args.ffmpeg_args))
+            command.extend(['-y', args.encode_output])
+            status, encode_time, encode_in, encode_out = measure(lambda: subprocess.call(command))
+            if status != 0:
+                print "%-8s ffmpeg failed with status %d" % (mode, status)
+                continue
+            print "%-8s prepare %7.2fs %8d bytes on disk %8d/%-8d blocks in/out, " \
+                  "encode %7.2fs %8d/%-8d blocks in/out, total %7.2fs" % (
+                      mode, prepare_time, prepare_disk, prepare_in, prepare_out,
+                      encode_time, encode_in, encode_out, prepare_time + encode_time)
+        finally:
+            shutil.rmtree(renumber_directory)
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+import json
+import hashlib
 import traceback
 import tempfile
 import StringIO
@@ -34,6 +37,7 @@ from matplotlib.patches import Polygon, Circle
 from functools import partial
 from map_util import points_to_latlong
 from shapely.geometry import Polygon, Point, LineString
+import columnar
 
 def get_arguments():
     parser = argparse.ArgumentParser(description='Map image data.')
@@ -43,6 +47,13 @@ def get_arguments():
     parser.add_argument('--directory', type=str, default="map")
     parser.add_argument('--data_directory', type=str, default="data")
     parser.add_argument('--movie_stats', type=str, default="movie_stats.txt")
+    # 'raster' draws with OpenCV on a precomputed projection, 'basemap'
+    # draws each map with matplotlib
+    parser.add_argument('--renderer', type=str, default="raster", choices=['raster', 'basemap'])
+    parser.add_argument('--processes', type=int, default=64)
+    # Render this many frames with both renderers and compare them,
+    # instead of writing output
+    parser.add_argument('--benchmark', type=int, default=0)
 
     return parser.parse_args()
 
@@ -127,10 +138,224 @@ def render_map(directory, data_directory, input_):
         comp = Image.alpha_composite(im1, im2_tx)
         fname = os.path.join(directory, "map.%05d.png" % i)
         comp.save(fname)
+        return True
 
     except Exception as e:
         print "exception in render_map on", i
         traceback.print_exc(limit=50)
+        return False
+
+# Map figure settings shared by both renderers
+DPI = 300
+MAP_WIDTH = 321
+MAP_HEIGHT = 204
+# Offset of the marker layer over the base map, in pixels (see the
+# affine transform in render_map)
+MARKER_SHIFT_X = -7
+MARKER_SHIFT_Y = 7
+# Size of the umbra outline in pixels: 0.2pt lines with 0.5pt '.'
+# markers.  matplotlib draws '.' as a circle of half the marker size,
+# stroked with the default 1pt marker edge.
+LINE_WIDTH = 0.2 * DPI / 72.
+MARKER_RADIUS = (0.5 * 0.5 / 2. + 1.0 / 2.) * DPI / 72.
+# Fixed point bits for sub-pixel OpenCV drawing
+SHIFT = 4
+
+class MapRaster(object):
+    """Renders map insets directly into a raster.
+
+    The Basemap projection and the figure transform are built once, with
+    the same figure setup as render_map, so lon/lat can be converted
+    straight to pixels.  The base map and pin are loaded once."""
+    def __init__(self, data_directory):
+        fig = plt.figure(dpi=DPI, figsize=(MAP_WIDTH / float(DPI), MAP_HEIGHT / float(DPI)))
+        self.map = Basemap(
+            llcrnrlon=-119.5, llcrnrlat=24.5,
+            urcrnrlon=-66, urcrnrlat=47,
+            projection='lcc',
+            lat_1=33, lat_2=45,
+            lat_0=39.828, lon_0=-98.579)
+        self.map.drawmapboundary(color='none')
+        ax = fig.gca()
+        fig.subplots_adjust(bottom=0, left=0, right=1, top=1, wspace=0, hspace=0)
+        plt.tight_layout(pad=0.0, w_pad=0.0, h_pad=0)
+        self.map.set_axes_limits(ax=ax)
+        fig.canvas.draw()
+        self.transform = ax.transData.frozen()
+        self.figure_height = fig.bbox.height
+        plt.close(fig)
+
+        self.base = cv2.imread(os.path.join(data_directory, "Grey_map_withline.png"), cv2.IMREAD_UNCHANGED)
+        self.pin = cv2.imread(os.path.join(data_directory, "Map_pin.png"), cv2.IMREAD_UNCHANGED)
+
+    def to_pixels(self, lons, lats):
+        """Convert lon/lat arrays to (x, y) coordinates in the map image,
+        measured from its top left corner in pixels and including the
+        marker layer offset."""
+        x, y = self.map(np.asarray(lons), np.asarray(lats))
+        display = self.transform.transform(np.column_stack([x, y]))
+        # These are pixel edge coordinates, and OpenCV draws in pixel
+        # center coordinates, but Agg snaps the umbra markers to pixel
+        # centers.  Compared with render_map, drawing the umbra at these
+        # coordinates unchanged matches best.
+        px = display[:, 0] + MARKER_SHIFT_X
+        py = self.figure_height - display[:, 1] + MARKER_SHIFT_Y
+        return np.column_stack([px, py])
+
+    def sample_pin(self, x0, x1, y0, y1):
+        """Resample the pin to the extent with pixel edges x0..x1, y0..y1
+        (fractional), taking the nearest pin pixel to each image pixel
+        center, as matplotlib's imshow does.  Returns the pin and the
+        image (row, column) of its top left pixel."""
+        columns = np.arange(int(np.floor(x0)), int(np.ceil(x1)))
+        rows = np.arange(int(np.floor(y0)), int(np.ceil(y1)))
+        u = np.floor((columns + 0.5 - x0) / (x1 - x0) * self.pin.shape[1]).astype(int)
+        v = np.floor((rows + 0.5 - y0) / (y1 - y0) * self.pin.shape[0]).astype(int)
+        columns_inside = (u >= 0) & (u < self.pin.shape[1])
+        rows_inside = (v >= 0) & (v < self.pin.shape[0])
+        if not columns_inside.any() or not rows_inside.any():
+            return None, None
+        pin = self.pin[v[rows_inside]][:, u[columns_inside]]
+        return pin, (rows[rows_inside][0], columns[columns_inside][0])
+
+    def draw_pin(self, image, photo_lon, photo_lat):
+        x_size, y_size = 1.3, 1.3*1.78
+        corners = self.to_pixels([photo_lon - x_size/2., photo_lon + x_size/2.],
+                                 [photo_lat - y_size/2., photo_lat + y_size/2.])
+        # The lower left corner of the extent is the bottom of the pin
+        x0, x1 = corners[0, 0], corners[1, 0]
+        y0, y1 = corners[1, 1], corners[0, 1]
+        if x1 <= x0 or y1 <= y0:
+            return
+        pin, corner = self.sample_pin(x0, x1, y0, y1)
+        if pin is not None:
+            alpha_over(image, pin, *corner)
+
+    def draw_umbra(self, image, poly):
+        lons, lats, colors = points_to_latlong(poly.boundary.coords)
+        points = np.round(self.to_pixels(lons, lats) * (1 << SHIFT)).astype(np.int32)
+        color = (0, 0, 0, 255)
+        cv2.polylines(image, [points], False, color, max(1, int(round(LINE_WIDTH))), cv2.LINE_AA, SHIFT)
+        radius = int(round(MARKER_RADIUS * (1 << SHIFT)))
+        for point in points:
+            cv2.circle(image, (int(point[0]), int(point[1])), radius, color, -1, cv2.LINE_AA, SHIFT)
+
+    def render(self, poly, movie_frame):
+        image = self.base.copy()
+        # The pin goes over the umbra outline, as with the zorders in
+        # render_map
+        self.draw_umbra(image, poly)
+        if movie_frame is not None:
+            self.draw_pin(image, movie_frame[2], movie_frame[1])
+        return image
+
+def alpha_over(image, overlay, y, x):
+    """Composite the BGRA overlay over the BGRA image at (y, x), in place,
+    clipped to the image."""
+    h, w = overlay.shape[:2]
+    y0, x0 = max(y, 0), max(x, 0)
+    y1, x1 = min(y + h, image.shape[0]), min(x + w, image.shape[1])
+    if y0 >= y1 or x0 >= x1:
+        return
+    src = overlay[y0-y:y1-y, x0-x:x1-x].astype(np.float32) / 255.
+    dst = image[y0:y1, x0:x1].astype(np.float32) / 255.
+    src_a = src[:, :, 3:]
+    dst_a = dst[:, :, 3:]
+    out_a = src_a + dst_a * (1 - src_a)
+    out = (src[:, :, :3] * src_a + dst[:, :, :3] * dst_a * (1 - src_a)) / np.maximum(out_a, 1e-6)
+    image[y0:y1, x0:x1, :3] = np.round(out * 255)
+    image[y0:y1, x0:x1, 3:] = np.round(out_a * 255)
+
+# Per-process raster renderer, built once by the Pool initializer.
+_raster = None
+
+def _init_worker(data_directory):
+    global _raster
+    _raster = MapRaster(data_directory)
+
+def render_map_raster(directory, data_directory, input_):
+    try:
+        i = input_['i']
+        if _raster is None:
+            _init_worker(data_directory)
+        image = _raster.render(input_['poly'], input_['movie_frame'])
+        fname = os.path.join(directory, "map.%05d.png" % i)
+        return cv2.imwrite(fname, image)
+
+    except Exception as e:
+        print "exception in render_map_raster on", i
+        traceback.print_exc(limit=50)
+        return False
+
+def renderer_pool(renderer, processes, data_directory):
+    """Returns a Pool for the renderer; only the raster renderer has
+    per-process state to set up."""
+    if renderer == 'raster':
+        return Pool(processes, initializer=_init_worker, initargs=(data_directory,))
+    return Pool(processes)
+
+RENDERERS = {
+    'basemap': render_map,
+    'raster': render_map_raster,
+}
+# Bump when a renderer's output changes, to invalidate the manifest
+RENDERER_VERSION = 2
+MANIFEST = "map_manifest.json"
+
+def data_digest(data_directory):
+    h = hashlib.sha1()
+    for fname in ("Grey_map_withline.png", "Map_pin.png"):
+        h.update(open(os.path.join(data_directory, fname), "rb").read())
+    return h.hexdigest()
+
+def input_digest(renderer, data_hash, input_):
+    """Hash of everything which determines the map image for a frame."""
+    h = hashlib.sha1()
+    h.update("%s %d %s" % (renderer, RENDERER_VERSION, data_hash))
+    h.update(input_['poly'].wkb)
+    h.update(repr(input_['movie_frame']))
+    return h.hexdigest()
+
+def load_manifest(directory):
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    return json.load(open(path))
+
+def save_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, sort_keys=True)
+    os.rename(path + ".tmp", path)
+
+def compare_maps(directory, reference_directory, indexes):
+    """Return the mean and max absolute pixel difference between the map
+    images in two directories."""
+    total = 0.
+    worst = 0
+    for i in indexes:
+        fname = "map.%05d.png" % i
+        a = cv2.imread(os.path.join(directory, fname), cv2.IMREAD_UNCHANGED).astype(np.int16)
+        b = cv2.imread(os.path.join(reference_directory, fname), cv2.IMREAD_UNCHANGED).astype(np.int16)
+        diff = np.abs(a - b)
+        total += diff.mean()
+        worst = max(worst, diff.max())
+    return total / max(len(indexes), 1), worst
+
+def benchmark(inputs, data_directory, processes):
+    """Render inputs with both renderers, and report the time taken and
+    the pixel differences."""
+    directories = {}
+    for renderer in 'basemap', 'raster':
+        directories[renderer] = tempfile.mkdtemp()
+        p = renderer_pool(renderer, processes, data_directory)
+        start = time.time()
+        p.map(partial(RENDERERS[renderer], directories[renderer], data_directory), inputs)
+        elapsed = time.time() - start
+        p.terminate()
+        print "%s: %d frames in %.2fs (%.2f frames/s)" % (renderer, len(inputs), elapsed, len(inputs) / elapsed)
+    mean, worst = compare_maps(directories['raster'], directories['basemap'], [input_['i'] for input_ in inputs])
+    print "raster vs basemap: mean abs difference %.3f, max %d" % (mean, worst)
 
 def main():
     args  = get_arguments()
@@ -139,14 +364,7 @@ def main():
     lines = [line.strip().split() for line in lines]
     movie_frames = dict([ (int(line[0]), (line[1], float(line[2]), float(line[3]))) for line in lines])
 
-    polys = pickle.load(open(args.umbra_polys))
-    r = pickle.load(open(args.input))
-    for i, fname in enumerate(r):
-        d = r[fname]
-        lat = d['lat']
-        lon = -d['lon']
-        dt = d['image_datetime']
-        point = Point(lon, lat)
+    polys = columnar.load_umbra_polys(args.umbra_polys)
 
     inputs = []
     path = load_path(args.eclipse_path_data)
@@ -168,11 +386,34 @@ def main():
     # Pre-render map images
     if args.directory is None:
         print "Must set directory for map output via --directory"
+    elif args.benchmark:
+        benchmark(inputs[:args.benchmark], args.data_directory, args.processes)
     else:
         # render_map(args.directory, args.data_directory, inputs[13])
-        p = Pool(64)
-        r = partial(render_map, args.directory, args.data_directory)
-        p.map(r, inputs)
+        manifest = load_manifest(args.directory)
+        data_hash = data_digest(args.data_directory)
+        digests = {}
+        todo = []
+        for input_ in inputs:
+            key = str(input_['i'])
+            digests[key] = input_digest(args.renderer, data_hash, input_)
+            fname = os.path.join(args.directory, "map.%05d.png" % input_['i'])
+            if manifest.get(key) != digests[key] or not os.path.exists(fname):
+                todo.append(input_)
+        print "Rendering %d of %d maps" % (len(todo), len(inputs))
+        start = time.time()
+        p = renderer_pool(args.renderer, args.processes, args.data_directory)
+        r = partial(RENDERERS[args.renderer], args.directory, args.data_directory)
+        results = p.map(r, todo)
+        p.terminate()
+        print "Rendered %d maps in %.2fs" % (len(todo), time.time() - start)
+        for input_, result in zip(todo, results):
+            key = str(input_['i'])
+            if result:
+                manifest[key] = digests[key]
+            else:
+                manifest.pop(key, None)
+        save_manifest(args.directory, manifest)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,223 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs the make_movie.sh stages through pipeline_runner, skipping stages
+whose inputs haven't changed and running independent stages concurrently.
+
+Paths default to the conf.sh environment variables described in README.md.
+"""
+
+import argparse
+import os
+import shlex
+import frame_manifest
+from pipeline_runner import Stage, Pipeline, FAILED, BLOCKED
+
+def get_arguments():
+    env = os.environ.get
+    parser = argparse.ArgumentParser(description='Run the movie pipeline incrementally')
+    parser.add_argument('--project_id', type=str, default=env('PROJECT_ID'))
+    parser.add_argument('--image_bucket', type=str, default=env('IMAGE_BUCKET', 'megamovie'))
+    parser.add_argument('--photo_table', type=str, default=env('PHOTO_TABLE', 'Photo'))
+    parser.add_argument('--output', type=str, default=env('OUTPUT', 'output'))
+    parser.add_argument('--image_dir', type=str, default=env('IMAGE_DIR'))
+    parser.add_argument('--map_dir', type=str, default=env('MAP_DIR'))
+    parser.add_argument('--rescaled_dir', type=str, default=env('RESCALED_DIR'))
+    parser.add_argument('--circles_dir', type=str, default=env('CIRCLES_DIR'))
+    parser.add_argument('--classify_dir', type=str, default=env('CLASSIFY_DIR'))
+    parser.add_argument('--credits_dir', type=str, default=env('CREDITS_DIR'))
+    parser.add_argument('--movie_dir', type=str, default=env('MOVIE_DIR'))
+    parser.add_argument('--final_dir', type=str, default=env('FINAL_DIR'))
+    parser.add_argument('--selected_dir', type=str, default=env('SELECTED_DIR'))
+    parser.add_argument('--rescaled_format', type=str,
+                        default=env('RESCALED_FORMAT', 'png-fast'))
+    parser.add_argument('--video_settings', type=str,
+                        default=env('VIDEO_SETTINGS', '-c:v libx264 -preset slow -crf 8'))
+    parser.add_argument('--state', type=str, default=None,
+                        help="Pipeline state file, defaults to $OUTPUT/pipeline_state.json")
+    parser.add_argument('--log_directory', type=str, default=None)
+    parser.add_argument('--jobs', type=int, default=2)
+    parser.add_argument('--dry_run', action='store_true')
+    parser.add_argument('--force', type=str, nargs='*', default=[],
+                        help="Stages to run even if they are up to date")
+    parser.add_argument('--list', action='store_true', help="List the stages and exit")
+    args = parser.parse_args()
+    if args.project_id is None or args.image_dir is None:
+        parser.error("--project_id and --image_dir (or PROJECT_ID and IMAGE_DIR) are required")
+
+    # Directories default to subdirectories of OUTPUT, as in conf.sh
+    for name, subdirectory in (('map_dir', 'map'), ('rescaled_dir', 'rescaled'),
+                               ('circles_dir', 'circles'), ('classify_dir', 'classify'),
+                               ('credits_dir', 'credits'), ('movie_dir', 'movie'),
+                               ('final_dir', 'final'), ('selected_dir', 'selected')):
+        if getattr(args, name) is None:
+            setattr(args, name, os.path.join(args.output, subdirectory))
+    if args.state is None:
+        args.state = os.path.join(args.output, 'pipeline_state.json')
+    return args
+
+def movie_stages(args):
+    out = lambda fname: os.path.join(args.output, fname)
+    datastore = {'project_id': args.project_id, 'photo_table': args.photo_table,
+                 'image_bucket': args.image_bucket}
+    video_settings = shlex.split(args.video_settings)
+
+    return [
+        # Photos listed from IMAGE_DIR
+        Stage('list_files',
+              "find %s -type f | grep -v '\\.jpg' > %s" % (args.image_dir, out('files.txt')),
+              inputs=[args.image_dir], outputs=[out('files.txt')]),
+        Stage('extract_image_dimensions',
+              ['python', 'extract_image_dimensions.py',
+               '--files', out('files.txt'),
+               '--output', out('image_dims.pkl')],
+              inputs=[out('files.txt')], outputs=[out('image_dims.pkl')]),
+        Stage('umbra_prep',
+              ['python', 'umbra_prep.py',
+               '--umbra_output', out('umbra_polys.pkl'),
+               '--umbra_columns', out('umbra_polys')],
+              outputs=[out('umbra_polys.pkl'), out('umbra_polys')]),
+        # Reads the Photo table, which the digest can't see; use --force
+        # extract_metadata to pick up new photos
+        Stage('extract_metadata',
+              ['python', 'extract_metadata_from_datastore.py',
+               '--project_id', args.project_id,
+               '--image_bucket', args.image_bucket,
+               '--output', out('extracted_metadata.pkl'),
+               '--directory', args.image_dir,
+               '--photo_table', args.photo_table,
+               '--files', out('files.txt')],
+              inputs=[out('files.txt')], outputs=[out('extracted_metadata.pkl')],
+              params=datastore),
+        Stage('umbra_photo',
+              ['python', 'umbra_photo.py',
+               '--input', out('extracted_metadata.pkl'),
+               '--umbra_polys', out('umbra_polys.pkl'),
+               '--umbra_photos', out('umbra_photos.pkl')],
+              inputs=[out('extracted_metadata.pkl'), out('umbra_polys.pkl')],
+              outputs=[out('umbra_photos.pkl')]),
+        Stage('umbra_classifier',
+              ['python', 'umbra_classifier.py',
+               '--umbra_photos', out('umbra_photos.pkl'),
+               '--input', out('extracted_metadata.pkl'),
+               '--umbra_polys', out('umbra_polys.pkl'),
+               '--photo_selections', out('photo_selections.pkl'),
+               '--image_directory', args.image_dir,
+               '--selected_directory', args.selected_dir,
+               '--directory', args.classify_dir],
+              inputs=[out('umbra_photos.pkl'), out('extracted_metadata.pkl'),
+                      out('umbra_polys.pkl'), args.image_dir],
+              outputs=[out('photo_selections.pkl'), args.selected_dir, args.classify_dir]),
+        Stage('rescale',
+              ['python', 'rescale_photos.py',
+               '--metadata', out('extracted_metadata.pkl'),
+               '--directory', args.image_dir,
+               '--circles_directory', args.circles_dir,
+               '--rescaled_directory', args.rescaled_dir,
+               '--rescaled_format', args.rescaled_format,
+               '--photo_selections', out('photo_selections.pkl')],
+              inputs=[out('extracted_metadata.pkl'), out('photo_selections.pkl'),
+                      args.image_dir],
+              outputs=[args.circles_dir, args.rescaled_dir]),
+        Stage('choose_movie_frames',
+              ['python', 'choose_movie_frames.py',
+               '--metadata', out('extracted_metadata.pkl'),
+               '--directory', args.image_dir,
+               '--rescaled_directory', args.rescaled_dir,
+               '--photo_selections', out('photo_selections.pkl'),
+               '--movie_frame_choices', out('movie_frame_choices.pkl'),
+               '--movie_stats', out('movie_stats.txt'),
+               '--umbra_polys', out('umbra_polys.pkl'),
+               '--movie_blacklist', 'data/movie_blacklist.txt'],
+              inputs=[out('extracted_metadata.pkl'), args.rescaled_dir,
+                      out('photo_selections.pkl'), out('umbra_polys.pkl'),
+                      'data/movie_blacklist.txt'],
+              outputs=[out('movie_frame_choices.pkl'), out('movie_stats.txt')]),
+        Stage('generate_maps',
+              ['python', 'generate_maps.py',
+               '--input', out('extracted_metadata.pkl'),
+               '--directory', args.map_dir,
+               '--umbra_polys', out('umbra_polys.pkl'),
+               '--eclipse_path_data', 'data/eclipse_path_data.txt',
+               '--movie_stats', out('movie_stats.txt'),
+               '--data_directory', 'data'],
+              inputs=[out('extracted_metadata.pkl'), out('umbra_polys.pkl'),
+                      'data/eclipse_path_data.txt', out('movie_stats.txt')],
+              outputs=[args.map_dir]),
+        Stage('render_movie',
+              ['python', 'render_movie.py',
+               '--metadata', out('extracted_metadata.pkl'),
+               '--directory', args.image_dir,
+               '--output_directory', args.movie_dir,
+               '--rescaled_directory', args.rescaled_dir,
+               '--photo_selections', out('photo_selections.pkl'),
+               '--umbra_polys', out('umbra_polys.pkl'),
+               '--data_directory', 'data',
+               '--movie_stats', out('movie_stats.txt'),
+               '--map_directory', args.map_dir,
+               '--movie_blacklist', 'data/movie_blacklist.txt'],
+              inputs=[out('extracted_metadata.pkl'), args.rescaled_dir,
+                      out('photo_selections.pkl'), out('umbra_polys.pkl'),
+                      out('movie_stats.txt'), args.map_dir, 'data/movie_blacklist.txt'],
+              outputs=[args.movie_dir]),
+        # Encodes the frames listed in render_movie's ffconcat manifest
+        Stage('encode_movie',
+              ['ffmpeg', '-f', 'concat', '-safe', '0',
+               '-i', os.path.join(args.movie_dir, frame_manifest.MANIFEST_FNAME),
+               '-filter:v', 'setpts=0.5*PTS'] + video_settings +
+              ['-y', os.path.join(args.final_dir, 'megamovie.mkv')],
+              inputs=[args.movie_dir],
+              outputs=[os.path.join(args.final_dir, 'megamovie.mkv')]),
+        # Reads the Photo table, like extract_metadata
+        Stage('render_credits',
+              ['python', 'render_credits.py',
+               '--project_id', args.project_id,
+               '--photo_table', args.photo_table,
+               '--additional_credits', 'data/additional_credits.txt',
+               '--rename_credits', 'data/rename_credits.txt',
+               '--credits_directory', args.credits_dir],
+              inputs=['data/additional_credits.txt', 'data/rename_credits.txt'],
+              outputs=[args.credits_dir], params=datastore),
+        Stage('encode_credits',
+              ['ffmpeg', '-framerate', '1',
+               '-i', os.path.join(args.credits_dir, '%05d.png')] + video_settings +
+              ['-y', os.path.join(args.final_dir, 'credits.mkv')],
+              inputs=[args.credits_dir],
+              outputs=[os.path.join(args.final_dir, 'credits.mkv')]),
+    ]
+
+def main():
+    args = get_arguments()
+    if not os.path.exists(args.output):
+        os.makedirs(args.output)
+    pipeline = Pipeline(movie_stages(args), args.state, args.log_directory)
+
+    if args.list:
+        for name in pipeline.order:
+            print name, "after", ', '.join(sorted(pipeline.dependencies[name])) or "nothing"
+        return
+
+    results = pipeline.run(jobs=args.jobs, dry_run=args.dry_run, force=args.force)
+    timings = dict(pipeline.timings())
+    for name in pipeline.order:
+        if name in timings:
+            print "%-26s %-10s %10.2fs" % (name, results[name], timings[name])
+        else:
+            print "%-26s %-10s" % (name, results[name])
+    if any(result in (FAILED, BLOCKED) for result in results.values()):
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
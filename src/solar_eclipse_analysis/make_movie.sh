@@ -15,7 +15,8 @@ python extract_image_dimensions.py \
 # Prep- only needs to be done once
 # Convert the umbra shapefiles to pickle
 time python umbra_prep.py \
-    --umbra_output $OUTPUT/umbra_polys.pkl &&
+    --umbra_output $OUTPUT/umbra_polys.pkl \
+    --umbra_columns $OUTPUT/umbra_polys &&
 
 # Extract all the photo metadata to pickle
 time python extract_metadata_from_datastore.py \
@@ -43,11 +44,12 @@ time python umbra_classifier.py \
        --directory $CLASSIFY_DIR &&
 
 # Rescale all photos which are assigned to an umbra bin based on sun disk
-time python rescale_all_umbra_photos.py \
+time python rescale_photos.py \
        --metadata $OUTPUT/extracted_metadata.pkl \
        --directory $IMAGE_DIR \
        --circles_directory $CIRCLES_DIR \
        --rescaled_directory $RESCALED_DIR \
+       --rescaled_format ${RESCALED_FORMAT:-png-fast} \
        --photo_selections $OUTPUT/photo_selections.pkl &&
 
 # Pick photos for each movie frame
@@ -81,13 +83,14 @@ time python render_movie.py \
        --movie_stats $OUTPUT/movie_stats.txt \
        --map_directory $MAP_DIR &&
 
-# Renumber movie frames to be sequential in case there were gaps
-time python renumber_movie.py \
-       --output_directory $MOVIE_DIR \
-       --renumber_directory $MOVIE_RENUMBER_DIR &&
+# Alternatively, render_movie.py can stream the frames straight into
+# ffmpeg, skipping the per-frame PNGs:
+#   python render_movie.py ... --stream_output $FINAL_DIR/megamovie.mkv \
+#       --ffmpeg_args "-filter:v setpts=0.5*PTS $VIDEO_SETTINGS"
 
-# Render the movie
-time ffmpeg -i $MOVIE_RENUMBER_DIR/%05d.png -filter:v "setpts=0.5*PTS" $VIDEO_SETTINGS -y $FINAL_DIR/megamovie.mkv &&
+# Render the movie from the ordered frame manifest written by render_movie.py
+# (renumber_movie.py --mode copy recreates the old contiguous copies)
+time ffmpeg -f concat -safe 0 -i $MOVIE_DIR/frames.ffconcat -filter:v "setpts=0.5*PTS" $VIDEO_SETTINGS -y $FINAL_DIR/megamovie.mkv &&
 
 # Render the credit frames
 time python render_credits.py \
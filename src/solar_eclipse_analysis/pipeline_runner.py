@@ -0,0 +1,322 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental runner for pipelines of command line stages.
+
+Each stage declares the files and directories it reads and writes.  A
+stage depends on every stage which writes one of its inputs (or a
+directory containing one), and stages with no dependency between them
+run concurrently.  A stage is skipped when the digest of its command,
+parameters and inputs matches the one recorded in the state file the
+last time it succeeded, and all its outputs exist.
+
+Files are digested by content.  Directories, which can hold hundreds of
+thousands of photos, are digested by the name, size and modification
+time of each file they contain.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+import traceback
+import Queue
+
+# Stage results
+RAN = 'ran'
+SKIPPED = 'skipped'
+FAILED = 'failed'
+BLOCKED = 'blocked'
+WOULD_RUN = 'would run'
+
+
+class Stage(object):
+    """A command, with the artifacts it reads and writes.
+
+    Arguments:
+      name: unique name of the stage
+      cmd: list of arguments, or a string which is run by the shell
+      inputs: paths of the files and directories the command reads
+      outputs: paths of the files and directories the command writes
+      params: additional values which change the output, e.g. the
+        contents of a table the command queries
+      after: names of stages to run first, other than those inferred
+        from inputs and outputs
+    """
+
+    def __init__(self, name, cmd, inputs=(), outputs=(), params=None, after=()):
+        self.name = name
+        self.cmd = cmd
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params or {}
+        self.after = list(after)
+
+    def __repr__(self):
+        return 'Stage(%r)' % self.name
+
+
+def _is_under(path, directory):
+    path = os.path.normpath(path)
+    directory = os.path.normpath(directory)
+    return path == directory or path.startswith(directory + os.sep)
+
+
+def file_digest(fpath):
+    sha1 = hashlib.sha1()
+    with open(fpath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+
+def directory_digest(directory):
+    sha1 = hashlib.sha1()
+    for root, dirnames, fnames in os.walk(directory):
+        dirnames.sort()
+        for fname in sorted(fnames):
+            fpath = os.path.join(root, fname)
+            st = os.stat(fpath)
+            sha1.update('%s %d %d\n' % (os.path.relpath(fpath, directory),
+                                        st.st_size, int(st.st_mtime * 1e6)))
+    return sha1.hexdigest()
+
+
+def makedirs(path):
+    """Creates a directory and its parents, which concurrent stages may
+    also be creating."""
+    try:
+        os.makedirs(path)
+    except OSError, e:
+        if e.errno != errno.EEXIST:
+            raise
+
+def path_digest(path):
+    """Returns a digest of a file or directory, or None if it doesn't exist."""
+    if os.path.isdir(path):
+        return directory_digest(path)
+    if os.path.exists(path):
+        return file_digest(path)
+    return None
+
+
+class Pipeline(object):
+    """A set of stages, run in dependency order.
+
+    Arguments:
+      stages: list of Stage
+      state_fpath: JSON file recording the digest and timing of each
+        stage's last successful run
+      log_directory: if set, each stage's stdout and stderr are written to
+        <log_directory>/<name>.log instead of the console
+    """
+
+    def __init__(self, stages, state_fpath, log_directory=None):
+        self.stages = list(stages)
+        self.state_fpath = state_fpath
+        self.log_directory = log_directory
+        self.by_name = dict((stage.name, stage) for stage in self.stages)
+        if len(self.by_name) != len(self.stages):
+            raise ValueError("Stage names must be unique")
+        self.dependencies = self._dependencies()
+        self.order = self._topological_order()
+        self.state = self._load()
+        self.lock = threading.Lock()
+
+    def _dependencies(self):
+        dependencies = {}
+        for stage in self.stages:
+            deps = set()
+            for name in stage.after:
+                if name not in self.by_name:
+                    raise ValueError("Stage %s runs after unknown stage %s" % (stage.name, name))
+                deps.add(name)
+            for other in self.stages:
+                if other is stage:
+                    continue
+                if any(_is_under(path, output)
+                       for path in stage.inputs for output in other.outputs):
+                    deps.add(other.name)
+            dependencies[stage.name] = deps
+        return dependencies
+
+    def _topological_order(self):
+        order = []
+        visiting = set()
+        visited = set()
+
+        def visit(name, path):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError("Dependency cycle: %s" % ' -> '.join(path + [name]))
+            visiting.add(name)
+            for dep in sorted(self.dependencies[name]):
+                visit(dep, path + [name])
+            visiting.remove(name)
+            visited.add(name)
+            order.append(name)
+
+        for stage in self.stages:
+            visit(stage.name, [])
+        return order
+
+    def digest(self, stage):
+        """Returns the digest of a stage's command, parameters and inputs."""
+        sha1 = hashlib.sha1()
+        sha1.update(json.dumps([stage.cmd, stage.params], sort_keys=True))
+        for path in stage.inputs:
+            sha1.update('%s %s\n' % (path, path_digest(path)))
+        return sha1.hexdigest()
+
+    def is_up_to_date(self, stage, digest):
+        entry = self.state.get(stage.name)
+        return entry is not None and entry.get('digest') == digest and \
+            all(os.path.exists(output) for output in stage.outputs)
+
+    def run(self, jobs=1, dry_run=False, force=()):
+        """Runs the stages which are out of date, at most jobs at a time.
+
+        Arguments:
+          jobs: the number of stages to run concurrently
+          dry_run: only report which stages would run
+          force: names of stages to run even if they are up to date
+        Returns:
+          dict of stage name -> result (RAN, SKIPPED, FAILED, BLOCKED or
+          WOULD_RUN)
+        """
+        for name in force:
+            if name not in self.by_name:
+                raise ValueError("Unknown stage %s" % name)
+        if self.log_directory is not None and not dry_run:
+            makedirs(self.log_directory)
+        results = {}
+        pending = list(self.order)
+        running = set()
+        completions = Queue.Queue()
+
+        while pending or running:
+            progress = True
+            while progress:
+                progress = False
+                for name in list(pending):
+                    deps = self.dependencies[name]
+                    if any(results.get(dep) in (FAILED, BLOCKED) for dep in deps):
+                        pending.remove(name)
+                        results[name] = BLOCKED
+                        print "Stage %s blocked by a failed dependency" % name
+                        progress = True
+                        continue
+                    if len(running) >= jobs or not all(dep in results for dep in deps):
+                        continue
+                    pending.remove(name)
+                    progress = True
+                    stage = self.by_name[name]
+                    upstream_runs = any(results[dep] == WOULD_RUN for dep in deps)
+                    digest = None if upstream_runs else self.digest(stage)
+                    if name not in force and digest is not None and \
+                       self.is_up_to_date(stage, digest):
+                        results[name] = SKIPPED
+                        print "Stage %s is up to date" % name
+                    elif dry_run:
+                        results[name] = WOULD_RUN
+                        print "Stage %s would run: %s" % (name, self._describe(stage))
+                    else:
+                        running.add(name)
+                        thread = threading.Thread(target=self._run_stage,
+                                                  args=(stage, digest, completions))
+                        thread.daemon = True
+                        thread.start()
+
+            if running:
+                name, result = completions.get()
+                running.remove(name)
+                results[name] = result
+
+        self._save()
+        return results
+
+    def _describe(self, stage):
+        if isinstance(stage.cmd, basestring):
+            return stage.cmd
+        return ' '.join(stage.cmd)
+
+    def _run_stage(self, stage, digest, completions):
+        # Always report a result, or run() waits for this stage forever
+        try:
+            result = self._execute(stage, digest)
+        except Exception, e:
+            print "Stage %s failed: %s" % (stage.name, e)
+            traceback.print_exc()
+            result = FAILED
+        completions.put((stage.name, result))
+
+    def _execute(self, stage, digest):
+        """Runs a stage, returning RAN or FAILED."""
+        print "Running stage %s: %s" % (stage.name, self._describe(stage))
+        for output in stage.outputs:
+            parent = os.path.dirname(output)
+            if parent:
+                makedirs(parent)
+        log = None
+        if self.log_directory is not None:
+            log = open(os.path.join(self.log_directory, stage.name + '.log'), 'w')
+        start = time.time()
+        try:
+            returncode = subprocess.call(stage.cmd, shell=isinstance(stage.cmd, basestring),
+                                         stdout=log, stderr=log)
+        except OSError, e:
+            print "Failed to start stage %s: %s" % (stage.name, e)
+            returncode = -1
+        finally:
+            if log is not None:
+                log.close()
+        elapsed = time.time() - start
+
+        if returncode != 0:
+            print "Stage %s failed with exit code %d after %.2fs" % (stage.name, returncode, elapsed)
+            return FAILED
+        print "Stage %s finished in %.2fs" % (stage.name, elapsed)
+        with self.lock:
+            self.state[stage.name] = {'digest': self.digest(stage) if digest is None else digest,
+                                      'elapsed': elapsed,
+                                      'finished': time.time()}
+            self._save()
+        return RAN
+
+    def timings(self):
+        """Returns a list of (stage name, seconds) for the last successful
+        run of each stage, in dependency order."""
+        return [(name, self.state[name]['elapsed'])
+                for name in self.order if name in self.state]
+
+    def _save(self):
+        tmp_fpath = self.state_fpath + '.tmp'
+        with open(tmp_fpath, 'w') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.rename(tmp_fpath, self.state_fpath)
+
+    def _load(self):
+        if not os.path.exists(self.state_fpath):
+            return {}
+        try:
+            with open(self.state_fpath) as f:
+                return json.load(f)
+        except ValueError:
+            print "Ignoring corrupt pipeline state", self.state_fpath
+            return {}
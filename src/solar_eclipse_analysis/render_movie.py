@@ -15,6 +15,10 @@
 
 import shutil
 import glob
+import time
+import collections
+import shlex
+import subprocess
 import functools
 import traceback
 import tempfile
@@ -37,6 +41,9 @@ from matplotlib import pyplot as plt
 from mpl_toolkits.basemap import Basemap
 from functools import partial
 from rawkit.raw import Raw
+import columnar
+import rescaled_cache
+import frame_manifest
 
 RES_X=1920
 RES_Y=1080
@@ -53,6 +60,17 @@ def get_arguments():
     parser.add_argument('--rescaled_directory', type=str, default="rescaled")
     parser.add_argument('--movie_blacklist', type=str, default="data/movie_blacklist.txt")
     parser.add_argument('--movie_stats', type=str, default="movie_stats.txt")
+    parser.add_argument('--processes', type=int, default=24)
+    # Stream raw frames to ffmpeg, writing the encoded movie here, instead
+    # of writing a PNG per frame
+    parser.add_argument('--stream_output', type=str, default=None)
+    parser.add_argument('--ffmpeg', type=str, default='ffmpeg')
+    parser.add_argument('--ffmpeg_args', type=str, default='-filter:v setpts=0.5*PTS')
+    parser.add_argument('--framerate', type=int, default=25)
+    # Maximum number of frames in flight when streaming (default 2 * processes)
+    parser.add_argument('--max_pending', type=int, default=None)
+    # Also write the per-frame PNGs to --output_directory when streaming
+    parser.add_argument('--debug_frames', action='store_true')
     return parser.parse_args()
 
 def hisEqulColor(img):
@@ -65,75 +83,109 @@ def hisEqulColor(img):
     cv2.cvtColor(ycrcb,cv2.COLOR_YCR_CB2BGR,img)
 
 def get_rescaled(fname, rescaled_directory):
-    rescaled_fname = fname + ".rescaled.png"
-    rescaled = os.path.join(rescaled_directory, rescaled_fname)
-    image = cv2.imread(rescaled, cv2.IMREAD_UNCHANGED)
+    rescaled = rescaled_cache.find_rescaled(rescaled_directory, fname)
+    image = None if rescaled is None else rescaled_cache.read_rescaled(rescaled)
     if image is None:
-        print "Failed to read image from", rescaled
-        return i, None
+        print "Failed to read rescaled image for", fname
+        return None
     # hisEqulColor(image)
-
-                
-    b_channel, g_channel, r_channel = cv2.split(image)
-    alpha_channel = np.ones(b_channel.shape, dtype=b_channel.dtype) * 255
-    image = cv2.merge((b_channel, g_channel, r_channel, alpha_channel))
     return image
 
 
-def stamp_and_number_image(directory, rescaled_directory, map_directory, data_directory, output_directory, blah):
-    try:
-        t = (RES_Y, RES_X, 4)
-        
-        i = blah['i']
-        fname = blah['fname']
-        poly = blah['poly']
+# Logo overlays and their (y, x) positions in the frame
+LOGOS = (
+    ("logo_footer_berkeley.png", (40, 1700)),
+    ("logo_footer_google.png", (40, 1800)),
+    ("EclipseMovie_logo_crop.png", (40, 40)),
+)
+FONT_SIZE = 39
+TITLE = "Eclipse Megamovie 2017"
 
-        image = get_rescaled(fname, rescaled_directory)
+# Per-process overlay cache: the logos and font are loaded by the first
+# frame a worker renders, and text rasters are cached by string.
+_overlays = None
+_text_cache = {}
 
-        map_fname = os.path.join(map_directory, "map.%05d.png" % i)
-        map_pad = np.zeros(t, dtype=np.uint8)
-        map_ = cv2.imread(map_fname, cv2.IMREAD_UNCHANGED)
-        s = map_.shape
-        map_pad[t[0]-s[0]-40:t[0]-40, t[1]-s[1]-40:t[1]-40] = map_
+def get_overlays(data_directory):
+    global _overlays
+    if _overlays is None:
+        logos = []
+        for fname, position in LOGOS:
+            logo = cv2.imread(os.path.join(data_directory, fname), cv2.IMREAD_UNCHANGED)
+            logos.append((logo, position))
+        font = ImageFont.truetype("ProductSans-Regular.ttf", FONT_SIZE)
+        _overlays = logos, font
+    return _overlays
 
-        
-        image = cv2.addWeighted(map_pad, 1, image, 1, 0)
-
-        berkeley_logo_pad = np.zeros(t, dtype=np.uint8)
-        berkeley_logo = cv2.imread(os.path.join(data_directory, "logo_footer_berkeley.png"), cv2.IMREAD_UNCHANGED)
-        s = berkeley_logo.shape
-        berkeley_logo_pad[40:40+s[0], 1700:1700+s[1]] = berkeley_logo
-        image = cv2.addWeighted(berkeley_logo_pad, 1, image, 1, 0)
-
-        google_logo_pad = np.zeros(t, dtype=np.uint8)
-        google_logo = cv2.imread(os.path.join(data_directory, "logo_footer_google.png"), cv2.IMREAD_UNCHANGED)
-        s = google_logo.shape
-        google_logo_pad[40:40+s[0], 1800:1800+s[1]] = google_logo
-        image = cv2.addWeighted(google_logo_pad, 1, image, 1, 0)
-
-        megamovie_logo_pad = np.zeros(t, dtype=np.uint8)
-        megamovie_logo = cv2.imread(os.path.join(data_directory, "EclipseMovie_logo_crop.png"), cv2.IMREAD_UNCHANGED)
-        s = megamovie_logo.shape
-        megamovie_logo_pad[40:40+s[0], 40:40+s[1]] = megamovie_logo
-        image = cv2.addWeighted(megamovie_logo_pad, 1, image, 1, 0)
-
-        im = Image.new("RGBA", (image.shape[1], image.shape[0]), (0,0,0,0))
+def get_text(txt, font):
+    """Return the BGR raster of txt and the offset it was drawn at.
+
+    The text is drawn on a canvas just large enough to hold it (plus a
+    margin) rather than on a full frame."""
+    if txt not in _text_cache:
+        width, height = font.getsize(txt)
+        pad = FONT_SIZE
+        im = Image.new("RGBA", (width + 2 * pad, height + 2 * pad), (0,0,0,0))
         draw = ImageDraw.Draw(im)
-        font = ImageFont.truetype("ProductSans-Regular.ttf", 39)
-
-        txt = "Eclipse Megamovie 2017"
-        draw.text((140, 45), txt, (255,255,255,255), font=font)
-        tfmt = poly[2].strftime("%H:%M:%S")
-        txt = "Time at Umbral Center: %s" % tfmt
-        draw.text((1350, 1040), txt, (255,255,255,255), font=font)
-        # txt = "Frame #%d %s" % (i, fname)
-        # draw.text((20, 1040), txt, (255,255,255,255), font=font)
-        x = cv2.cvtColor(np.asarray(im), cv2.COLOR_RGB2BGR)
-        b_channel, g_channel, r_channel = cv2.split(x)
-        alpha_channel = np.ones(b_channel.shape, dtype=b_channel.dtype) * 255
-        x = cv2.merge((b_channel, g_channel, r_channel, alpha_channel))
-        image = cv2.addWeighted( x, 1, image, 1, 0.0)
+        draw.text((pad, pad), txt, (255,255,255,255), font=font)
+        _text_cache[txt] = cv2.cvtColor(np.asarray(im), cv2.COLOR_RGB2BGR), pad
+    return _text_cache[txt]
+
+def add_overlay(image, overlay, y, x):
+    """Add overlay into image at (y, x) in place, with saturation.
 
+    Only the region covered by the overlay (clipped to the image) is
+    touched; adding zeros elsewhere would leave the image unchanged."""
+    h, w = overlay.shape[:2]
+    y0, x0 = max(y, 0), max(x, 0)
+    y1, x1 = min(y + h, image.shape[0]), min(x + w, image.shape[1])
+    if y0 >= y1 or x0 >= x1:
+        return
+    c = overlay.shape[2]
+    roi = np.ascontiguousarray(image[y0:y1, x0:x1, :c])
+    image[y0:y1, x0:x1, :c] = cv2.add(roi, np.ascontiguousarray(overlay[y0-y:y1-y, x0-x:x1-x]))
+
+def add_text(image, txt, font, y, x):
+    raster, pad = get_text(txt, font)
+    add_overlay(image, raster, y - pad, x - pad)
+
+def composite_frame(rescaled_directory, map_directory, data_directory, blah):
+    """Return the composited BGRA frame for blah, or None if the rescaled
+    photo can't be read."""
+    i = blah['i']
+    fname = blah['fname']
+    poly = blah['poly']
+
+    image = get_rescaled(fname, rescaled_directory)
+    if image is None:
+        return None
+    logos, font = get_overlays(data_directory)
+
+    map_fname = os.path.join(map_directory, "map.%05d.png" % i)
+    map_ = cv2.imread(map_fname, cv2.IMREAD_UNCHANGED)
+    s = map_.shape
+    add_overlay(image, map_, RES_Y-s[0]-40, RES_X-s[1]-40)
+
+    for logo, (y, x) in logos:
+        add_overlay(image, logo, y, x)
+
+    add_text(image, TITLE, font, 45, 140)
+    tfmt = poly[2].strftime("%H:%M:%S")
+    txt = "Time at Umbral Center: %s" % tfmt
+    add_text(image, txt, font, 1040, 1350)
+    # txt = "Frame #%d %s" % (i, fname)
+    # add_text(image, txt, font, 1040, 20)
+    # The text layer is opaque over the whole frame
+    image[:, :, 3] = 255
+    return image
+
+def stamp_and_number_image(directory, rescaled_directory, map_directory, data_directory, output_directory, blah):
+    try:
+        i = blah['i']
+        fname = blah['fname']
+        image = composite_frame(rescaled_directory, map_directory, data_directory, blah)
+        if image is None:
+            return i, fname, False
         new_fname = os.path.join(output_directory, "%05d.png" % i)
         cv2.imwrite(new_fname, image)
         return i, fname, True
@@ -142,6 +194,57 @@ def stamp_and_number_image(directory, rescaled_directory, map_directory, data_di
         traceback.print_exc(limit=50)
         return i, fname, False
 
+def render_frame(rescaled_directory, map_directory, data_directory, debug_directory, blah):
+    """Return (i, fname, raw bgr24 frame bytes or None) for streaming to
+    the encoder.  The PNG is only written if debug_directory is set."""
+    try:
+        i = blah['i']
+        fname = blah['fname']
+        image = composite_frame(rescaled_directory, map_directory, data_directory, blah)
+        if image is None:
+            return i, fname, None
+        if debug_directory is not None:
+            cv2.imwrite(os.path.join(debug_directory, "%05d.png" % i), image)
+        return i, fname, np.ascontiguousarray(image[:, :, :3]).tostring()
+
+    except Exception as e:
+        traceback.print_exc(limit=50)
+        return i, fname, None
+
+def open_encoder(args):
+    """Start ffmpeg reading raw bgr24 frames from stdin."""
+    command = [args.ffmpeg,
+               '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+               '-s', '%dx%d' % (RES_X, RES_Y),
+               '-framerate', str(args.framerate),
+               '-i', '-']
+    command.extend(shlex.split(args.ffmpeg_args))
+    command.extend(['-y', args.stream_output])
+    return subprocess.Popen(command, stdin=subprocess.PIPE)
+
+def stream_frames(p, worker, blahs, encoder, max_pending):
+    """Feed the frames rendered by the pool to the encoder in frame order.
+
+    At most max_pending frames are in flight (rendered or rendering but
+    not yet written), which bounds memory use to max_pending frames."""
+    pending = collections.deque()
+    results = []
+    def write_next():
+        i, fname, frame = pending.popleft().get()
+        if frame is not None:
+            encoder.stdin.write(frame)
+        results.append((i, fname, frame is not None))
+    for blah in blahs:
+        if len(pending) >= max_pending:
+            write_next()
+        pending.append(p.apply_async(worker, (blah,)))
+    while pending:
+        write_next()
+    return results
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory))
+
 def main():
     args  = get_arguments()
 
@@ -150,10 +253,9 @@ def main():
     lines = f.readlines()
     lines = [line.strip().split() for line in lines]
     movie_frames = dict([ (int(line[0]), line[1]) for line in lines])
-    polys = pickle.load(open(args.umbra_polys))
+    polys = columnar.load_umbra_polys(args.umbra_polys)
     
     blahs = []
-    metadata = pickle.load(open(args.metadata))
     for i, poly in enumerate(polys):
         if i in movie_frames:
             blah = {}
@@ -166,9 +268,32 @@ def main():
     # for blah in blahs:
     #     results.append(stamp_and_number_image(args.directory, args.rescaled_directory, args.map_directory, args.data_directory, args.output_directory, blah))
         
-    p = Pool(24)
-    s = functools.partial(stamp_and_number_image, args.directory, args.rescaled_directory, args.map_directory, args.data_directory, args.output_directory)
-    results = p.map(s, blahs)
+    start = time.time()
+    p = Pool(args.processes)
+    if args.stream_output is None:
+        s = functools.partial(stamp_and_number_image, args.directory, args.rescaled_directory, args.map_directory, args.data_directory, args.output_directory)
+        results = p.map(s, blahs)
+        # List the frames in order for ffmpeg, instead of renumbering them
+        rendered_fpaths = [os.path.join(args.output_directory, "%05d.png" % i)
+                           for i, fname, success in sorted(results) if success]
+        frame_manifest.write_ffconcat(os.path.join(args.output_directory, frame_manifest.MANIFEST_FNAME),
+                                      rendered_fpaths, args.framerate)
+        disk = directory_size(args.output_directory)
+    else:
+        debug_directory = args.output_directory if args.debug_frames else None
+        s = functools.partial(render_frame, args.rescaled_directory, args.map_directory, args.data_directory, debug_directory)
+        encoder = open_encoder(args)
+        results = stream_frames(p, s, blahs, encoder, args.max_pending or 2 * args.processes)
+        encoder.stdin.close()
+        if encoder.wait() != 0:
+            print "ffmpeg failed with status", encoder.returncode
+        disk = os.path.getsize(args.stream_output)
+        if debug_directory is not None:
+            disk += directory_size(debug_directory)
+    p.terminate()
+    elapsed = time.time() - start
+    rendered = len([result for result in results if result[2]])
+    print "Rendered %d of %d frames in %.2fs (%.2f frames/s), %d bytes on disk" % (rendered, len(blahs), elapsed, rendered / max(elapsed, 1e-9), disk)
 
 
 if __name__ == '__main__':
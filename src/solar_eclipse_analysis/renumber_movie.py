@@ -13,30 +13,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import shutil
-import glob
 import os
 import argparse
+import frame_manifest
 
 def get_arguments():
     parser = argparse.ArgumentParser(description='Render movie.')
     parser.add_argument('--output_directory', type=str, default='movie')
     parser.add_argument('--renumber_directory', type=str, default='renumber')
+    parser.add_argument('--mode', type=str, default='manifest', choices=frame_manifest.MODES,
+                        help="Write an ffconcat manifest of the frames, or link or copy them "
+                        "to contiguous numbers in renumber_directory")
+    parser.add_argument('--framerate', type=int, default=25)
     return parser.parse_args()
 
 
 def main():
     args = get_arguments()
-    gs = glob.glob(args.output_directory + "/*")
-    gs.sort()
-    r = []
-    for g in gs:
-        r.append(g)
-
-    for i in range(len(r)):
-        source = r[i]
-        dest = os.path.join(args.renumber_directory, "%05d.png" % i)
-        shutil.copyfile(source, dest)
+    fpaths = frame_manifest.frame_fpaths(args.output_directory)
+    if args.mode == 'manifest':
+        frame_manifest.write_ffconcat(os.path.join(args.output_directory, frame_manifest.MANIFEST_FNAME),
+                                      fpaths, args.framerate)
+    else:
+        frame_manifest.link_frames(fpaths, args.renumber_directory, args.mode)
 
 
 if __name__ == '__main__':
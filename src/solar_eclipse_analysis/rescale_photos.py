@@ -24,6 +24,23 @@ import argparse
 import cv2
 from multiprocessing import Pool
 from rawkit.raw import Raw
+import columnar
+import rescaled_cache
+from find_all_circles import load_image
+from find_circles import findCircles
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Rescale the photos assigned to umbras.')
+    parser.add_argument('--metadata', type=str, default="extracted_metadata.pkl")
+    parser.add_argument('--directory', type=str, default="")
+    parser.add_argument('--circles_directory', type=str, default="circles")
+    parser.add_argument('--rescaled_directory', type=str, default="rescaled")
+    parser.add_argument('--photo_selections', type=str, default="photo_selections.pkl")
+    # Storage format of the rescaled photos, see rescaled_cache
+    parser.add_argument('--rescaled_format', type=str, default="png-fast",
+                        choices=rescaled_cache.FORMATS)
+    parser.add_argument('--processes', type=int, default=24)
+    return parser.parse_args()
 
 blacklist = ['9bb78815fbfb44fbec67d2cabc3378562422f59ee91fa5e864775fa3e25665df', '7a972430e284eef81294b95b32f4c14be31a896b53149b40863ef659be1a2131']
 
@@ -148,7 +165,8 @@ def process_image(work):
             print "Image", fname, "is in blacklist"
             return fname, False
         rescaled_directory = work['rescaled_directory'] 
-        new_fname = os.path.join(rescaled_directory, os.path.basename(fname) + ".rescaled.png")
+        rescaled_format = work.get('rescaled_format', 'png')
+        new_fname = rescaled_cache.rescaled_path(rescaled_directory, fname, rescaled_format)
         if os.path.exists(new_fname):
             print "Image", fname, "already has rescaled output:", new_fname
             return fname, True
@@ -198,8 +216,7 @@ def process_image(work):
         
         
         if image is not None:
-            params = [cv2.IMWRITE_PNG_COMPRESSION, 9]
-            cv2.imwrite(new_fname, image, params)
+            rescaled_cache.write_rescaled(new_fname, image, rescaled_format)
             return fname, True
         else:
             return fname, False
@@ -207,3 +224,68 @@ def process_image(work):
         print "Failed to process work %s, exception: %s" % (work, str(e))
         traceback.print_exc(limit=50)
         return fname, False
+
+def sun_circle(fname, circles_directory):
+    """Return (cx, cy, r) of the sun in the photo at fname, or None.
+    Detected circles are cached in circles_directory."""
+    cached = os.path.join(circles_directory, os.path.basename(fname) + ".pkl")
+    if os.path.exists(cached):
+        circles = pickle.load(open(cached, "rb"))
+    else:
+        image = load_image(fname)
+        if image is None:
+            return None
+        circles = findCircles(fname, image, circles_directory)
+    if circles is None or not len(circles):
+        return None
+    cx, cy, r = circles[0][0]
+    return cx, cy, r
+
+def rescale_work(work):
+    """Find the sun in work's photo, then rescale it with process_image."""
+    fname = work['fname']
+    rescaled = rescaled_cache.rescaled_path(work['rescaled_directory'], fname, work['rescaled_format'])
+    if os.path.basename(fname) not in blacklist and not os.path.exists(rescaled):
+        try:
+            circle = sun_circle(fname, work['circles_directory'])
+        except Exception as e:
+            print "Failed to find circles in %s, exception: %s" % (fname, str(e))
+            return fname, False
+        if circle is None:
+            print "No sun found in", fname
+            return fname, False
+        work['cx'], work['cy'], work['r'] = circle
+    return process_image(work)
+
+def main():
+    args = get_arguments()
+    for directory in (args.circles_directory, args.rescaled_directory):
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    photo_selections = columnar.load_frame_table(args.photo_selections, columnar.PHOTO_SELECTION_FIELDS, list)
+    metadata = columnar.load_metadata(args.metadata, ['lat', 'lon', 'image_datetime', 'equatorial_mount'])
+    fnames = set()
+    for rows in photo_selections.values():
+        if rows is not None:
+            fnames.update(row[1] for row in rows)
+
+    work = []
+    for fname in sorted(fnames):
+        work.append({
+            'fname': os.path.join(args.directory, fname),
+            'metadata': metadata.get(fname, {}),
+            'circles_directory': args.circles_directory,
+            'rescaled_directory': args.rescaled_directory,
+            'rescaled_format': args.rescaled_format,
+        })
+    print "Rescaling %d photos" % len(work)
+
+    p = Pool(args.processes)
+    results = p.map(rescale_work, work, chunksize=1)
+    p.close()
+    p.join()
+    print "Rescaled %d of %d photos" % (sum(1 for fname, success in results if success), len(results))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage for the rescaled 1920x1080 photos.
+
+rescale_photos writes each rescaled photo once, and choose_movie_frames
+and render_movie read them back.  Three formats are supported:
+
+  png       BGR PNG at maximum compression (the original format)
+  png-fast  BGRA PNG at the fastest zlib setting
+  npy       raw BGRA array, read back with a memory map (no decoding)
+
+Readers always get a BGRA image with an opaque alpha channel, whatever
+the format the photo was written in.
+
+Running this module benchmarks the formats on existing rescaled photos.
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+import cv2
+
+FORMATS = ('png', 'png-fast', 'npy')
+EXTENSIONS = {
+    'png': '.rescaled.png',
+    'png-fast': '.rescaled.png',
+    'npy': '.rescaled.npy',
+}
+PNG_COMPRESSION = {
+    'png': 9,
+    'png-fast': 1,
+}
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark rescaled photo formats.')
+    parser.add_argument('--rescaled_directory', type=str, default="rescaled")
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--benchmark_directory', type=str, default=None)
+    return parser.parse_args()
+
+def rescaled_path(rescaled_directory, fname, format='png'):
+    return os.path.join(rescaled_directory, os.path.basename(fname) + EXTENSIONS[format])
+
+def find_rescaled(rescaled_directory, fname):
+    """Return the path of the rescaled photo for fname, in any format, or
+    None if there isn't one."""
+    for extension in ('.rescaled.npy', '.rescaled.png'):
+        path = os.path.join(rescaled_directory, os.path.basename(fname) + extension)
+        if os.path.exists(path):
+            return path
+    return None
+
+def list_rescaled(rescaled_directory):
+    """Return the set of photo names which have a rescaled photo."""
+    names = set()
+    for f in os.listdir(rescaled_directory):
+        for extension in ('.rescaled.npy', '.rescaled.png'):
+            if f.endswith(extension):
+                names.add(f[:-len(extension)])
+    return names
+
+def add_alpha(image):
+    """Return image as BGRA with an opaque alpha channel."""
+    if image.shape[2] == 4:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+
+def write_rescaled(path, image, format='png'):
+    """Write a rescaled BGR image in the given format.
+
+    The file is written under a temporary name and renamed, so a reader
+    never sees a partial photo."""
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(prefix='.' + name, dir=directory or '.')
+    os.close(fd)
+    try:
+        if format == 'npy':
+            with open(tmp, 'wb') as f:
+                np.save(f, np.ascontiguousarray(add_alpha(image)))
+        else:
+            if format != 'png':
+                image = add_alpha(image)
+            # imwrite picks the codec from the extension
+            png = tmp + '.png'
+            if not cv2.imwrite(png, image, [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION[format]]):
+                raise IOError("Failed to write %s" % path)
+            os.rename(png, tmp)
+        os.rename(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+def read_rescaled(path):
+    """Read a rescaled photo as BGRA, or return None on failure.
+
+    npy photos are memory mapped copy-on-write, so callers may modify
+    the image without affecting the file."""
+    if path.endswith('.npy'):
+        try:
+            return np.load(path, mmap_mode='c')
+        except (IOError, ValueError):
+            return None
+    image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+    if image is None:
+        return None
+    return add_alpha(image)
+
+def benchmark(images, directory):
+    print "%-10s %12s %12s %12s" % ("format", "encode ms", "decode ms", "bytes")
+    for format in FORMATS:
+        encode = decode = size = 0
+        for i, image in enumerate(images):
+            path = os.path.join(directory, "%05d%s" % (i, EXTENSIONS[format]))
+            start = time.time()
+            write_rescaled(path, image, format)
+            encode += time.time() - start
+            size += os.path.getsize(path)
+            start = time.time()
+            # Touch every pixel so the memory map is actually read
+            read_rescaled(path).sum()
+            decode += time.time() - start
+            os.unlink(path)
+        n = float(len(images))
+        print "%-10s %12.1f %12.1f %12d" % (format, encode * 1000 / n, decode * 1000 / n, size / n)
+
+def main():
+    args = get_arguments()
+    images = []
+    for fname in sorted(list_rescaled(args.rescaled_directory)):
+        image = read_rescaled(find_rescaled(args.rescaled_directory, fname))
+        if image is not None:
+            images.append(np.array(image[:, :, :3]))
+        if len(images) == args.count:
+            break
+    print "Benchmarking %d rescaled photos" % len(images)
+    directory = args.benchmark_directory or tempfile.mkdtemp()
+    benchmark(images, directory)
+
+if __name__ == '__main__':
+    main()
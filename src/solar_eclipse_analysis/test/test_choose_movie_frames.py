@@ -0,0 +1,68 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for choose_movie_frames."""
+import sys
+sys.path.append("..")
+import random
+import unittest2
+import choose_movie_frames
+
+def random_selections(n, photos):
+  random.seed(3)
+  photo_selections = {}
+  for i in range(n):
+    r = random.random()
+    if r < 0.3:
+      continue
+    elif r < 0.4:
+      photo_selections[i] = None
+    elif r < 0.5:
+      photo_selections[i] = []
+    else:
+      photo_selections[i] = [
+        [random.random(), random.choice(photos), 0., 0., None, 0, 0]
+        for j in range(random.randint(1, 6))]
+  return photo_selections
+
+class ChooseMovieFramesTest(unittest2.TestCase):
+  def setUp(self):
+    self.photos = ["photo%d" % i for i in range(40)]
+    self.rescaled = set(self.photos[::3])
+    self.photo_selections = random_selections(200, self.photos)
+
+  def testSelectionIndex(self):
+    index = choose_movie_frames.selection_index({2: [], 3: None, 5: [[]]}, 8)
+    self.assertEqual(list(index), [-1, -1, 2, 2, 2, 5, 5, 5])
+
+  def testSelectionsMatchReference(self):
+    n = 210
+    selections = choose_movie_frames.rescaled_photo_selections(
+      n, self.photo_selections, self.rescaled)
+    for i in range(n):
+      _, expected = choose_movie_frames.filter_rescaled_photo_selections(
+        i, self.photo_selections, self.rescaled)
+      self.assertEqual(selections[i], expected)
+
+  def testFramesMatchReference(self):
+    choose_movie_frames.c.clear()
+    expected = choose_movie_frames.choose_movie_frames_reference(
+      200, self.photo_selections, self.rescaled, {})
+    choose_movie_frames.c.clear()
+    frames = choose_movie_frames.choose_movie_frames(
+      200, self.photo_selections, self.rescaled, {})
+    self.assertEqual(frames, expected)
+
+if __name__ == '__main__':
+  unittest2.main()
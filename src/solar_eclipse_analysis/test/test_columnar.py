@@ -0,0 +1,99 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for columnar."""
+import sys
+sys.path.append("..")
+import datetime
+import shutil
+import tempfile
+import unittest2
+import numpy as np
+import pytz
+from shapely.geometry import Polygon
+import columnar
+
+DT = datetime.datetime(2017, 8, 21, 17, 30, 1, 500, pytz.utc)
+
+class ColumnarTest(unittest2.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+  def testMetadataRoundTrip(self):
+    metadata = {
+      'a': {'lat': 44.5, 'lon': 123.2, 'image_datetime': DT,
+            'equatorial_mount': True, 'width': 6000, 'height': 4000},
+      'b': {'lat': 36.1, 'lon': 86.7, 'image_datetime': DT,
+            'equatorial_mount': False},
+    }
+    columnar.write_metadata(self.directory, metadata)
+    fields = ['lat', 'lon', 'image_datetime', 'equatorial_mount', 'width', 'height']
+    self.assertEqual(columnar.load_metadata(self.directory, fields), metadata)
+    self.assertEqual(columnar.load_metadata(self.directory, ['width']),
+                     {'a': {'width': 6000}, 'b': {}})
+
+  def testMetadataTypes(self):
+    # Whole column conversion gives back the written python types
+    metadata = {}
+    for i in range(0, 100, 7):
+      metadata['%03d' % i] = {'lat': i / 4., 'lon': 86.7, 'image_datetime': DT}
+      if i % 2:
+        metadata['%03d' % i].update({'width': i, 'equatorial_mount': i % 3 == 0})
+    columnar.write_metadata(self.directory, metadata)
+    loaded = columnar.load_metadata(self.directory, ['lat', 'lon', 'image_datetime', 'width', 'equatorial_mount'])
+    self.assertEqual(loaded, metadata)
+    self.assertIs(type(loaded['021']['width']), int)
+    self.assertIs(type(loaded['014']['lat']), float)
+    self.assertIs(type(loaded['021']['equatorial_mount']), bool)
+    self.assertIs(type(loaded.keys()[0]), str)
+
+  def testFrameTableRoundTrip(self):
+    frames = {
+      0: [(0.1, 'a', 44.5, 123.2, DT), (0.2, 'b', 44.6, 123.1, DT)],
+      1: [],
+      3: [(0.3, 'c', 36.1, 86.7, DT)],
+    }
+    columnar.write_frame_table(self.directory, frames, columnar.UMBRA_PHOTO_FIELDS)
+    self.assertEqual(columnar.load_frame_table(self.directory, columnar.UMBRA_PHOTO_FIELDS), frames)
+
+  def testFrameChoicesRoundTrip(self):
+    choices = {0: None, 1: (0.1, 'a', 44.5, 123.2, DT, 6000, 4000)}
+    columnar.write_frame_choices(self.directory, choices)
+    self.assertEqual(columnar.load_frame_choices(self.directory), choices)
+
+  def testCirclesRoundTrip(self):
+    circles = {'a': np.array([[[10., 20., 5.], [11., 21., 6.]]], dtype=np.float32), 'b': None}
+    columnar.write_circles(self.directory, circles)
+    loaded = columnar.load_circles(self.directory)
+    self.assertIsNone(loaded['b'])
+    np.testing.assert_array_equal(loaded['a'], circles['a'])
+
+  def testUmbraPolysRoundTrip(self):
+    polys = []
+    for i in range(3):
+      poly = Polygon(((i, 0), (i + 1, 0), (i + 1, 1), (i, 1)))
+      polys.append((poly, poly.centroid, datetime.datetime(2017, 8, 21, 17, 0, i)))
+    columnar.write_umbra_polys(self.directory, polys)
+    loaded = columnar.load_umbra_polys(self.directory)
+    self.assertEqual(len(loaded), len(polys))
+    for (poly, centroid, dt), (lpoly, lcentroid, ldt) in zip(polys, loaded):
+      self.assertTrue(poly.equals_exact(lpoly, 0))
+      self.assertTrue(centroid.equals(lcentroid))
+      self.assertEqual(dt, ldt)
+
+if __name__ == '__main__':
+  unittest2.main()
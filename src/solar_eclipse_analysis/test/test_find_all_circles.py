@@ -0,0 +1,66 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the find_all_circles results log."""
+import sys
+sys.path.append("..")
+import os
+import pickle
+import shutil
+import tempfile
+import unittest2
+import numpy as np
+import find_all_circles
+
+CIRCLES = np.array([[[320., 240., 50.]]], dtype=np.float32)
+
+class ResultsLogTest(unittest2.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.path = os.path.join(self.directory, "circles.log")
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+  def testEntryRoundTrip(self):
+    line = find_all_circles.encode_entry('a', CIRCLES, True)
+    key, circles, success = find_all_circles.decode_entry(line)
+    self.assertEqual(key, 'a')
+    self.assertTrue(success)
+    np.testing.assert_array_equal(circles, CIRCLES)
+
+  def testCorruptEntryIsRejected(self):
+    line = find_all_circles.encode_entry('a', CIRCLES, True)
+    self.assertIsNone(find_all_circles.decode_entry(line[:-5] + "\n"))
+    self.assertIsNone(find_all_circles.decode_entry(line[:-1]))
+
+  def testResumeAfterTruncatedWrite(self):
+    with open(self.path, "wb") as f:
+      f.write(find_all_circles.encode_entry('a', CIRCLES, True))
+      f.write(find_all_circles.encode_entry('b', None, False)[:10])
+    log = find_all_circles.open_results(self.path)
+    log.write(find_all_circles.encode_entry('c', None, True))
+    log.close()
+    results = find_all_circles.read_results(self.path)
+    self.assertEqual(sorted(results), ['a', 'c'])
+    self.assertEqual(results['c'], (None, True))
+
+  def testWriteMergedSkipsFailures(self):
+    output = os.path.join(self.directory, "all_circles.pkl")
+    find_all_circles.write_merged({'a': (CIRCLES, True), 'b': (None, False)}, output)
+    merged = pickle.load(open(output))
+    self.assertEqual(sorted(merged), ['a'])
+
+if __name__ == '__main__':
+  unittest2.main()
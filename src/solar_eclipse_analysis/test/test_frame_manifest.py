@@ -0,0 +1,66 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for frame_manifest."""
+import sys
+sys.path.append("..")
+import os
+import shutil
+import tempfile
+import unittest2
+import frame_manifest
+
+class FrameManifestTest(unittest2.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.movie = os.path.join(self.directory, 'movie')
+    os.makedirs(self.movie)
+    # Frames are numbered by umbra polygon, with gaps
+    for i in [7, 3, 12]:
+      with open(os.path.join(self.movie, "%05d.png" % i), 'w') as f:
+        f.write('frame %d' % i)
+    self.fpaths = frame_manifest.frame_fpaths(self.movie)
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+  def test_frame_fpaths(self):
+    frame_manifest.write_ffconcat(os.path.join(self.movie, frame_manifest.MANIFEST_FNAME),
+                                  self.fpaths)
+    self.assertEqual([os.path.basename(fpath) for fpath in frame_manifest.frame_fpaths(self.movie)],
+                     ['00003.png', '00007.png', '00012.png'])
+
+  def test_write_ffconcat(self):
+    fpath = os.path.join(self.movie, frame_manifest.MANIFEST_FNAME)
+    frame_manifest.write_ffconcat(fpath, self.fpaths, framerate=25)
+    lines = open(fpath).read().splitlines()
+    self.assertEqual(lines[0], 'ffconcat version 1.0')
+    files = [line[len("file '"):-1] for line in lines if line.startswith('file ')]
+    self.assertEqual(files, [os.path.abspath(f) for f in self.fpaths + self.fpaths[-1:]])
+    self.assertEqual([line for line in lines if line.startswith('duration ')],
+                     ['duration 0.040000'] * 3)
+
+  def test_link_frames(self):
+    for mode in ['symlink', 'hardlink', 'copy']:
+      renumber = os.path.join(self.directory, mode)
+      frame_manifest.link_frames(self.fpaths, renumber, mode)
+      self.assertEqual(sorted(os.listdir(renumber)), ['00000.png', '00001.png', '00002.png'])
+      self.assertEqual(open(os.path.join(renumber, '00001.png')).read(), 'frame 7')
+      # Relinking replaces the previous links
+      frame_manifest.link_frames(self.fpaths, renumber, mode)
+    self.assertTrue(os.path.islink(os.path.join(self.directory, 'symlink', '00000.png')))
+    self.assertEqual(os.stat(self.fpaths[0]).st_nlink, 2)
+
+if __name__ == '__main__':
+  unittest2.main()
@@ -0,0 +1,116 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for generate_maps."""
+import sys
+sys.path.append("..")
+import os
+import shutil
+import tempfile
+import unittest2
+import numpy as np
+from shapely.geometry import Polygon
+import generate_maps
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+class GenerateMapsTest(unittest2.TestCase):
+  def testAlphaOverOpaque(self):
+    image = np.zeros((10, 10, 4), dtype=np.uint8)
+    image[:, :] = (10, 20, 30, 255)
+    overlay = np.zeros((4, 4, 4), dtype=np.uint8)
+    overlay[:, :] = (200, 100, 50, 255)
+    generate_maps.alpha_over(image, overlay, 8, -2)
+    self.assertEqual(list(image[9, 1]), [200, 100, 50, 255])
+    self.assertEqual(list(image[9, 2]), [10, 20, 30, 255])
+    self.assertEqual(list(image[7, 1]), [10, 20, 30, 255])
+
+  def testAlphaOverTransparent(self):
+    image = np.zeros((10, 10, 4), dtype=np.uint8)
+    image[:, :] = (10, 20, 30, 128)
+    expected = image.copy()
+    overlay = np.zeros((4, 4, 4), dtype=np.uint8)
+    overlay[:, :] = (200, 100, 50, 0)
+    generate_maps.alpha_over(image, overlay, 2, 2)
+    self.assertTrue(np.array_equal(image, expected))
+
+  def testInputDigest(self):
+    poly = Polygon([(0, 0), (1, 0), (1, 1)])
+    input_ = {'poly': poly, 'movie_frame': ('a', 40., -100.)}
+    digest = generate_maps.input_digest('raster', 'data', input_)
+    self.assertEqual(digest, generate_maps.input_digest('raster', 'data', dict(input_)))
+    self.assertNotEqual(digest, generate_maps.input_digest('basemap', 'data', input_))
+    self.assertNotEqual(digest, generate_maps.input_digest('raster', 'other', input_))
+    moved = {'poly': poly, 'movie_frame': ('a', 41., -100.)}
+    self.assertNotEqual(digest, generate_maps.input_digest('raster', 'data', moved))
+
+class MapRasterTest(unittest2.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.raster = generate_maps.MapRaster(DATA_DIRECTORY)
+
+  def setUp(self):
+    self.image = np.zeros(self.raster.base.shape, dtype=np.uint8)
+
+  def testToPixels(self):
+    # The map is centered in the figure, before the marker layer offset
+    corners = self.raster.to_pixels([-119.5, -66], [24.5, 47])
+    center = corners.mean(axis=0) - (generate_maps.MARKER_SHIFT_X, generate_maps.MARKER_SHIFT_Y)
+    self.assertAlmostEqual(center[0], generate_maps.MAP_WIDTH / 2.)
+    self.assertAlmostEqual(center[1], generate_maps.MAP_HEIGHT / 2.)
+    # North is up and east is right
+    self.assertLess(corners[0, 0], corners[1, 0])
+    self.assertGreater(corners[0, 1], corners[1, 1])
+
+  def testDrawUmbra(self):
+    lons, lats = [-96, -94, -94, -96], [37.5, 37.5, 38.5, 38.5]
+    self.raster.draw_umbra(self.image, Polygon(zip(lons, lats)))
+    for x, y in np.floor(self.raster.to_pixels(lons, lats)).astype(int):
+      self.assertEqual(list(self.image[y, x]), [0, 0, 0, 255])
+    # The outline is not filled
+    x, y = np.floor(self.raster.to_pixels([-95], [38])[0]).astype(int)
+    self.assertEqual(self.image[y, x, 3], 0)
+
+  def testDrawPin(self):
+    self.raster.draw_pin(self.image, -95, 38)
+    rows, columns = np.nonzero(self.image[:, :, 3])
+    # The pin's extent is centered on the photo location
+    (x0, y1), (x1, y0) = self.raster.to_pixels([-95.65, -94.35], [38 - 1.157, 38 + 1.157])
+    self.assertGreaterEqual(columns.min(), np.floor(x0))
+    self.assertLess(columns.max(), np.ceil(x1))
+    self.assertGreaterEqual(rows.min(), np.floor(y0))
+    self.assertLess(rows.max(), np.ceil(y1))
+    # Off the map, nothing is drawn
+    self.image[:] = 0
+    self.raster.draw_pin(self.image, -180, 38)
+    self.assertFalse(self.image.any())
+
+  def testMatchesBasemap(self):
+    directories = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+    try:
+      poly = Polygon([(-123, 44), (-121, 44.5), (-119, 44), (-121, 43.5)])
+      inputs = [{'i': i, 'poly': poly, 'movie_frame': ('a', lat, lon), 'length': 2,
+                 'poly_dt': None, 'eclipse_path_data': None, 'path': None, 'path_data': None}
+                for i, (lat, lon) in enumerate([(44, -121), (36.5, -87.4)])]
+      for input_ in inputs:
+        self.assertTrue(generate_maps.render_map(directories[0], DATA_DIRECTORY, input_))
+        self.assertTrue(generate_maps.render_map_raster(directories[1], DATA_DIRECTORY, input_))
+      mean, worst = generate_maps.compare_maps(directories[1], directories[0], [0, 1])
+      self.assertLess(mean, 0.5)
+    finally:
+      for directory in directories:
+        shutil.rmtree(directory)
+
+if __name__ == '__main__':
+  unittest2.main()
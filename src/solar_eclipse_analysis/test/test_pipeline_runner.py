@@ -0,0 +1,159 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for pipeline_runner."""
+import sys
+sys.path.append("..")
+import os
+import shutil
+import tempfile
+import unittest2
+import pipeline_runner
+from pipeline_runner import Stage, Pipeline
+
+# Copies argv[1] to argv[2], appending argv[3]
+COPY = "import sys; open(sys.argv[2], 'w').write(open(sys.argv[1]).read() + sys.argv[3])"
+# Writes argv[1], then waits up to 10s for argv[2] to appear
+RENDEZVOUS = "import os, sys, time\n" \
+             "open(sys.argv[1], 'w').write('x')\n" \
+             "deadline = time.time() + 10\n" \
+             "while not os.path.exists(sys.argv[2]) and time.time() < deadline:\n" \
+             "  time.sleep(0.01)\n" \
+             "sys.exit(0 if os.path.exists(sys.argv[2]) else 1)"
+
+class PipelineRunnerTest(unittest2.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.state = self.path('state.json')
+    with open(self.path('source.txt'), 'w') as f:
+      f.write('a')
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+  def path(self, fname):
+    return os.path.join(self.directory, fname)
+
+  def copy_stage(self, name, source, dest, suffix):
+    return Stage(name, [sys.executable, '-c', COPY, self.path(source), self.path(dest), suffix],
+                 inputs=[self.path(source)], outputs=[self.path(dest)])
+
+  def chain(self):
+    # source -> first -> second, and source -> other
+    return [self.copy_stage('second', 'first.txt', 'second.txt', 'c'),
+            self.copy_stage('first', 'source.txt', 'first.txt', 'b'),
+            self.copy_stage('other', 'source.txt', 'other.txt', 'd')]
+
+  def test_order(self):
+    pipeline = Pipeline(self.chain(), self.state)
+    self.assertEqual(pipeline.dependencies['second'], set(['first']))
+    self.assertEqual(pipeline.dependencies['other'], set())
+    self.assertLess(pipeline.order.index('first'), pipeline.order.index('second'))
+
+  def test_directory_dependency(self):
+    stages = [Stage('write', ['true'], outputs=[self.path('frames')]),
+              Stage('read', ['true'], inputs=[self.path('frames/00001.png')])]
+    self.assertEqual(Pipeline(stages, self.state).dependencies['read'], set(['write']))
+
+  def test_cycle(self):
+    stages = [self.copy_stage('first', 'second.txt', 'first.txt', 'b'),
+              self.copy_stage('second', 'first.txt', 'second.txt', 'c')]
+    with self.assertRaises(ValueError):
+      Pipeline(stages, self.state)
+
+  def test_incremental(self):
+    results = Pipeline(self.chain(), self.state).run()
+    self.assertEqual(set(results.values()), set([pipeline_runner.RAN]))
+    self.assertEqual(open(self.path('second.txt')).read(), 'abc')
+
+    # Nothing changed
+    results = Pipeline(self.chain(), self.state).run()
+    self.assertEqual(set(results.values()), set([pipeline_runner.SKIPPED]))
+
+    # A changed input reruns its stage and those downstream of it
+    with open(self.path('first.txt'), 'w') as f:
+      f.write('B')
+    results = Pipeline(self.chain(), self.state).run()
+    self.assertEqual(results, {'first': pipeline_runner.SKIPPED,
+                               'second': pipeline_runner.RAN,
+                               'other': pipeline_runner.SKIPPED})
+    self.assertEqual(open(self.path('second.txt')).read(), 'Bc')
+
+    # Changed parameters, and missing outputs
+    stages = self.chain()
+    stages[2].params = {'table': 'Photo2'}
+    os.remove(self.path('second.txt'))
+    results = Pipeline(stages, self.state).run()
+    self.assertEqual(results, {'first': pipeline_runner.SKIPPED,
+                               'second': pipeline_runner.RAN,
+                               'other': pipeline_runner.RAN})
+
+    results = Pipeline(self.chain(), self.state).run(force=['first'])
+    self.assertEqual(results['first'], pipeline_runner.RAN)
+
+  def test_dry_run(self):
+    pipeline = Pipeline(self.chain(), self.state)
+    results = pipeline.run(dry_run=True)
+    self.assertEqual(set(results.values()), set([pipeline_runner.WOULD_RUN]))
+    self.assertFalse(os.path.exists(self.path('first.txt')))
+
+    Pipeline(self.chain(), self.state).run()
+    with open(self.path('source.txt'), 'w') as f:
+      f.write('A')
+    results = Pipeline(self.chain(), self.state).run(dry_run=True)
+    self.assertEqual(set(results.values()), set([pipeline_runner.WOULD_RUN]))
+    self.assertEqual(open(self.path('second.txt')).read(), 'abc')
+
+  def test_failure_blocks_downstream(self):
+    stages = self.chain()
+    stages[1].cmd = [sys.executable, '-c', 'import sys; sys.exit(3)']
+    results = Pipeline(stages, self.state).run(jobs=2)
+    self.assertEqual(results, {'first': pipeline_runner.FAILED,
+                               'second': pipeline_runner.BLOCKED,
+                               'other': pipeline_runner.RAN})
+    self.assertNotIn('first', Pipeline(stages, self.state).state)
+
+  def test_concurrent(self):
+    # Each stage only succeeds if the other starts while it is running
+    stages = [Stage('left', [sys.executable, '-c', RENDEZVOUS, self.path('l'), self.path('r')],
+                    outputs=[self.path('l')]),
+              Stage('right', [sys.executable, '-c', RENDEZVOUS, self.path('r'), self.path('l')],
+                    outputs=[self.path('r')])]
+    results = Pipeline(stages, self.state).run(jobs=2)
+    self.assertEqual(set(results.values()), set([pipeline_runner.RAN]))
+
+  def test_timings_and_logs(self):
+    pipeline = Pipeline(self.chain(), self.state, log_directory=self.path('logs'))
+    pipeline.run()
+    self.assertEqual([name for name, elapsed in pipeline.timings()], pipeline.order)
+    self.assertTrue(os.path.exists(self.path('logs/first.log')))
+
+  def test_unopenable_log(self):
+    # A directory in the way of first's log fails the stage, rather than
+    # killing its thread and leaving run() waiting for it
+    os.makedirs(self.path('logs/first.log'))
+    results = Pipeline(self.chain(), self.state, log_directory=self.path('logs')).run(jobs=2)
+    self.assertEqual(results, {'first': pipeline_runner.FAILED,
+                               'second': pipeline_runner.BLOCKED,
+                               'other': pipeline_runner.RAN})
+
+  def test_shared_output_directory(self):
+    # Concurrent stages create the same new output directory
+    stages = [self.copy_stage('left', 'source.txt', 'out/left.txt', 'l'),
+              self.copy_stage('right', 'source.txt', 'out/right.txt', 'r')]
+    results = Pipeline(stages, self.state, log_directory=self.path('logs')).run(jobs=2)
+    self.assertEqual(set(results.values()), set([pipeline_runner.RAN]))
+
+if __name__ == '__main__':
+  unittest2.main()
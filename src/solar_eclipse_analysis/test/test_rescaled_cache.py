@@ -0,0 +1,66 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for rescaled_cache."""
+import sys
+sys.path.append("..")
+import os
+import shutil
+import tempfile
+import unittest2
+import numpy as np
+import rescaled_cache
+
+class RescaledCacheTest(unittest2.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.image = np.random.randint(0, 256, (108, 192, 3)).astype(np.uint8)
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+  def testRoundTrip(self):
+    for format in rescaled_cache.FORMATS:
+      path = rescaled_cache.rescaled_path(self.directory, "photo", format)
+      rescaled_cache.write_rescaled(path, self.image, format)
+      image = rescaled_cache.read_rescaled(path)
+      self.assertEqual(image.shape, (108, 192, 4))
+      self.assertTrue(np.array_equal(image[:, :, :3], self.image))
+      self.assertTrue((image[:, :, 3] == 255).all())
+      os.unlink(path)
+
+  def testOriginalFormat(self):
+    path = rescaled_cache.rescaled_path(self.directory, "photo", "png")
+    rescaled_cache.write_rescaled(path, self.image, "png")
+    self.assertTrue(path.endswith(".rescaled.png"))
+    self.assertEqual(os.listdir(self.directory), ["photo.rescaled.png"])
+
+  def testMemoryMapIsCopyOnWrite(self):
+    path = rescaled_cache.rescaled_path(self.directory, "photo", "npy")
+    rescaled_cache.write_rescaled(path, self.image, "npy")
+    image = rescaled_cache.read_rescaled(path)
+    image[:] = 0
+    self.assertTrue(np.array_equal(rescaled_cache.read_rescaled(path)[:, :, :3], self.image))
+
+  def testFindAndList(self):
+    rescaled_cache.write_rescaled(
+      rescaled_cache.rescaled_path(self.directory, "a", "png"), self.image, "png")
+    rescaled_cache.write_rescaled(
+      rescaled_cache.rescaled_path(self.directory, "b", "npy"), self.image, "npy")
+    self.assertEqual(rescaled_cache.list_rescaled(self.directory), set(["a", "b"]))
+    self.assertTrue(rescaled_cache.find_rescaled(self.directory, "b").endswith(".npy"))
+    self.assertIsNone(rescaled_cache.find_rescaled(self.directory, "c"))
+
+if __name__ == '__main__':
+  unittest2.main()
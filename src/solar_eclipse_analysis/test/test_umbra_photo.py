@@ -0,0 +1,80 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for umbra_photo."""
+import sys
+sys.path.append("..")
+import datetime
+import random
+import unittest2
+from shapely.geometry import Point, Polygon
+import umbra_photo
+
+def make_polys(count):
+  # Overlapping unit squares marching east, one per second
+  polys = []
+  start = datetime.datetime(2017, 8, 21, 17, 0, 0)
+  for i in range(count):
+    x = i * 0.5
+    poly = Polygon(((x, 0), (x + 1, 0), (x + 1, 1), (x, 1)))
+    polys.append((poly, poly.centroid, start + datetime.timedelta(seconds=i)))
+  return polys
+
+def brute_force(r, polys):
+  # The original O(photos x polygons) assignment
+  poly_dts = dict((poly_dt, poly) for poly, poly_centroid, poly_dt in polys)
+  poly_table = dict((j, []) for j in range(len(polys)))
+  for fname in sorted(r):
+    d = r[fname]
+    lat = d['lat']
+    lon = -d['lon']
+    dt = d['image_datetime']
+    point = Point(lon, lat)
+    pdt = dt.replace(tzinfo=None)
+    if pdt not in poly_dts or not poly_dts[pdt].contains(point):
+      continue
+    for j, (poly, poly_centroid, poly_dt) in enumerate(polys):
+      if poly.contains(point):
+        poly_table[j].append((poly_centroid.distance(point), fname, lat, lon, dt))
+  for j in poly_table:
+    poly_table[j].sort()
+  return poly_table
+
+class UmbraPhotoTest(unittest2.TestCase):
+  def setUp(self):
+    random.seed(0)
+    self.polys = make_polys(20)
+    self.photos = {}
+    for i in range(200):
+      j = random.randrange(len(self.polys))
+      self.photos['%05d' % i] = {
+        'lat': random.uniform(-0.2, 1.2),
+        'lon': -random.uniform(-0.2, 11),
+        'image_datetime': self.polys[j][2],
+      }
+
+  def testContainingMatchesBruteForce(self):
+    index = umbra_photo.UmbraIndex(self.polys)
+    for d in self.photos.values():
+      point = Point(-d['lon'], d['lat'])
+      expected = [j for j, p in enumerate(self.polys) if p[0].contains(point)]
+      self.assertEqual(index.containing(point), expected)
+
+  def testAssignPhotosMatchesBruteForce(self):
+    index = umbra_photo.UmbraIndex(self.polys)
+    poly_table = umbra_photo.assign_photos(self.photos, index, None)
+    self.assertEqual(poly_table, brute_force(self.photos, self.polys))
+
+if __name__ == '__main__':
+  unittest2.main()
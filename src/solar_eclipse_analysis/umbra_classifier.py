@@ -9,6 +9,7 @@ from shapely.geometry import Polygon, Point, LineString
 from shapely.geometry import shape
 from multiprocessing import Pool
 import functools
+import columnar
 
 def get_arguments():
     parser = argparse.ArgumentParser(description='')
@@ -24,16 +25,16 @@ def get_arguments():
 def main():
     args = get_arguments()
     # Load table of umbra to photo mappings
-    umbra_photos = pickle.load(open(args.umbra_photos))
-    polys = pickle.load(open(args.umbra_polys))
+    umbra_photos = columnar.load_frame_table(args.umbra_photos, columnar.UMBRA_PHOTO_FIELDS)
+    polys = columnar.load_umbra_polys(args.umbra_polys)
 
-    for i, poly in enumerate(polys):
+    for i in range(len(polys)):
         dirname = os.path.join(args.directory, str(i))
         if not os.path.exists(dirname):
             os.mkdir(dirname)
 
     # Load photo points
-    r = pickle.load(open(args.input))
+    r = columnar.load_metadata(args.input, ['width', 'height'])
 
     prevset = set()
     k = umbra_photos.keys()
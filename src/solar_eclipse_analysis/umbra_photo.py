@@ -1,4 +1,5 @@
 import os
+import time
 import datetime
 import shapefile
 import argparse
@@ -6,7 +7,10 @@ import pickle
 from shapely.geometry import Polygon, Point, LineString
 
 from shapely.geometry import shape
+from shapely.prepared import prep
+from shapely.strtree import STRtree
 from multiprocessing import Pool
+import columnar
 import functools
 
 def get_arguments():
@@ -14,6 +18,10 @@ def get_arguments():
     parser.add_argument('--input', type=str, default="extracted_metadata.pkl")
     parser.add_argument('--umbra_polys', type=str, default='umbra_polys.pkl')
     parser.add_argument('--umbra_photos', type=str, default='umbra_photos.pkl')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--chunk_size', type=int, default=1000)
+    # Optional previously generated umbra_photos.pkl to compare against
+    parser.add_argument('--reference', type=str, default=None)
     return parser.parse_args()
 
 def load_map(map_path):
@@ -24,7 +32,33 @@ def load_map(map_path):
     return shp_geom
 
 
-def process_item(d, fname, polys, poly_dts):
+class UmbraIndex(object):
+    """Spatio-temporal index over the umbra polygons.
+
+    Polygons are indexed by bounds in an STR-tree (so a photo is only
+    tested against the few umbras that can contain it) and by the UTC
+    time of the umbra.  Containment tests use prepared geometries.
+    """
+    def __init__(self, polys):
+        self.polys = polys
+        geoms = [poly for poly, poly_centroid, poly_dt in polys]
+        self.tree = STRtree(geoms)
+        self.geom_index = dict((id(geom), j) for j, geom in enumerate(geoms))
+        self.prepared = [prep(geom) for geom in geoms]
+        self.poly_dts = {}
+        for j, (poly, poly_centroid, poly_dt) in enumerate(polys):
+            self.poly_dts[poly_dt] = j
+
+    def candidates(self, point):
+        """Return the sorted indexes of the umbras whose bounds contain point."""
+        return sorted(self.geom_index[id(geom)] for geom in self.tree.query(point))
+
+    def containing(self, point):
+        """Return the sorted indexes of the umbras which contain point."""
+        return [j for j in self.candidates(point) if self.prepared[j].contains(point)]
+
+
+def process_item(d, fname, index):
     lat = d['lat']
     lon = -d['lon']
     dt = d['image_datetime']
@@ -32,60 +66,86 @@ def process_item(d, fname, polys, poly_dts):
     # # Based on photo's time, find the umbra whose center point's time is the same
     # TODO(dek): fix https://b.corp.google.com/issues/64974121
     pdt = dt.replace(tzinfo=None)
-    if pdt not in poly_dts:
+    if pdt not in index.poly_dts:
         print "Point outside eclipse time window:", fname, pdt, lat, lon
         return None
-    current_poly = poly_dts[pdt][0]
-    if not current_poly.contains(point):
+    if not index.prepared[index.poly_dts[pdt]].contains(point):
         print "Point outside eclipse time window:", fname, pdt, lat,lon
         return None
     # Now we know this photo point/dt is in totality
     # Find all umbra polys that contain this photo
     x = []
-    for j, p in enumerate(polys):
-        poly, poly_centroid, poly_dt = p
-        if poly.contains(point):
-            x.append((j, (poly_centroid.distance(point), fname, lat, lon, dt)))
+    for j in index.containing(point):
+        poly, poly_centroid, poly_dt = index.polys[j]
+        x.append((j, (poly_centroid.distance(point), fname, lat, lon, dt)))
     return x
 
-def main():
-    args = get_arguments()
+def process_items(items, index):
+    """Assign a batch of (fname, metadata) items to their umbras."""
+    results = []
+    for fname, d in items:
+        x = process_item(d, fname, index)
+        if x is not None:
+            results.extend(x)
+    return results
+
+# Per-process umbra index, used when assignment is sharded across a Pool.
+# Prepared geometries can't be pickled, so each worker builds its own.
+_index = None
+
+def _init_worker(umbra_polys):
+    global _index
+    _index = UmbraIndex(columnar.load_umbra_polys(umbra_polys))
 
-    polys = pickle.load(open(args.umbra_polys))
+def _process_chunk(items):
+    return process_items(items, _index)
+
+def assign_photos(r, index, umbra_polys, processes=1, chunk_size=1000):
+    """Build the table of umbra index -> photos contained by that umbra."""
     poly_table = {}
-    for j, poly in enumerate(polys):
+    for j in range(len(index.polys)):
         poly_table[j] = []
 
-    poly_dts = {}
-    for poly, poly_centroid, poly_dt in polys:
-        poly_dts[poly_dt] = poly, poly_centroid
+    fnames = sorted(r)
+    items = [(fname, r[fname]) for fname in fnames]
+    if processes > 1:
+        p = Pool(processes, initializer=_init_worker, initargs=(umbra_polys,))
+        batches = [items[i:i+chunk_size] for i in range(0, len(items), chunk_size)]
+        results = p.map(_process_chunk, batches)
+        p.terminate()
+    else:
+        results = [process_items(items, index)]
 
-    # Load photo points
-    r = pickle.load(open(args.input))
-
-    photo_fname = {}
-    included_photos = set()
-    fnames = []
-    for i, fname in enumerate(r):
-        fnames.append(fname)
-    fnames.sort()
-    
-    for i, fname in enumerate(fnames):
-        d = r[fname]
-        results = process_item(d, fname, polys, poly_dts)
-        if results is None:
-            # print "Photo", i, "failed to process item"
-            continue
-        # print "Photo", i, "successfully process item"
-        for result in results:
-            j, data = result
+    for result in results:
+        for j, data in result:
             poly_table[j].append(data)
 
-
     # Sort by distance of photo to center of enclosing umbra
     for j in poly_table:
         poly_table[j].sort()
+    return poly_table
+
+def main():
+    args = get_arguments()
+
+    polys = columnar.load_umbra_polys(args.umbra_polys)
+    index = UmbraIndex(polys)
+
+    # Load photo points
+    r = columnar.load_metadata(args.input, ['lat', 'lon', 'image_datetime'])
+
+    start = time.time()
+    poly_table = assign_photos(r, index, args.umbra_polys, args.processes, args.chunk_size)
+    print "Assigned %d photos to %d umbras in %.2fs" % (len(r), len(polys), time.time() - start)
+
     pickle.dump(poly_table, open(args.umbra_photos, "wb"))
 
+    if args.reference is not None:
+        reference = pickle.load(open(args.reference))
+        if reference == poly_table:
+            print "Output matches reference", args.reference
+        else:
+            print "Output differs from reference", args.reference
+
 if __name__ == '__main__':
     main()
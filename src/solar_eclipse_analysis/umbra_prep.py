@@ -1,17 +1,29 @@
 import os
+import time
 import datetime
 import shapefile
 import argparse
 import pickle
-from shapely.geometry import Polygon, Point, LineString
+from shapely.geometry import Polygon, Point, LineString, box
+from shapely.prepared import prep
+from multiprocessing import Pool
 
 from shapely.geometry import shape
+import columnar
 
 def get_arguments():
     parser = argparse.ArgumentParser(description='')
     parser.add_argument('--umbra', type=str, default='data/w_umbra17_1m.shp')
     parser.add_argument('--umbra_output', type=str, default='umbra_polys.pkl')
+    # Directory for the memory-mappable (WKB + timestamps) copy of the output
+    parser.add_argument('--umbra_columns', type=str, default='umbra_polys')
     parser.add_argument('--us_map_file', type=str, default="data/cb_2016_us_nation_20m.shp")
+    # Simplification tolerance (degrees) for the US boundary.  0 keeps
+    # the full boundary, which is needed for identical output.
+    parser.add_argument('--simplify_tolerance', type=float, default=0.)
+    parser.add_argument('--processes', type=int, default=8)
+    # Optional previously generated umbra_polys.pkl to compare against
+    parser.add_argument('--reference', type=str, default=None)
     return parser.parse_args()
 
 def load_map(map_path):
@@ -27,10 +39,8 @@ def f(args):
         d = poly_centroid.distance(point)
         return (i, j), d
 
-def main():
-    args = get_arguments()
-
-    us_map = load_map(args.us_map_file)
+def load_us_map_polygon(us_map_file):
+    us_map = load_map(us_map_file)
     # Extract 48 contiguous states
     main_us = us_map.boundary[78:79]
     points = []
@@ -38,8 +48,44 @@ def main():
     for line in main_us.geoms:
         for point in line.coords:
             points.append((point[0], point[1]))
-    us_map_polygon = Polygon(points)
+    return Polygon(points)
+
+# Per-process US boundary.  Prepared geometries can't be pickled, so
+# each Pool worker builds its own.
+_us_map_bounds = None
+_us_map_prepared = None
+
+def _init_worker(us_map_file, simplify_tolerance):
+    global _us_map_bounds, _us_map_prepared
+    us_map_polygon = load_us_map_polygon(us_map_file)
+    if simplify_tolerance > 0:
+        us_map_polygon = us_map_polygon.simplify(simplify_tolerance)
+    _us_map_bounds = box(*us_map_polygon.bounds)
+    _us_map_prepared = prep(us_map_polygon)
+
+def process_shape(item):
+    """Return the umbra tuple for a shapefile record, or None if the umbra
+    does not intersect the US map."""
+    points, time_str = item
+    poly = Polygon(points)
+    # Cheap bounding box test first
+    if not _us_map_bounds.intersects(box(*poly.bounds)):
+        return None
+    if not _us_map_prepared.intersects(poly):
+        return None
+    dt = datetime.datetime.strptime("2017/08/21 " + time_str, "%Y/%m/%d %H:%M:%S")
+    return poly, poly.centroid, dt
 
+def compare(polys, reference):
+    if len(polys) != len(reference):
+        return False
+    for (poly, poly_centroid, poly_dt), (ref, ref_centroid, ref_dt) in zip(polys, reference):
+        if poly_dt != ref_dt or not poly.equals_exact(ref, 0) or not poly_centroid.equals(ref_centroid):
+            return False
+    return True
+
+def main():
+    args = get_arguments()
 
     umbra_shape = shapefile.Reader("data/umbra17_1s.shp")
     # extract umbra polygons and their attributes (UTC time)
@@ -50,15 +96,25 @@ def main():
     shapes = umbra_shape.shapes()
     records = umbra_shape.shapeRecords()
     assert(len(shapes) == len(records))
-    polys = []
-    for i, shape in enumerate(shapes):
-        record = records[i].record
-        poly = Polygon(shape.points)
-        dt = datetime.datetime.strptime("2017/08/21 " + record[0], "%Y/%m/%d %H:%M:%S")
-        if us_map_polygon.intersects(poly):
-            polys.append( (poly, poly.centroid, dt) )
+    items = [(shape.points, records[i].record[0]) for i, shape in enumerate(shapes)]
+
+    start = time.time()
+    p = Pool(args.processes, initializer=_init_worker,
+             initargs=(args.us_map_file, args.simplify_tolerance))
+    results = p.map(process_shape, items, chunksize=max(1, len(items) / (args.processes * 4)))
+    p.terminate()
+    polys = [result for result in results if result is not None]
+    print "Selected %d of %d umbras in %.2fs" % (len(polys), len(items), time.time() - start)
+
     with open(args.umbra_output, "wb") as o:
         pickle.dump(polys, o)
+    columnar.write_umbra_polys(args.umbra_columns, polys)
+
+    if args.reference is not None:
+        if compare(polys, pickle.load(open(args.reference))):
+            print "Output matches reference", args.reference
+        else:
+            print "Output differs from reference", args.reference
 
 if __name__ == '__main__':
     main()
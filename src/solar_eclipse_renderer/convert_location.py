@@ -14,39 +14,153 @@
 
 import ephem
 import math
+import numpy as np
 deg = math.degrees
 from coords import horizontal_to_cartesian
-from lune import get_lune
+from lune import get_lune_array
+
+# Fields of the positions returned by sample_location, in the order of
+# the tuples returned by convert_location
+POSITION_DTYPE = np.dtype([('date', 'S24'),
+                           ('sun_alt', np.float64), ('sun_az', np.float64),
+                           ('moon_alt', np.float64), ('moon_az', np.float64),
+                           ('r_sun', np.float64), ('r_moon', np.float64),
+                           ('lune', np.float64),
+                           ('parallactic_angle', np.float64),
+                           ('lat', np.float64), ('lon', np.float64)])
 
 def convert_location(lat, lon, start_datetime, end_datetime, inclusion_threshold, dt = 1):
     """Convert a lat, lon and start to end datetime to a series of sun and moon positions.
 
     The resulting positions are filtered by inclusion_threshold, which
-    is compared to the seperation angle.  The datetime clock is
-    incremented by dt seconds by iteration."""
+    is compared to the lune percentage.  The datetime clock is
+    incremented by dt seconds by iteration.  Returns a list of tuples
+    with the fields of POSITION_DTYPE."""
+    return sample_location(lat, lon, start_datetime, end_datetime, inclusion_threshold, dt).tolist()
 
-    obs = ephem.Observer()
-    obs.lat = math.radians(lat)
-    obs.lon = math.radians(lon)
+def separation_array(az1, alt1, az2, alt2):
+    """Vectorized ephem.separation of (az, alt) pairs, in radians."""
+    cosine = np.sin(alt1)*np.sin(alt2) + np.cos(alt1)*np.cos(alt2)*np.cos(az1-az2)
+    return np.arccos(np.clip(cosine, -1, 1))
 
-    sun = ephem.Sun()
-    moon = ephem.Moon()
+class _Ephemeris(object):
+    """Sun and moon positions at an observer, computed at most once per step."""
 
-    d = ephem.Date(start_datetime)
-    pos = []
+    def __init__(self, lat, lon, dates):
+        self.obs = ephem.Observer()
+        self.obs.lat = math.radians(lat)
+        self.obs.lon = math.radians(lon)
+        self.sun = ephem.Sun()
+        self.moon = ephem.Moon()
+        self.dates = dates
+        self.computed = {}
+
+    def position(self, i):
+        """Returns (sun_alt, sun_az, moon_alt, moon_az, r_sun, r_moon,
+        parallactic_angle) at step i."""
+        if i not in self.computed:
+            self.obs.date = self.dates[i]
+            self.sun.compute(self.obs)
+            self.moon.compute(self.obs)
+            self.computed[i] = (float(self.sun.alt), float(self.sun.az),
+                                float(self.moon.alt), float(self.moon.az),
+                                self.sun.size/2, self.moon.size/2,
+                                float(self.sun.parallactic_angle()))
+        return self.computed[i]
 
-    while d < ephem.Date(end_datetime):
-        obs.date = d
-        sun.compute(obs)
-        moon.compute(obs)
-        l = get_lune(sun, moon)
+    def positions(self, steps):
+        return np.array([self.position(i) for i in steps], dtype=np.float64).reshape(-1, 7)
 
-        if l > inclusion_threshold:
-          # print(str(d), "Sun: %.3f %.3f" % (deg(sun.alt), deg(sun.az)), "Moon: %.3f %.3f" % (deg(moon.alt), deg(moon.az)), "%.4f" % s, parallactic_angle, ph)
-          r_sun=sun.size/2
-          r_moon=moon.size/2
-          parallactic_angle = sun.parallactic_angle()
-          pos.append( (str(d), float(sun.alt), float(sun.az), float(moon.alt), float(moon.az), r_sun, r_moon, l, parallactic_angle, lat, lon))
+    def separation(self, steps):
+        p = self.positions(steps)
+        return separation_array(p[:, 1], p[:, 0], p[:, 3], p[:, 2])
 
+    def lune(self, steps):
+        p = self.positions(steps)
+        s = np.degrees(separation_array(p[:, 1], p[:, 0], p[:, 3], p[:, 2]))*60*60
+        return get_lune_array(s, p[:, 4], p[:, 5])
+
+def _date_steps(start_datetime, end_datetime, dt):
+    """Returns the dates convert_location steps through, accumulated the
+    same way so they match to the last bit."""
+    d = ephem.Date(start_datetime)
+    end = ephem.Date(end_datetime)
+    dates = []
+    while d < end:
+        dates.append(d)
         d = ephem.Date(d + (dt*ephem.second))
-    return pos
+    return dates
+
+def _closest_step(ephemeris, n, coarse):
+    """Returns the step with the smallest sun-moon separation, which is
+    unimodal over the few hours around an eclipse: the smallest coarse
+    sample, refined by ternary search between its neighbors."""
+    coarse_steps = range(0, n, coarse)
+    if coarse_steps[-1] != n - 1:
+        coarse_steps.append(n - 1)
+    k = int(np.argmin(ephemeris.separation(coarse_steps)))
+    lo = coarse_steps[max(k - 1, 0)]
+    hi = coarse_steps[min(k + 1, len(coarse_steps) - 1)]
+    while hi - lo > 2:
+        m1 = lo + (hi - lo) // 3
+        m2 = hi - (hi - lo) // 3
+        s1, s2 = ephemeris.separation([m1, m2])
+        if s1 < s2:
+            hi = m2
+        else:
+            lo = m1
+    steps = range(lo, hi + 1)
+    return steps[int(np.argmin(ephemeris.separation(steps)))]
+
+def _first_included(ephemeris, lo, hi, inclusion_threshold):
+    """Bisects for the furthest step from hi, towards lo, whose lune is
+    above inclusion_threshold, given that hi's is."""
+    # Invariant: hi is included, lo is not (or is the end of the range)
+    if ephemeris.lune([lo])[0] > inclusion_threshold:
+        return lo
+    while abs(hi - lo) > 1:
+        mid = (lo + hi) // 2
+        if ephemeris.lune([mid])[0] > inclusion_threshold:
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+def sample_location(lat, lon, start_datetime, end_datetime, inclusion_threshold, dt = 1, coarse_dt = 1200):
+    """Computes convert_location as a structured array of POSITION_DTYPE.
+
+    Instead of computing the sun and moon at every step, the closest
+    approach is found from steps coarse_dt seconds apart, and the start
+    and end of the steps with a lune above inclusion_threshold are found
+    by bisection around it.  Only the steps inside that window are
+    computed in full, and their lunes are computed together."""
+    dates = _date_steps(start_datetime, end_datetime, dt)
+    n = len(dates)
+    if n == 0:
+        return np.zeros(0, dtype=POSITION_DTYPE)
+    ephemeris = _Ephemeris(lat, lon, dates)
+
+    closest = _closest_step(ephemeris, n, max(int(coarse_dt // dt), 1))
+    if ephemeris.lune([closest])[0] <= inclusion_threshold:
+        return np.zeros(0, dtype=POSITION_DTYPE)
+    first = _first_included(ephemeris, 0, closest, inclusion_threshold)
+    last = _first_included(ephemeris, n - 1, closest, inclusion_threshold)
+
+    steps = range(first, last + 1)
+    p = ephemeris.positions(steps)
+    lune = ephemeris.lune(steps)
+    result = np.zeros(len(steps), dtype=POSITION_DTYPE)
+    result['date'] = [str(dates[i]) for i in steps]
+    result['sun_alt'] = p[:, 0]
+    result['sun_az'] = p[:, 1]
+    result['moon_alt'] = p[:, 2]
+    result['moon_az'] = p[:, 3]
+    result['r_sun'] = p[:, 4]
+    result['r_moon'] = p[:, 5]
+    result['lune'] = lune
+    result['parallactic_angle'] = p[:, 6]
+    result['lat'] = lat
+    result['lon'] = lon
+    # The window is contiguous around the closest approach, but drop any
+    # steps inside it which dip below the threshold, as convert_location did
+    return result[lune > inclusion_threshold]
@@ -0,0 +1,91 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark convert_location against the step-by-step reference over
+the full grid of locations written by create_locations.py."""
+
+import argparse
+import math
+import pickle
+import time
+import ephem
+import numpy as np
+from convert_location import convert_location
+from lune import get_lune
+
+def convert_location_reference(lat, lon, start_datetime, end_datetime, inclusion_threshold, dt = 1):
+    """convert_location as it was before batching: computes the sun and
+    moon positions at every step."""
+
+    obs = ephem.Observer()
+    obs.lat = math.radians(lat)
+    obs.lon = math.radians(lon)
+
+    sun = ephem.Sun()
+    moon = ephem.Moon()
+
+    d = ephem.Date(start_datetime)
+    pos = []
+
+    while d < ephem.Date(end_datetime):
+        obs.date = d
+        sun.compute(obs)
+        moon.compute(obs)
+        l = get_lune(sun, moon)
+
+        if l > inclusion_threshold:
+          # print(str(d), "Sun: %.3f %.3f" % (deg(sun.alt), deg(sun.az)), "Moon: %.3f %.3f" % (deg(moon.alt), deg(moon.az)), "%.4f" % s, parallactic_angle, ph)
+          r_sun=sun.size/2
+          r_moon=moon.size/2
+          parallactic_angle = sun.parallactic_angle()
+          pos.append( (str(d), float(sun.alt), float(sun.az), float(moon.alt), float(moon.az), r_sun, r_moon, l, parallactic_angle, lat, lon))
+
+        d = ephem.Date(d + (dt*ephem.second))
+    return pos
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='')
+    parser.add_argument('--locations', type=str, nargs='*',
+                        default=["locations_inside.pkl", "locations_outside.pkl"])
+    parser.add_argument('--start_datetime', type=str, default="2017/08/21 16:00:00")
+    parser.add_argument('--end_datetime', type=str, default="2017/08/21 20:00:00")
+    parser.add_argument('--inclusion_threshold', type=float, default=95)
+    parser.add_argument('--dt', type=int, default=30)
+    return parser.parse_args()
+
+def main():
+    args  = get_arguments()
+    locations = []
+    for fname in args.locations:
+        locations.extend(pickle.load(open(fname, "rb")))
+
+    results = {}
+    for name, fn in ('reference', convert_location_reference), ('batched', convert_location):
+        start = time.time()
+        results[name] = [fn(lat, lon, args.start_datetime, args.end_datetime,
+                            args.inclusion_threshold, args.dt) for lat, lon in locations]
+        elapsed = time.time() - start
+        print "%-9s %d locations in %.2fs (%.2f ms/location), %d positions" % (
+            name, len(locations), elapsed, 1000 * elapsed / len(locations),
+            sum(len(pts) for pts in results[name]))
+
+    mismatches = 0
+    for reference, batched in zip(results['reference'], results['batched']):
+        if [p[0] for p in reference] != [p[0] for p in batched] or \
+           not all(np.allclose(p[1:], q[1:]) for p, q in zip(reference, batched)):
+            mismatches += 1
+    print "Locations which differ:", mismatches
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Solar corona drawing shared by the OpenGL and software renderers.
+
+The random shape of the corona is generated once per renderer (and can
+be saved to and loaded from JSON so renders are repeatable).  Since only
+the sun's position, size and parallactic angle change between frames,
+the corona is drawn and blurred once per sun radius into a sprite
+centered on the sun, which each frame translates (and rotates) into
+place.
+"""
+
+import json
+import math
+import cv2
+import numpy as np
+deg = math.degrees
+from render_constants import *
+
+# Number of corona sprites (one per sun radius) to keep
+SPRITE_CACHE_SIZE = 4
+
+class CoronaParameters(object):
+    """Random parameters defining the shape of the corona."""
+
+    def setupRandom(self):
+        # Create a collection of "polar coronal angles" which are used to
+        # generate the fine, curved, "polar" coronal streams.
+        self.n_polar_coronal_angles = 10
+        self.polar_coronal_angles = np.hstack([
+            np.random.random_sample(self.n_polar_coronal_angles) * (NORTHERN_MAX - NORTHERN_MIN) + NORTHERN_MIN,
+            np.random.random_sample(self.n_polar_coronal_angles) * (SOUTHERN_MAX - SOUTHERN_MIN) + SOUTHERN_MIN
+        ])
+        # Create a series of sub-angles that define collection of substreams off the main polar angle,
+        self.polar_coronal_ellipse_params = np.random.random_sample(self.n_polar_coronal_angles*2)
+        self.polar_coronal_subangles = []
+        self.n_coronal_subangles_per_angle = 5
+        for i in range(self.n_polar_coronal_angles*2):
+            self.polar_coronal_subangles.append(np.random.normal(0, 5, self.n_coronal_subangles_per_angle))
+
+        # Create a series of "equatorial corona angles" which are used to generate large, triangle-shaped "equatorial" coronal streams
+        self.n_equatorial_coronal_angles = 3
+        self.equatorial_coronal_angles = np.hstack([
+            np.random.random_sample(self.n_equatorial_coronal_angles) * (WESTERN_MAX - WESTERN_MIN) + WESTERN_MIN,
+            np.random.random_sample(self.n_equatorial_coronal_angles) * (EASTERN_MAX - EASTERN_MIN) + EASTERN_MIN,
+        ])
+        self.corona_sprites = {}
+
+    def writeRandom(self, fname):
+        w = open(fname, "w")
+        w.write(self.getRandomAsJSON())
+        w.close()
+
+    def getRandomAsJSON(self):
+        d = {
+            'n_polar_corona_angles': self.n_polar_coronal_angles,
+            'polar_coronal_angles': list(self.polar_coronal_angles),
+            'polar_coronal_subangles': map(list, self.polar_coronal_subangles),
+            'polar_coronal_ellipse_params': list(self.polar_coronal_ellipse_params),
+            'n_coronal_subangles_per_angle': self.n_coronal_subangles_per_angle,
+            'n_equatorial_coronal_angles': self.n_equatorial_coronal_angles,
+            'equatorial_coronal_angles': list(self.equatorial_coronal_angles)
+        }
+
+        return json.dumps(d)
+
+    def setRandomAsJSON(self, j):
+        d = json.loads(j)
+        self.n_polar_corona_angles = d['n_polar_corona_angles']
+        self.polar_coronal_angles = d['polar_coronal_angles']
+        self.polar_coronal_subangles = d['polar_coronal_subangles']
+        self.polar_coronal_ellipse_params = d['polar_coronal_ellipse_params']
+        self.n_coronal_subangles_per_angle = d['n_coronal_subangles_per_angle']
+        self.n_equatorial_coronal_angles = d['n_equatorial_coronal_angles']
+        self.equatorial_coronal_angles = d['equatorial_coronal_angles']
+        self.corona_sprites = {}
+
+    def corona_shapes(self, circle_center, circle_size):
+        """Returns the (center, axes, angle) of the polar ellipse arcs and
+        the equatorial polygons of a corona around a sun at circle_center."""
+        polar = []
+        for i, angle in enumerate(self.polar_coronal_angles):
+            for j in self.polar_coronal_subangles[i]:
+                x = int(circle_center[0] + math.cos(angle)*circle_size)
+                y = int(circle_center[1] + math.sin(angle)*circle_size)
+                polar.append(((x,y), (int(circle_size*8), int(circle_size/8.)), deg(angle)+j))
+        equatorial = []
+        for angle in self.equatorial_coronal_angles:
+            pts = []
+            for delta, scale in ((-15, 1), (-15, 2), (-5, 4), (0, 6), (5, 4), (15, 2), (15, 1)):
+                a = angle + math.radians(delta)
+                pts.append([int(circle_center[0] + math.cos(a)*circle_size*scale),
+                            int(circle_center[1] + math.sin(a)*circle_size*scale)])
+            equatorial.append(np.array(pts))
+        return polar, equatorial
+
+    def corona_sprite(self, circle_size):
+        """Returns (sprite, center): the BGRA corona around a sun of radius
+        circle_size, cropped to where it is non-zero, and the position of
+        the sun's center in it.  Sprites are cached per radius."""
+        if circle_size in self.corona_sprites:
+            return self.corona_sprites[circle_size]
+
+        glare_blurs = (int(circle_size*1.5), int(circle_size*1.25))
+
+        def shapes(center):
+            polar, equatorial = self.corona_shapes(center, circle_size)
+            arcs = [cv2.ellipse2Poly(e_center, axes, int(round(angle)), 0, 90, 1)
+                    for e_center, axes, angle in polar]
+            glare = [np.array([[center[0] - 3*circle_size, center[1] - 3*circle_size],
+                               [center[0] + 3*circle_size, center[1] + 3*circle_size]])]
+            # The region each layer is blurred over: the bounding box of
+            # its shapes plus a pixel for line width, the kernel size and
+            # (for the second glare blur) the spread of the first blur
+            rois = [roi(arcs, (5, 5)),
+                    roi(equatorial, (100, 100)),
+                    roi(glare, (glare_blurs[0],) * 2),
+                    roi(glare, (glare_blurs[1],) * 2, glare_blurs[0])]
+            return polar, equatorial, rois
+
+        def roi(points, ksize, pad=0):
+            x, y, w, h = cv2.boundingRect(np.vstack(points).astype(np.int32))
+            pad += 1
+            return x - pad - ksize[0], y - pad - ksize[1], x + w + pad + ksize[0], y + h + pad + ksize[1], ksize
+
+        def blur_roi(image, region):
+            x0, y0, x1, y1, ksize = region
+            # Everything outside the region is zero, so blurring it with a
+            # zero border is the same as blurring the whole layer
+            image[y0:y1, x0:x1] = cv2.blur(np.ascontiguousarray(image[y0:y1, x0:x1]), ksize,
+                                           borderType=cv2.BORDER_CONSTANT)
+            return image
+
+        # Lay the shapes out around a center far enough from the origin
+        # that all their coordinates are positive, then shift them so the
+        # canvas just covers the union of the blurred regions
+        c = 9*circle_size + 2
+        rois = shapes((c, c))[2]
+        x0 = min(r[0] for r in rois)
+        y0 = min(r[1] for r in rois)
+        center = (c - x0, c - y0)
+        polar, equatorial, rois = shapes(center)
+        canvas = np.zeros((max(r[3] for r in rois), max(r[2] for r in rois), 4), np.uint8)
+
+        # Draw coronal polar angle lines as bundles of truncated ellipses.
+        # The ellipses start at the sun surface and project outward
+        # towards the poles, then curve away
+        # TODO(dek): better curving, especially angle-dependent curves
+        im_polar = canvas.copy()
+        for ellipse_center, axes, angle in polar:
+            cv2.ellipse(im_polar, ellipse_center, axes, angle,  0, 90, (255, 255, 255, 127))
+        blur_polar = blur_roi(im_polar, rois[0])
+
+        # Draw the coronal equatorial regions as polygons that get
+        # skinnier as they get further from the sun's surface
+        im_equitorial = canvas.copy()
+        for pts in equatorial:
+            cv2.fillConvexPoly(im_equitorial, pts, (255, 255, 255, 127))
+        # Blur the equatorial corona
+        blur_equitorial = blur_roi(im_equitorial, rois[1])
+
+        # Create a blurred sun to simulate glare
+        im_corona_positive = canvas
+        cv2.circle(im_corona_positive, center, int(circle_size*3), [255, 255, 255, 127], -1)
+        blur_corona_positive = blur_roi(im_corona_positive, rois[2])
+        blur_corona_positive = blur_roi(blur_corona_positive, rois[3])
+        # Subtract out the center of the glare
+        cv2.circle(blur_corona_positive, center, circle_size, [0,0,0, 255], -1)
+
+        alpha = 1
+        beta = 0.15
+        # Combine the blurred polar corona with the glare
+        result = cv2.addWeighted( blur_polar, alpha, blur_corona_positive, beta, 0.0)
+        # Combine that with the equitorial blur
+        result2 = cv2.addWeighted( result, 1, blur_equitorial, 1, 0.0)
+
+        # Crop to the non-zero pixels
+        x, y, w, h = cv2.boundingRect(cv2.findNonZero(result2.max(axis=2)))
+        sprite = (np.ascontiguousarray(result2[y:y+h, x:x+w]), (center[0] - x, center[1] - y))
+        if len(self.corona_sprites) >= SPRITE_CACHE_SIZE:
+            self.corona_sprites.clear()
+        self.corona_sprites[circle_size] = sprite
+        return sprite
+
+    def render_corona(self, circle_center, circle_size):
+        """Draw the corona around a sun at circle_center (x, y image
+        pixels) with radius circle_size.  Returns a RES_Y x RES_X BGRA
+        image, before parallactic rotation."""
+        sprite, (cx, cy) = self.corona_sprite(circle_size)
+        result = np.zeros((RES_Y, RES_X, 4), np.uint8)
+        # Paste the part of the sprite that falls in the frame
+        x0, y0 = circle_center[0] - cx, circle_center[1] - cy
+        h, w = sprite.shape[:2]
+        fx0, fy0 = max(x0, 0), max(y0, 0)
+        fx1, fy1 = min(x0 + w, RES_X), min(y0 + h, RES_Y)
+        if fx0 < fx1 and fy0 < fy1:
+            result[fy0:fy1, fx0:fx1] = sprite[fy0-y0:fy1-y0, fx0-x0:fx1-x0]
+        return result
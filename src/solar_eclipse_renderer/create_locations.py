@@ -15,7 +15,8 @@
 """Create a collection of locations along and near the eclipse umbral path.
 
 Creates a grid of locations along the eclipse umbral path boundary
-(clipped by the US map) and a padded region around it.
+(clipped by the US map) and a padded region around it.  The locations
+are written as pickled lists of (x, y) tuples and as (N, 2) .npy arrays.
 """
 
 import argparse
@@ -23,8 +24,8 @@ import numpy as np
 import pickle
 import sys
 from eclipse_gis import eclipse_gis
+from shapely import vectorized
 from shapely.geometry import shape
-from shapely.geometry.point import Point
 from shapely.geometry.polygon import Polygon
 from util import load_map
 
@@ -35,6 +36,8 @@ def get_arguments():
     # Default to US-map-clipped data
     parser.add_argument('--eclipse_path_data', type=str, default="eclipse_path_data.txt")
     parser.add_argument('--us_map_file', type=str, default="cb_2016_us_nation_20m.shp")
+    parser.add_argument('--x_count', type=int, default=75)
+    parser.add_argument('--y_count', type=int, default=125)
     return parser.parse_args()
 
 def cartesian_product2(arrays):
@@ -45,6 +48,14 @@ def cartesian_product2(arrays):
         arr[...,i] = a
     return arr.reshape(-1, la)
 
+def grid_points(us_map_polygon, x_count, y_count):
+    """Returns an (x_count * y_count, 2) array of candidate points covering
+    the bounding box of the US."""
+    min_x, min_y, max_x, max_y = us_map_polygon.bounds
+    x_range = np.linspace(min_x, max_x, x_count)
+    y_range = np.linspace(min_y, max_y, y_count)
+    return cartesian_product2([x_range, y_range])
+
 def generate_grid(eclipse_path_data, us_map_polygon, outside=False, umbra_boundary_buffer_size=1.5, x_count=75, y_count=125):
     """Generate a grid of locations within or around the eclipse path.  If
     outside=False, the grid points are within the eclipse path.  If
@@ -52,45 +63,31 @@ def generate_grid(eclipse_path_data, us_map_polygon, outside=False, umbra_bounda
     eclipse path.  umbra_boundary_buffer_size defines the buffer.
     x_count and y_count define the number of points in the grid (the
     full grid covers the bounding box of the United states).
+
+    Returns an (N, 2) array of the points, in the order of grid_points.
+    The points are classified together with shapely.vectorized, which
+    tests them against prepared geometries.
     """
     times, points = eclipse_gis.load_stripped_data(open(eclipse_path_data).readlines())
     boundary, center = eclipse_gis.generate_polygon(points)
-    eg = eclipse_gis.EclipseGIS(boundary, center)
 
-    # TODO(dek) use shapely to compute the BB
-    min_x = min([item[0] for item in us_map_polygon.exterior.coords])
-    min_y = min([item[1] for item in us_map_polygon.exterior.coords])
-    max_x = max([item[0] for item in us_map_polygon.exterior.coords])
-    max_y = max([item[1] for item in us_map_polygon.exterior.coords])
-
-    # Create a grid of candidate points covering the US
-    x_range = np.linspace(min_x, max_x, x_count)
-    y_range = np.linspace(min_y, max_y, y_count)
-    cp = cartesian_product2([x_range, y_range])
-    p = []
+    cp = grid_points(us_map_polygon, x_count, y_count)
+    x, y = cp[:, 0], cp[:, 1]
+    inside_umbra = vectorized.contains(boundary, x, y)
+    if not outside:
+        return cp[inside_umbra]
 
-    # Create a buffer around the eclipse path bounding
+    # Points outside the eclipse path, inside a buffer around the eclipse
+    # path boundary, and inside the US map boundaries.  The US map is the
+    # most detailed polygon, so only the points left are tested against it
     boundary_buffer = boundary.buffer(umbra_boundary_buffer_size)
-    for point in cp:
-        Po = Point(point)
-        inside_umbra = eg.test_point_within_eclipse_boundary(Po)
-        inside_us = us_map_polygon.contains(Po)
-        inside_boundary_buffer = boundary_buffer.contains(Po)
-        # Filter candidate points
-        if not outside and inside_umbra:
-            # User wants point inside the eclipse path and point is inside the
-            # eclipse path
-            p.append(Po)
-        elif outside and not inside_umbra and inside_us and inside_boundary_buffer:
-            # User wants point outside the eclipse path and point is not inside
-            # the eclipse path, is inside the US map boundaries, and inside the boundary buffer
-            p.append(Po)
-
-    return p
+    keep = ~inside_umbra
+    keep[keep] = vectorized.contains(boundary_buffer, x[keep], y[keep])
+    keep[keep] = vectorized.contains(us_map_polygon, x[keep], y[keep])
+    return cp[keep]
 
-def main():
-    args  = get_arguments()
-    us_map = load_map(args.us_map_file)
+def load_us_map_polygon(us_map_file):
+    us_map = load_map(us_map_file)
     # Extract 48 contiguous states
     main_us = us_map.boundary[78:79]
     points = []
@@ -98,21 +95,28 @@ def main():
     for line in main_us.geoms:
         for point in line.coords:
             points.append((point[1], point[0]))
-    us_map_polygon = Polygon(points)
+    return Polygon(points)
+
+def write_locations(fname, locations):
+    """Write locations as a pickled list of (x, y) tuples, and as an (N, 2)
+    array to the .npy file of the same name."""
+    pickle.dump(map(tuple, locations.tolist()), open(fname, "wb"))
+    np.save(fname.replace(".pkl", ".npy"), locations)
+
+def main():
+    args  = get_arguments()
+    us_map_polygon = load_us_map_polygon(args.us_map_file)
 
-    p = generate_grid(args.eclipse_path_data, us_map_polygon, False)
+    p = generate_grid(args.eclipse_path_data, us_map_polygon, False, x_count=args.x_count, y_count=args.y_count)
 
     # Dump inside results
-    inside_results = [ (item.x, item.y) for item in p ]
-    print "Inside results:", len(inside_results)
-    fname = "locations_inside.pkl"
-    pickle.dump(inside_results, open(fname, "wb"))
+    print "Inside results:", len(p)
+    write_locations("locations_inside.pkl", p)
 
     # Dump outside results
-    p = generate_grid(args.eclipse_path_data, us_map_polygon, True)
-    outside_results = [ (item.x, item.y) for item in p ]
-    print "Outside results:", len(outside_results)
-    fname = "locations_outside.pkl"
-    pickle.dump(outside_results, open(fname, "wb"))
+    p = generate_grid(args.eclipse_path_data, us_map_polygon, True, x_count=args.x_count, y_count=args.y_count)
+    print "Outside results:", len(p)
+    write_locations("locations_outside.pkl", p)
 
-main()
+if __name__ == '__main__':
+    main()
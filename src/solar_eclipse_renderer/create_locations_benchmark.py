@@ -0,0 +1,104 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time create_locations.generate_grid against the point-by-point
+reference, on grids of a few sizes."""
+
+import argparse
+import time
+import numpy as np
+from eclipse_gis import eclipse_gis
+from shapely.geometry.point import Point
+import create_locations
+from create_locations import cartesian_product2, load_us_map_polygon
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='')
+    parser.add_argument('--eclipse_path_data', type=str, default="eclipse_path_data.txt")
+    parser.add_argument('--us_map_file', type=str, default="cb_2016_us_nation_20m.shp")
+    # Grid sizes (e.g. 75x125 1000x1000)
+    parser.add_argument('--sizes', type=str, nargs='*', default=["75x125", "250x250", "1000x1000"])
+    return parser.parse_args()
+
+def generate_grid_reference(eclipse_path_data, us_map_polygon, outside=False, umbra_boundary_buffer_size=1.5, x_count=75, y_count=125):
+    """Generate a grid of locations within or around the eclipse path.  If
+    outside=False, the grid points are within the eclipse path.  If
+    outside=True, the grid points are in a buffer region around the
+    eclipse path.  umbra_boundary_buffer_size defines the buffer.
+    x_count and y_count define the number of points in the grid (the
+    full grid covers the bounding box of the United states).
+
+    This is create_locations.generate_grid as it was before vectorizing:
+    it tests each point with Shapely, one at a time, returning a list of
+    Points.
+    """
+    times, points = eclipse_gis.load_stripped_data(open(eclipse_path_data).readlines())
+    boundary, center = eclipse_gis.generate_polygon(points)
+    eg = eclipse_gis.EclipseGIS(boundary, center)
+
+    # TODO(dek) use shapely to compute the BB
+    min_x = min([item[0] for item in us_map_polygon.exterior.coords])
+    min_y = min([item[1] for item in us_map_polygon.exterior.coords])
+    max_x = max([item[0] for item in us_map_polygon.exterior.coords])
+    max_y = max([item[1] for item in us_map_polygon.exterior.coords])
+
+    # Create a grid of candidate points covering the US
+    x_range = np.linspace(min_x, max_x, x_count)
+    y_range = np.linspace(min_y, max_y, y_count)
+    cp = cartesian_product2([x_range, y_range])
+    p = []
+
+    # Create a buffer around the eclipse path bounding
+    boundary_buffer = boundary.buffer(umbra_boundary_buffer_size)
+    for point in cp:
+        Po = Point(point)
+        inside_umbra = eg.test_point_within_eclipse_boundary(Po)
+        inside_us = us_map_polygon.contains(Po)
+        inside_boundary_buffer = boundary_buffer.contains(Po)
+        # Filter candidate points
+        if not outside and inside_umbra:
+            # User wants point inside the eclipse path and point is inside the
+            # eclipse path
+            p.append(Po)
+        elif outside and not inside_umbra and inside_us and inside_boundary_buffer:
+            # User wants point outside the eclipse path and point is not inside
+            # the eclipse path, is inside the US map boundaries, and inside the boundary buffer
+            p.append(Po)
+
+    return p
+
+def benchmark(eclipse_path_data, us_map_polygon, sizes, reference_limit=100000):
+    """Print the time to generate the inside and outside grids of each
+    size ("XxY"), with and without vectorized tests (the latter only up
+    to reference_limit points)."""
+    for size in sizes:
+        x_count, y_count = map(int, size.split("x"))
+        for outside in (False, True):
+            start = time.time()
+            n = len(create_locations.generate_grid(eclipse_path_data, us_map_polygon, outside, x_count=x_count, y_count=y_count))
+            elapsed = time.time() - start
+            line = "%9s %-7s %7d points: vectorized %8.3fs" % (size, "outside" if outside else "inside", n, elapsed)
+            if x_count * y_count <= reference_limit:
+                start = time.time()
+                generate_grid_reference(eclipse_path_data, us_map_polygon, outside, x_count=x_count, y_count=y_count)
+                reference_elapsed = time.time() - start
+                line += ", reference %8.3fs (%.0fx)" % (reference_elapsed, reference_elapsed / elapsed)
+            print line
+
+def main():
+    args = get_arguments()
+    benchmark(args.eclipse_path_data, load_us_map_polygon(args.us_map_file), args.sizes)
+
+if __name__ == '__main__':
+    main()
@@ -18,33 +18,39 @@ This application receives the arguments defining a solar eclipse
 rendering (at a location, time range, and various camera parameters).
 
 It requires an OpenGL-capable X server, but renders offline (no
-window) and exits when complete.
+window) and exits when complete.  With --indexes, it renders a batch of
+locations and a sweep of camera parameters on a pool of processes, each
+with its own renderer, and writes one stats index for the batch.
 """
 
 import argparse
+import cv2
+import numpy as np
 import piexif
-import math
-import ephem
 import json
 import sys
 import os
+import errno
 import pickle
+import time
+from multiprocessing import Pool
 from eclipse_gis import eclipse_gis
 import signal
-from PyQt5 import QtGui, QtCore, QtWidgets
+try:
+    from PyQt5 import QtGui, QtCore, QtWidgets
+    QWidget = QtWidgets.QWidget
+except ImportError:
+    # Only the opengl backend needs Qt
+    QWidget = object
 from convert_location import convert_location
-from eclipse_renderer import EclipseRenderer, RES_X, RES_Y
+from render_constants import RES_X, RES_Y
 from util import get_phase, TOTALITY, NO_ECLIPSE, PARTIAL
 
-def write_stat(eclipse_renderer, stats, suffix, pt):
-    """Write a single line of data describing the sun center and size for this time point."""
+def stat_line(eclipse_renderer, suffix, pt):
+    """A single line of data describing the sun center and size for this time point."""
     sun_center, moon_center = eclipse_renderer.getSunMoonCenter(pt)
-    c = eclipse_renderer.getSunSize(pt)
-    sun_radius = c[1]
-    # sun_radius_correct = eclipse_renderer.getSunSizeProj(pt)
-    # print sun_radius, sun_radius_correct
-    # TODO(dek): replace this hack with code a getMoonSize function that works like getSunSize
-    moon_radius = sun_radius
+    sun_radius = eclipse_renderer.getSunSize(pt)[1]
+    moon_radius = eclipse_renderer.getMoonSize(pt)[1]
     l = "(%d, %d, %d)" % (RES_X - sun_center[0], sun_center[1], sun_radius)
     lune = pt[7]
     if lune == 0.:
@@ -58,37 +64,199 @@ def write_stat(eclipse_renderer, stats, suffix, pt):
         l2 = "None"
     else:
         l2 = "(%d, %d, %d)" % (RES_X - moon_center[0], moon_center[1], moon_radius)
-    stats.write("%s|%s|%s|%s\n" % (suffix, t, l, l2))
+    return "%s|%s|%s|%s\n" % (suffix, t, l, l2)
 
-def write_image(image, fname, pt, lat, lon, fov, pan):
-    """Write the image corresponding to a time and space point to fname."""
+def write_stat(eclipse_renderer, stats, suffix, pt):
+    """Write a single line of data describing the sun center and size for this time point."""
+    stats.write(stat_line(eclipse_renderer, suffix, pt))
+
+def encode_image(image):
+    """Encode a QImage from the OpenGL renderer or a BGR numpy image from
+    the software renderer as JPEG bytes."""
+    if isinstance(image, np.ndarray):
+        _, data = cv2.imencode(".jpg", image)
+        return data.tostring()
+    buf = QtCore.QBuffer()
+    buf.open(QtCore.QIODevice.WriteOnly)
+    image.save(buf, "JPG")
+    return str(buf.data())
+
+def degrees_to_dms(value):
+    """EXIF rational degrees, minutes and seconds of abs(value) degrees.
+    Like the string ephem.degrees formats, seconds are rounded to a tenth,
+    then truncated."""
+    tenths = int(round(abs(value) * 36000))
+    return ((tenths // 36000, 1), ((tenths // 600) % 60, 1), ((tenths % 600) // 10, 1))
+
+def image_exif(pt, lat, lon, fov, pan):
+    """The EXIF block for the image corresponding to a time and space point."""
     dt = pt[0]
     s = pt[7]
-    image.save(fname)
     datestamp, time = dt.split(" ")
     h, m, s = time.split(":")
     timestamp = ((int(h),1), (int(m),1), (int(s),1))
-    lat_pretty = ephem.degrees(math.radians(lat))
-    lat_h, lat_m, lat_s = str(lat_pretty).split(":")
-    lat_fmt = ((int(lat_h), 1), (int(lat_m), 1), (int(float(lat_s)), 1))
-    lon_pretty = ephem.degrees(math.radians(lon))
-    lon_h, lon_m, lon_s = str(lon_pretty).split(":")
-    lon_fmt = ((-int(lon_h), 1), (int(lon_m), 1), (int(float(lon_s)), 1))
-    exif = piexif.load(fname)
-    # Update the EXIF GPS time and date
-    exif['GPS'][piexif.GPSIFD.GPSLatitude ] = lat_fmt
-    exif['GPS'][piexif.GPSIFD.GPSLatitudeRef ] = 'N'
-    exif['GPS'][piexif.GPSIFD.GPSLongitude ] = lon_fmt
-    exif['GPS'][piexif.GPSIFD.GPSLongitudeRef ] = 'W'
+    exif = {"0th": {}, "Exif": {}, "GPS": {}, "Interop": {}, "1st": {}, "thumbnail": None}
+    # Set the EXIF GPS time and date
+    exif['GPS'][piexif.GPSIFD.GPSLatitude ] = degrees_to_dms(lat)
+    exif['GPS'][piexif.GPSIFD.GPSLatitudeRef ] = 'N' if lat >= 0 else 'S'
+    exif['GPS'][piexif.GPSIFD.GPSLongitude ] = degrees_to_dms(lon)
+    exif['GPS'][piexif.GPSIFD.GPSLongitudeRef ] = 'W' if lon < 0 else 'E'
     exif['GPS'][piexif.GPSIFD.GPSDateStamp ] = datestamp
     exif['GPS'][piexif.GPSIFD.GPSTimeStamp ] = timestamp
     t = get_phase(s)
     # Write custom data into the MakerNote
     exif['Exif'][piexif.ExifIFD.MakerNote] = "%s|%d, %d|%d" % (t, fov, pan[0], pan[1])
-    b = piexif.dump(exif)
-    piexif.insert(b, fname)
+    return piexif.dump(exif)
+
+def write_image(image, fname, pt, lat, lon, fov, pan):
+    """Write the image corresponding to a time and space point to fname.
+
+    The JPEG is encoded in memory and written once, with its EXIF block."""
+    piexif.insert(image_exif(pt, lat, lon, fov, pan), encode_image(image), fname)
+
+LOCATION_FILES = {
+    'inside': "locations_inside.pkl",
+    'outside': "locations_outside.pkl",
+}
+# Locations loaded by this process, by subset
+locations = {}
+
+def load_locations(subset):
+    """Returns the (lat, lon) locations of subset, loading them once per process."""
+    if subset not in LOCATION_FILES:
+        raise RuntimeError, "Unrecognized subset: '%s'" % subset
+    if subset not in locations:
+        locations[subset] = pickle.load(open(LOCATION_FILES[subset], "rb"))
+    return locations[subset]
+
+def location_points(subset, index, inclusion_threshold):
+    """Returns lat, lon and the time-space points to render for one location."""
+    min_dts = "2017/08/21 16:00:00"
+    max_dts = "2017/08/21 20:00:00"
+    lat, lon = load_locations(subset)[index]
+    # Generate points to render, filtering by inclusion threshold
+    pts = convert_location(lat, lon, min_dts, max_dts, inclusion_threshold, dt=30)
+    return lat, lon, pts
+
+def make_directory(directory):
+    # Batch workers may race to create the same directory
+    try:
+        os.mkdir(directory)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
 
-class MainWindow(QtWidgets.QWidget):
+def render_points(eclipse_renderer, pts, outdir, subset, lat, lon, fov, pan_x, pan_y):
+    """Render time-space point images of one location to files, returning
+    the directory they were written to and their stats lines."""
+    make_directory(outdir)
+    dir_ = os.path.join(outdir,
+                        "%.4f,%.4f,%d,%d,%d,%s" % (
+                            lat, lon,fov,pan_x,pan_y,subset))
+    make_directory(dir_)
+
+    lines = []
+    for i, pt in enumerate(pts):
+        suffix = "%05d.jpg" % i
+        fname = os.path.join(dir_, suffix)
+        lines.append(stat_line(eclipse_renderer, suffix, pt))
+        image = eclipse_renderer.paint(pt)
+        write_image(image, fname, pt, lat, lon, fov, (pan_x, pan_y))
+    return dir_, lines
+
+def render_location(eclipse_renderer, subset, index, outdir, inclusion_threshold, fov, pan_x, pan_y):
+    """Render the time-space point images of one location to files."""
+    lat, lon, pts = location_points(subset, index, inclusion_threshold)
+    # Only create dirs and write stats if there are any time points
+    if len(pts):
+        dir_, lines = render_points(eclipse_renderer, pts, outdir, subset, lat, lon, fov, pan_x, pan_y)
+        stats = open(os.path.join(dir_, "stats.txt"), "w")
+        stats.writelines(lines)
+        stats.close()
+
+def create_renderer(backend, fov, pan, generate=False, load_file=None, save_file=None):
+    if backend == 'software':
+        from software_renderer import SoftwareEclipseRenderer
+        return SoftwareEclipseRenderer(fov, pan, generate=generate, load_file=load_file, save_file=save_file)
+    # Imported here so the software backend doesn't need OpenGL
+    from eclipse_renderer import EclipseRenderer
+    return EclipseRenderer(fov, pan, generate=generate, load_file=load_file, save_file=save_file)
+
+# The renderer (and Qt application) of a batch worker process, created
+# once and reused for all of the locations and camera parameters it renders
+worker_renderer = None
+worker_app = None
+
+def init_worker(backend, load_file):
+    global worker_renderer, worker_app
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if backend == 'opengl':
+        worker_app = QtWidgets.QApplication(['Eclipse'])
+    worker_renderer = create_renderer(backend, 2, (0, 0), load_file=load_file)
+
+def render_batch_location(task):
+    """Render one location with each of a list of (fov, (pan_x, pan_y))
+    cameras, returning the number of images and the stats index lines."""
+    subset, index, cameras, outdir, inclusion_threshold = task
+    lat, lon, pts = location_points(subset, index, inclusion_threshold)
+    lines = []
+    if len(pts):
+        for fov, (pan_x, pan_y) in cameras:
+            worker_renderer.setView(fov, (pan_x, pan_y))
+            dir_, dir_lines = render_points(worker_renderer, pts, outdir, subset, lat, lon, fov, pan_x, pan_y)
+            # Index lines are relative to outdir
+            lines.extend(os.path.join(os.path.basename(dir_), l) for l in dir_lines)
+    return len(pts) * len(cameras), lines
+
+def parse_indexes(s):
+    """Parses location indexes like '0-9,12,15'."""
+    indexes = []
+    for part in s.split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            indexes.extend(range(int(first), int(last) + 1))
+        else:
+            indexes.append(int(part))
+    return indexes
+
+def parse_pan(s):
+    pan_x, pan_y = s.split(",")
+    return int(pan_x), int(pan_y)
+
+def render_batch(args):
+    """Render the locations in args.indexes with each combination of
+    args.fovs and args.pans, writing one stats index for all of them."""
+    load_file = args.load_file
+    if args.generate:
+        # Generate the corona once, so that every worker renders the same one
+        from corona import CoronaParameters
+        corona = CoronaParameters()
+        corona.setupRandom()
+        corona.writeRandom(args.save_file)
+        load_file = args.save_file
+    fovs = args.fovs or [args.fov]
+    pans = args.pans or [(args.pan_x, args.pan_y)]
+    cameras = [(fov, pan) for fov in fovs for pan in pans]
+    tasks = [(args.subset, index, cameras, args.output_dir, args.inclusion_threshold)
+             for index in parse_indexes(args.indexes)]
+
+    make_directory(args.output_dir)
+    stats_index = open(args.stats_index or os.path.join(args.output_dir, "stats_index.txt"), "w")
+    pool = Pool(args.processes, init_worker, (args.backend, load_file))
+    start = time.time()
+    images = 0
+    try:
+        for i, (count, lines) in enumerate(pool.imap(render_batch_location, tasks)):
+            stats_index.writelines(lines)
+            stats_index.flush()
+            images += count
+            print "%d/%d locations, %d images, %.2f images/s" % (
+                i + 1, len(tasks), images, images / (time.time() - start))
+    finally:
+        pool.terminate()
+        stats_index.close()
+
+class MainWindow(QWidget):
     def __init__(self, fov, pan_x, pan_y, subset, index, outdir, inclusion_threshold, generate, load_file, save_file):
         super(MainWindow, self).__init__()
         self.fov = fov
@@ -99,42 +267,12 @@ class MainWindow(QtWidgets.QWidget):
         self.outdir = outdir
         self.inclusion_threshold = inclusion_threshold
 
-        self.eclipse_renderer = EclipseRenderer(self.fov, (self.pan_x, self.pan_y), generate=generate, load_file=load_file, save_file=save_file)
+        self.eclipse_renderer = create_renderer('opengl', self.fov, (self.pan_x, self.pan_y), generate, load_file, save_file)
 
     def run(self):
         """Driver function for iterating over and rendering time-space point images to files."""
-        min_dts = "2017/08/21 16:00:00"
-        max_dts = "2017/08/21 20:00:00"
-
-        if self.subset == 'inside':
-            posl = pickle.load(open("locations_inside.pkl", "rb"))
-        elif self.subset == 'outside':
-            posl = pickle.load(open("locations_outside.pkl", "rb"))
-        else:
-            raise RuntimeError, "Unrecognized subset: '%s'" % self.subset
-
-        pos = posl[self.index]
-        lat, lon = pos
-        # Generate points to render, filtering by inclusion threshold
-        pts = convert_location(lat, lon, min_dts, max_dts, self.inclusion_threshold, dt=30)
-        # Only create dirs and write stats if there are any time points
-        if len(pts):
-            if not os.path.exists(self.outdir):
-                os.mkdir(self.outdir)
-            dir_ = os.path.join(self.outdir,
-                                "%.4f,%.4f,%d,%d,%d,%s" % (
-                                    lat, lon,self.fov,self.pan_x,self.pan_y,self.subset))
-            if not os.path.exists(dir_):
-                os.mkdir(dir_)
-
-            stats = open(os.path.join(dir_, "stats.txt"), "w")
-            for i, pt in enumerate(pts):
-                suffix = "%05d.jpg" % i
-                fname = os.path.join(dir_, suffix)
-                write_stat(self.eclipse_renderer, stats, suffix, pt)
-                image = self.eclipse_renderer.paint(pt)
-                write_image(image, fname, pt, lat, lon, self.fov, (self.pan_x, self.pan_y))
-            stats.close()
+        render_location(self.eclipse_renderer, self.subset, self.index, self.outdir,
+                        self.inclusion_threshold, self.fov, self.pan_x, self.pan_y)
         sys.exit(0)
 
 def get_arguments():
@@ -149,10 +287,28 @@ def get_arguments():
     parser.add_argument('--generate', action='store_true')
     parser.add_argument('--output_dir', type=str, default="/mnt/dek/images/generated-images-7")
     parser.add_argument('--inclusion_threshold', type=float, default=95)
+    parser.add_argument('--backend', type=str, default='opengl', choices=['opengl', 'software'],
+                        help="software renders with NumPy/OpenCV, without an X server")
+    # Batch mode: render these locations (e.g. 0-99,120) with every
+    # combination of --fovs and --pans, on --processes workers
+    parser.add_argument('--indexes', type=str, default=None)
+    parser.add_argument('--fovs', type=int, nargs='*', default=None)
+    parser.add_argument('--pans', type=parse_pan, nargs='*', default=None, help="pan_x,pan_y pairs")
+    parser.add_argument('--processes', type=int, default=4)
+    # Defaults to stats_index.txt in --output_dir
+    parser.add_argument('--stats_index', type=str, default=None)
     return parser.parse_args()
 
 def main():
     args  = get_arguments()
+    if args.indexes is not None:
+        render_batch(args)
+        return
+    if args.backend == 'software':
+        eclipse_renderer = create_renderer('software', args.fov, (args.pan_x, args.pan_y), args.generate, args.load_file, args.save_file)
+        render_location(eclipse_renderer, args.subset, args.index, args.output_dir,
+                        args.inclusion_threshold, args.fov, args.pan_x, args.pan_y)
+        return
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     app = QtWidgets.QApplication(['Eclipse'])
     window = MainWindow(args.fov, args.pan_x, args.pan_y, args.subset, args.index, args.output_dir, args.inclusion_threshold, args.generate, args.load_file, args.save_file)
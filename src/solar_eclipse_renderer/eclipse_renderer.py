@@ -31,6 +31,8 @@ from OpenGL.GLU import *
 from PyQt5 import QtGui, QtCore, QtWidgets
 from PyQt5.QtOpenGL import *
 from render_constants import *
+from corona import CoronaParameters
+from projection import Camera, sun_moon_circles
 
 def qimage_to_numpy(image):
     # Convert a QImage to a numpy array
@@ -41,13 +43,15 @@ def qimage_to_numpy(image):
 
     return np.frombuffer(ptr.asstring(image.byteCount()), dtype=np.uint8).reshape(height, width, 4)
 
-class EclipseRenderer:
+class EclipseRenderer(CoronaParameters):
     def __init__(self, fov=2, pan=(0,0), generate=False, load_file=None, save_file=None):
         # fov defines the Field of View of the resulting image
         # at fov=0.5 degrees, the sun will completley fill the image
         self.fov = fov
         # (x,y) pixels to pan the rendered image
         self.pan = pan
+        # The same view as setupProjection, for computing screen geometry
+        self.camera = Camera(fov, pan)
         self.surfaceFormat = QtGui.QSurfaceFormat()
 
         self.openGLContext = QtGui.QOpenGLContext()
@@ -78,58 +82,16 @@ class EclipseRenderer:
 
         self.initializeGL()
 
-    def setupRandom(self):
-        # Create a collection of "polar coronal angles" which are used to
-        # generate the fine, curved, "polar" coronal streams.
-        self.n_polar_coronal_angles = 10
-        self.polar_coronal_angles = np.hstack([
-            np.random.random_sample(self.n_polar_coronal_angles) * (NORTHERN_MAX - NORTHERN_MIN) + NORTHERN_MIN,
-            np.random.random_sample(self.n_polar_coronal_angles) * (SOUTHERN_MAX - SOUTHERN_MIN) + SOUTHERN_MIN
-        ])
-        # Create a series of sub-angles that define collection of substreams off the main polar angle,
-        self.polar_coronal_ellipse_params = np.random.random_sample(self.n_polar_coronal_angles*2)
-        self.polar_coronal_subangles = []
-        self.n_coronal_subangles_per_angle = 5
-        for i in range(self.n_polar_coronal_angles*2):
-            self.polar_coronal_subangles.append(np.random.normal(0, 5, self.n_coronal_subangles_per_angle))
-
-        # Create a series of "equatorial corona angles" which are used to generate large, triangle-shaped "equatorial" coronal streams
-        self.n_equatorial_coronal_angles = 3
-        self.equatorial_coronal_angles = np.hstack([
-            np.random.random_sample(self.n_equatorial_coronal_angles) * (WESTERN_MAX - WESTERN_MIN) + WESTERN_MIN,
-            np.random.random_sample(self.n_equatorial_coronal_angles) * (EASTERN_MAX - EASTERN_MIN) + EASTERN_MIN,
-        ])
-
-    def writeRandom(self, fname):
-        w = open(fname, "w")
-        w.write(self.getRandomAsJSON())
-        w.close()
-
-    def getRandomAsJSON(self):
-        d = {
-            'n_polar_corona_angles': self.n_polar_coronal_angles,
-            'polar_coronal_angles': list(self.polar_coronal_angles),
-            'polar_coronal_subangles': map(list, self.polar_coronal_subangles),
-            'polar_coronal_ellipse_params': list(self.polar_coronal_ellipse_params),
-            'n_coronal_subangles_per_angle': self.n_coronal_subangles_per_angle,
-            'n_equatorial_coronal_angles': self.n_equatorial_coronal_angles,
-            'equatorial_coronal_angles': list(self.equatorial_coronal_angles)
-        }
-
-        return json.dumps(d)
-
     def setRandomAsJSON(self, j):
-        d = json.loads(j)
-        self.n_polar_corona_angles = d['n_polar_corona_angles']
-        self.polar_coronal_angles = d['polar_coronal_angles']
-        self.polar_coronal_subangles = d['polar_coronal_subangles']
-        self.polar_coronal_ellipse_params = d['polar_coronal_ellipse_params']
-        self.n_coronal_subangles_per_angle = d['n_coronal_subangles_per_angle']
-        self.n_equatorial_coronal_angles = d['n_equatorial_coronal_angles']
-        self.equatorial_coronal_angles = d['equatorial_coronal_angles']
-
+        CoronaParameters.setRandomAsJSON(self, j)
         self.initializeGL()
 
+    def setView(self, fov, pan):
+        # Change the camera parameters, keeping the GL context
+        self.fov = fov
+        self.pan = pan
+        self.camera = Camera(fov, pan)
+
     def initializeGL(self):
         self.fbo.bind()
         glViewport(0, 0, RES_X, RES_Y)
@@ -204,25 +166,6 @@ class EclipseRenderer:
         painter.end()
         self.fbo.release()
 
-    def getSunSizeProj(self, p):
-        """Get the size of the sun in screen pixels.
-
-        Warning: this function doesn't work correctly, unless the sun
-        is positioned appropriately.  Use getSunSize instead.
-        """
-        dt, sun_alt, sun_az, moon_alt, moon_az, sun_r, moon_r, sep, parallactic_angle = p
-        sun_coords = horizontal_to_cartesian(deg(sun_alt), deg(sun_az))
-        sun_x, sun_y, sun_z = scale_vector(sun_coords, SUN_EARTH_DISTANCE)
-
-        self.setupProjection(sun_x, sun_y, sun_z)
-        x0= gluProject(sun_x, sun_y, sun_z)
-        x1= gluProject(sun_x-SUN_RADIUS, sun_y, sun_z)
-
-        # Return the distance between two suns spaced by solar radius,
-        # in screen pixels
-        x = abs(x1[0] - x0[0])
-        return x
-
     def getSunMoonCenter(self, p):
         # Get the center of the sun and the moon in screen pixels
         dt, sun_alt, sun_az, moon_alt, moon_az, sun_r, moon_r, sep, parallactic_angle, lat, lon = p
@@ -238,10 +181,20 @@ class EclipseRenderer:
         return sun_center, moon_center
 
     def getSunSize(self, p):
+        """Get the center and radius of the sun in image pixels, computed
+        from the projection without rendering."""
+        return sun_moon_circles(self.camera, p)[0]
+
+    def getMoonSize(self, p):
+        """Get the center and radius of the moon in image pixels."""
+        return sun_moon_circles(self.camera, p)[1]
+
+    def getSunSizeContour(self, p):
         """Get the size of the sun in screen pixels.
 
-        This is a hack: it renders the sun, then finds the contour
-        surrounding the sun and computes the center/radius of that.
+        This renders the sun, then finds the contour surrounding the sun
+        and computes the center/radius of that.  getSunSize computes the
+        same circle without rendering.
         """
         self.fbo.bind()
         self.clear_background()
@@ -324,76 +277,12 @@ class EclipseRenderer:
         glFlush()
 
     def draw_corona(self, p):
-        im_polar = np.zeros((RES_Y, RES_X, 4), np.uint8)
         dt, sun_alt, sun_az, moon_alt, moon_az, sun_r, moon_r, sep, parallactic_angle, lat, lon = p
-        sun_coords = horizontal_to_cartesian(deg(sun_alt), deg(sun_az))
-        sun_x, sun_y, sun_z = scale_vector(sun_coords, SUN_EARTH_DISTANCE)
         sun_center, sun_size = self.getSunSize(p)
 
         circle_center = (int(sun_center[0]), int(sun_center[1]))
         circle_size = int(sun_size)
-        circle_color = (255, 255, 255, 255)
-
-        # Draw coronal polar angle lines as bundles of truncated ellipses.
-        # The ellipses start at the sun surface and project outward
-        # towards the poles, then curve away
-        # TODO(dek): better curving, especially angle-dependent curves
-        for i, angle in enumerate(self.polar_coronal_angles):
-            for j in self.polar_coronal_subangles[i]:
-                x = int(circle_center[0] + math.cos(angle)*circle_size)
-                y = int(circle_center[1] + math.sin(angle)*circle_size)
-                cv2.ellipse(im_polar, (x,y), (int(circle_size*8), int(circle_size/8.)), deg(angle)+j,  0, 90, (255, 255, 255, 127))
-        blur_polar = cv2.blur(im_polar, (5, 5))
-
-        # Draw the coronal equatorial regions as polygons that get
-        # skinnier as they get further from the sun's surface
-        im_equitorial = np.zeros((RES_Y, RES_X, 4), np.uint8)
-        for i, angle in enumerate(self.equatorial_coronal_angles):
-            min_ = angle - math.radians(15)
-            min_2 = angle - math.radians(5)
-            max_2 = angle + math.radians(5)
-            max_ = angle + math.radians(15)
-
-            x1 = int(circle_center[0] + math.cos(min_)*circle_size)
-            y1 = int(circle_center[1] + math.sin(min_)*circle_size)
-            x1_2 = int((circle_center[0] + math.cos(min_)*circle_size*2))
-            y1_2 = int((circle_center[1] + math.sin(min_)*circle_size*2))
-
-            x2 = int((circle_center[0] + math.cos(min_2)*circle_size*4))
-            y2 = int((circle_center[1] + math.sin(min_2)*circle_size*4))
-
-            x3 = int((circle_center[0] + math.cos(angle)*circle_size*6))
-            y3 = int((circle_center[1] + math.sin(angle)*circle_size*6))
-
-            x4 = int((circle_center[0] + math.cos(max_2)*circle_size*4))
-            y4 = int((circle_center[1] + math.sin(max_2)*circle_size*4))
-
-            x5_2 = int((circle_center[0] + math.cos(max_)*circle_size*2))
-            y5_2 = int((circle_center[1] + math.sin(max_)*circle_size*2))
-            x5 = int(circle_center[0] + math.cos(max_)*circle_size)
-            y5 = int(circle_center[1] + math.sin(max_)*circle_size)
-
-            pts = np.array([ [x1,y1], [x1_2, y1_2], [x2,y2], [x3,y3], [x4,y4], [x5_2, y5_2], [x5,y5] ])
-
-            cv2.fillConvexPoly(im_equitorial, pts, (255, 255, 255, 127))
-
-        # Blur the equatorial corona
-        blur_equitorial = cv2.blur(im_equitorial, (100, 100))
-
-        # Create a blurred sun to simulate glare
-        im_corona_positive = np.zeros((RES_Y, RES_X, 4), np.uint8)
-        cv2.circle(im_corona_positive, circle_center, int(circle_size*3), [255, 255, 255, 127], -1)
-        blur_corona_positive = cv2.blur(im_corona_positive, (int(circle_size*1.5), int(circle_size*1.5)))
-        blur_corona_positive = cv2.blur(blur_corona_positive, (int(circle_size*1.25), int(circle_size*1.25)))
-        # Subtract out the center of the glare
-        cv2.circle(blur_corona_positive, circle_center, circle_size, [0,0,0, 255], -1)
-
-        alpha = 1
-        beta = 0.15
-        # Combine the blurred polar corona with the glare
-        result = cv2.addWeighted( blur_polar, alpha, blur_corona_positive, beta, 0.0)
-        # Combine that with the equitorial blur
-        result2 = cv2.addWeighted( result, 1, blur_equitorial, 1, 0.0)
+        result2 = self.render_corona(circle_center, circle_size)
 
         # Render the solar corona to the screen
         self.fbo.bind()
@@ -1,5 +1,6 @@
 import ephem
 import math
+import numpy as np
 deg = math.degrees
 def get_lune(sun, moon):
     r_sun=sun.size/2
@@ -25,3 +26,29 @@ def get_lune(sun, moon):
             return percent_eclipse
     else:
         return 0.
+
+def get_lune_array(s, r_sun, r_moon):
+    """Vectorized get_lune over arrays of separations and radii (arcsec).
+
+    Returns the percentage of the sun's disc eclipsed at each point."""
+    s = np.asarray(s, dtype=np.float64)
+    r_sun = np.asarray(r_sun, dtype=np.float64)
+    r_moon = np.asarray(r_moon, dtype=np.float64)
+    s, r_sun, r_moon = np.broadcast_arrays(s, r_sun, r_moon)
+    percent = np.zeros(s.shape)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = (r_sun+r_moon+s)*(r_moon+s-r_sun)*(s+r_sun-r_moon)*(r_sun+r_moon-s)
+        lunedelta = 0.25*np.sqrt(np.abs(x))
+        overlap = (s < r_moon+r_sun) & (lunedelta != 0)
+
+        x = (r_moon*r_moon)-(r_sun*r_sun)-(s*s)
+        y = (r_moon*r_moon)+(s*s)-(r_sun*r_sun)
+        ratio = x/(2*r_sun*s)
+        total = overlap & (ratio > 1)
+        partial = overlap & ~total
+        lune_area = 2*lunedelta + r_sun*r_sun*np.arccos(np.clip(ratio, -1, 1)) - \
+                    r_moon*r_moon*np.arccos(np.clip(y/(2*r_moon*s), -1, 1))
+        percent[partial] = ((1-(lune_area/(np.pi*r_sun*r_sun)))*100)[partial]
+    percent[total] = 100.
+    return percent
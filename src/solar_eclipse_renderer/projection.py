@@ -0,0 +1,146 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""NumPy versions of the GLU projection calls used by EclipseRenderer,
+and the screen geometry of the sun and moon.
+
+gluPerspective, gluLookAt and gluProject are computed with the same
+matrices GLU builds, so the software renderer places the sun and moon
+where the OpenGL renderer does, without a GL context.  The circles the
+sun and moon cover on screen are computed in closed form from the same
+camera, instead of rendering them and measuring their contours.
+"""
+
+import math
+import numpy as np
+from coords import horizontal_to_cartesian, scale_vector
+from render_constants import *
+
+def perspective(fovy, aspect, z_near, z_far):
+    """The matrix gluPerspective multiplies by (fovy in degrees)."""
+    f = 1. / math.tan(math.radians(fovy) / 2)
+    return np.array([[f / aspect, 0, 0, 0],
+                     [0, f, 0, 0],
+                     [0, 0, (z_far + z_near) / (z_near - z_far), 2 * z_far * z_near / (z_near - z_far)],
+                     [0, 0, -1, 0]], dtype=np.float64)
+
+def look_at(eye, center, up):
+    """The matrix gluLookAt multiplies by."""
+    eye = np.asarray(eye, dtype=np.float64)
+    forward = np.asarray(center, dtype=np.float64) - eye
+    forward /= np.linalg.norm(forward)
+    side = np.cross(forward, up)
+    side /= np.linalg.norm(side)
+    up = np.cross(side, forward)
+    m = np.identity(4)
+    m[0, :3] = side
+    m[1, :3] = up
+    m[2, :3] = -forward
+    translate = np.identity(4)
+    translate[:3, 3] = -eye
+    return np.dot(m, translate)
+
+def project(obj, modelview, projection, viewport):
+    """gluProject: returns the window coordinates (x, y, z) of obj, with y
+    up from the bottom of the viewport, or None if obj is behind the
+    camera."""
+    v = np.dot(projection, np.dot(modelview, np.append(np.asarray(obj, dtype=np.float64), 1.)))
+    if v[3] <= 0:
+        return None
+    v = v[:3] / v[3]
+    return (viewport[0] + viewport[2] * (v[0] + 1) / 2,
+            viewport[1] + viewport[3] * (v[1] + 1) / 2,
+            (v[2] + 1) / 2)
+
+def sun_moon_positions(p):
+    """Returns the cartesian positions of the sun and moon in the scene,
+    for a time-space point p from convert_location."""
+    dt, sun_alt, sun_az, moon_alt, moon_az, sun_r, moon_r, sep, parallactic_angle, lat, lon = p
+    sun_coords = horizontal_to_cartesian(math.degrees(sun_alt), math.degrees(sun_az))
+    sun = scale_vector(sun_coords, SUN_EARTH_DISTANCE)
+    moon_coords = horizontal_to_cartesian(math.degrees(moon_alt), math.degrees(moon_az))
+    moon = scale_vector(moon_coords, EARTH_MOON_DISTANCE)
+    return sun, moon
+
+def sun_moon_circles(camera, p):
+    """Points camera at the sun for time-space point p, and returns the
+    ((x, y), radius) circles, in image pixels, that the sun and the moon
+    cover (see Camera.sphere_circle)."""
+    sun, moon = sun_moon_positions(p)
+    camera.setupProjection(*sun)
+    return camera.sphere_circle(sun, SUN_RADIUS), camera.sphere_circle(moon, MOON_RADIUS)
+
+class Camera(object):
+    """The view EclipseRenderer.setupProjection sets up: a camera at the
+    origin with field of view fov (degrees, vertical), pointed at the sun
+    offset by pan."""
+
+    def __init__(self, fov=2, pan=(0, 0)):
+        self.fov = fov
+        self.pan = pan
+        self.viewport = (0, 0, RES_X, RES_Y)
+        self.modelview = np.identity(4)
+        self.view = np.identity(4)
+        self.projection = np.identity(4)
+
+    def setupProjection(self, sun_x, sun_y, sun_z):
+        aspect = RES_X/float(RES_Y)
+        self.view = look_at((0, 0, 0), (sun_x+self.pan[0], sun_y+self.pan[1], sun_z), (0, 1, 0))
+        self.projection = np.dot(perspective(self.fov, aspect, EARTH_MOON_DISTANCE, SUN_EARTH_DISTANCE),
+                                 self.view)
+
+    def project(self, obj):
+        return project(obj, self.modelview, self.projection, self.viewport)
+
+    def to_image(self, window):
+        """Converts window coordinates to image pixels (y down), as in the
+        framebuffer images the OpenGL renderer reads back."""
+        return window[0], RES_Y - window[1]
+
+    def focal_length(self):
+        """The distance from the eye to the image plane, in pixels."""
+        return RES_Y / (2. * math.tan(math.radians(self.fov) / 2))
+
+    def sphere_circle(self, obj, radius):
+        """Returns ((x, y), r), in image pixels, of the smallest circle
+        enclosing the sphere at obj, or None if the sphere isn't entirely
+        in front of the camera.
+
+        The sphere's silhouette is a cone from the eye, with half angle
+        alpha, at an angle theta from the optical axis; the image plane
+        cuts it in an ellipse whose major axis points away from the image
+        center, spanning tan(theta - alpha) to tan(theta + alpha).  Like
+        cv2.minEnclosingCircle of the sphere's rendered contour, the
+        circle is centered on the ellipse, with its semi-major axis as
+        radius."""
+        v = np.dot(self.view, np.append(np.asarray(obj, dtype=np.float64), 1.))[:3]
+        distance = np.linalg.norm(v)
+        if distance <= radius:
+            return None
+        alpha = math.asin(radius / distance)
+        theta = math.acos(-v[2] / distance)
+        if theta + alpha >= math.pi / 2:
+            return None
+        f = self.focal_length()
+        near = f * math.tan(theta - alpha)
+        far = f * math.tan(theta + alpha)
+        offset = math.hypot(v[0], v[1])
+        if offset > 0:
+            direction = (v[0] / offset, v[1] / offset)
+        else:
+            direction = (1., 0.)
+        center = (near + far) / 2
+        window = (self.viewport[0] + self.viewport[2] / 2. + center * direction[0],
+                  self.viewport[1] + self.viewport[3] / 2. + center * direction[1])
+        return self.to_image(window), (far - near) / 2
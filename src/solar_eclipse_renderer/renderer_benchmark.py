@@ -0,0 +1,283 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure software renderer throughput, in frames/sec, over the frames
+of a few locations, rendered by a pool of worker processes.  With
+--corona, time the cached corona against drawing it from scratch in each
+frame instead.  With --batch, compare rendering locations with one
+eclipse_render.py process per location and camera, --processes at a
+time, against one eclipse_render.py --indexes batch."""
+
+import argparse
+import glob
+import math
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+import cv2
+import ephem
+import numpy as np
+import piexif
+from convert_location import convert_location
+from render_constants import RES_X, RES_Y
+from software_renderer import SoftwareEclipseRenderer
+
+renderer = None
+
+def init_worker(fov, pan, load_file):
+    global renderer
+    renderer = SoftwareEclipseRenderer(fov, pan, load_file=load_file)
+
+def paint(pt):
+    renderer.paint(pt)
+    return 1
+
+def render_corona_reference(params, circle_center, circle_size, res=(RES_X, RES_Y)):
+    """CoronaParameters.render_corona as it was before the corona
+    sprite: draw the corona of params around a sun at circle_center (x, y
+    image pixels) with radius circle_size, blurring full frame layers.
+    Returns a res[1] x res[0] BGRA image, before parallactic rotation."""
+    im_polar = np.zeros((res[1], res[0], 4), np.uint8)
+
+    # Draw coronal polar angle lines as bundles of truncated ellipses.
+    # The ellipses start at the sun surface and project outward
+    # towards the poles, then curve away
+    # TODO(dek): better curving, especially angle-dependent curves
+    for i, angle in enumerate(params.polar_coronal_angles):
+        for j in params.polar_coronal_subangles[i]:
+            x = int(circle_center[0] + math.cos(angle)*circle_size)
+            y = int(circle_center[1] + math.sin(angle)*circle_size)
+            cv2.ellipse(im_polar, (x,y), (int(circle_size*8), int(circle_size/8.)), math.degrees(angle)+j,  0, 90, (255, 255, 255, 127))
+    blur_polar = cv2.blur(im_polar, (5, 5))
+
+    # Draw the coronal equatorial regions as polygons that get
+    # skinnier as they get further from the sun's surface
+    im_equitorial = np.zeros((res[1], res[0], 4), np.uint8)
+    for i, angle in enumerate(params.equatorial_coronal_angles):
+        min_ = angle - math.radians(15)
+        min_2 = angle - math.radians(5)
+        max_2 = angle + math.radians(5)
+        max_ = angle + math.radians(15)
+
+        x1 = int(circle_center[0] + math.cos(min_)*circle_size)
+        y1 = int(circle_center[1] + math.sin(min_)*circle_size)
+        x1_2 = int((circle_center[0] + math.cos(min_)*circle_size*2))
+        y1_2 = int((circle_center[1] + math.sin(min_)*circle_size*2))
+
+        x2 = int((circle_center[0] + math.cos(min_2)*circle_size*4))
+        y2 = int((circle_center[1] + math.sin(min_2)*circle_size*4))
+
+        x3 = int((circle_center[0] + math.cos(angle)*circle_size*6))
+        y3 = int((circle_center[1] + math.sin(angle)*circle_size*6))
+
+        x4 = int((circle_center[0] + math.cos(max_2)*circle_size*4))
+        y4 = int((circle_center[1] + math.sin(max_2)*circle_size*4))
+
+        x5_2 = int((circle_center[0] + math.cos(max_)*circle_size*2))
+        y5_2 = int((circle_center[1] + math.sin(max_)*circle_size*2))
+        x5 = int(circle_center[0] + math.cos(max_)*circle_size)
+        y5 = int(circle_center[1] + math.sin(max_)*circle_size)
+
+        pts = np.array([ [x1,y1], [x1_2, y1_2], [x2,y2], [x3,y3], [x4,y4], [x5_2, y5_2], [x5,y5] ])
+
+        cv2.fillConvexPoly(im_equitorial, pts, (255, 255, 255, 127))
+
+    # Blur the equatorial corona
+    blur_equitorial = cv2.blur(im_equitorial, (100, 100))
+
+    # Create a blurred sun to simulate glare
+    im_corona_positive = np.zeros((res[1], res[0], 4), np.uint8)
+    cv2.circle(im_corona_positive, circle_center, int(circle_size*3), [255, 255, 255, 127], -1)
+    blur_corona_positive = cv2.blur(im_corona_positive, (int(circle_size*1.5), int(circle_size*1.5)))
+    blur_corona_positive = cv2.blur(blur_corona_positive, (int(circle_size*1.25), int(circle_size*1.25)))
+    # Subtract out the center of the glare
+    cv2.circle(blur_corona_positive, circle_center, circle_size, [0,0,0, 255], -1)
+
+    alpha = 1
+    beta = 0.15
+    # Combine the blurred polar corona with the glare
+    result = cv2.addWeighted( blur_polar, alpha, blur_corona_positive, beta, 0.0)
+    # Combine that with the equitorial blur
+    result2 = cv2.addWeighted( result, 1, blur_equitorial, 1, 0.0)
+    return result2
+
+def time_corona(pts, fov, load_file):
+    r = SoftwareEclipseRenderer(fov, load_file=load_file)
+    circles = []
+    for pt in pts:
+        sun_center, sun_size = r.getSunSize(pt)
+        circles.append(((int(sun_center[0]), int(sun_center[1])), int(sun_size)))
+    for name, render in (("reference", lambda *circle: render_corona_reference(r, *circle)),
+                         ("cached", r.render_corona)):
+        r.corona_sprites = {}
+        start = time.time()
+        for circle_center, circle_size in circles:
+            render(circle_center, circle_size)
+        elapsed = time.time() - start
+        print "%-9s corona: %d frames in %.2fs, %.2f ms/frame" % (name, len(circles), elapsed, 1000 * elapsed / len(circles))
+
+def count_lines(fpaths):
+    return sum(len(open(fpath).readlines()) for fpath in fpaths)
+
+def compare_batch(args):
+    common = [sys.executable, 'eclipse_render.py', '--backend', 'software', '--load-file', args.load_file,
+              '--inclusion_threshold', str(args.inclusion_threshold)]
+    for processes in args.processes:
+        directory = tempfile.mkdtemp()
+        try:
+            # One process per location and camera, as eclipse_render.py is
+            # run without --indexes
+            single_dir = os.path.join(directory, 'single')
+            commands = [common + ['--index', str(index), '--fov', str(args.fov), '--output_dir', single_dir]
+                        for index in range(args.count)]
+            start = time.time()
+            statuses = ThreadPool(processes).map(subprocess.call, commands)
+            single_elapsed = time.time() - start
+            single_images = count_lines(glob.glob(os.path.join(single_dir, '*', 'stats.txt')))
+
+            batch_dir = os.path.join(directory, 'batch')
+            command = common + ['--indexes', '0-%d' % (args.count - 1), '--fovs', str(args.fov),
+                                '--processes', str(processes), '--output_dir', batch_dir]
+            start = time.time()
+            statuses.append(subprocess.call(command, stdout=open(os.devnull, 'w')))
+            batch_elapsed = time.time() - start
+            batch_images = count_lines([os.path.join(batch_dir, 'stats_index.txt')])
+            if any(statuses):
+                print "eclipse_render.py failed"
+            print "%d processes: one per location %d images in %.2fs, %.2f images/s; " \
+                  "batch %d images in %.2fs, %.2f images/s" % (
+                      processes, single_images, single_elapsed, single_images / single_elapsed,
+                      batch_images, batch_elapsed, batch_images / batch_elapsed)
+        finally:
+            shutil.rmtree(directory)
+
+def io_counters():
+    """Bytes read and written, and read and write calls, by this process."""
+    counters = dict(line.split(": ") for line in open("/proc/self/io").read().splitlines())
+    return [int(counters[key]) for key in ('rchar', 'wchar', 'syscr', 'syscw')]
+
+def save_image(image, fname):
+    """Save a QImage from the OpenGL renderer or a BGR numpy image from the
+    software renderer."""
+    if isinstance(image, np.ndarray):
+        cv2.imwrite(fname, image)
+    else:
+        image.save(fname)
+
+def write_image_reference(image, fname, pt, lat, lon, fov, pan):
+    """eclipse_render.write_image as it was before encoding in memory:
+    write the image to fname, then read it back to insert the EXIF block."""
+    from util import get_phase
+    dt = pt[0]
+    s = pt[7]
+    save_image(image, fname)
+    datestamp, time = dt.split(" ")
+    h, m, s = time.split(":")
+    timestamp = ((int(h),1), (int(m),1), (int(s),1))
+    lat_pretty = ephem.degrees(math.radians(lat))
+    lat_h, lat_m, lat_s = str(lat_pretty).split(":")
+    lat_fmt = ((int(lat_h), 1), (int(lat_m), 1), (int(float(lat_s)), 1))
+    lon_pretty = ephem.degrees(math.radians(lon))
+    lon_h, lon_m, lon_s = str(lon_pretty).split(":")
+    lon_fmt = ((-int(lon_h), 1), (int(lon_m), 1), (int(float(lon_s)), 1))
+    exif = piexif.load(fname)
+    # Update the EXIF GPS time and date
+    exif['GPS'][piexif.GPSIFD.GPSLatitude ] = lat_fmt
+    exif['GPS'][piexif.GPSIFD.GPSLatitudeRef ] = 'N'
+    exif['GPS'][piexif.GPSIFD.GPSLongitude ] = lon_fmt
+    exif['GPS'][piexif.GPSIFD.GPSLongitudeRef ] = 'W'
+    exif['GPS'][piexif.GPSIFD.GPSDateStamp ] = datestamp
+    exif['GPS'][piexif.GPSIFD.GPSTimeStamp ] = timestamp
+    t = get_phase(s)
+    # Write custom data into the MakerNote
+    exif['Exif'][piexif.ExifIFD.MakerNote] = "%s|%d, %d|%d" % (t, fov, pan[0], pan[1])
+    b = piexif.dump(exif)
+    piexif.insert(b, fname)
+
+def time_exif(pts, fov, load_file, repeat=3):
+    import eclipse_render
+    r = SoftwareEclipseRenderer(fov, load_file=load_file)
+    images = [r.paint(pt) for pt in pts[:10]]
+    methods = [("reference", write_image_reference),
+               ("in memory", eclipse_render.write_image)]
+    elapsed = [0.] * len(methods)
+    io = [[0] * 4 for _ in methods]
+    directory = tempfile.mkdtemp()
+    try:
+        # Alternate between the methods frame by frame, so they see the
+        # same conditions
+        for i in range(len(pts) * repeat):
+            pt = pts[i % len(pts)]
+            for j in (range(len(methods)) if i % 2 else reversed(range(len(methods)))):
+                fname = os.path.join(directory, "%d-%05d.jpg" % (j, i))
+                start_io = io_counters()
+                start = time.time()
+                methods[j][1](images[i % len(images)], fname, pt, 33.0, -80.0, fov, (0, 0))
+                elapsed[j] += time.time() - start
+                io[j] = [total + end - start for total, start, end in zip(io[j], start_io, io_counters())]
+        frames = len(pts) * repeat
+        for (name, _), e, (rchar, wchar, syscr, syscw) in zip(methods, elapsed, io):
+            print "%-9s %d frames in %.2fs, %.1f frames/s; per frame %d bytes read, %d bytes written, " \
+                  "%.1f reads, %.1f writes" % (name, frames, e, frames / e, rchar / frames, wchar / frames,
+                                               syscr / float(frames), syscw / float(frames))
+    finally:
+        shutil.rmtree(directory)
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='')
+    parser.add_argument('--locations', type=str, default="locations_inside.pkl")
+    parser.add_argument('--count', type=int, default=4, help="Number of locations")
+    parser.add_argument('--fov', type=int, default=2)
+    parser.add_argument('--load-file', type=str, default="random.txt")
+    parser.add_argument('--inclusion_threshold', type=float, default=95)
+    parser.add_argument('--processes', type=int, nargs='*', default=[1, 4])
+    parser.add_argument('--corona', action='store_true', help="Time drawing the corona only")
+    parser.add_argument('--exif', action='store_true', help="Time writing frames only")
+    parser.add_argument('--batch', action='store_true',
+                        help="Compare eclipse_render.py per location against batch mode")
+    return parser.parse_args()
+
+def main():
+    args  = get_arguments()
+    if args.batch:
+        compare_batch(args)
+        return
+    pts = []
+    for lat, lon in pickle.load(open(args.locations, "rb"))[:args.count]:
+        pts.extend(convert_location(lat, lon, "2017/08/21 16:00:00", "2017/08/21 20:00:00",
+                                    args.inclusion_threshold, dt=30))
+    if args.corona:
+        time_corona(pts, args.fov, args.load_file)
+        return
+    if args.exif:
+        time_exif(pts, args.fov, args.load_file)
+        return
+    for processes in args.processes:
+        p = Pool(processes, init_worker, (args.fov, (0, 0), args.load_file))
+        # Exclude worker start up from the timing
+        p.map(paint, pts[:processes])
+        start = time.time()
+        frames = sum(p.map(paint, pts, chunksize=1))
+        elapsed = time.time() - start
+        p.terminate()
+        print "%d processes: %d frames in %.2fs, %.2f frames/s" % (processes, frames, elapsed, frames / elapsed)
+
+if __name__ == '__main__':
+    main()
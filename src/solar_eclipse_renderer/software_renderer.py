@@ -0,0 +1,122 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Software version of EclipseRenderer, which needs no OpenGL or X server.
+
+The scene is composited the same way as EclipseRenderer.paint (corona,
+sun, glare blur, moon), but the sun and moon spheres are rasterized
+analytically as anti-aliased discs at the positions and sizes the GLU
+projection gives, using NumPy and OpenCV only.  paint returns a BGR
+NumPy image rather than a QImage.
+"""
+
+import math
+import cv2
+import numpy as np
+from corona import CoronaParameters
+from projection import Camera, sun_moon_positions, sun_moon_circles
+from render_constants import *
+
+# Sub-pixel precision bits for drawing discs
+SHIFT = 4
+
+class SoftwareEclipseRenderer(CoronaParameters):
+    def __init__(self, fov=2, pan=(0,0), generate=False, load_file=None, save_file=None):
+        # fov defines the Field of View of the resulting image
+        # at fov=0.5 degrees, the sun will completley fill the image
+        self.fov = fov
+        # (x,y) pixels to pan the rendered image
+        self.pan = pan
+        self.camera = Camera(fov, pan)
+
+        if generate:
+            self.setupRandom()
+            self.writeRandom(save_file)
+        else:
+            self.setRandomAsJSON(open(load_file).read())
+
+    def setView(self, fov, pan):
+        self.fov = fov
+        self.pan = pan
+        self.camera = Camera(fov, pan)
+
+    def getSunMoonCenter(self, p):
+        # Get the center of the sun and the moon in screen pixels
+        sun, moon = sun_moon_positions(p)
+        self.camera.setupProjection(*sun)
+        return self.camera.project(sun), self.camera.project(moon)
+
+    def getSunSize(self, p):
+        """Get the center and radius of the sun in image pixels."""
+        return sun_moon_circles(self.camera, p)[0]
+
+    def getMoonSize(self, p):
+        """Get the center and radius of the moon in image pixels."""
+        return sun_moon_circles(self.camera, p)[1]
+
+    def draw_disc(self, image, obj, radius, color):
+        """Draw the anti-aliased disc a sphere at obj covers over image
+        (float32 BGR), in place."""
+        circle = self.camera.sphere_circle(obj, radius)
+        if circle is None:
+            return
+        (x, y), r = circle
+        scale = 1 << SHIFT
+        if abs(x) > 1e6 or abs(y) > 1e6 or r > 1e6:
+            return
+        coverage = np.zeros((RES_Y, RES_X), np.uint8)
+        cv2.circle(coverage, (int(round(x * scale)), int(round(y * scale))), int(round(r * scale)),
+                   255, -1, cv2.LINE_AA, SHIFT)
+        alpha = coverage.astype(np.float32)[:, :, np.newaxis] / 255.
+        image *= 1 - alpha
+        image += alpha * np.array(color, np.float32)
+
+    def draw_corona(self, image, p):
+        parallactic_angle = p[8]
+        sun_center, sun_size = self.getSunSize(p)
+        circle_center = (int(sun_center[0]), int(sun_center[1]))
+        sprite, sprite_center = self.corona_sprite(int(sun_size))
+
+        # Translate the sprite to the sun, then apply parallactic rotation
+        # about the image center, with nearest neighbor sampling as
+        # QPainter does
+        transform = cv2.getRotationMatrix2D((RES_X/2, RES_Y/2), -math.degrees(parallactic_angle), 1.0)
+        transform[:, 2] += np.dot(transform[:, :2], (circle_center[0] - sprite_center[0],
+                                                     circle_center[1] - sprite_center[1]))
+        corona = cv2.warpAffine(sprite, transform, (RES_X, RES_Y), flags=cv2.INTER_NEAREST)
+        alpha = corona[:, :, 3:].astype(np.float32) / 255.
+        image *= 1 - alpha
+        image += alpha * corona[:, :, :3]
+
+    def paint(self, p):
+        sun, moon = sun_moon_positions(p)
+        # Set up the appropriate viewing projection
+        self.camera.setupProjection(*sun)
+
+        image = np.zeros((RES_Y, RES_X, 3), np.float32)
+        # Draw the corona first as a background layer
+        self.draw_corona(image, p)
+
+        # Draw the sun, then combine it with a blurred copy for glare
+        self.draw_disc(image, sun, SUN_RADIUS, (255, 255, 255))
+        npimage = np.clip(np.round(image), 0, 255).astype(np.uint8)
+        blur = cv2.GaussianBlur(npimage, (75, 75), 0, 0)
+        cv2.convertScaleAbs(blur, blur, 2, 1)
+        combo = cv2.addWeighted(blur, 0.5, npimage, 0.5, -1)
+        # The combined image is drawn over the scene with alpha 254
+        image = (combo.astype(np.float32) * 254 + npimage) / 255.
+
+        # Draw the moon on top
+        self.draw_disc(image, moon, MOON_RADIUS, (0, 0, 0))
+        return np.clip(np.round(image), 0, 255).astype(np.uint8)
@@ -0,0 +1,80 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for convert_location."""
+import sys
+sys.path.append("..")
+import math
+import pickle
+import unittest2
+import numpy as np
+from convert_location import convert_location, sample_location, POSITION_DTYPE
+from convert_location_benchmark import convert_location_reference
+from lune import get_lune, get_lune_array
+
+START = "2017/08/21 16:00:00"
+END = "2017/08/21 20:00:00"
+
+class Body(object):
+  def __init__(self, az, alt, size):
+    self.az = az
+    self.alt = alt
+    self.size = size
+
+class ConvertLocationTest(unittest2.TestCase):
+  def assertPositionsEqual(self, positions, reference):
+    self.assertEqual([p[0] for p in positions], [p[0] for p in reference])
+    for position, expected in zip(positions, reference):
+      self.assertTrue(np.allclose(position[1:], expected[1:], rtol=1e-9, atol=1e-9),
+                      (position, expected))
+
+  def test_agreement(self):
+    inside = pickle.load(open("../locations_inside.pkl", "rb"))
+    outside = pickle.load(open("../locations_outside.pkl", "rb"))
+    locations = inside[::len(inside) // 8] + outside[::len(outside) // 8]
+    for lat, lon in locations:
+      for threshold in [0., 50., 95.]:
+        reference = convert_location_reference(lat, lon, START, END, threshold, dt=30)
+        positions = convert_location(lat, lon, START, END, threshold, dt=30)
+        self.assertPositionsEqual(positions, reference)
+
+  def test_short_steps(self):
+    lat, lon = pickle.load(open("../locations_inside.pkl", "rb"))[0]
+    start, end = "2017/08/21 17:00:00", "2017/08/21 19:00:00"
+    self.assertPositionsEqual(convert_location(lat, lon, start, end, 95, dt=5),
+                              convert_location_reference(lat, lon, start, end, 95, dt=5))
+
+  def test_structured(self):
+    lat, lon = pickle.load(open("../locations_inside.pkl", "rb"))[0]
+    positions = sample_location(lat, lon, START, END, 95, dt=30)
+    self.assertEqual(positions.dtype, POSITION_DTYPE)
+    self.assertTrue(len(positions) > 0)
+    self.assertTrue((positions['lune'] > 95).all())
+    self.assertEqual(len(sample_location(lat, lon, START, START, 95, dt=30)), 0)
+
+  def test_lune_array(self):
+    random = np.random.RandomState(0)
+    r_sun = random.uniform(940, 960, 2000)
+    # get_lune doesn't handle annular eclipses, so the moon is always larger
+    r_moon = random.uniform(965, 1010, 2000)
+    s = random.uniform(0, 2100, 2000)
+    expected = []
+    for i in range(len(s)):
+      sun = Body(0., 0., 2 * r_sun[i])
+      moon = Body(0., math.radians(s[i] / 3600.), 2 * r_moon[i])
+      expected.append(get_lune(sun, moon))
+    self.assertTrue(np.allclose(get_lune_array(s, r_sun, r_moon), expected, atol=1e-6))
+
+if __name__ == '__main__':
+  unittest2.main()
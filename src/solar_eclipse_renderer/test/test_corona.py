@@ -0,0 +1,100 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cached corona sprite."""
+import sys
+sys.path.append("..")
+import math
+import unittest2
+import cv2
+import numpy as np
+import corona
+from corona import CoronaParameters
+from renderer_benchmark import render_corona_reference
+from render_constants import *
+
+# Padding around the frame when drawing an unclipped reference corona
+PAD = 1500
+
+class CoronaTest(unittest2.TestCase):
+  def setUp(self):
+    np.random.seed(0)
+    self.corona = CoronaParameters()
+    self.corona.setupRandom()
+
+  def unclipped_reference(self, circle_center, circle_size):
+    """render_corona_reference, drawn on a larger frame so that nothing is
+    clipped at (or blurred against) the frame edges, cropped back."""
+    image = render_corona_reference(self.corona, (circle_center[0] + PAD, circle_center[1] + PAD), circle_size,
+                                    (RES_X + 2*PAD, RES_Y + 2*PAD))
+    return image[PAD:PAD+RES_Y, PAD:PAD+RES_X]
+
+  def test_matches_reference(self):
+    # A corona well inside the frame is drawn exactly as before
+    for circle_center in [(960, 540), (700, 400)]:
+      expected = render_corona_reference(self.corona, circle_center, 30)
+      np.testing.assert_array_equal(self.corona.render_corona(circle_center, 30), expected)
+
+  def test_matches_unclipped_reference(self):
+    # Coronas reaching past the frame edges match drawing them unclipped
+    for circle_center, circle_size in [((960, 540), 144), ((-100, 200), 144), ((1800, 1000), 80)]:
+      expected = self.unclipped_reference(circle_center, circle_size)
+      np.testing.assert_array_equal(self.corona.render_corona(circle_center, circle_size), expected)
+
+  def test_sprite_is_tight(self):
+    sprite, (x, y) = self.corona.corona_sprite(144)
+    self.assertTrue(np.any(sprite[0]) and np.any(sprite[-1]))
+    self.assertTrue(np.any(sprite[:, 0]) and np.any(sprite[:, -1]))
+    np.testing.assert_array_equal(sprite[y-10:y+11, x-10:x+11],
+                                  render_corona_reference(self.corona, (960, 540), 144)[530:551, 950:971])
+
+  def test_cache(self):
+    sprite = self.corona.corona_sprite(100)
+    self.assertIs(self.corona.corona_sprite(100), sprite)
+    self.assertIsNot(self.corona.corona_sprite(101), sprite)
+    for size in range(102, 110):
+      self.corona.corona_sprite(size)
+    self.assertLessEqual(len(self.corona.corona_sprites), corona.SPRITE_CACHE_SIZE)
+
+    # New random parameters draw a new corona
+    self.corona.corona_sprite(100)
+    self.corona.setRandomAsJSON(self.corona.getRandomAsJSON())
+    self.assertEqual(self.corona.corona_sprites, {})
+
+  def test_rotated_sprite(self):
+    # The software renderer rotates the sprite in one warp; inside the
+    # frame that is the same as rotating the rendered corona, up to
+    # rounding of the nearest neighbor samples
+    from software_renderer import SoftwareEclipseRenderer
+    renderer = SoftwareEclipseRenderer.__new__(SoftwareEclipseRenderer)
+    renderer.setRandomAsJSON(self.corona.getRandomAsJSON())
+    circle_center, circle_size, angle = (300, 800), 144, -1.2
+    renderer.getSunSize = lambda p: (circle_center, circle_size)
+    image = np.zeros((RES_Y, RES_X, 3), np.float32)
+    renderer.draw_corona(image, [0] * 8 + [angle])
+
+    rotation = cv2.getRotationMatrix2D((RES_X/2, RES_Y/2), -math.degrees(angle), 1.0)
+    expected = cv2.warpAffine(render_corona_reference(self.corona, circle_center, circle_size),
+                              rotation, (RES_X, RES_Y), flags=cv2.INTER_NEAREST)
+    inside = cv2.warpAffine(np.ones((RES_Y, RES_X), np.uint8), rotation, (RES_X, RES_Y),
+                            flags=cv2.INTER_NEAREST) > 0
+    # Away from the frame edges, where the reference clips the corona
+    inside = cv2.erode(inside.astype(np.uint8), np.ones((201, 201), np.uint8)) > 0
+    alpha = expected[:, :, 3:] / 255.
+    difference = np.abs(image - alpha * expected[:, :, :3])[inside]
+    self.assertLess(np.mean(difference > 1e-3), 0.01)
+    self.assertLess(np.mean(difference), 0.01)
+
+if __name__ == '__main__':
+  unittest2.main()
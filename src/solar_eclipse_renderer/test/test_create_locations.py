@@ -0,0 +1,70 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for create_locations."""
+import sys
+sys.path.append("..")
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import unittest2
+import numpy as np
+from shapely.geometry.polygon import Polygon
+from create_locations import generate_grid, write_locations
+from create_locations_benchmark import generate_grid_reference
+
+ECLIPSE_PATH_DATA = "../../../data/eclipse_path_data.txt"
+
+def us_like_polygon(n=2000):
+  """A detailed, non-convex (lat, lon) polygon covering roughly the
+  contiguous US, standing in for the US map shapefile."""
+  angles = np.linspace(0, 2 * math.pi, n, endpoint=False)
+  wobble = 1 + 0.1 * np.sin(7 * angles) + 0.05 * np.sin(53 * angles)
+  return Polygon(zip(37 + 12 * wobble * np.sin(angles), -96 + 29 * wobble * np.cos(angles)))
+
+class CreateLocationsTest(unittest2.TestCase):
+  def setUp(self):
+    self.us_map_polygon = us_like_polygon()
+
+  def test_matches_reference(self):
+    for outside in (False, True):
+      expected = [(p.x, p.y) for p in generate_grid_reference(ECLIPSE_PATH_DATA, self.us_map_polygon, outside)]
+      p = generate_grid(ECLIPSE_PATH_DATA, self.us_map_polygon, outside)
+      self.assertGreater(len(expected), 0)
+      self.assertEqual(map(tuple, p.tolist()), expected)
+
+  def test_density(self):
+    inside = generate_grid(ECLIPSE_PATH_DATA, self.us_map_polygon, x_count=300, y_count=500)
+    self.assertEqual(inside.shape[1], 2)
+    # About 16 times as many points as the default 75x125 grid
+    ratio = len(inside) / float(len(generate_grid(ECLIPSE_PATH_DATA, self.us_map_polygon)))
+    self.assertTrue(12 < ratio < 20, ratio)
+
+  def test_write_locations(self):
+    directory = tempfile.mkdtemp()
+    try:
+      inside = generate_grid(ECLIPSE_PATH_DATA, self.us_map_polygon)
+      fname = os.path.join(directory, "locations_inside.pkl")
+      write_locations(fname, inside)
+      locations = pickle.load(open(fname, "rb"))
+      self.assertEqual(locations, [(p.x, p.y) for p in generate_grid_reference(ECLIPSE_PATH_DATA, self.us_map_polygon)])
+      self.assertIsInstance(locations[0][0], float)
+      np.testing.assert_array_equal(np.load(os.path.join(directory, "locations_inside.npy")), inside)
+    finally:
+      shutil.rmtree(directory)
+
+if __name__ == '__main__':
+  unittest2.main()
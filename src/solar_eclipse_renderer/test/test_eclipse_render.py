@@ -0,0 +1,91 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for eclipse_render's batch mode and image writing."""
+import sys
+sys.path.append("..")
+import math
+import os
+import shutil
+import tempfile
+import unittest2
+import ephem
+import numpy as np
+import eclipse_render
+from eclipse_render import parse_indexes, parse_pan
+from renderer_benchmark import write_image_reference
+
+class BatchRenderTest(unittest2.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.cwd = os.getcwd()
+    # Locations are loaded relative to the renderer directory
+    os.chdir("..")
+    self.random_file = os.path.join(self.directory, 'random.txt')
+    np.random.seed(0)
+    eclipse_render.create_renderer('software', 2, (0, 0), generate=True, save_file=self.random_file)
+
+  def tearDown(self):
+    os.chdir(self.cwd)
+    shutil.rmtree(self.directory)
+
+  def test_parse(self):
+    self.assertEqual(parse_indexes("3"), [3])
+    self.assertEqual(parse_indexes("0-3,7,9-10"), [0, 1, 2, 3, 7, 9, 10])
+    self.assertEqual(parse_pan("-10,20"), (-10, 20))
+
+  def test_batch_location(self):
+    eclipse_render.init_worker('software', self.random_file)
+    outdir = os.path.join(self.directory, 'images')
+    cameras = [(2, (0, 0)), (4, (10, -10))]
+    count, lines = eclipse_render.render_batch_location(('inside', 0, cameras, outdir, 99))
+    self.assertEqual(count, len(lines))
+    self.assertGreater(count, 0)
+
+    # One directory per camera, indexed relative to outdir
+    directories = sorted(os.listdir(outdir))
+    self.assertEqual(len(directories), 2)
+    self.assertTrue(directories[1].endswith(",4,10,-10,inside"))
+    for line in lines:
+      fname, phase, sun, moon = line.strip().split("|")
+      self.assertTrue(os.path.exists(os.path.join(outdir, fname)))
+      self.assertIn(os.path.dirname(fname), directories)
+
+    # The worker's renderer is reused, and renders the same images as a
+    # renderer created for the camera
+    renderer = eclipse_render.create_renderer('software', 4, (10, -10), load_file=self.random_file)
+    lat, lon, pts = eclipse_render.location_points('inside', 0, 99)
+    self.assertEqual(eclipse_render.stat_line(renderer, "00000.jpg", pts[0]),
+                     lines[len(pts)].split("/")[1])
+    np.testing.assert_array_equal(renderer.paint(pts[0]), eclipse_render.worker_renderer.paint(pts[0]))
+
+  def test_degrees_to_dms(self):
+    # Matches formatting with ephem.degrees and parsing the string
+    for value in [33.0191, -80.4620, 0.5, -0.01, 44.99999, 12.999986, -179.9]:
+      d, m, s = str(ephem.degrees(math.radians(value))).split(":")
+      self.assertEqual(eclipse_render.degrees_to_dms(value),
+                       ((abs(int(d)), 1), (int(m), 1), (int(float(s)), 1)))
+
+  def test_write_image(self):
+    renderer = eclipse_render.create_renderer('software', 2, (0, 0), load_file=self.random_file)
+    lat, lon, pts = eclipse_render.location_points('inside', 0, 99)
+    image = renderer.paint(pts[0])
+    fname = os.path.join(self.directory, 'image.jpg')
+    reference_fname = os.path.join(self.directory, 'reference.jpg')
+    eclipse_render.write_image(image, fname, pts[0], lat, lon, 2, (10, -10))
+    write_image_reference(image, reference_fname, pts[0], lat, lon, 2, (10, -10))
+    self.assertEqual(open(fname, 'rb').read(), open(reference_fname, 'rb').read())
+
+if __name__ == '__main__':
+  unittest2.main()
@@ -0,0 +1,111 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the closed form sun and moon screen geometry in projection."""
+import sys
+sys.path.append("..")
+import math
+import pickle
+import unittest2
+import numpy as np
+from convert_location import convert_location
+from projection import Camera, sun_moon_positions, sun_moon_circles
+from render_constants import *
+from test_software_renderer import sun_contour_circle
+
+def render_sphere(camera, obj, radius):
+  """Rasterizes the sphere at obj by casting a ray through each pixel
+  center, independent of sphere_circle."""
+  v = np.dot(camera.view, np.append(obj, 1.))[:3]
+  f = camera.focal_length()
+  yy, xx = np.mgrid[:RES_Y, :RES_X]
+  # Image pixel centers to window coordinates, and to rays in eye space
+  rays = np.dstack([(xx + 0.5 - RES_X / 2.) / f, (RES_Y - yy - 0.5 - RES_Y / 2.) / f, -np.ones(xx.shape)])
+  cos = np.dot(rays, v) / np.linalg.norm(rays, axis=2) / np.linalg.norm(v)
+  inside = cos >= math.cos(math.asin(radius / np.linalg.norm(v)))
+  image = np.zeros((RES_Y, RES_X, 3), np.uint8)
+  image[inside] = 255
+  return image
+
+class ProjectionTest(unittest2.TestCase):
+  def setUp(self):
+    lat, lon = pickle.load(open("../locations_inside.pkl", "rb"))[0]
+    self.pts = convert_location(lat, lon, "2017/08/21 16:00:00", "2017/08/21 20:00:00", 0, dt=600)
+
+  def assertCircleMatchesContour(self, camera, obj, radius, tolerance=0.5):
+    (x, y), r = camera.sphere_circle(obj, radius)
+    # The contour runs through pixel indices, which are offset by half a
+    # pixel from image coordinates
+    (cx, cy), cr = sun_contour_circle(render_sphere(camera, obj, radius))
+    self.assertLess(abs(cx + 0.5 - x), tolerance)
+    self.assertLess(abs(cy + 0.5 - y), tolerance)
+    self.assertLess(abs(cr - r), 2 * tolerance)
+
+  def test_sun_sweep(self):
+    # The sun over the day, at a range of fields of view, and panned
+    # towards the edges of the image
+    for fov, pan in [(2, (0, 0)), (1, (0, 0)), (4, (0, 0)),
+                     (2, (2e9, 0)), (2, (-1.5e9, 1.8e9)), (10, (1.5e10, -1e10))]:
+      camera = Camera(fov, pan)
+      for pt in self.pts[::3]:
+        sun, moon = sun_moon_positions(pt)
+        camera.setupProjection(*sun)
+        self.assertCircleMatchesContour(camera, sun, SUN_RADIUS)
+
+  def test_moon_sweep(self):
+    camera = Camera(2, (0, 0))
+    for pt in self.pts:
+      sun, moon = sun_moon_positions(pt)
+      camera.setupProjection(*sun)
+      if camera.sphere_circle(moon, MOON_RADIUS)[1] < RES_Y / 2:
+        moon_circle = camera.sphere_circle(moon, MOON_RADIUS)
+        (x, y), r = moon_circle
+        if 0 < x - r and x + r < RES_X and 0 < y - r and y + r < RES_Y:
+          self.assertCircleMatchesContour(camera, moon, MOON_RADIUS)
+
+  def test_centers_match_projection(self):
+    # On the optical axis the circle is centered on the projected center
+    camera = Camera(2, (0, 0))
+    for pt in self.pts:
+      sun_circle, moon_circle = sun_moon_circles(camera, pt)
+      sun, moon = sun_moon_positions(pt)
+      self.assertTrue(np.allclose(sun_circle[0], camera.to_image(camera.project(sun))))
+      # Off axis, the ellipse center is pushed slightly outwards
+      window = camera.project(moon)
+      offset = np.subtract(moon_circle[0], camera.to_image(window))
+      center = np.subtract(camera.to_image(window), (RES_X / 2., RES_Y / 2.))
+      self.assertGreaterEqual(np.dot(offset, center), -1e-6)
+      self.assertLess(np.linalg.norm(offset), 0.5)
+
+  def test_eccentric_sphere(self):
+    # Far off axis with a wide field of view the silhouette is visibly
+    # elliptical, and the enclosing circle is its semi-major axis
+    camera = Camera(60, (0, 0))
+    camera.setupProjection(0, 0, -SUN_EARTH_DISTANCE)
+    distance = SUN_EARTH_DISTANCE
+    obj = (math.sin(math.radians(25)) * distance, 0, -math.cos(math.radians(25)) * distance)
+    (x, y), r = camera.sphere_circle(obj, SUN_RADIUS * 20)
+    alpha = math.asin(20 * SUN_RADIUS / distance)
+    self.assertGreater(r, camera.focal_length() * math.tan(alpha) * 1.1)
+    # approxPolyDP's tolerance matters more on a large silhouette
+    self.assertCircleMatchesContour(camera, obj, SUN_RADIUS * 20, tolerance=1.5)
+
+  def test_behind_camera(self):
+    camera = Camera(2, (0, 0))
+    camera.setupProjection(0, 0, -SUN_EARTH_DISTANCE)
+    self.assertIsNone(camera.sphere_circle((0, 0, SUN_EARTH_DISTANCE), SUN_RADIUS))
+    self.assertIsNone(camera.sphere_circle((0, 0, 0), SUN_RADIUS))
+
+if __name__ == '__main__':
+  unittest2.main()
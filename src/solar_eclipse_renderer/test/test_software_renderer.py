@@ -0,0 +1,131 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for software_renderer and projection."""
+import sys
+sys.path.append("..")
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import unittest2
+import cv2
+import numpy as np
+from convert_location import convert_location
+from projection import Camera, perspective, look_at, project, sun_moon_positions
+from render_constants import *
+from software_renderer import SoftwareEclipseRenderer
+
+def psnr(a, b):
+  mse = np.mean((a.astype(np.float64) - b.astype(np.float64)) ** 2)
+  return float('inf') if mse == 0 else 10 * math.log10(255. ** 2 / mse)
+
+def sun_contour_circle(image):
+  """The contour method EclipseRenderer.getSunSize uses."""
+  gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+  _, thresh = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
+  contours = cv2.findContours(thresh, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)[-2]
+  contour = max(contours, key=cv2.contourArea)
+  poly = cv2.approxPolyDP(np.array(contour), 3, True)
+  return cv2.minEnclosingCircle(poly)
+
+def opengl_renderer(**kwargs):
+  """Returns an EclipseRenderer, or None if there's no OpenGL context."""
+  try:
+    from PyQt5 import QtWidgets
+    from eclipse_renderer import EclipseRenderer
+    opengl_renderer.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(['Eclipse'])
+    return EclipseRenderer(**kwargs)
+  except (ImportError, RuntimeError, SystemExit):
+    return None
+
+class SoftwareRendererTest(unittest2.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.random_file = os.path.join(self.directory, 'random.txt')
+    np.random.seed(0)
+    self.renderer = SoftwareEclipseRenderer(generate=True, save_file=self.random_file)
+    lat, lon = pickle.load(open("../locations_inside.pkl", "rb"))[0]
+    self.pts = convert_location(lat, lon, "2017/08/21 16:00:00", "2017/08/21 20:00:00", 50, dt=30)
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+  def test_glu_matrices(self):
+    # gluPerspective and gluLookAt reference values
+    p = perspective(90, 2., 1., 3.)
+    self.assertTrue(np.allclose(p, [[0.5, 0, 0, 0], [0, 1, 0, 0], [0, 0, -2, -3], [0, 0, -1, 0]]))
+    m = look_at((0, 0, 0), (1, 0, 0), (0, 1, 0))
+    self.assertTrue(np.allclose(np.dot(m, [1, 0, 0, 1]), [0, 0, -1, 1]))
+    self.assertTrue(np.allclose(project((0, 0, -2), np.identity(4), p, (0, 0, 100, 50)),
+                                (50, 25, 0.75)))
+    self.assertIsNone(project((0, 0, 2), np.identity(4), p, (0, 0, 100, 50)))
+
+  def test_camera_centers_sun(self):
+    for pt in self.pts[::5]:
+      sun_center, moon_center = self.renderer.getSunMoonCenter(pt)
+      self.assertAlmostEqual(sun_center[0], RES_X / 2., places=3)
+      self.assertAlmostEqual(sun_center[1], RES_Y / 2., places=3)
+
+  def test_sun_size_matches_contour(self):
+    camera = Camera(2, (0, 0))
+    for pt in self.pts[::5]:
+      sun, moon = sun_moon_positions(pt)
+      camera.setupProjection(*sun)
+      self.renderer.camera = camera
+      image = np.zeros((RES_Y, RES_X, 3), np.float32)
+      self.renderer.draw_disc(image, sun, SUN_RADIUS, (255, 255, 255))
+      (x, y), r = sun_contour_circle(image.astype(np.uint8))
+      (ex, ey), er = self.renderer.getSunSize(pt)
+      self.assertLess(abs(x - ex), 1.5)
+      self.assertLess(abs(y - ey), 1.5)
+      self.assertLess(abs(r - er), 1.5)
+
+  def test_phases(self):
+    totality = [pt for pt in self.pts if pt[7] == 100.][0]
+    partial = [pt for pt in self.pts if 50 < pt[7] < 90][0]
+    center = (RES_Y // 2, RES_X // 2)
+
+    image = self.renderer.paint(totality)
+    self.assertEqual(image.shape, (RES_Y, RES_X, 3))
+    (x, y), r = self.renderer.getSunSize(totality)
+    # The moon covers the sun, surrounded by the corona and glare
+    self.assertLess(image[center].max(), 10)
+    ring = image[int(y), int(x + r * 1.2)]
+    self.assertGreater(ring.min(), 100)
+
+    image = self.renderer.paint(partial)
+    # Some of the sun's disc is still bright
+    yy, xx = np.mgrid[:RES_Y, :RES_X]
+    inside = (xx - x) ** 2 + (yy - y) ** 2 < (0.9 * r) ** 2
+    self.assertGreater((image[inside].min(axis=1) > 200).mean(), 0.05)
+
+  def test_repeatable(self):
+    loaded = SoftwareEclipseRenderer(load_file=self.random_file)
+    pt = self.pts[len(self.pts) // 2]
+    self.assertEqual(psnr(self.renderer.paint(pt), loaded.paint(pt)), float('inf'))
+
+  def test_matches_opengl(self):
+    reference = opengl_renderer(load_file=self.random_file)
+    if reference is None:
+      self.skipTest("No OpenGL context")
+    from eclipse_renderer import qimage_to_numpy
+    for pt in self.pts[::4]:
+      expected = qimage_to_numpy(reference.paint(pt))[:, :, :3]
+      image = self.renderer.paint(pt)
+      self.assertGreater(psnr(image, expected), 30)
+
+if __name__ == '__main__':
+  unittest2.main()